@@ -95,6 +95,8 @@ class BrUtils:
                 range.
             ``CnpjFormatterOptionsForbiddenKeyCharacterException``: If a CNPJ
                 formatter key option contains a disallowed character.
+            ``CnpjFormatterOptionsTemplateInvalidException``: If a CNPJ
+                formatter ``template`` does not have exactly 14 ``#`` slots.
             ``CnpjGeneratorOptionsTypeError``: If CNPJ generator options have
                 an invalid type.
             ``CnpjGeneratorOptionPrefixInvalidException``: If CNPJ generator
@@ -112,6 +114,8 @@ class BrUtils:
                 range.
             ``CpfFormatterOptionsForbiddenKeyCharacterException``: If a CPF
                 formatter key option contains a disallowed character.
+            ``CpfFormatterOptionsTemplateInvalidException``: If a CPF formatter
+                ``template`` does not have exactly 11 ``#`` slots.
             ``CpfGeneratorOptionsTypeError``: If CPF generator options have an
                 invalid type.
             ``CpfGeneratorOptionPrefixInvalidException``: If CPF generator
@@ -169,6 +173,8 @@ class BrUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CnpjFormatterOptionsForbiddenKeyCharacterException``: If a
                 formatter key option contains a disallowed character.
+            ``CnpjFormatterOptionsTemplateInvalidException``: If the formatter
+                ``template`` does not have exactly 14 ``#`` slots.
             ``CnpjGeneratorOptionsTypeError``: If generator options have an
                 invalid type.
             ``CnpjGeneratorOptionPrefixInvalidException``: If generator
@@ -212,6 +218,8 @@ class BrUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CpfFormatterOptionsForbiddenKeyCharacterException``: If a
                 formatter key option contains a disallowed character.
+            ``CpfFormatterOptionsTemplateInvalidException``: If the formatter
+                ``template`` does not have exactly 11 ``#`` slots.
             ``CpfGeneratorOptionsTypeError``: If generator options have an
                 invalid type.
             ``CpfGeneratorOptionPrefixInvalidException``: If generator
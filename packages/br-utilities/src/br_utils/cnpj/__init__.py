@@ -12,6 +12,7 @@ from cnpj_utils import (
     CnpjFormatterOptions,
     CnpjFormatterOptionsForbiddenKeyCharacterException,
     CnpjFormatterOptionsHiddenRangeInvalidException,
+    CnpjFormatterOptionsTemplateInvalidException,
     CnpjFormatterOptionsTypeError,
     CnpjFormatterTypeError,
     CnpjGenerator,
@@ -43,6 +44,7 @@ __all__ = [
     "CnpjFormatterOptions",
     "CnpjFormatterOptionsForbiddenKeyCharacterException",
     "CnpjFormatterOptionsHiddenRangeInvalidException",
+    "CnpjFormatterOptionsTemplateInvalidException",
     "CnpjFormatterOptionsTypeError",
     "CnpjFormatterTypeError",
     "CnpjGenerator",
@@ -12,6 +12,7 @@ from cpf_utils import (
     CpfFormatterOptions,
     CpfFormatterOptionsForbiddenKeyCharacterException,
     CpfFormatterOptionsHiddenRangeInvalidException,
+    CpfFormatterOptionsTemplateInvalidException,
     CpfFormatterOptionsTypeError,
     CpfFormatterTypeError,
     CpfGenerator,
@@ -39,6 +40,7 @@ __all__ = [
     "CpfFormatterOptions",
     "CpfFormatterOptionsForbiddenKeyCharacterException",
     "CpfFormatterOptionsHiddenRangeInvalidException",
+    "CpfFormatterOptionsTemplateInvalidException",
     "CpfFormatterOptionsTypeError",
     "CpfFormatterTypeError",
     "CpfGenerator",
@@ -50,6 +50,7 @@ def describe_the_br_utils_package_api():
                 CpfFormatterOptions,
                 CpfFormatterOptionsForbiddenKeyCharacterException,
                 CpfFormatterOptionsHiddenRangeInvalidException,
+                CpfFormatterOptionsTemplateInvalidException,
                 CpfFormatterOptionsTypeError,
                 CpfFormatterTypeError,
                 CpfGenerator,
@@ -73,6 +74,7 @@ def describe_the_br_utils_package_api():
             assert CpfFormatterOptions is not None
             assert CpfFormatterOptionsForbiddenKeyCharacterException is not None
             assert CpfFormatterOptionsHiddenRangeInvalidException is not None
+            assert CpfFormatterOptionsTemplateInvalidException is not None
             assert CpfFormatterOptionsTypeError is not None
             assert CpfFormatterTypeError is not None
             assert CpfGenerator is not None
@@ -98,6 +100,7 @@ def describe_the_br_utils_package_api():
                 CnpjFormatterOptions,
                 CnpjFormatterOptionsForbiddenKeyCharacterException,
                 CnpjFormatterOptionsHiddenRangeInvalidException,
+                CnpjFormatterOptionsTemplateInvalidException,
                 CnpjFormatterOptionsTypeError,
                 CnpjFormatterTypeError,
                 CnpjGenerator,
@@ -128,6 +131,7 @@ def describe_the_br_utils_package_api():
             assert CnpjFormatterOptions is not None
             assert CnpjFormatterOptionsForbiddenKeyCharacterException is not None
             assert CnpjFormatterOptionsHiddenRangeInvalidException is not None
+            assert CnpjFormatterOptionsTemplateInvalidException is not None
             assert CnpjFormatterOptionsTypeError is not None
             assert CnpjFormatterTypeError is not None
             assert CnpjGenerator is not None
@@ -0,0 +1,54 @@
+"""Benchmark bytes-like input against the equivalent ``str`` input.
+
+Run from the package root with ``python benchmarks/bytes_input.py``. Prints
+the per-item cost of ``CnpjCheckDigits.classify`` over formatted CNPJ bases
+given as ``str``, as ``bytes`` and as ``memoryview`` slices of a single
+buffer, as read from a binary file.
+"""
+
+import random
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_bases() -> list[str]:
+    rng = random.Random(0)
+    bases = ["".join(rng.choices(_ALPHABET, k=12)) for _ in range(_SAMPLE_SIZE)]
+
+    return [f"{b[:2]}.{b[2:5]}.{b[5:8]}/{b[8:]}" for b in bases]
+
+
+def _classify_all(cnpj_inputs: list) -> None:
+    classify = CnpjCheckDigits.classify
+
+    for cnpj_input in cnpj_inputs:
+        classify(cnpj_input)
+
+
+def main() -> None:
+    str_bases = _sample_bases()
+    bytes_bases = [base.encode() for base in str_bases]
+    buffer = memoryview(b"".join(bytes_bases))
+    size = len(bytes_bases[0])
+    memoryview_bases = [buffer[i : i + size] for i in range(0, len(buffer), size)]
+
+    for label, cnpj_inputs in (
+        ("str", str_bases),
+        ("bytes", bytes_bases),
+        ("memoryview", memoryview_bases),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda i=cnpj_inputs: _classify_all(i), number=1, repeat=_REPEAT
+            )
+        )
+        print(f"{label:>10}: {best / len(cnpj_inputs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Benchmark ``CnpjCheckDigits.calculate_array`` against ``complete_many``.
+
+Run from the package root with ``python benchmarks/calculate_array.py``
+(requires the ``numpy`` extra). Prints the per-row cost of calculating the
+check digits of the same bases held as a ``uint8`` character matrix and as a
+list of strings.
+"""
+
+import random
+import timeit
+
+import numpy as np
+from cnpj_dv import CnpjCheckDigits
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 1_000_000
+_REPEAT = 5
+
+
+def _sample_bases() -> list[str]:
+    rng = random.Random(0)
+
+    return ["".join(rng.choices(_ALPHABET, k=12)) for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    bases = _sample_bases()
+    matrix = np.frombuffer("".join(bases).encode(), np.uint8).reshape(len(bases), 12)
+
+    for label, path in (
+        ("complete_many", lambda: CnpjCheckDigits.complete_many(bases)),
+        ("calculate_array", lambda: CnpjCheckDigits.calculate_array(matrix)),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+        print(f"{label:>15}: {best / len(bases) * 1e9:8.1f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
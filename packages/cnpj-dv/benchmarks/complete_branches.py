@@ -0,0 +1,54 @@
+"""Benchmark ``CnpjCheckDigits.complete_branches`` against ``complete_many``.
+
+Run from the package root with ``python benchmarks/complete_branches.py``.
+Prints the per-item cost of completing many branches of a few companies
+through full-base ``complete_many`` calls and through one
+``complete_branches`` call per base ID.
+"""
+
+import random
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_BASE_ID_COUNT = 20
+_BRANCHES_PER_BASE_ID = 500
+_REPEAT = 5
+
+
+def _sample_companies() -> dict[str, list[str]]:
+    rng = random.Random(0)
+
+    return {
+        "".join(rng.choices(_ALPHABET, k=8)): [
+            f"{branch:04d}" for branch in range(1, _BRANCHES_PER_BASE_ID + 1)
+        ]
+        for _ in range(_BASE_ID_COUNT)
+    }
+
+
+def _complete_many_path(companies: dict[str, list[str]]) -> None:
+    for base_id, branch_ids in companies.items():
+        CnpjCheckDigits.complete_many([base_id + branch_id for branch_id in branch_ids])
+
+
+def _complete_branches_path(companies: dict[str, list[str]]) -> None:
+    for base_id, branch_ids in companies.items():
+        CnpjCheckDigits.complete_branches(base_id, branch_ids)
+
+
+def main() -> None:
+    companies = _sample_companies()
+    item_count = _BASE_ID_COUNT * _BRANCHES_PER_BASE_ID
+
+    for label, path in (
+        ("complete_many", _complete_many_path),
+        ("complete_branches", _complete_branches_path),
+    ):
+        best = min(timeit.repeat(lambda p=path: p(companies), number=1, repeat=_REPEAT))
+        print(f"{label:>18}: {best / item_count * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
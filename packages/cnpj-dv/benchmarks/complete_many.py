@@ -0,0 +1,45 @@
+"""Benchmark ``CnpjCheckDigits.complete_many`` against the constructor path.
+
+Run from the package root with ``python benchmarks/complete_many.py``. Prints
+the per-item cost of completing the same bases through one
+:class:`~cnpj_dv.CnpjCheckDigits` instance per item and through a single
+``complete_many`` call.
+"""
+
+import random
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_bases() -> list[str]:
+    rng = random.Random(0)
+
+    return ["".join(rng.choices(_ALPHABET, k=12)) for _ in range(_SAMPLE_SIZE)]
+
+
+def _constructor_path(bases: list[str]) -> list[str]:
+    return [CnpjCheckDigits(base).cnpj for base in bases]
+
+
+def _complete_many_path(bases: list[str]) -> list[str | None]:
+    return CnpjCheckDigits.complete_many(bases)
+
+
+def main() -> None:
+    bases = _sample_bases()
+
+    for label, path in (
+        ("constructor", _constructor_path),
+        ("complete_many", _complete_many_path),
+    ):
+        best = min(timeit.repeat(lambda p=path: p(bases), number=1, repeat=_REPEAT))
+        print(f"{label:>14}: {best / len(bases) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 from .cnpj_check_digits import (
+    CNPJ_CHECK_DIGIT_BY_REMAINDER,
+    CNPJ_FIRST_WEIGHTS,
     CNPJ_MAX_LENGTH,
     CNPJ_MIN_LENGTH,
+    CNPJ_SECOND_DIGIT_WEIGHT,
+    CNPJ_SECOND_WEIGHTS,
     CnpjCheckDigits,
+    CnpjCheckDigitsStatus,
 )
 from .exceptions import (
     CnpjCheckDigitsException,
@@ -13,13 +18,18 @@ from .exceptions import (
 from .types import CnpjInput
 
 __all__ = [
+    "CNPJ_CHECK_DIGIT_BY_REMAINDER",
+    "CNPJ_FIRST_WEIGHTS",
     "CNPJ_MAX_LENGTH",
     "CNPJ_MIN_LENGTH",
+    "CNPJ_SECOND_DIGIT_WEIGHT",
+    "CNPJ_SECOND_WEIGHTS",
     "CnpjCheckDigits",
     "CnpjCheckDigitsException",
     "CnpjCheckDigitsInputInvalidException",
     "CnpjCheckDigitsInputLengthException",
     "CnpjCheckDigitsInputTypeError",
+    "CnpjCheckDigitsStatus",
     "CnpjCheckDigitsTypeError",
     "CnpjInput",
 ]
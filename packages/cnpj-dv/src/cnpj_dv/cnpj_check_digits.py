@@ -4,12 +4,26 @@ Validates length, base ID, branch ID and rejects repeated numeric
 digits.
 """
 
+from __future__ import annotations
+
+import re
+from enum import IntEnum
+from operator import getitem
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     CnpjCheckDigitsInputInvalidException,
     CnpjCheckDigitsInputLengthException,
     CnpjCheckDigitsInputTypeError,
 )
-from .types import CnpjInput
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    import numpy as np
+
+    from .types import CnpjInput
 
 CNPJ_MIN_LENGTH = 12
 """Minimum number of characters required for the CNPJ check digits
@@ -21,14 +35,243 @@ CNPJ_MAX_LENGTH = 14
 digits calculation.
 """
 
+CNPJ_FIRST_WEIGHTS = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+"""Weights of the base characters in the first check digit sum."""
+
+CNPJ_SECOND_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3)
+"""Weights of the base characters in the second check digit sum."""
+
+CNPJ_SECOND_DIGIT_WEIGHT = 2
+"""Weight of the first check digit in the second check digit sum."""
+
+CNPJ_CHECK_DIGIT_BY_REMAINDER = (0, 0, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+"""Check digit for each remainder of a weighted sum divided by 11."""
+
+
+class CnpjCheckDigitsStatus(IntEnum):
+    """Eligibility of a CNPJ base for the check digits calculation, as
+    reported by :meth:`CnpjCheckDigits.classify`.
+    """
+
+    OK = 0
+    """The base is eligible and its check digits were calculated."""
+
+    INVALID_LENGTH = 1
+    """The character count is not between 12 and 14."""
+
+    INVALID_BASE_ID = 2
+    """The base ID (first 8 characters) is all zeros."""
+
+    INVALID_BRANCH_ID = 3
+    """The branch ID (characters 9-12) is all zeros."""
+
+    REPEATED_DIGITS = 4
+    """The first 12 characters are the same numeric digit."""
+
+
 _CNPJ_BASE_ID_LENGTH = 8
 _CNPJ_INVALID_BASE_ID = "0" * _CNPJ_BASE_ID_LENGTH
 _CNPJ_BRANCH_ID_LENGTH = 4
 _CNPJ_INVALID_BRANCH_ID = "0" * _CNPJ_BRANCH_ID_LENGTH
+_CNPJ_MAX_BRANCH_LENGTH = CNPJ_MAX_LENGTH - _CNPJ_BASE_ID_LENGTH
 
 _DELTA_FACTOR = ord("0")
-_WEIGHTS = (2, 3, 4, 5, 6, 7, 8, 9)
+_SECOND_SUM_SHIFT = 16
+_FIRST_SUM_MASK = (1 << _SECOND_SUM_SHIFT) - 1
+_CNPJ_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 _DIGIT_CHARS = "0123456789"
+_NON_ALPHANUMERIC_PATTERN = re.compile(r"[^0-9A-Za-z]")
+_NON_ALPHANUMERIC_BYTES = bytes(
+    code for code in range(256) if not (chr(code).isascii() and chr(code).isalnum())
+)
+_BYTES_INPUT_TYPES = (bytes, bytearray, memoryview)
+_EXPECTED_INPUT_TYPE = "string, bytes or string[]"
+_EXPECTED_ARRAY_TYPE = "uint8 array of shape (N, 12)"
+_DIGITS_COUNT = len(_DIGIT_CHARS)
+_INVALID_IDS_BY_TYPE: dict[type, tuple[str | bytes, str | bytes]] = {
+    str: (_CNPJ_INVALID_BASE_ID, _CNPJ_INVALID_BRANCH_ID),
+    bytes: (_CNPJ_INVALID_BASE_ID.encode(), _CNPJ_INVALID_BRANCH_ID.encode()),
+}
+
+
+def _build_weighted_tables() -> tuple[dict[str | int, int], ...]:
+    """Build one lookup table per base position mapping each alphanumeric
+    character, and its byte value, to its packed contribution to both
+    weighted sums.
+
+    The first-digit contribution sits in the low bits and the second-digit
+    contribution is shifted by ``_SECOND_SUM_SHIFT``, so adding the packed
+    values of all positions yields both sums at once.
+    """
+    tables: list[dict[str | int, int]] = []
+
+    for first_weight, second_weight in zip(
+        CNPJ_FIRST_WEIGHTS, CNPJ_SECOND_WEIGHTS, strict=True
+    ):
+        table: dict[str | int, int] = {}
+
+        for char in _CNPJ_CHARS:
+            code = ord(char)
+            table[char] = table[code] = (code - _DELTA_FACTOR) * (
+                first_weight + (second_weight << _SECOND_SUM_SHIFT)
+            )
+
+        tables.append(table)
+
+    return tuple(tables)
+
+
+_WEIGHTED_TABLES = _build_weighted_tables()
+
+
+def _build_value_by_char_code() -> tuple[int, ...]:
+    """Build a 256-entry table mapping each byte value to its numeric value
+    in the check digits calculation, with lowercase letters read as
+    uppercase and every non-alphanumeric byte mapped to ``-1``.
+    """
+    values = [-1] * 256
+
+    for char in _CNPJ_CHARS:
+        values[ord(char)] = values[ord(char.lower())] = ord(char) - _DELTA_FACTOR
+
+    return tuple(values)
+
+
+_VALUE_BY_CHAR_CODE = _build_value_by_char_code()
+_BASE_ID_TABLES = _WEIGHTED_TABLES[:_CNPJ_BASE_ID_LENGTH]
+_BRANCH_ID_TABLES = _WEIGHTED_TABLES[_CNPJ_BASE_ID_LENGTH:]
+
+
+def _sanitize_bytes(cnpj_bytes: bytes | bytearray | memoryview) -> bytes:
+    """Strip non-alphanumeric bytes and uppercase the remainder, without
+    decoding.
+    """
+    cnpj_bytes = bytes(cnpj_bytes)
+
+    if cnpj_bytes.isalnum():
+        return cnpj_bytes.upper()
+
+    return cnpj_bytes.translate(None, _NON_ALPHANUMERIC_BYTES).upper()
+
+
+def _sanitize(cnpj_string: str) -> str:
+    """Strip non-alphanumeric characters and uppercase the remainder."""
+    if cnpj_string.isascii() and cnpj_string.isalnum():
+        return cnpj_string.upper()
+
+    return _NON_ALPHANUMERIC_PATTERN.sub("", cnpj_string).upper()
+
+
+def _calculate_digits(cnpj_base: str | bytes) -> tuple[int, int]:
+    """Compute both check digits of 12 sanitized base characters (or their
+    byte values) in a single table-driven pass of the standard CNPJ
+    modulo-11 algorithm.
+    """
+    return _digits_from_sums(sum(map(getitem, _WEIGHTED_TABLES, cnpj_base)))
+
+
+def _digits_from_sums(sums: int) -> tuple[int, int]:
+    """Derive both check digits from the packed weighted sums of a base."""
+    first_digit = CNPJ_CHECK_DIGIT_BY_REMAINDER[(sums & _FIRST_SUM_MASK) % 11]
+    second_sum = (sums >> _SECOND_SUM_SHIFT) + first_digit * CNPJ_SECOND_DIGIT_WEIGHT
+
+    return first_digit, CNPJ_CHECK_DIGIT_BY_REMAINDER[second_sum % 11]
+
+
+def _classify(cnpj_chars: str | bytes) -> CnpjCheckDigitsStatus:
+    """Report whether sanitized characters (or bytes) are eligible for the
+    check digits calculation, without raising.
+    """
+    if not CNPJ_MIN_LENGTH <= len(cnpj_chars) <= CNPJ_MAX_LENGTH:
+        return CnpjCheckDigitsStatus.INVALID_LENGTH
+
+    invalid_base_id, invalid_branch_id = _INVALID_IDS_BY_TYPE[type(cnpj_chars)]
+
+    if cnpj_chars[:_CNPJ_BASE_ID_LENGTH] == invalid_base_id:
+        return CnpjCheckDigitsStatus.INVALID_BASE_ID
+
+    if cnpj_chars[_CNPJ_BASE_ID_LENGTH:CNPJ_MIN_LENGTH] == invalid_branch_id:
+        return CnpjCheckDigitsStatus.INVALID_BRANCH_ID
+
+    first_char = cnpj_chars[:1]
+
+    if (
+        first_char.isdigit()
+        and cnpj_chars[:CNPJ_MIN_LENGTH] == first_char * CNPJ_MIN_LENGTH
+    ):
+        return CnpjCheckDigitsStatus.REPEATED_DIGITS
+
+    return CnpjCheckDigitsStatus.OK
+
+
+def _complete(cnpj_chars: str | bytes) -> str | None:
+    """Return the full CNPJ for sanitized characters (or bytes), or ``None``
+    when they are not eligible for the check digits calculation.
+    """
+    if _classify(cnpj_chars) is not CnpjCheckDigitsStatus.OK:
+        return None
+
+    cnpj_base = cnpj_chars[:CNPJ_MIN_LENGTH]
+    first_digit, second_digit = _calculate_digits(cnpj_base)
+
+    if isinstance(cnpj_base, bytes):
+        cnpj_base = cnpj_base.decode("ascii")
+
+    return cnpj_base + _DIGIT_CHARS[first_digit] + _DIGIT_CHARS[second_digit]
+
+
+def _import_numpy() -> ModuleType:
+    """Import NumPy for the array API, pointing to the optional extra when it
+    is not installed.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            'NumPy is required for array input. Install it with "pip install cnpj-dv[numpy]".'
+        ) from error
+
+    return numpy
+
+
+def _sanitize_id(id_input: object) -> str:
+    """Sanitize a base or branch ID given as a string or bytes-like object.
+    Bytes-like IDs are decoded only after sanitization, since their
+    characters are part of the completed CNPJ.
+
+    Raises:
+        CnpjCheckDigitsInputTypeError: When input is not a ``str`` or
+            bytes-like object.
+    """
+    if isinstance(id_input, str):
+        return _sanitize(id_input)
+
+    if isinstance(id_input, _BYTES_INPUT_TYPES):
+        return _sanitize_bytes(id_input).decode("ascii")
+
+    raise CnpjCheckDigitsInputTypeError(id_input, "string or bytes")
+
+
+def _sanitize_input(cnpj_input: object) -> str | bytes:
+    """Sanitize a string, bytes-like object or list of strings without
+    creating an instance. Bytes-like input stays ``bytes``.
+
+    Raises:
+        CnpjCheckDigitsInputTypeError: When input is not a ``str``,
+            bytes-like object or ``list[str]``.
+    """
+    if isinstance(cnpj_input, str):
+        return _sanitize(cnpj_input)
+
+    if isinstance(cnpj_input, _BYTES_INPUT_TYPES):
+        return _sanitize_bytes(cnpj_input)
+
+    if isinstance(cnpj_input, list) and all(
+        isinstance(item, str) for item in cnpj_input
+    ):
+        return _sanitize("".join(cnpj_input))
+
+    raise CnpjCheckDigitsInputTypeError(cnpj_input, _EXPECTED_INPUT_TYPE)
 
 
 class CnpjCheckDigits:
@@ -42,12 +285,12 @@ class CnpjCheckDigits:
         """Create a calculator for the given CNPJ base (12 to 14 chars).
 
         Args:
-            cnpj_input: Alphanumeric CNPJ with or without formatting, or
-                a list of strings.
+            cnpj_input: Alphanumeric CNPJ with or without formatting, as
+                a string or bytes-like object, or a list of strings.
 
         Raises:
-            CnpjCheckDigitsInputTypeError: When input is not a ``str`` or
-                ``list[str]``.
+            CnpjCheckDigitsInputTypeError: When input is not a ``str``,
+                bytes-like object or ``list[str]``.
             CnpjCheckDigitsInputLengthException: When character count is
                 not between 12 and 14.
             CnpjCheckDigitsInputInvalidException: When base ID is all zero
@@ -62,25 +305,24 @@ class CnpjCheckDigits:
         self._validate_branch_id(parsed_input, cnpj_input)
         self._validate_non_repeated_digits(parsed_input, cnpj_input)
 
-        self._cnpj_chars: tuple[str, ...] = tuple(parsed_input[:CNPJ_MIN_LENGTH])
-        self._cached_first_digit: int | None = None
-        self._cached_second_digit: int | None = None
+        self._cnpj_base: str = parsed_input[:CNPJ_MIN_LENGTH]
+        self._cached_digits: tuple[int, int] | None = None
 
     @property
     def first(self) -> str:
         """First check digit (13th character of the full CNPJ)."""
-        if self._cached_first_digit is None:
-            self._cached_first_digit = self._calculate(self._cnpj_chars)
+        if self._cached_digits is None:
+            self._cached_digits = self._calculate(self._cnpj_base)
 
-        return _DIGIT_CHARS[self._cached_first_digit]
+        return _DIGIT_CHARS[self._cached_digits[0]]
 
     @property
     def second(self) -> str:
         """Second check digit (14th character of the full CNPJ)."""
-        if self._cached_second_digit is None:
-            self._cached_second_digit = self._calculate((*self._cnpj_chars, self.first))
+        if self._cached_digits is None:
+            self._cached_digits = self._calculate(self._cnpj_base)
 
-        return _DIGIT_CHARS[self._cached_second_digit]
+        return _DIGIT_CHARS[self._cached_digits[1]]
 
     @property
     def both(self) -> str:
@@ -92,57 +334,218 @@ class CnpjCheckDigits:
         """Full 14-character CNPJ (base 12 characters concatenated with
         the 2 check digits).
         """
-        return "".join(self._cnpj_chars) + self.both
+        return self._cnpj_base + self.both
 
-    def _parse_input(self, cnpj_input: object) -> list[str]:
-        """Parse a string or list of strings into alphanumeric characters.
+    @staticmethod
+    def complete_many(cnpj_inputs: Iterable[CnpjInput]) -> list[str | None]:
+        """Calculate the full CNPJ for many bases in a single call.
+
+        Each item accepts the same formats as the constructor and is mapped
+        to its full 14-character CNPJ, in input order. Items the constructor
+        would reject with a ``CnpjCheckDigitsException`` (invalid length,
+        zeroed base ID or branch ID, repeated digits) are mapped to ``None``
+        instead, and no :class:`CnpjCheckDigits` instance is created per
+        item.
 
         Raises:
-            CnpjCheckDigitsInputTypeError: When input is not a ``str`` or
-                ``list[str]``.
+            CnpjCheckDigitsInputTypeError: When any item is not a ``str``,
+                bytes-like object or ``list[str]``.
+        """
+        results: list[str | None] = []
+        append = results.append
+
+        for cnpj_input in cnpj_inputs:
+            append(_complete(_sanitize_input(cnpj_input)))
+
+        return results
+
+    @staticmethod
+    def classify(cnpj_input: CnpjInput) -> tuple[CnpjCheckDigitsStatus, str | None]:
+        """Classify a CNPJ base and calculate its check digits without
+        raising for ineligible values.
+
+        Accepts the same formats as the constructor. Returns
+        ``CnpjCheckDigitsStatus.OK`` with both check digits when the base is
+        eligible, or the status matching the ``CnpjCheckDigitsException``
+        the constructor would raise together with ``None``. This keeps
+        rejected inputs as cheap as accepted ones on dirty datasets.
+        Bytes-like input is classified on its byte values, without decoding.
+
+        Raises:
+            CnpjCheckDigitsInputTypeError: When input is not a ``str``,
+                bytes-like object or ``list[str]``.
+        """
+        cnpj_chars = _sanitize_input(cnpj_input)
+        status = _classify(cnpj_chars)
+
+        if status is not CnpjCheckDigitsStatus.OK:
+            return status, None
+
+        first_digit, second_digit = _calculate_digits(cnpj_chars[:CNPJ_MIN_LENGTH])
+
+        return status, _DIGIT_CHARS[first_digit] + _DIGIT_CHARS[second_digit]
+
+    @staticmethod
+    def complete_branches(
+        base_id: str | bytes | bytearray | memoryview,
+        branch_ids: Iterable[str | bytes | bytearray | memoryview],
+    ) -> list[str | None]:
+        """Calculate the full CNPJ for many branches of the same company.
+
+        The weighted sums of the 8-character base ID are computed once and
+        each 4-character branch ID only adds its own share, so completing
+        many branches of one company is cheaper than completing each full
+        base on its own. Branch IDs may carry formatting and trailing check
+        digits (4 to 6 alphanumeric characters). Results follow the input
+        order, with ineligible branches (invalid length, zeroed branch ID,
+        repeated digits) mapped to ``None``; every item is ``None`` when the
+        base ID itself is not 8 characters long or is all zeros. Base and
+        branch IDs may also be bytes-like objects.
+
+        Raises:
+            CnpjCheckDigitsInputTypeError: When the base ID or any branch ID
+                is not a ``str`` or bytes-like object.
+        """
+        base_chars = _sanitize_id(base_id)
+        is_eligible_base = (
+            len(base_chars) == _CNPJ_BASE_ID_LENGTH
+            and base_chars != _CNPJ_INVALID_BASE_ID
+        )
+        base_sums = sum(map(getitem, _BASE_ID_TABLES, base_chars))
+        first_char = base_chars[:1]
+        ineligible_branch_ids = {_CNPJ_INVALID_BRANCH_ID}
+
+        if first_char.isdigit() and base_chars == first_char * _CNPJ_BASE_ID_LENGTH:
+            ineligible_branch_ids.add(first_char * _CNPJ_BRANCH_ID_LENGTH)
+
+        results: list[str | None] = []
+        append = results.append
+
+        for branch_input in branch_ids:
+            branch_chars = _sanitize_id(branch_input)
+
+            if not is_eligible_base or not (
+                _CNPJ_BRANCH_ID_LENGTH <= len(branch_chars) <= _CNPJ_MAX_BRANCH_LENGTH
+            ):
+                append(None)
+                continue
+
+            branch_chars = branch_chars[:_CNPJ_BRANCH_ID_LENGTH]
+
+            if branch_chars in ineligible_branch_ids:
+                append(None)
+                continue
+
+            first_digit, second_digit = _digits_from_sums(
+                sum(map(getitem, _BRANCH_ID_TABLES, branch_chars), base_sums)
+            )
+            append(
+                base_chars
+                + branch_chars
+                + _DIGIT_CHARS[first_digit]
+                + _DIGIT_CHARS[second_digit]
+            )
+
+        return results
+
+    @staticmethod
+    def calculate_array(cnpj_chars: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the check digits of many CNPJ bases at once with NumPy.
+
+        Takes a ``uint8`` matrix of ASCII character values with one base per
+        row, such as ``np.frombuffer(data, np.uint8).reshape(-1, 12)``. Rows
+        may hold 12 to 14 columns; like the constructor, only the first 12
+        are used and lowercase letters count as uppercase. Both check digits
+        of every row are derived from two dot products with the weights, a
+        modulo 11 and ``np.where``, with no per-row Python work.
+
+        Returns a ``(check_digits, eligible)`` pair: an ``(N, 2)`` ``uint8``
+        matrix of digit values (``0`` to ``9``) and an ``(N,)`` boolean mask
+        that is ``False`` for rows the constructor would reject (zeroed base
+        ID or branch ID, repeated digits) or that hold a non-alphanumeric
+        character. Check digits of ineligible rows carry no meaning.
+
+        Requires the ``numpy`` extra (``pip install cnpj-dv[numpy]``).
+
+        Raises:
+            CnpjCheckDigitsInputTypeError: When input is not a 2-dimensional
+                ``uint8`` array with 12 to 14 columns.
+        """
+        np = _import_numpy()
+
+        if not (
+            isinstance(cnpj_chars, np.ndarray)
+            and cnpj_chars.dtype == np.uint8
+            and cnpj_chars.ndim == 2
+            and CNPJ_MIN_LENGTH <= cnpj_chars.shape[1] <= CNPJ_MAX_LENGTH
+        ):
+            raise CnpjCheckDigitsInputTypeError(cnpj_chars, _EXPECTED_ARRAY_TYPE)
+
+        values = np.array(_VALUE_BY_CHAR_CODE, np.int32)[
+            cnpj_chars[:, :CNPJ_MIN_LENGTH]
+        ]
+
+        first_remainder = values @ np.array(CNPJ_FIRST_WEIGHTS, np.int32) % 11
+        first_digits = np.where(first_remainder < 2, 0, 11 - first_remainder)
+        second_remainder = (
+            values @ np.array(CNPJ_SECOND_WEIGHTS, np.int32)
+            + first_digits * CNPJ_SECOND_DIGIT_WEIGHT
+        ) % 11
+        second_digits = np.where(second_remainder < 2, 0, 11 - second_remainder)
+
+        is_zero = values == 0
+        eligible = (
+            (values >= 0).all(axis=1)
+            & ~is_zero[:, :_CNPJ_BASE_ID_LENGTH].all(axis=1)
+            & ~is_zero[:, _CNPJ_BASE_ID_LENGTH:].all(axis=1)
+            & ~((values == values[:, :1]).all(axis=1) & (values[:, 0] < _DIGITS_COUNT))
+        )
+
+        return (
+            np.stack([first_digits, second_digits], axis=1).astype(np.uint8),
+            eligible,
+        )
+
+    def _parse_input(self, cnpj_input: object) -> str:
+        """Parse a string, bytes-like object or list of strings into
+        alphanumeric characters.
+
+        Raises:
+            CnpjCheckDigitsInputTypeError: When input is not a ``str``,
+                bytes-like object or ``list[str]``.
         """
         if isinstance(cnpj_input, str):
             return self._parse_string_input(cnpj_input)
 
+        if isinstance(cnpj_input, _BYTES_INPUT_TYPES):
+            return _sanitize_bytes(cnpj_input).decode("ascii")
+
         if isinstance(cnpj_input, list):
             return self._parse_list_input(cnpj_input)
 
-        raise CnpjCheckDigitsInputTypeError(cnpj_input, "string or string[]")
+        raise CnpjCheckDigitsInputTypeError(cnpj_input, _EXPECTED_INPUT_TYPE)
 
-    def _parse_string_input(self, cnpj_string: str) -> list[str]:
+    def _parse_string_input(self, cnpj_string: str) -> str:
         """Strip non-alphanumeric characters and uppercase the remainder."""
-        result: list[str] = []
-        append = result.append
-
-        for char in cnpj_string:
-            code = ord(char)
-            if 48 <= code <= 57 or 65 <= code <= 90:
-                append(char)
-            elif 97 <= code <= 122:
-                append(chr(code - 32))
+        return _sanitize(cnpj_string)
 
-        return result
-
-    def _parse_list_input(self, cnpj_list: list[object]) -> list[str]:
+    def _parse_list_input(self, cnpj_list: list[object]) -> str:
         """Concatenate a list of strings and normalize the result.
 
         Raises:
-            CnpjCheckDigitsInputTypeError: When input is not a ``str`` or
-                ``list[str]``.
+            CnpjCheckDigitsInputTypeError: When any item is not a ``str``.
         """
         if not cnpj_list:
-            return []
+            return ""
 
         is_string_list = all(isinstance(item, str) for item in cnpj_list)
 
         if not is_string_list:
-            raise CnpjCheckDigitsInputTypeError(cnpj_list, "string or string[]")
+            raise CnpjCheckDigitsInputTypeError(cnpj_list, _EXPECTED_INPUT_TYPE)
 
         return self._parse_string_input("".join(cnpj_list))
 
-    def _validate_length(
-        self, cnpj_chars: list[str], original_input: CnpjInput
-    ) -> None:
+    def _validate_length(self, cnpj_chars: str, original_input: CnpjInput) -> None:
         """Ensure character count is between ``CNPJ_MIN_LENGTH`` and
         ``CNPJ_MAX_LENGTH``.
 
@@ -155,14 +558,12 @@ class CnpjCheckDigits:
         if chars_count < CNPJ_MIN_LENGTH or chars_count > CNPJ_MAX_LENGTH:
             raise CnpjCheckDigitsInputLengthException(
                 original_input,
-                "".join(cnpj_chars),
+                cnpj_chars,
                 CNPJ_MIN_LENGTH,
                 CNPJ_MAX_LENGTH,
             )
 
-    def _validate_base_id(
-        self, cnpj_chars: list[str], original_input: CnpjInput
-    ) -> None:
+    def _validate_base_id(self, cnpj_chars: str, original_input: CnpjInput) -> None:
         """Reject base ID (first 8 digits) when it is all zeros.
 
         Raises:
@@ -175,9 +576,7 @@ class CnpjCheckDigits:
                 f'Base ID "{_CNPJ_INVALID_BASE_ID}" is not eligible.',
             )
 
-    def _validate_branch_id(
-        self, cnpj_chars: list[str], original_input: CnpjInput
-    ) -> None:
+    def _validate_branch_id(self, cnpj_chars: str, original_input: CnpjInput) -> None:
         """Reject branch ID (digits 9-12) when it is all zeros.
 
         Raises:
@@ -194,7 +593,7 @@ class CnpjCheckDigits:
             )
 
     def _validate_non_repeated_digits(
-        self, cnpj_chars: list[str], original_input: CnpjInput
+        self, cnpj_chars: str, original_input: CnpjInput
     ) -> None:
         """Reject inputs where all first 12 characters are the same.
 
@@ -213,17 +612,8 @@ class CnpjCheckDigits:
                 "Repeated digits are not considered valid.",
             )
 
-    def _calculate(self, cnpj_sequence: tuple[str, ...] | list[str]) -> int:
-        """Compute a single check digit using the standard CNPJ modulo-11
+    def _calculate(self, cnpj_base: str) -> tuple[int, int]:
+        """Compute both check digits using the standard CNPJ modulo-11
         algorithm.
         """
-        length = len(cnpj_sequence)
-        sum_result = 0
-
-        for index in range(length - 1, -1, -1):
-            char_value = ord(cnpj_sequence[index]) - _DELTA_FACTOR
-            sum_result += char_value * _WEIGHTS[(length - 1 - index) % 8]
-
-        remainder = sum_result % 11
-
-        return 0 if remainder < 2 else 11 - remainder
+        return _calculate_digits(cnpj_base)
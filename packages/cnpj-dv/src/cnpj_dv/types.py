@@ -1,9 +1,10 @@
-CnpjInput = str | list[str]
+CnpjInput = str | bytes | bytearray | memoryview | list[str]
 """Represents valid input types for CNPJ check digits.
 
 A CNPJ can be provided as:
 
 - A string containing alphanumeric characters (with or without formatting)
+- A ``bytes``, ``bytearray`` or ``memoryview`` with the same ASCII content
 - A list of strings, where each string represents an alphanumeric character
   or group of alphanumeric characters.
 """
@@ -12,6 +12,7 @@ from cnpj_dv import (
     CnpjCheckDigitsInputInvalidException,
     CnpjCheckDigitsInputLengthException,
     CnpjCheckDigitsInputTypeError,
+    CnpjCheckDigitsStatus,
 )
 
 # Shared conformance fixtures: (12-char base, expected 14-char CNPJ).
@@ -257,9 +258,9 @@ class _CnpjCheckDigitsWithCalculateSpy(CnpjCheckDigits):
         self.calculate_call_count = 0
         super().__init__(cnpj_input)
 
-    def _calculate(self, cnpj_sequence):
+    def _calculate(self, cnpj_base):
         self.calculate_call_count += 1
-        return super()._calculate(cnpj_sequence)
+        return super()._calculate(cnpj_base)
 
 
 def describe_cnpj_check_digits():
@@ -354,7 +355,14 @@ def describe_cnpj_check_digits():
                 }
 
                 assert len(second_results) == 1
-                assert cnpj_check_digits.calculate_call_count == 2
+                assert cnpj_check_digits.calculate_call_count == 1
+
+            def it_shares_a_single_calculation_with_the_first_digit():
+                cnpj_check_digits = _CnpjCheckDigitsWithCalculateSpy("914157320007")
+
+                assert cnpj_check_digits.first == "9"
+                assert cnpj_check_digits.second == "3"
+                assert cnpj_check_digits.calculate_call_count == 1
 
     def describe_both_digits():
         @pytest.mark.parametrize(("base", "full"), TEST_CASES)
@@ -409,3 +417,201 @@ def describe_cnpj_check_digits():
                 assert cnpj_check_digits.first == "9"
                 assert cnpj_check_digits.second == "3"
                 assert cnpj_check_digits.cnpj == "91415732000793"
+
+    def describe_when_given_bytes_like_input():
+        @pytest.mark.parametrize("bytes_type", [bytes, bytearray, memoryview])
+        @pytest.mark.parametrize(("base", "full"), TEST_CASES)
+        def it_matches_the_string_input(bytes_type, base, full):
+            cnpj_input = bytes_type(base.encode())
+
+            assert CnpjCheckDigits(cnpj_input).cnpj == full
+            assert CnpjCheckDigits.complete_many([cnpj_input]) == [full]
+            assert CnpjCheckDigits.classify(cnpj_input) == (
+                CnpjCheckDigitsStatus.OK,
+                full[-2:],
+            )
+
+        def it_strips_formatting_and_uppercases_the_bytes():
+            assert CnpjCheckDigits(b"mg.kgm.j9x/0001-68").cnpj == "MGKGMJ9X000168"
+
+        def it_accepts_memoryview_slices():
+            buffer = memoryview(b"91415732000793;MGKGMJ9X000168")
+
+            assert CnpjCheckDigits.complete_many([buffer[:12], buffer[15:27]]) == [
+                "91415732000793",
+                "MGKGMJ9X000168",
+            ]
+
+        @pytest.mark.parametrize(
+            ("cnpj_input", "status"),
+            [
+                (b"12345678910", CnpjCheckDigitsStatus.INVALID_LENGTH),
+                (b"00.000.000/0001", CnpjCheckDigitsStatus.INVALID_BASE_ID),
+                (b"12.345.678/0000", CnpjCheckDigitsStatus.INVALID_BRANCH_ID),
+                (b"77.777.777/7777", CnpjCheckDigitsStatus.REPEATED_DIGITS),
+            ],
+        )
+        def it_classifies_ineligible_bytes_without_raising(cnpj_input, status):
+            assert CnpjCheckDigits.classify(cnpj_input) == (status, None)
+
+        def it_raises_length_exception_showing_the_original_bytes():
+            with pytest.raises(CnpjCheckDigitsInputLengthException) as exc_info:
+                CnpjCheckDigits(b"123")
+
+            assert str(exc_info.value) == (
+                "CNPJ input b'123' does not contain 12 to 14 characters. Got 3 in \"123\"."
+            )
+
+        def it_completes_branches_given_as_bytes():
+            assert CnpjCheckDigits.complete_branches(
+                b"91415732", [b"0007", "0001"]
+            ) == [
+                "91415732000793",
+                CnpjCheckDigits("914157320001").cnpj,
+            ]
+
+    def describe_complete_many():
+        def it_returns_the_full_cnpj_for_each_base_in_order():
+            bases = [base for base, _ in TEST_CASES]
+
+            assert CnpjCheckDigits.complete_many(bases) == [
+                full for _, full in TEST_CASES
+            ]
+
+        def it_accepts_any_iterable_of_supported_inputs():
+            cnpj_inputs = iter(["91.415.732/0007", ["MG", "KGM", "J9X", "0001"]])
+
+            assert CnpjCheckDigits.complete_many(cnpj_inputs) == [
+                "91415732000793",
+                "MGKGMJ9X000168",
+            ]
+
+        def it_returns_an_empty_list_for_an_empty_iterable():
+            assert CnpjCheckDigits.complete_many([]) == []
+
+        @pytest.mark.parametrize(
+            "cnpj_input",
+            [
+                *INVALID_LENGTH_INPUTS,
+                *INVALID_BASE_ID_INPUTS,
+                *INVALID_BRANCH_ID_INPUTS,
+                *REPEATED_DIGIT_INPUTS,
+            ],
+        )
+        def it_maps_ineligible_inputs_to_none(cnpj_input):
+            assert CnpjCheckDigits.complete_many(["914157320007", cnpj_input]) == [
+                "91415732000793",
+                None,
+            ]
+
+        @pytest.mark.parametrize("cnpj_input", INVALID_TYPE_INPUTS)
+        def it_raises_input_type_error_for_invalid_items(cnpj_input):
+            with pytest.raises(CnpjCheckDigitsInputTypeError):
+                CnpjCheckDigits.complete_many(["914157320007", cnpj_input])
+
+        @pytest.mark.parametrize("cnpj_input", REPEATED_LETTER_INPUTS)
+        def it_matches_the_constructor_for_repeated_letters(cnpj_input):
+            assert CnpjCheckDigits.complete_many([cnpj_input]) == [
+                CnpjCheckDigits(cnpj_input).cnpj
+            ]
+
+    def describe_complete_branches():
+        @pytest.mark.parametrize(("base", "full"), TEST_CASES)
+        def it_matches_complete_many_for_each_base_and_branch(base, full):
+            assert CnpjCheckDigits.complete_branches(base[:8], [base[8:]]) == [full]
+
+        def it_completes_many_branches_of_one_base_id_in_order():
+            branch_ids = ["0001", "0007", "A1B2", "ZZZZ"]
+
+            assert CnpjCheckDigits.complete_branches("91415732", branch_ids) == (
+                CnpjCheckDigits.complete_many(
+                    [f"91415732{branch}" for branch in branch_ids]
+                )
+            )
+
+        def it_accepts_formatted_and_lowercase_ids_with_trailing_check_digits():
+            assert CnpjCheckDigits.complete_branches(
+                "mg.kgm.j9x", ["/0001-68", "0001"]
+            ) == [
+                "MGKGMJ9X000168",
+                "MGKGMJ9X000168",
+            ]
+
+        def it_returns_an_empty_list_for_an_empty_iterable():
+            assert CnpjCheckDigits.complete_branches("91415732", []) == []
+
+        @pytest.mark.parametrize("branch_id", ["", "000", "0001234", "0000", "00.00"])
+        def it_maps_ineligible_branch_ids_to_none(branch_id):
+            assert CnpjCheckDigits.complete_branches(
+                "91415732", ["0007", branch_id]
+            ) == [
+                "91415732000793",
+                None,
+            ]
+
+        @pytest.mark.parametrize("base_id", ["", "9141573", "914157320", "00.000.000"])
+        def it_maps_every_branch_to_none_for_an_ineligible_base_id(base_id):
+            assert CnpjCheckDigits.complete_branches(base_id, ["0001", "0007"]) == [
+                None,
+                None,
+            ]
+
+        @pytest.mark.parametrize("digit", "123456789")
+        def it_maps_repeated_digits_to_none(digit):
+            assert CnpjCheckDigits.complete_branches(
+                digit * 8, [digit * 4, "0001"]
+            ) == [
+                None,
+                CnpjCheckDigits(digit * 8 + "0001").cnpj,
+            ]
+
+        @pytest.mark.parametrize("invalid_input", [None, 91415732, ["9141", "5732"]])
+        def it_raises_input_type_error_for_a_non_string_base_id(invalid_input):
+            with pytest.raises(CnpjCheckDigitsInputTypeError):
+                CnpjCheckDigits.complete_branches(invalid_input, ["0001"])
+
+        @pytest.mark.parametrize("invalid_input", [None, 1, ["0", "0", "0", "1"]])
+        def it_raises_input_type_error_for_a_non_string_branch_id(invalid_input):
+            with pytest.raises(CnpjCheckDigitsInputTypeError):
+                CnpjCheckDigits.complete_branches("91415732", ["0001", invalid_input])
+
+    def describe_classify():
+        @pytest.mark.parametrize(("base", "full"), TEST_CASES)
+        def it_returns_ok_and_both_check_digits_for_eligible_bases(base, full):
+            assert CnpjCheckDigits.classify(base) == (
+                CnpjCheckDigitsStatus.OK,
+                full[-2:],
+            )
+
+        def it_accepts_the_same_formats_as_the_constructor():
+            assert CnpjCheckDigits.classify(["mg", "kgm", "j9x", "/0001-68"]) == (
+                CnpjCheckDigitsStatus.OK,
+                "68",
+            )
+
+        @pytest.mark.parametrize(
+            ("cnpj_inputs", "status"),
+            [
+                (INVALID_LENGTH_INPUTS, CnpjCheckDigitsStatus.INVALID_LENGTH),
+                (INVALID_BASE_ID_INPUTS, CnpjCheckDigitsStatus.INVALID_BASE_ID),
+                (INVALID_BRANCH_ID_INPUTS, CnpjCheckDigitsStatus.INVALID_BRANCH_ID),
+                (REPEATED_DIGIT_INPUTS, CnpjCheckDigitsStatus.REPEATED_DIGITS),
+            ],
+        )
+        def it_returns_the_status_of_ineligible_inputs_without_raising(
+            cnpj_inputs, status
+        ):
+            for cnpj_input in cnpj_inputs:
+                assert CnpjCheckDigits.classify(cnpj_input) == (status, None)
+
+        @pytest.mark.parametrize("cnpj_input", REPEATED_LETTER_INPUTS)
+        def it_accepts_repeated_letters(cnpj_input):
+            assert CnpjCheckDigits.classify(cnpj_input) == (
+                CnpjCheckDigitsStatus.OK,
+                CnpjCheckDigits(cnpj_input).both,
+            )
+
+        @pytest.mark.parametrize("cnpj_input", INVALID_TYPE_INPUTS)
+        def it_raises_input_type_error_for_invalid_types(cnpj_input):
+            with pytest.raises(CnpjCheckDigitsInputTypeError):
+                CnpjCheckDigits.classify(cnpj_input)
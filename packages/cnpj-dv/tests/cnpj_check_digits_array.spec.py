@@ -0,0 +1,122 @@
+"""Spec for :meth:`cnpj_dv.CnpjCheckDigits.calculate_array`.
+
+The pure-Python API is the reference: every row of the matrix must yield the
+same check digits and eligibility as :meth:`CnpjCheckDigits.classify` on the
+same characters. Skipped when the optional ``numpy`` extra is not installed.
+"""
+
+import random
+
+import pytest
+from cnpj_dv import (
+    CnpjCheckDigits,
+    CnpjCheckDigitsInputTypeError,
+    CnpjCheckDigitsStatus,
+)
+
+np = pytest.importorskip("numpy")
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+def _to_matrix(bases: list[str]):
+    return np.frombuffer("".join(bases).encode(), np.uint8).reshape(len(bases), -1)
+
+
+def _reference(base: str) -> tuple[list[int], bool]:
+    status, check_digits = CnpjCheckDigits.classify(base)
+
+    if status is not CnpjCheckDigitsStatus.OK:
+        return [], False
+
+    return [int(digit) for digit in check_digits], True
+
+
+def describe_calculate_array():
+    def describe_when_given_eligible_bases():
+        def it_matches_the_pure_python_check_digits():
+            rng = random.Random(0)
+            bases = ["".join(rng.choices(_ALPHABET, k=12)) for _ in range(2_000)]
+
+            check_digits, eligible = CnpjCheckDigits.calculate_array(_to_matrix(bases))
+
+            for base, row_digits, row_eligible in zip(
+                bases, check_digits.tolist(), eligible.tolist(), strict=True
+            ):
+                expected_digits, expected_eligible = _reference(base)
+
+                assert row_eligible is expected_eligible
+
+                if expected_eligible:
+                    assert row_digits == expected_digits
+
+        def it_returns_uint8_digits_and_a_boolean_mask():
+            check_digits, eligible = CnpjCheckDigits.calculate_array(
+                _to_matrix(["914157320007", "MGKGMJ9X0001"])
+            )
+
+            assert check_digits.dtype == np.uint8
+            assert check_digits.tolist() == [[9, 3], [6, 8]]
+            assert eligible.dtype == np.bool_
+            assert eligible.tolist() == [True, True]
+
+        def it_ignores_the_check_digit_columns_of_full_cnpjs():
+            check_digits, _ = CnpjCheckDigits.calculate_array(
+                _to_matrix(["91415732000700"])
+            )
+
+            assert check_digits.tolist() == [[9, 3]]
+
+        def it_returns_empty_results_for_an_empty_matrix():
+            check_digits, eligible = CnpjCheckDigits.calculate_array(
+                np.empty((0, 12), np.uint8)
+            )
+
+            assert check_digits.shape == (0, 2)
+            assert eligible.shape == (0,)
+
+    def describe_when_given_ineligible_bases():
+        @pytest.mark.parametrize(
+            "base",
+            [
+                "000000000001",
+                "123456780000",
+                "777777777777",
+                "000000000000",
+                "91.415.73200",
+                "91415732 007",
+            ],
+        )
+        def it_masks_the_row_out(base):
+            _, eligible = CnpjCheckDigits.calculate_array(
+                _to_matrix(["914157320007", base])
+            )
+
+            assert eligible.tolist() == [True, False]
+
+        def it_keeps_repeated_letters_eligible():
+            check_digits, eligible = CnpjCheckDigits.calculate_array(
+                _to_matrix(["AAAAAAAAAAAA"])
+            )
+
+            assert eligible.tolist() == [True]
+            assert (
+                "".join(map(str, check_digits[0]))
+                == CnpjCheckDigits("AAAAAAAAAAAA").both
+            )
+
+    def describe_when_given_an_invalid_array():
+        @pytest.mark.parametrize(
+            "cnpj_chars",
+            [
+                "914157320007",
+                [[57, 49, 52, 49, 53, 55, 51, 50, 48, 48, 48, 55]],
+                np.zeros((2, 12), np.int64),
+                np.zeros(12, np.uint8),
+                np.zeros((2, 11), np.uint8),
+                np.zeros((2, 15), np.uint8),
+            ],
+        )
+        def it_raises_input_type_error(cnpj_chars):
+            with pytest.raises(CnpjCheckDigitsInputTypeError):
+                CnpjCheckDigits.calculate_array(cnpj_chars)
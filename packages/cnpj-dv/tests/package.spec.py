@@ -10,8 +10,12 @@ export). Those concern JS packaging only and have no Python equivalent.
 
 import cnpj_dv
 from cnpj_dv import (
+    CNPJ_CHECK_DIGIT_BY_REMAINDER,
+    CNPJ_FIRST_WEIGHTS,
     CNPJ_MAX_LENGTH,
     CNPJ_MIN_LENGTH,
+    CNPJ_SECOND_DIGIT_WEIGHT,
+    CNPJ_SECOND_WEIGHTS,
     CnpjCheckDigits,
     CnpjCheckDigitsException,
     CnpjCheckDigitsInputInvalidException,
@@ -29,6 +33,14 @@ def describe_the_cnpj_dv_package_api():
         def it_exposes_cnpj_max_length():
             assert CNPJ_MAX_LENGTH == 14
 
+        def it_exposes_the_check_digit_weights():
+            assert CNPJ_FIRST_WEIGHTS == (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+            assert CNPJ_SECOND_WEIGHTS == (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3)
+            assert CNPJ_SECOND_DIGIT_WEIGHT == 2
+
+        def it_exposes_the_check_digit_by_remainder_table():
+            assert CNPJ_CHECK_DIGIT_BY_REMAINDER == (0, 0, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+
     def describe_when_inspecting_public_names():
         def it_exports_all_public_resources():
             expected_names = {
@@ -38,9 +50,14 @@ def describe_the_cnpj_dv_package_api():
                 "CnpjCheckDigitsException",
                 "CnpjCheckDigitsInputInvalidException",
                 "CnpjCheckDigitsInputLengthException",
+                "CnpjCheckDigitsStatus",
                 "CnpjInput",
                 "CNPJ_MIN_LENGTH",
                 "CNPJ_MAX_LENGTH",
+                "CNPJ_FIRST_WEIGHTS",
+                "CNPJ_SECOND_WEIGHTS",
+                "CNPJ_SECOND_DIGIT_WEIGHT",
+                "CNPJ_CHECK_DIGIT_BY_REMAINDER",
             }
 
             assert expected_names.issubset(set(dir(cnpj_dv)))
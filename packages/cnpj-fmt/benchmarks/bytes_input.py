@@ -0,0 +1,51 @@
+"""Benchmark ``CnpjFormatter.format`` on bytes-like input against ``str``.
+
+Run from the package root with ``python benchmarks/bytes_input.py``. Prints
+the per-item cost of formatting raw CNPJs given as ``str``, as ``bytes`` and
+as ``memoryview`` slices of a single buffer, as read from a binary file.
+"""
+
+import random
+import timeit
+
+from cnpj_fmt import CnpjFormatter
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+
+    return [
+        "".join(rng.choices(_ALPHABET, k=12)) + "".join(rng.choices("0123456789", k=2))
+        for _ in range(_SAMPLE_SIZE)
+    ]
+
+
+def main() -> None:
+    formatter = CnpjFormatter()
+    str_cnpjs = _sample_cnpjs()
+    bytes_cnpjs = [cnpj.encode() for cnpj in str_cnpjs]
+    buffer = memoryview(b"".join(bytes_cnpjs))
+    size = len(bytes_cnpjs[0])
+    memoryview_cnpjs = [buffer[i : i + size] for i in range(0, len(buffer), size)]
+
+    for label, cnpj_inputs in (
+        ("str", str_cnpjs),
+        ("bytes", bytes_cnpjs),
+        ("memoryview", memoryview_cnpjs),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda i=cnpj_inputs: [formatter.format(cnpj) for cnpj in i],
+                number=1,
+                repeat=_REPEAT,
+            )
+        )
+        print(f"{label:>10}: {best / len(cnpj_inputs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
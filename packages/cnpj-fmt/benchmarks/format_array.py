@@ -0,0 +1,39 @@
+"""Benchmark ``CnpjFormatter.format_array`` against ``format_many``.
+
+Run from the package root with ``python benchmarks/format_array.py``
+(requires the ``numpy`` extra). Prints the per-row cost of masking the same
+raw CNPJs with ``format_many`` and as a single NumPy ``U14`` array.
+"""
+
+import random
+import timeit
+
+import numpy as np
+from cnpj_fmt import CnpjFormatter
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 200_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+
+    return ["".join(rng.choices(_ALPHABET, k=14)) for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    formatter = CnpjFormatter(hidden=True)
+    cnpjs = _sample_cnpjs()
+    array = np.array(cnpjs, dtype="U14")
+
+    for label, run in (
+        ("format_many", lambda: formatter.format_many(cnpjs)),
+        ("format_array", lambda: formatter.format_array(array)),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=_REPEAT))
+        print(f"{label:>12}: {best / len(cnpjs) * 1e9:8.1f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
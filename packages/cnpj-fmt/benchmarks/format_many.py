@@ -0,0 +1,50 @@
+"""Benchmark ``CnpjFormatter.format_many`` against per-item ``format`` calls.
+
+Run from the package root with ``python benchmarks/format_many.py``. Prints
+the per-item cost of formatting a report column in which one value in ten
+has an invalid length, with masking and per-call options, for each way of
+handling the invalid values.
+"""
+
+import random
+import timeit
+
+from cnpj_fmt import CnpjFormatter
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+    cnpjs = []
+
+    for index in range(_SAMPLE_SIZE):
+        size = 13 if index % 10 == 0 else 14
+        cnpjs.append("".join(rng.choices(_ALPHABET, k=size)))
+
+    return cnpjs
+
+
+def main() -> None:
+    formatter = CnpjFormatter()
+    cnpjs = _sample_cnpjs()
+
+    def per_item() -> list[str]:
+        return [formatter.format(cnpj, hidden=True) for cnpj in cnpjs]
+
+    for label, run in (
+        ("format", per_item),
+        ("collect", lambda: formatter.format_many(cnpjs, hidden=True)),
+        (
+            "callback",
+            lambda: formatter.format_many(cnpjs, hidden=True, errors="callback"),
+        ),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=_REPEAT))
+        print(f"{label:>10}: {best / len(cnpjs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
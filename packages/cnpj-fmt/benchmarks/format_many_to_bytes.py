@@ -0,0 +1,49 @@
+"""Benchmark ``CnpjFormatter.format_many_to_bytes`` against encoding and
+joining per-item ``format`` results.
+
+Run from the package root with ``python benchmarks/format_many_to_bytes.py``.
+Prints the per-item cost of turning a column of raw CNPJs into
+newline-separated bytes, as a CSV or HTTP writer would, and of writing the
+same records into a preallocated ``bytearray``.
+"""
+
+import random
+import timeit
+
+from cnpj_fmt import CnpjFormatter
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+
+    return ["".join(rng.choices(_ALPHABET, k=14)) for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    formatter = CnpjFormatter()
+    cnpjs = _sample_cnpjs()
+    buffer = bytearray(19 * len(cnpjs))
+
+    def encode_and_join() -> bytes:
+        return b"".join(formatter.format(cnpj).encode() + b"\n" for cnpj in cnpjs)
+
+    for label, run in (
+        ("format", encode_and_join),
+        ("to_bytes", lambda: formatter.format_many_to_bytes(cnpjs, separator=b"\n")),
+        (
+            "into buffer",
+            lambda: formatter.format_many_to_bytes(
+                cnpjs, buffer=buffer, separator=b"\n"
+            ),
+        ),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=_REPEAT))
+        print(f"{label:>11}: {best / len(cnpjs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark ``CnpjIncrementalFormatter`` against re-formatting the whole
+field on every keystroke.
+
+Run from the package root with ``python benchmarks/incremental.py``. Types
+the same CNPJs one character at a time, reading the masked value after each
+keystroke, and prints the per-keystroke cost of pushing into an incremental
+formatter and of calling ``CnpjFormatter.format`` on the text typed so far
+(which goes through ``on_fail`` until the CNPJ is complete).
+"""
+
+import random
+import timeit
+
+from cnpj_fmt import CnpjFormatter, CnpjIncrementalFormatter
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 2_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+
+    return ["".join(rng.choices(_ALPHABET, k=14)) for _ in range(_SAMPLE_SIZE)]
+
+
+def _type_incrementally(cnpjs: list[str]) -> None:
+    formatter = CnpjIncrementalFormatter()
+
+    for cnpj in cnpjs:
+        formatter.clear()
+
+        for char in cnpj:
+            formatter.push(char)
+            formatter.value  # noqa: B018
+
+
+def _reformat_each_keystroke(cnpjs: list[str]) -> None:
+    formatter = CnpjFormatter(on_fail=lambda value, _error: value)
+
+    for cnpj in cnpjs:
+        for end in range(1, len(cnpj) + 1):
+            formatter.format(cnpj[:end])
+
+
+def main() -> None:
+    cnpjs = _sample_cnpjs()
+    keystrokes = sum(len(cnpj) for cnpj in cnpjs)
+
+    for label, run in (
+        ("incremental", _type_incrementally),
+        ("reformat", _reformat_each_keystroke),
+    ):
+        best = min(timeit.repeat(lambda run=run: run(cnpjs), number=1, repeat=_REPEAT))
+        print(f"{label:>11}: {best / keystrokes * 1e9:8.1f} ns/keystroke")
+
+
+if __name__ == "__main__":
+    main()
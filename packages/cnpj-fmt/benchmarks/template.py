@@ -0,0 +1,48 @@
+"""Benchmark ``CnpjFormatter.format`` with ``template`` masks against the
+built-in mask.
+
+Run from the package root with ``python benchmarks/template.py``. Prints the
+per-call cost of formatting the same CNPJs with the default options, with a
+template equal to the built-in mask and with custom templates. Templates
+compile into the same kind of plan as the delimiter keys, so all of them
+should cost about the same.
+"""
+
+import random
+import timeit
+
+from cnpj_fmt import CnpjFormatter
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+
+    return ["".join(rng.choices(_ALPHABET, k=14)) for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    cnpjs = _sample_cnpjs()
+
+    for label, formatter in (
+        ("built-in", CnpjFormatter()),
+        ("same mask", CnpjFormatter(template="##.###.###/####-##")),
+        ("no dots", CnpjFormatter(template="########/####-##")),
+        ("spaced", CnpjFormatter(template="## ### ### #### ##")),
+        ("hidden", CnpjFormatter(template="## ### ### #### ##", hidden=True)),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda formatter=formatter: [formatter.format(cnpj) for cnpj in cnpjs],
+                number=1,
+                repeat=_REPEAT,
+            )
+        )
+        print(f"{label:>9}: {best / len(cnpjs) * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
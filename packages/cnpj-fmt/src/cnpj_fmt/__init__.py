@@ -1,12 +1,14 @@
 from .cnpj_fmt import cnpj_fmt
 from .cnpj_formatter import CnpjFormatter
 from .cnpj_formatter_options import CNPJ_LENGTH, CnpjFormatterOptions
+from .cnpj_incremental_formatter import CnpjIncrementalFormatter
 from .exceptions import (
     CnpjFormatterException,
     CnpjFormatterInputLengthException,
     CnpjFormatterInputTypeError,
     CnpjFormatterOptionsForbiddenKeyCharacterException,
     CnpjFormatterOptionsHiddenRangeInvalidException,
+    CnpjFormatterOptionsTemplateInvalidException,
     CnpjFormatterOptionsTypeError,
     CnpjFormatterTypeError,
 )
@@ -21,8 +23,10 @@ __all__ = [
     "CnpjFormatterOptions",
     "CnpjFormatterOptionsForbiddenKeyCharacterException",
     "CnpjFormatterOptionsHiddenRangeInvalidException",
+    "CnpjFormatterOptionsTemplateInvalidException",
     "CnpjFormatterOptionsTypeError",
     "CnpjFormatterTypeError",
+    "CnpjIncrementalFormatter",
     "CnpjInput",
     "cnpj_fmt",
 ]
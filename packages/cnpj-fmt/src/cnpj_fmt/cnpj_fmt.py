@@ -19,6 +19,7 @@ def cnpj_fmt(
     dot_key: str | None = None,
     slash_key: str | None = None,
     dash_key: str | None = None,
+    template: str | None = None,
     escape: bool | None = None,
     encode: bool | None = None,
     on_fail: OnFailCallback | None = None,
@@ -39,6 +40,8 @@ def cnpj_fmt(
             ``hidden_start`` or ``hidden_end`` are out of valid range.
         CnpjFormatterOptionsForbiddenKeyCharacterException: If any key
             option contains a disallowed character.
+        CnpjFormatterOptionsTemplateInvalidException: If ``template``
+            does not have exactly 14 ``#`` slots.
 
     See Also:
         :class:`CnpjFormatter` for detailed option descriptions.
@@ -52,6 +55,7 @@ def cnpj_fmt(
         dot_key=dot_key,
         slash_key=slash_key,
         dash_key=dash_key,
+        template=template,
         escape=escape,
         encode=encode,
         on_fail=on_fail,
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import html
 import re
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
+from lacus.utils import LruCache
+
 from .cnpj_formatter_options import CNPJ_LENGTH, CnpjFormatterOptions
 from .exceptions import (
     CnpjFormatterInputLengthException,
@@ -16,14 +19,30 @@ from .exceptions import (
 )
 
 if TYPE_CHECKING:
-    from .types import CnpjFormatterOptionsInput, CnpjInput, OnFailCallback
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    import numpy as np
 
-HIDDEN_KEY_PLACEHOLDER = CnpjFormatterOptions.DISALLOWED_KEY_CHARACTERS[0]
-"""A rarely-used 1-length character that is replaced with ``hidden_key``
-when ``hidden`` is ``True``.
-"""
+    from .types import (
+        CnpjFormatterOptionsInput,
+        CnpjInput,
+        FormatManyErrors,
+        OnFailCallback,
+    )
 
 _ALPHANUMERIC_PATTERN = re.compile(r"[^0-9A-Za-z]")
+_NON_ALPHANUMERIC_BYTES = bytes(
+    code for code in range(256) if not (chr(code).isascii() and chr(code).isalnum())
+)
+_BYTES_INPUT_TYPES = (bytes, bytearray, memoryview)
+_EXPECTED_INPUT_TYPE = "string, bytes or string[]"
+_EXPECTED_ARRAY_TYPE = "string or bytes array"
+_ARRAY_CHUNK_SIZE = 1 << 16
+_CACHEABLE_INPUT_TYPES = (str, bytes)
+_RESOLVED_OPTIONS_CACHE_SIZE = 32
+_FORMAT_PLAN_CACHE_SIZE = 64
+_FORMAT_MANY_ERRORS = ("collect", "callback", "raise")
 
 
 def _sanitize_cnpj_input(value: str) -> str:
@@ -39,6 +58,29 @@ def _sanitize_cnpj_input(value: str) -> str:
     return sanitized.upper()
 
 
+def _sanitize_cnpj_bytes(value: bytes | bytearray | memoryview) -> str:
+    """Strip non-alphanumeric bytes with ``bytes.translate`` and uppercase
+    the remainder, decoding only the sanitized ASCII characters.
+    """
+    sanitized = bytes(value).translate(None, _NON_ALPHANUMERIC_BYTES)
+
+    return sanitized.upper().decode("ascii")
+
+
+def _import_numpy() -> ModuleType:
+    """Import NumPy for the array API, pointing to the optional extra when it
+    is not installed.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            'NumPy is required for array input. Install it with "pip install cnpj-fmt[numpy]".'
+        ) from error
+
+    return numpy
+
+
 def _has_per_call_overrides(
     options: CnpjFormatterOptionsInput,
     *,
@@ -49,6 +91,7 @@ def _has_per_call_overrides(
     dot_key: str | None = None,
     slash_key: str | None = None,
     dash_key: str | None = None,
+    template: str | None = None,
     escape: bool | None = None,
     encode: bool | None = None,
     on_fail: OnFailCallback | None = None,
@@ -62,6 +105,7 @@ def _has_per_call_overrides(
         or dot_key is not None
         or slash_key is not None
         or dash_key is not None
+        or template is not None
         or escape is not None
         or encode is not None
         or on_fail is not None
@@ -77,6 +121,7 @@ def _per_call_option_overrides(
     dot_key: str | None = None,
     slash_key: str | None = None,
     dash_key: str | None = None,
+    template: str | None = None,
     escape: bool | None = None,
     encode: bool | None = None,
     on_fail: OnFailCallback | None = None,
@@ -97,6 +142,8 @@ def _per_call_option_overrides(
         overrides["slash_key"] = slash_key
     if dash_key is not None:
         overrides["dash_key"] = dash_key
+    if template is not None:
+        overrides["template"] = template
     if escape is not None:
         overrides["escape"] = escape
     if encode is not None:
@@ -107,6 +154,223 @@ def _per_call_option_overrides(
     return overrides
 
 
+def _items_key(mapping: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple((name, value.__class__, value) for name, value in mapping.items())
+
+
+def _override_key(
+    options: CnpjFormatterOptionsInput, keyword_overrides: dict[str, Any]
+) -> tuple[Any, ...] | None:
+    """Return a hashable key identifying a set of per-call overrides, or
+    ``None`` when one of them cannot be hashed.
+
+    Values are keyed along with their class, so ``1`` does not share the
+    entry of ``True`` and still fails the type checks.
+    """
+    if options is None:
+        options_key = None
+    elif isinstance(options, CnpjFormatterOptions):
+        options_key = _items_key(options.all)
+    elif isinstance(options, dict):
+        options_key = _items_key(options)
+    else:
+        return None
+
+    key = (options_key, _items_key(keyword_overrides))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _encode_literal(text: str, escape: bool, encode: bool) -> str:
+    """HTML-escape and URL-encode a delimiter or ``hidden_key``.
+
+    Formatted CNPJs only get these transformations applied to their literal
+    parts, since both leave the sanitized ASCII letters and digits unchanged
+    and work character by character.
+    """
+    if escape:
+        text = html.escape(text, quote=True)
+
+    if encode:
+        text = quote(text, safe="")
+
+    return text
+
+
+def _mask_literals(
+    template: str | None, dot_key: str, slash_key: str, dash_key: str
+) -> list[str]:
+    """Return the 15 literal runs of a mask: the text before the first CNPJ
+    character, between each pair of characters, and after the last one.
+
+    They are the parts of ``template`` around its ``#`` slots or, without a
+    template, the delimiter keys placed as in ``XX.XXX.XXX/XXXX-XX``.
+    """
+    if template is not None:
+        return template.split(CnpjFormatterOptions.TEMPLATE_SLOT)
+
+    literals = [""] * (CNPJ_LENGTH + 1)
+    literals[2] = literals[5] = dot_key
+    literals[8] = slash_key
+    literals[12] = dash_key
+
+    return literals
+
+
+@lru_cache(maxsize=_FORMAT_PLAN_CACHE_SIZE)
+def _compile_format_plan(
+    hidden: bool,
+    hidden_key: str,
+    hidden_start: int,
+    hidden_end: int,
+    dot_key: str,
+    slash_key: str,
+    dash_key: str,
+    template: str | None,
+    escape: bool,
+    encode: bool,
+) -> str:
+    """Compile formatting options into a ``%``-template that formats a
+    sanitized CNPJ in one step: ``plan % tuple(sanitized_cnpj)``.
+
+    Each character is a ``%s`` field, or a ``%.0s`` field (which consumes the
+    character without printing it) followed by ``hidden_key`` when it is
+    hidden, with the literal runs of the mask in between.
+    """
+    hidden_field = "%.0s" + _encode_literal(hidden_key, escape, encode).replace(
+        "%", "%%"
+    )
+    literals = [
+        _encode_literal(literal, escape, encode).replace("%", "%%")
+        for literal in _mask_literals(template, dot_key, slash_key, dash_key)
+    ]
+    parts = [literals[0]]
+
+    for index in range(CNPJ_LENGTH):
+        parts.append(
+            hidden_field if hidden and hidden_start <= index <= hidden_end else "%s"
+        )
+        parts.append(literals[index + 1])
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=_FORMAT_PLAN_CACHE_SIZE)
+def _compile_column_layout(
+    hidden: bool,
+    hidden_key: str,
+    hidden_start: int,
+    hidden_end: int,
+    dot_key: str,
+    slash_key: str,
+    dash_key: str,
+    template: str | None,
+    escape: bool,
+    encode: bool,
+) -> tuple[int | str, ...]:
+    """Compile formatting options into the column layout of a formatted
+    CNPJ: for each output character, either the index of the sanitized
+    character copied there or the literal character written there.
+
+    Every formatted CNPJ has the same layout, so :meth:`CnpjFormatter.format_array`
+    fills whole columns at a time, and hidden characters are simply left out
+    of the copied ones.
+    """
+    hidden_columns = tuple(_encode_literal(hidden_key, escape, encode))
+    literals = [
+        _encode_literal(literal, escape, encode)
+        for literal in _mask_literals(template, dot_key, slash_key, dash_key)
+    ]
+    columns: list[int | str] = list(literals[0])
+
+    for index in range(CNPJ_LENGTH):
+        if hidden and hidden_start <= index <= hidden_end:
+            columns.extend(hidden_columns)
+        else:
+            columns.append(index)
+
+        columns.extend(literals[index + 1])
+
+    return tuple(columns)
+
+
+def _format_plan_of(options: CnpjFormatterOptions) -> str:
+    return _compile_format_plan(
+        options.hidden,
+        options.hidden_key,
+        options.hidden_start,
+        options.hidden_end,
+        options.dot_key,
+        options.slash_key,
+        options.dash_key,
+        options.template,
+        options.escape,
+        options.encode,
+    )
+
+
+def _column_layout_of(options: CnpjFormatterOptions) -> tuple[int | str, ...]:
+    return _compile_column_layout(
+        options.hidden,
+        options.hidden_key,
+        options.hidden_start,
+        options.hidden_end,
+        options.dot_key,
+        options.slash_key,
+        options.dash_key,
+        options.template,
+        options.escape,
+        options.encode,
+    )
+
+
+def _format_char_codes(
+    np: ModuleType,
+    char_codes: np.ndarray,
+    layout: tuple[int | str, ...],
+    output: np.ndarray,
+) -> None:
+    """Format a matrix of character codes, one CNPJ per row, into the rows
+    of ``output`` (a zeroed matrix of output character codes).
+
+    Mirrors :meth:`CnpjFormatter.format`: ASCII letters and digits are kept
+    and uppercased, and rows that keep exactly 14 of them get the sanitized
+    characters scattered into their layout columns and the literal
+    characters broadcast into the others. Other rows stay zeroed, which
+    reads as an empty string.
+    """
+    keep = (
+        ((char_codes >= ord("0")) & (char_codes <= ord("9")))
+        | ((char_codes >= ord("A")) & (char_codes <= ord("Z")))
+        | ((char_codes >= ord("a")) & (char_codes <= ord("z")))
+    )
+    rows = np.flatnonzero(keep.sum(axis=1) == CNPJ_LENGTH)
+
+    if not len(rows):
+        return
+
+    sanitized = char_codes[rows][keep[rows]].reshape(len(rows), CNPJ_LENGTH)
+    is_lowercase = sanitized >= ord("a")
+    sanitized = np.where(is_lowercase, sanitized - (ord("a") - ord("A")), sanitized)
+    source_columns = [
+        column for column, item in enumerate(layout) if item.__class__ is int
+    ]
+    literal_columns = [
+        column for column, item in enumerate(layout) if item.__class__ is str
+    ]
+    formatted = np.zeros((len(rows), output.shape[1]), output.dtype)
+    formatted[:, source_columns] = sanitized[
+        :, [layout[column] for column in source_columns]
+    ]
+    formatted[:, literal_columns] = [ord(layout[column]) for column in literal_columns]
+    output[rows] = formatted
+
+
 def _invoke_on_fail(
     on_fail: OnFailCallback,
     cnpj_input: CnpjInput,
@@ -120,6 +384,34 @@ def _invoke_on_fail(
     return result
 
 
+def _writable_view(
+    buffer: bytearray | memoryview, offset: int, size: int
+) -> memoryview:
+    """Return the ``size`` bytes of ``buffer`` starting at ``offset`` as a
+    writable byte view.
+
+    Raises:
+        TypeError: If ``buffer`` is not a writable buffer.
+        ValueError: If ``offset`` is negative or the buffer is too small.
+    """
+    view = memoryview(buffer)
+
+    if view.readonly:
+        raise TypeError("buffer must be writable")
+
+    view = view.cast("B")
+
+    if offset < 0:
+        raise ValueError(f"offset must not be negative, got {offset}")
+
+    if offset + size > len(view):
+        raise ValueError(
+            f"{size} bytes do not fit in a buffer of {len(view)} bytes at offset {offset}"
+        )
+
+    return view[offset : offset + size]
+
+
 class CnpjFormatter:
     """Formatter for CNPJ identifiers.
 
@@ -131,7 +423,14 @@ class CnpjFormatter:
     of throwing.
     """
 
-    __slots__ = ("_options",)
+    __slots__ = (
+        "_cache",
+        "_cache_version",
+        "_options",
+        "_plan",
+        "_plan_version",
+        "_resolved_options",
+    )
 
     def __init__(
         self,
@@ -144,9 +443,11 @@ class CnpjFormatter:
         dot_key: str | None = None,
         slash_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: OnFailCallback | None = None,
+        cache_size: int | None = None,
     ) -> None:
         """Create a new formatter with optional default options.
 
@@ -162,6 +463,11 @@ class CnpjFormatter:
         per-call options. When a plain mapping or nothing is passed, a
         new :class:`CnpjFormatterOptions` instance is created from it.
 
+        A positive ``cache_size`` enables an LRU cache of up to that many
+        formatted results, keyed by the raw ``str`` or ``bytes`` input and
+        the resolved options (see :attr:`cache`). Results of failed
+        formatting are not cached, so ``on_fail`` runs on every call.
+
         Raises:
             CnpjFormatterOptionsTypeError: If any option has an invalid
                 type.
@@ -170,6 +476,8 @@ class CnpjFormatter:
                 range.
             CnpjFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
         """
         if isinstance(options, CnpjFormatterOptions):
             self._options = options
@@ -183,11 +491,32 @@ class CnpjFormatter:
                 dot_key=dot_key,
                 slash_key=slash_key,
                 dash_key=dash_key,
+                template=template,
                 escape=escape,
                 encode=encode,
                 on_fail=on_fail,
             )
 
+        self._cache: LruCache[tuple[Any, ...], str] | None = (
+            LruCache(cache_size) if cache_size else None
+        )
+        self._cache_version = self._options.version
+        self._resolved_options: (
+            LruCache[tuple[Any, ...], CnpjFormatterOptions] | None
+        ) = None
+        self._plan = ""
+        self._plan_version = -1
+
+    @property
+    def cache(self) -> LruCache[tuple[Any, ...], str] | None:
+        """Return the result cache enabled by ``cache_size``, or ``None``.
+
+        Its ``hits``, ``misses`` and ``evictions`` counters show how well
+        it serves the traffic. Entries for the default options are dropped
+        as soon as :attr:`options` is mutated.
+        """
+        return self._cache
+
     @property
     def options(self) -> CnpjFormatterOptions:
         """Return the default options used by this formatter.
@@ -211,6 +540,7 @@ class CnpjFormatter:
         dot_key: str | None = None,
         slash_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: OnFailCallback | None = None,
@@ -218,7 +548,8 @@ class CnpjFormatter:
         """Format a CNPJ value into a human-readable string.
 
         Input is normalized by stripping non-alphanumeric characters
-        and converting to uppercase. If the result length is not
+        and converting to uppercase. Bytes-like input is sanitized with
+        ``bytes.translate`` before its characters are decoded. If the result length is not
         exactly 14, the configured ``on_fail`` callback is invoked with
         the original value and an error; its return value is used as
         the result.
@@ -226,6 +557,9 @@ class CnpjFormatter:
         When valid, the result may be further transformed according to
         options:
 
+        - If ``template`` is set, the characters fill its ``#`` slots
+          instead of the mask built from ``dot_key``, ``slash_key`` and
+          ``dash_key``.
         - If ``hidden`` is ``True``, characters between
           ``hidden_start`` and ``hidden_end`` (inclusive) are replaced
           with ``hidden_key``.
@@ -240,8 +574,8 @@ class CnpjFormatter:
         keyword parameters are provided, ``options`` takes precedence.
 
         Raises:
-            CnpjFormatterInputTypeError: If the input is not a ``str``
-                or sequence of ``str``.
+            CnpjFormatterInputTypeError: If the input is not a ``str``,
+                bytes-like object or sequence of ``str``.
             CnpjFormatterOptionsTypeError: If any option has an invalid
                 type.
             CnpjFormatterOptionsHiddenRangeInvalidException: If
@@ -249,10 +583,119 @@ class CnpjFormatter:
                 range.
             CnpjFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
         """
-        actual_input = self._to_string_input(cnpj_input)
+        cache = self._cache
+        cache_key = None
+
+        if cache is not None and cnpj_input.__class__ in _CACHEABLE_INPUT_TYPES:
+            actual_options = self._resolve_options(
+                options,
+                hidden,
+                hidden_key,
+                hidden_start,
+                hidden_end,
+                dot_key,
+                slash_key,
+                dash_key,
+                template,
+                escape,
+                encode,
+                on_fail,
+            )
+            cache_key = self._cache_key(cnpj_input, actual_options)
+            cached_cnpj = cache.get(cache_key)
+
+            if cached_cnpj is not None:
+                return cached_cnpj
+
+        formatted_cnpj = self._sanitize(cnpj_input)
+
+        if cache_key is None:
+            actual_options = self._resolve_options(
+                options,
+                hidden,
+                hidden_key,
+                hidden_start,
+                hidden_end,
+                dot_key,
+                slash_key,
+                dash_key,
+                template,
+                escape,
+                encode,
+                on_fail,
+            )
+
+        if len(formatted_cnpj) != CNPJ_LENGTH:
+            if actual_options.on_fail is CnpjFormatterOptions.DEFAULT_ON_FAIL:
+                # The default callback returns "" whatever it is given, so
+                # skip building an exception just for it to be discarded.
+                return ""
+
+            exception = CnpjFormatterInputLengthException(
+                cnpj_input,
+                formatted_cnpj,
+                CNPJ_LENGTH,
+            )
+
+            return _invoke_on_fail(actual_options.on_fail, cnpj_input, exception)
 
-        if _has_per_call_overrides(
+        formatted_cnpj = self._format_plan(actual_options) % tuple(formatted_cnpj)
+
+        if cache_key is not None:
+            cache.put(cache_key, formatted_cnpj)  # type: ignore[union-attr]
+
+        return formatted_cnpj
+
+    def format_into(
+        self,
+        buffer: bytearray | memoryview,
+        offset: int,
+        cnpj_input: CnpjInput,
+        options: CnpjFormatterOptionsInput = None,
+        *,
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        slash_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+        on_fail: OnFailCallback | None = None,
+    ) -> int:
+        """Format a CNPJ value straight into a writable buffer.
+
+        Writes the UTF-8 encoding of what :meth:`format` returns under the
+        same options (plain ASCII unless a key option is not) into
+        ``buffer`` at ``offset`` and returns the number of bytes written,
+        so the next value goes at ``offset`` plus that number. With the
+        default ``on_fail``, an invalid-length input writes nothing and
+        returns ``0``.
+
+        Raises:
+            TypeError: If ``buffer`` is not a writable buffer.
+            ValueError: If ``offset`` is negative or the formatted value
+                does not fit in ``buffer`` at ``offset``; nothing is
+                written then.
+            CnpjFormatterInputTypeError: If the input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+            CnpjFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CnpjFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CnpjFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
+        """
+        data = self.format(
+            cnpj_input,
             options,
             hidden=hidden,
             hidden_key=hidden_key,
@@ -261,77 +704,427 @@ class CnpjFormatter:
             dot_key=dot_key,
             slash_key=slash_key,
             dash_key=dash_key,
+            template=template,
             escape=escape,
             encode=encode,
             on_fail=on_fail,
-        ):
-            actual_options = self._options.copy()
-            keyword_overrides = _per_call_option_overrides(
-                hidden=hidden,
-                hidden_key=hidden_key,
-                hidden_start=hidden_start,
-                hidden_end=hidden_end,
-                dot_key=dot_key,
-                slash_key=slash_key,
-                dash_key=dash_key,
-                escape=escape,
-                encode=encode,
-                on_fail=on_fail,
-            )
+        ).encode("utf-8")
+        _writable_view(buffer, offset, len(data))[:] = data
 
-            if keyword_overrides:
-                actual_options.set(keyword_overrides)
+        return len(data)
 
-            if options is not None:
-                actual_options.set(options)
-        else:
-            actual_options = self._options
+    def format_many(
+        self,
+        cnpj_inputs: Iterable[CnpjInput],
+        options: CnpjFormatterOptionsInput = None,
+        *,
+        errors: FormatManyErrors = "collect",
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        slash_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+        on_fail: OnFailCallback | None = None,
+    ) -> tuple[list[str], list[int]]:
+        """Format many CNPJ values in a single call.
 
-        formatted_cnpj = _sanitize_cnpj_input(actual_input)
+        Returns the formatted values, in input order, and the indices of the
+        inputs whose sanitized length is not 14. Options are resolved and
+        compiled once for the whole batch, and valid inputs are formatted
+        exactly as :meth:`format` formats them. ``errors`` chooses what
+        happens to the invalid ones:
 
-        if len(formatted_cnpj) != CNPJ_LENGTH:
-            exception = CnpjFormatterInputLengthException(
-                cnpj_input,
-                formatted_cnpj,
-                CNPJ_LENGTH,
+        - ``"collect"`` (default): an empty string takes their place, and no
+          exception is built nor ``on_fail`` called.
+        - ``"callback"``: ``on_fail`` is called for each of them, as
+          :meth:`format` does, and its return value takes their place.
+        - ``"raise"``: the :class:`CnpjFormatterInputLengthException` of the
+          first one is raised.
+
+        Raises:
+            ValueError: If ``errors`` is not one of the values above.
+            CnpjFormatterInputTypeError: If any input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+            CnpjFormatterInputLengthException: If ``errors`` is ``"raise"``
+                and any input has an invalid length.
+            CnpjFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CnpjFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CnpjFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
+        """
+        if errors not in _FORMAT_MANY_ERRORS:
+            raise ValueError(
+                f'errors must be "collect", "callback" or "raise", got {errors!r}'
             )
 
-            return _invoke_on_fail(actual_options.on_fail, cnpj_input, exception)
+        actual_options = self._resolve_options(
+            options,
+            hidden,
+            hidden_key,
+            hidden_start,
+            hidden_end,
+            dot_key,
+            slash_key,
+            dash_key,
+            template,
+            escape,
+            encode,
+            on_fail,
+        )
+        plan = self._format_plan(actual_options)
+        blank_failures = errors == "collect" or (
+            errors == "callback"
+            and actual_options.on_fail is CnpjFormatterOptions.DEFAULT_ON_FAIL
+        )
+        formatted_cnpjs: list[str] = []
+        failed_indices: list[int] = []
 
-        if actual_options.hidden:
-            starting_part = formatted_cnpj[: actual_options.hidden_start]
-            ending_part = formatted_cnpj[actual_options.hidden_end + 1 :]
-            hidden_part_length = (
-                actual_options.hidden_end - actual_options.hidden_start + 1
-            )
-            hidden_part = HIDDEN_KEY_PLACEHOLDER * hidden_part_length
-            formatted_cnpj = starting_part + hidden_part + ending_part
-
-        formatted_cnpj = (
-            formatted_cnpj[:2]
-            + actual_options.dot_key
-            + formatted_cnpj[2:5]
-            + actual_options.dot_key
-            + formatted_cnpj[5:8]
-            + actual_options.slash_key
-            + formatted_cnpj[8:12]
-            + actual_options.dash_key
-            + formatted_cnpj[12:14]
+        for index, cnpj_input in enumerate(cnpj_inputs):
+            sanitized_cnpj = self._sanitize(cnpj_input)
+
+            if len(sanitized_cnpj) == CNPJ_LENGTH:
+                formatted_cnpjs.append(plan % tuple(sanitized_cnpj))
+                continue
+
+            if blank_failures:
+                formatted_cnpjs.append("")
+            else:
+                exception = CnpjFormatterInputLengthException(
+                    cnpj_input,
+                    sanitized_cnpj,
+                    CNPJ_LENGTH,
+                )
+
+                if errors == "raise":
+                    raise exception
+
+                formatted_cnpjs.append(
+                    _invoke_on_fail(actual_options.on_fail, cnpj_input, exception)
+                )
+
+            failed_indices.append(index)
+
+        return formatted_cnpjs, failed_indices
+
+    def format_many_to_bytes(
+        self,
+        cnpj_inputs: Iterable[CnpjInput],
+        options: CnpjFormatterOptionsInput = None,
+        *,
+        buffer: bytearray | memoryview | None = None,
+        offset: int = 0,
+        separator: bytes = b"",
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        slash_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+    ) -> tuple[memoryview, list[int]]:
+        """Format many CNPJ values into fixed-width byte records.
+
+        Each input becomes one record: the UTF-8 encoding of what
+        :meth:`format` returns for it, followed by ``separator`` (e.g.
+        ``b"\\n"`` or ``b"\\r\\n"``). Every formatted CNPJ has the same
+        width under the same options, so records have a fixed stride, and
+        the records of invalid-length inputs are filled with spaces instead
+        (``on_fail`` is not called).
+
+        The records are written into ``buffer`` at ``offset`` (or into new
+        ``bytes`` when no buffer is given) and returned as a ``memoryview``
+        over the written bytes, ready for ``file.write`` or
+        ``socket.sendall``, along with the indices of the invalid inputs.
+        Options are resolved and compiled once for the whole batch, and the
+        records are encoded in one pass instead of one ``encode()`` per
+        value.
+
+        Raises:
+            TypeError: If ``buffer`` is not a writable buffer.
+            ValueError: If ``separator`` is not ASCII, ``offset`` is
+                negative or the records do not fit in ``buffer`` at
+                ``offset``; nothing is written then.
+            CnpjFormatterInputTypeError: If any input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+            CnpjFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CnpjFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CnpjFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
+        """
+        if not separator.isascii():
+            raise ValueError(f"separator must be ASCII bytes, got {separator!r}")
+
+        actual_options = self._resolve_options(
+            options,
+            hidden,
+            hidden_key,
+            hidden_start,
+            hidden_end,
+            dot_key,
+            slash_key,
+            dash_key,
+            template,
+            escape,
+            encode,
+            None,
         )
+        text_separator = separator.decode("ascii")
+        plan = self._format_plan(actual_options) + text_separator.replace("%", "%%")
+        record_width = len((plan % (("0",) * CNPJ_LENGTH)).encode("utf-8")) - len(
+            separator
+        )
+        blank_record = " " * record_width + text_separator
+        records: list[str] = []
+        failed_indices: list[int] = []
 
-        if actual_options.hidden:
-            formatted_cnpj = formatted_cnpj.replace(
-                HIDDEN_KEY_PLACEHOLDER,
-                actual_options.hidden_key,
-            )
+        for index, cnpj_input in enumerate(cnpj_inputs):
+            sanitized_cnpj = self._sanitize(cnpj_input)
 
-        if actual_options.escape:
-            formatted_cnpj = html.escape(formatted_cnpj, quote=True)
+            if len(sanitized_cnpj) == CNPJ_LENGTH:
+                records.append(plan % tuple(sanitized_cnpj))
+            else:
+                records.append(blank_record)
+                failed_indices.append(index)
 
-        if actual_options.encode:
-            formatted_cnpj = quote(formatted_cnpj, safe="")
+        data = "".join(records).encode("utf-8")
 
-        return formatted_cnpj
+        if buffer is None:
+            return memoryview(data), failed_indices
+
+        view = _writable_view(buffer, offset, len(data))
+        view[:] = data
+
+        return view, failed_indices
+
+    def format_array(
+        self,
+        cnpj_array: np.ndarray,
+        options: CnpjFormatterOptionsInput = None,
+        *,
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        slash_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+    ) -> np.ndarray:
+        """Format a NumPy array of CNPJ values without per-row Python calls.
+
+        Accepts fixed-width unicode (e.g. ``U14``) or bytes (e.g. ``S14``)
+        arrays of any shape and returns a fixed-width unicode array of the
+        same shape, preallocated to the formatted length (18 characters with
+        the default options). Each element holds what :meth:`format` returns
+        for it under the same options, or an empty string when its sanitized
+        length is not 14: ``on_fail`` is not called, so the failed rows are
+        found with ``result == ""``.
+
+        The array is viewed as a matrix of character codes and sanitized
+        with vectorized operations, in chunks to bound memory use; the
+        sanitized characters and the delimiter (or ``hidden_key``) columns
+        are then written straight into the output matrix.
+
+        Requires the ``numpy`` extra (``pip install cnpj-fmt[numpy]``).
+
+        Raises:
+            CnpjFormatterInputTypeError: If the input is not a NumPy
+                unicode or bytes array.
+            CnpjFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CnpjFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CnpjFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
+        """
+        np = _import_numpy()
+
+        if not (isinstance(cnpj_array, np.ndarray) and cnpj_array.dtype.kind in "US"):
+            raise CnpjFormatterInputTypeError(cnpj_array, _EXPECTED_ARRAY_TYPE)
+
+        actual_options = self._resolve_options(
+            options,
+            hidden,
+            hidden_key,
+            hidden_start,
+            hidden_end,
+            dot_key,
+            slash_key,
+            dash_key,
+            template,
+            escape,
+            encode,
+            None,
+        )
+        layout = _column_layout_of(actual_options)
+        width = max(len(layout), 1)
+        flat_array = np.ascontiguousarray(cnpj_array).reshape(-1)
+        output = np.zeros((len(flat_array), width), np.uint32)
+
+        code_dtype = np.dtype(np.uint32 if flat_array.dtype.kind == "U" else np.uint8)
+        code_dtype = code_dtype.newbyteorder(flat_array.dtype.byteorder)
+        char_codes = flat_array.view(code_dtype).reshape(
+            len(flat_array), flat_array.dtype.itemsize // code_dtype.itemsize
+        )
+
+        for start in range(0, len(flat_array), _ARRAY_CHUNK_SIZE):
+            stop = start + _ARRAY_CHUNK_SIZE
+            _format_char_codes(np, char_codes[start:stop], layout, output[start:stop])
+
+        return output.view(f"U{width}").reshape(cnpj_array.shape)
+
+    def _sanitize(self, cnpj_input: CnpjInput) -> str:
+        """Strip the input down to its alphanumeric characters.
+
+        Raises:
+            CnpjFormatterInputTypeError: If the input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+        """
+        if isinstance(cnpj_input, _BYTES_INPUT_TYPES):
+            return _sanitize_cnpj_bytes(cnpj_input)
+
+        return _sanitize_cnpj_input(self._to_string_input(cnpj_input))
+
+    def _format_plan(self, options: CnpjFormatterOptions) -> str:
+        """Return the compiled format plan of ``options``, recompiling the
+        one of the instance defaults only after they change.
+        """
+        if options is not self._options:
+            return _format_plan_of(options)
+
+        if self._plan_version != options.version:
+            self._plan = _format_plan_of(options)
+            self._plan_version = options.version
+
+        return self._plan
+
+    def _resolve_options(
+        self,
+        options: CnpjFormatterOptionsInput,
+        hidden: bool | None,
+        hidden_key: str | None,
+        hidden_start: int | None,
+        hidden_end: int | None,
+        dot_key: str | None,
+        slash_key: str | None,
+        dash_key: str | None,
+        template: str | None,
+        escape: bool | None,
+        encode: bool | None,
+        on_fail: OnFailCallback | None,
+    ) -> CnpjFormatterOptions:
+        """Return the instance defaults, or a copy of them with the per-call
+        overrides applied (keyword arguments first, then ``options``).
+
+        Resolved copies are memoized per defaults :attr:`~CnpjFormatterOptions.version`
+        and overrides, so repeating the same overrides skips building and
+        validating a new options instance.
+        """
+        if not _has_per_call_overrides(
+            options,
+            hidden=hidden,
+            hidden_key=hidden_key,
+            hidden_start=hidden_start,
+            hidden_end=hidden_end,
+            dot_key=dot_key,
+            slash_key=slash_key,
+            dash_key=dash_key,
+            template=template,
+            escape=escape,
+            encode=encode,
+            on_fail=on_fail,
+        ):
+            return self._options
+
+        keyword_overrides = _per_call_option_overrides(
+            hidden=hidden,
+            hidden_key=hidden_key,
+            hidden_start=hidden_start,
+            hidden_end=hidden_end,
+            dot_key=dot_key,
+            slash_key=slash_key,
+            dash_key=dash_key,
+            template=template,
+            escape=escape,
+            encode=encode,
+            on_fail=on_fail,
+        )
+        override_key = _override_key(options, keyword_overrides)
+
+        if override_key is None:
+            return self._merge_options(options, keyword_overrides)
+
+        resolved_options = self._resolved_options
+
+        if resolved_options is None:
+            resolved_options = LruCache(_RESOLVED_OPTIONS_CACHE_SIZE)
+            self._resolved_options = resolved_options
+
+        resolved_key = (self._options.version, override_key)
+        actual_options = resolved_options.get(resolved_key)
+
+        if actual_options is None:
+            actual_options = self._merge_options(options, keyword_overrides)
+            resolved_options.put(resolved_key, actual_options)
+
+        return actual_options
+
+    def _merge_options(
+        self, options: CnpjFormatterOptionsInput, keyword_overrides: dict[str, Any]
+    ) -> CnpjFormatterOptions:
+        """Return a copy of the instance defaults with the per-call overrides
+        applied (keyword arguments first, then ``options``).
+        """
+        actual_options = self._options.copy()
+
+        if keyword_overrides:
+            actual_options.set(keyword_overrides)
+
+        if options is not None:
+            actual_options.set(options)
+
+        return actual_options
+
+    def _cache_key(
+        self, cnpj_input: str | bytes, actual_options: CnpjFormatterOptions
+    ) -> tuple[Any, ...]:
+        """Return the cache key of an input under the resolved options.
+
+        Calls with the instance defaults share one options slot, and the
+        whole cache is dropped when those defaults have changed since the
+        last call; per-call options are keyed by their values.
+        """
+        if actual_options is not self._options:
+            return (cnpj_input, *actual_options.all.values())
+
+        if self._cache_version != actual_options.version:
+            self._cache.clear()  # type: ignore[union-attr]
+            self._cache_version = actual_options.version
+
+        return (cnpj_input,)
 
     @staticmethod
     def _to_string_input(cnpj_input: Any) -> str:
@@ -349,11 +1142,11 @@ class CnpjFormatter:
         ):
             for item in cnpj_input:
                 if not isinstance(item, str):
-                    raise CnpjFormatterInputTypeError(cnpj_input, "string or string[]")
+                    raise CnpjFormatterInputTypeError(cnpj_input, _EXPECTED_INPUT_TYPE)
 
             return "".join(cnpj_input)
 
-        raise CnpjFormatterInputTypeError(cnpj_input, "string or string[]")
+        raise CnpjFormatterInputTypeError(cnpj_input, _EXPECTED_INPUT_TYPE)
 
 
 __all__ = ["CnpjFormatter"]
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from .exceptions import (
     CnpjFormatterOptionsForbiddenKeyCharacterException,
     CnpjFormatterOptionsHiddenRangeInvalidException,
+    CnpjFormatterOptionsTemplateInvalidException,
     CnpjFormatterOptionsTypeError,
 )
 
@@ -112,6 +113,18 @@ class CnpjFormatterOptions:
     end (``XXXX-XX``).
     """
 
+    DEFAULT_TEMPLATE = None
+    """Default value for the ``template`` option.
+
+    When ``None``, the mask is built from ``dot_key``, ``slash_key`` and
+    ``dash_key`` (``XX.XXX.XXX/XXXX-XX``).
+    """
+
+    TEMPLATE_SLOT = "#"
+    """Character marking, in the ``template`` option, where each of the 14
+    CNPJ characters goes.
+    """
+
     DEFAULT_ESCAPE = False
     """Default value for the ``escape`` option.
 
@@ -132,7 +145,7 @@ class CnpjFormatterOptions:
 
     DISALLOWED_KEY_CHARACTERS = ("\u00e5", "\u00eb", "\u00ef", "\u00f6")
     """Characters not allowed in key options (``hidden_key``, ``dot_key``,
-    ``slash_key``, ``dash_key``).
+    ``slash_key``, ``dash_key``) nor in ``template``.
 
     They are reserved for internal formatting logic. For now, the first
     character is only used to replace the hidden key placeholder in
@@ -151,6 +164,7 @@ class CnpjFormatterOptions:
         dot_key: str | None = None,
         slash_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: OnFailCallback | None = None,
@@ -178,14 +192,19 @@ class CnpjFormatterOptions:
                 range.
             CnpjFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
         """
         self._options: CnpjFormatterOptionsType = {}  # type: ignore[typeddict-item]
+        # Bumped by every setter; see the ``version`` property.
+        self._version = 0
 
         self.hidden = hidden
         self.hidden_key = hidden_key
         self.dot_key = dot_key
         self.slash_key = slash_key
         self.dash_key = dash_key
+        self.template = template
         self.escape = escape
         self.encode = encode
         self.on_fail = on_fail
@@ -210,6 +229,16 @@ class CnpjFormatterOptions:
         """
         return {**self._options}
 
+    @property
+    def version(self) -> int:
+        """Return a counter that grows every time an option is set.
+
+        Two reads that return the same number saw the same options, which
+        lets caches built on top of this instance tell when to drop their
+        entries.
+        """
+        return self._version
+
     @property
     def hidden(self) -> bool:
         """Return whether hidden character replacement is enabled.
@@ -231,6 +260,7 @@ class CnpjFormatterOptions:
         """
         actual_hidden = self.DEFAULT_HIDDEN if value is None else bool(value)
         self._options["hidden"] = actual_hidden
+        self._version += 1
 
     @property
     def hidden_key(self) -> str:
@@ -265,6 +295,7 @@ class CnpjFormatterOptions:
 
         self._assert_no_disallowed_key_characters("hidden_key", actual_hidden_key)
         self._options["hidden_key"] = actual_hidden_key
+        self._version += 1
 
     @property
     def hidden_start(self) -> int:
@@ -354,6 +385,7 @@ class CnpjFormatterOptions:
 
         self._assert_no_disallowed_key_characters("dot_key", actual_dot_key)
         self._options["dot_key"] = actual_dot_key
+        self._version += 1
 
     @property
     def slash_key(self) -> str:
@@ -386,6 +418,7 @@ class CnpjFormatterOptions:
 
         self._assert_no_disallowed_key_characters("slash_key", actual_slash_key)
         self._options["slash_key"] = actual_slash_key
+        self._version += 1
 
     @property
     def dash_key(self) -> str:
@@ -416,6 +449,51 @@ class CnpjFormatterOptions:
 
         self._assert_no_disallowed_key_characters("dash_key", actual_dash_key)
         self._options["dash_key"] = actual_dash_key
+        self._version += 1
+
+    @property
+    def template(self) -> str | None:
+        """Return the mask the CNPJ is formatted into, or ``None``.
+
+        Each ``#`` slot of the template takes one of the 14 CNPJ
+        characters, in order, and the text around the slots is kept as is
+        (e.g. ``"##.###.###/####-##"``). When ``None``, the mask is built
+        from ``dot_key``, ``slash_key`` and ``dash_key``, which a template
+        overrides.
+        """
+        return self._options["template"]
+
+    @template.setter
+    def template(self, value: str | None) -> None:
+        """Set the mask the CNPJ is formatted into.
+
+        Each ``#`` slot of the template takes one of the 14 CNPJ
+        characters, in order, and the text around the slots is kept as is
+        (e.g. ``"########/####-##"`` or ``"## ### ### #### ##"``). The
+        hidden range still refers to CNPJ characters, so hidden slots are
+        replaced with ``hidden_key``. ``None`` restores the mask built from
+        the delimiter keys.
+
+        Raises:
+            CnpjFormatterOptionsTypeError: If the value is not a ``str``.
+            CnpjFormatterOptionsForbiddenKeyCharacterException: If the
+                value contains any disallowed key character.
+            CnpjFormatterOptionsTemplateInvalidException: If the value does
+                not have exactly 14 ``#`` slots.
+        """
+        if value is not None:
+            if not isinstance(value, str):
+                raise CnpjFormatterOptionsTypeError("template", value, "string")
+
+            self._assert_no_disallowed_key_characters("template", value)
+
+            if value.count(self.TEMPLATE_SLOT) != CNPJ_LENGTH:
+                raise CnpjFormatterOptionsTemplateInvalidException(
+                    value, self.TEMPLATE_SLOT, CNPJ_LENGTH
+                )
+
+        self._options["template"] = value
+        self._version += 1
 
     @property
     def escape(self) -> bool:
@@ -441,6 +519,7 @@ class CnpjFormatterOptions:
         """
         actual_escape = self.DEFAULT_ESCAPE if value is None else bool(value)
         self._options["escape"] = actual_escape
+        self._version += 1
 
     @property
     def encode(self) -> bool:
@@ -462,6 +541,7 @@ class CnpjFormatterOptions:
         """
         actual_encode = self.DEFAULT_ENCODE if value is None else bool(value)
         self._options["encode"] = actual_encode
+        self._version += 1
 
     @property
     def on_fail(self) -> OnFailCallback:
@@ -493,6 +573,7 @@ class CnpjFormatterOptions:
             raise CnpjFormatterOptionsTypeError("on_fail", value, "function")
 
         self._options["on_fail"] = actual_on_fail
+        self._version += 1
 
     def set_hidden_range(
         self,
@@ -557,6 +638,7 @@ class CnpjFormatterOptions:
 
         self._options["hidden_start"] = actual_hidden_start
         self._options["hidden_end"] = actual_hidden_end
+        self._version += 1
 
         return self
 
@@ -565,6 +647,7 @@ class CnpjFormatterOptions:
         duplicate = object.__new__(type(self))
 
         object.__setattr__(duplicate, "_options", self._options.copy())
+        object.__setattr__(duplicate, "_version", 0)
 
         return duplicate
 
@@ -584,6 +667,8 @@ class CnpjFormatterOptions:
                 range.
             CnpjFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CnpjFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 14 ``#`` slots.
         """
         if options is None:
             return self
@@ -608,6 +693,7 @@ class CnpjFormatterOptions:
         self.dot_key = coalesce("dot_key", self.dot_key)
         self.slash_key = coalesce("slash_key", self.slash_key)
         self.dash_key = coalesce("dash_key", self.dash_key)
+        self.template = coalesce("template", self.template)
         self.escape = coalesce("escape", self.escape)
         self.encode = coalesce("encode", self.encode)
         self.on_fail = coalesce("on_fail", self.on_fail)
@@ -102,6 +102,9 @@ def _format_length_exception_input(actual_input: CnpjInput) -> str:
     if isinstance(actual_input, str):
         return f'"{actual_input}"'
 
+    if isinstance(actual_input, (bytes, bytearray, memoryview)):
+        return repr(bytes(actual_input))
+
     if isinstance(actual_input, Sequence):
         return f"sequence[{len(actual_input)}]"
 
@@ -188,12 +191,32 @@ class CnpjFormatterOptionsForbiddenKeyCharacterException(CnpjFormatterException)
         self.forbidden_characters = list(forbidden_characters)
 
 
+class CnpjFormatterOptionsTemplateInvalidException(CnpjFormatterException):
+    """Exception raised when the ``template`` option does not have one slot
+    for each of the 14 CNPJ characters.
+
+    The error message includes the template, the slot character and the
+    expected and actual number of slots.
+    """
+
+    def __init__(self, actual_input: str, slot: str, expected_slots: int) -> None:
+        super().__init__(
+            f'CNPJ formatting option "template" must have {expected_slots} "{slot}" '
+            f'slots. Got {actual_input.count(slot)} in "{actual_input}".'
+        )
+        self.option_name = "template"
+        self.actual_input = actual_input
+        self.slot = slot
+        self.expected_slots = expected_slots
+
+
 __all__ = [
     "CnpjFormatterException",
     "CnpjFormatterInputLengthException",
     "CnpjFormatterInputTypeError",
     "CnpjFormatterOptionsForbiddenKeyCharacterException",
     "CnpjFormatterOptionsHiddenRangeInvalidException",
+    "CnpjFormatterOptionsTemplateInvalidException",
     "CnpjFormatterOptionsTypeError",
     "CnpjFormatterTypeError",
 ]
@@ -1,18 +1,20 @@
 """Type aliases for the ``cnpj_fmt`` package."""
 
 from collections.abc import Callable, Mapping, Sequence
-from typing import Any, TypeAlias, TypedDict
+from typing import Any, Literal, TypeAlias, TypedDict
 
 from .cnpj_formatter_options import CnpjFormatterOptions
 from .exceptions import CnpjFormatterException
 
-CnpjInput = str | Sequence[str]
+CnpjInput = str | bytes | bytearray | memoryview | Sequence[str]
 """Represents valid input types for CNPJ formatting.
 
 A CNPJ can be provided as:
 
 - A string containing alphanumeric characters (with or without
   formatting)
+- A ``bytes``, ``bytearray`` or ``memoryview`` with the same ASCII
+  content
 - A sequence of strings, where each string represents an alphanumeric
   character or group of alphanumeric characters.
 """
@@ -26,6 +28,20 @@ issues. The callback receives the original input value and the exception
 object, and should return a string to use as the fallback output.
 """
 
+FormatManyErrors = Literal["collect", "callback", "raise"]
+"""How :meth:`CnpjFormatter.format_many` handles inputs of invalid length.
+
+- ``"collect"``: leave an empty string in their place, without building an
+  exception or calling ``on_fail``.
+- ``"callback"``: call ``on_fail`` with the input and a
+  :class:`CnpjFormatterInputLengthException`, as :meth:`CnpjFormatter.format`
+  does, and use its return value.
+- ``"raise"``: raise the :class:`CnpjFormatterInputLengthException` of the
+  first one.
+
+Their indices are reported in every mode but ``"raise"``.
+"""
+
 CnpjFormatterOptionsInput: TypeAlias = CnpjFormatterOptions | Mapping[str, Any] | None
 
 
@@ -49,6 +65,8 @@ class CnpjFormatterOptionsType(TypedDict):
         dot_key: Dot delimiter between the first character groups.
         slash_key: Slash delimiter before the branch identifier block.
         dash_key: Dash delimiter before the final check characters.
+        template: Mask with one ``#`` slot per CNPJ character, overriding
+            the delimiter keys; ``None`` keeps the delimiter-based mask.
         escape: When ``True``, HTML special characters are escaped.
         encode: When ``True``, the formatted string is URL-encoded.
         on_fail: Callback invoked when normalized input length is not
@@ -62,6 +80,7 @@ class CnpjFormatterOptionsType(TypedDict):
     dot_key: str
     slash_key: str
     dash_key: str
+    template: str | None
     escape: bool
     encode: bool
     on_fail: OnFailCallback
@@ -71,5 +90,6 @@ __all__ = [
     "CnpjFormatterOptionsInput",
     "CnpjFormatterOptionsType",
     "CnpjInput",
+    "FormatManyErrors",
     "OnFailCallback",
 ]
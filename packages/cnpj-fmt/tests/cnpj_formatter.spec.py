@@ -20,6 +20,7 @@ from cnpj_fmt import (
     CnpjFormatterOptions,
     CnpjFormatterOptionsTypeError,
 )
+from cnpj_fmt import cnpj_formatter as cnpj_formatter_module
 
 INVALID_LENGTH_CASES = [
     ("1", 1),
@@ -265,6 +266,32 @@ def describe_cnpj_formatter():
                     == "12.ABC.DEF/00GH-34"
                 )
 
+        def describe_when_input_is_bytes_like():
+            @pytest.mark.parametrize("bytes_type", [bytes, bytearray, memoryview])
+            def it_formats_the_same_as_a_string(bytes_type):
+                assert _format(bytes_type(b"12abcDEF00gH34")) == "12.ABC.DEF/00GH-34"
+
+            def it_strips_punctuation_bytes():
+                assert _format(b"12.abc.DEF/00gH-34") == "12.ABC.DEF/00GH-34"
+
+            def it_accepts_memoryview_slices():
+                buffer = memoryview(b"91415732000793;12ABCDEF00GH34")
+
+                assert _format(buffer[15:]) == "12.ABC.DEF/00GH-34"
+
+            def it_fails_with_the_original_bytes_when_length_is_not_14():
+                def on_fail(value, error):
+                    assert isinstance(error, CnpjFormatterInputLengthException)
+                    assert value == b"1.2.3"
+                    assert error.evaluated_input == "123"
+                    assert str(error) == (
+                        "CNPJ input b'1.2.3' does not contain 14 characters. Got 3 in \"123\"."
+                    )
+
+                    return "ERROR"
+
+                assert _format(b"1.2.3", on_fail=on_fail) == "ERROR"
+
         def describe_when_input_is_not_string_or_sequence_of_strings():
             @pytest.mark.parametrize(("input_value", "actual_type"), INVALID_TYPE_CASES)
             def it_raises_cnpj_formatter_input_type_error(input_value, actual_type):
@@ -273,7 +300,7 @@ def describe_cnpj_formatter():
 
                 error = exc_info.value
 
-                assert error.expected_type == "string or string[]"
+                assert error.expected_type == "string, bytes or string[]"
                 assert error.actual_input is input_value
                 assert error.actual_type == actual_type
 
@@ -285,7 +312,7 @@ def describe_cnpj_formatter():
 
                 error = exc_info.value
 
-                assert error.expected_type == "string or string[]"
+                assert error.expected_type == "string, bytes or string[]"
                 assert error.actual_input == input_value
 
         def describe_when_sanitized_input_length_is_not_14():
@@ -503,3 +530,405 @@ def describe_cnpj_formatter():
                 )
 
                 assert result == "12[.]ABC[.][*][*][*][/][*][*]DE[-]99"
+
+    def describe_cache():
+        def it_is_disabled_by_default():
+            assert CnpjFormatter().cache is None
+
+        def it_caches_formatted_results_by_raw_input():
+            formatter = CnpjFormatter(cache_size=8)
+
+            assert formatter.format("12ABC34500DE99") == "12.ABC.345/00DE-99"
+            assert formatter.format("12ABC34500DE99") == "12.ABC.345/00DE-99"
+            assert formatter.format(b"12ABC34500DE99") == "12.ABC.345/00DE-99"
+
+            cache = formatter.cache
+            assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+        def it_keys_per_call_options_separately():
+            formatter = CnpjFormatter(cache_size=8)
+
+            assert (
+                formatter.format("12ABC34500DE99", hidden=True) == "12.ABC.***/****-**"
+            )
+            assert (
+                formatter.format("12ABC34500DE99", {"hidden": True})
+                == "12.ABC.***/****-**"
+            )
+            assert formatter.format("12ABC34500DE99") == "12.ABC.345/00DE-99"
+            assert (formatter.cache.hits, formatter.cache.misses) == (1, 2)
+
+        def it_drops_the_cache_when_the_default_options_change():
+            formatter = CnpjFormatter(cache_size=8)
+
+            assert formatter.format("12ABC34500DE99") == "12.ABC.345/00DE-99"
+
+            formatter.options.dash_key = "_"
+
+            assert formatter.format("12ABC34500DE99") == "12.ABC.345/00DE_99"
+            assert len(formatter.cache) == 1
+
+        def it_does_not_cache_failures():
+            calls = []
+            formatter = CnpjFormatter(
+                cache_size=8, on_fail=lambda value, _: calls.append(value) or "fail"
+            )
+
+            assert formatter.format("123") == "fail"
+            assert formatter.format("123") == "fail"
+            assert calls == ["123", "123"]
+            assert len(formatter.cache) == 0
+
+        def it_evicts_the_least_recently_used_input():
+            formatter = CnpjFormatter(cache_size=1)
+
+            formatter.format("12ABC34500DE99")
+            formatter.format("91415732000793")
+
+            assert len(formatter.cache) == 1
+            assert formatter.cache.evictions == 1
+
+    def describe_per_call_options_resolution():
+        def it_reuses_the_options_resolved_for_repeated_overrides(monkeypatch):
+            copies = []
+            original_copy = CnpjFormatterOptions.copy
+
+            def counting_copy(options):
+                copies.append(options)
+
+                return original_copy(options)
+
+            monkeypatch.setattr(CnpjFormatterOptions, "copy", counting_copy)
+            formatter = CnpjFormatter()
+
+            for _ in range(3):
+                assert (
+                    formatter.format("12ABC34500DE99", hidden=True)
+                    == "12.ABC.***/****-**"
+                )
+                assert (
+                    formatter.format("12ABC34500DE99", {"dash_key": "_"})
+                    == "12.ABC.345/00DE_99"
+                )
+
+            assert len(copies) == 2
+
+        def it_resolves_again_after_the_default_options_change():
+            formatter = CnpjFormatter()
+
+            assert (
+                formatter.format("12ABC34500DE99", hidden=True) == "12.ABC.***/****-**"
+            )
+
+            formatter.options.hidden_key = "#"
+
+            assert (
+                formatter.format("12ABC34500DE99", hidden=True) == "12.ABC.###/####-##"
+            )
+
+        def it_still_raises_for_invalid_overrides_after_valid_ones():
+            formatter = CnpjFormatter()
+
+            assert formatter.format("12ABC34500DE99", hidden=True, hidden_start=2) == (
+                "12.***.***/****-**"
+            )
+
+            with pytest.raises(CnpjFormatterOptionsTypeError):
+                formatter.format("12ABC34500DE99", hidden=True, hidden_start=2.0)
+
+            with pytest.raises(CnpjFormatterOptionsTypeError):
+                formatter.format(
+                    "12ABC34500DE99", {"hidden": True, "hidden_start": 2.0}
+                )
+
+    def describe_format_plan():
+        def it_keeps_percent_signs_in_keys_literal():
+            formatter = CnpjFormatter(hidden=True, hidden_key="%s", dash_key="%")
+
+            assert formatter.format("12ABC34500DE99") == "12.ABC.%s%s%s/%s%s%s%s%%s%s"
+
+        def it_escapes_and_encodes_only_the_keys():
+            formatter = CnpjFormatter(
+                dot_key="&", dash_key=" ", escape=True, encode=True
+            )
+
+            assert (
+                formatter.format("12ABC34500DE99")
+                == "12%26amp%3BABC%26amp%3B345%2F00DE%2099"
+            )
+
+        def it_recompiles_after_the_default_options_change():
+            formatter = CnpjFormatter()
+
+            assert formatter.format("12ABC34500DE99") == "12.ABC.345/00DE-99"
+
+            formatter.options.set_hidden_range(0, 1)
+            formatter.options.hidden = True
+
+            assert formatter.format("12ABC34500DE99") == "**.ABC.345/00DE-99"
+
+    def describe_template_option():
+        @pytest.mark.parametrize(
+            ("template", "expected"),
+            [
+                ("##.###.###/####-##", "12.ABC.345/00DE-99"),
+                ("########/####-##", "12ABC345/00DE-99"),
+                ("## ### ### #### ##", "12 ABC 345 00DE 99"),
+                ("CNPJ: ##############.", "CNPJ: 12ABC34500DE99."),
+            ],
+        )
+        def it_fills_the_slots_of_the_template(template, expected):
+            assert (
+                CnpjFormatter().format("12abc34500de99", template=template) == expected
+            )
+
+        def it_overrides_the_delimiter_keys():
+            formatter = CnpjFormatter(dot_key="|", slash_key="|", dash_key="|")
+
+            assert (
+                formatter.format("12ABC34500DE99", template="##-###-###-####-##")
+                == "12-ABC-345-00DE-99"
+            )
+
+        def it_hides_the_slots_in_the_hidden_range():
+            formatter = CnpjFormatter(
+                template="## ### ### #### ##", hidden=True, hidden_key="•"
+            )
+
+            assert formatter.format("12ABC34500DE99") == "12 ABC ••• •••• ••"
+
+        def it_escapes_and_encodes_the_template_text():
+            formatter = CnpjFormatter(template="<##############> 100%", escape=True)
+
+            assert formatter.format("12ABC34500DE99") == "&lt;12ABC34500DE99&gt; 100%"
+            assert (
+                formatter.format("12ABC34500DE99", encode=True)
+                == "%26lt%3B12ABC34500DE99%26gt%3B%20100%25"
+            )
+
+        def it_applies_to_the_batch_and_array_methods():
+            formatter = CnpjFormatter(template="########/####-##")
+
+            assert formatter.format_many(["12ABC34500DE99"]) == (
+                ["12ABC345/00DE-99"],
+                [],
+            )
+            assert (
+                bytes(formatter.format_many_to_bytes(["12ABC34500DE99"])[0])
+                == b"12ABC345/00DE-99"
+            )
+
+        def it_recompiles_the_plan_when_the_template_changes():
+            formatter = CnpjFormatter()
+            formatter.format("12ABC34500DE99")
+
+            formatter.options.template = "##############"
+
+            assert formatter.format("12ABC34500DE99") == "12ABC34500DE99"
+
+    def describe_format_many_method():
+        def it_formats_each_input_like_format():
+            formatter = CnpjFormatter(hidden=True)
+            cnpj_inputs = ["12ABC34500DE99", b"91415732000793", ["12ABC", "34500DE99"]]
+
+            formatted, failed_indices = formatter.format_many(cnpj_inputs)
+
+            assert formatted == [
+                formatter.format(cnpj_input) for cnpj_input in cnpj_inputs
+            ]
+            assert failed_indices == []
+
+        def it_applies_per_call_options_to_the_whole_batch():
+            formatted, _ = CnpjFormatter().format_many(
+                ["12ABC34500DE99", "91415732000793"], {"dash_key": "_"}, escape=True
+            )
+
+            assert formatted == ["12.ABC.345/00DE_99", "91.415.732/0007_93"]
+
+        def describe_when_errors_is_collect():
+            def it_leaves_empty_strings_and_reports_the_failed_indices():
+                calls = []
+                formatter = CnpjFormatter(
+                    on_fail=lambda value, _: calls.append(value) or "fail"
+                )
+
+                formatted, failed_indices = formatter.format_many(
+                    ["1", "12ABC34500DE99", "", "914157320007931"]
+                )
+
+                assert formatted == ["", "12.ABC.345/00DE-99", "", ""]
+                assert failed_indices == [0, 2, 3]
+                assert calls == []
+
+        def describe_when_errors_is_callback():
+            def it_calls_on_fail_for_each_failure():
+                calls = []
+
+                def on_fail(value, exception):
+                    calls.append((value, exception.evaluated_input))
+
+                    return "fail"
+
+                formatted, failed_indices = CnpjFormatter(on_fail=on_fail).format_many(
+                    ["12ABC34500DE99", "1-2"], errors="callback"
+                )
+
+                assert formatted == ["12.ABC.345/00DE-99", "fail"]
+                assert failed_indices == [1]
+                assert calls == [("1-2", "12")]
+
+        def describe_when_errors_is_raise():
+            def it_raises_for_the_first_failure():
+                with pytest.raises(CnpjFormatterInputLengthException) as exc_info:
+                    CnpjFormatter().format_many(
+                        ["12ABC34500DE99", "12", "1"], errors="raise"
+                    )
+
+                assert exc_info.value.actual_input == "12"
+
+        def it_raises_for_an_unknown_errors_mode():
+            with pytest.raises(ValueError, match="errors"):
+                CnpjFormatter().format_many([], errors="ignore")
+
+        def it_raises_for_an_invalid_input_type():
+            with pytest.raises(CnpjFormatterInputTypeError):
+                CnpjFormatter().format_many(["12ABC34500DE99", 123])
+
+    def describe_format_into_method():
+        def it_writes_the_encoded_result_of_format_at_the_offset():
+            buffer = bytearray(b"." * 22)
+
+            written = CnpjFormatter().format_into(buffer, 2, "12ABC34500DE99")
+
+            assert written == 18
+            assert buffer == b"..12.ABC.345/00DE-99.."
+
+        def it_accepts_a_memoryview_and_per_call_options():
+            buffer = bytearray(40)
+
+            written = CnpjFormatter().format_into(
+                memoryview(buffer), 0, b"91415732000793", hidden=True, hidden_key="•"
+            )
+
+            assert bytes(buffer[:written]).decode() == "91.415.•••/••••-••"
+
+        def it_writes_what_on_fail_returns_for_an_invalid_length():
+            buffer = bytearray(8)
+
+            assert CnpjFormatter().format_into(buffer, 0, "123") == 0
+            assert (
+                CnpjFormatter(on_fail=lambda _value, _error: "n/a").format_into(
+                    buffer, 0, "123"
+                )
+                == 3
+            )
+            assert buffer == b"n/a\0\0\0\0\0"
+
+        @pytest.mark.parametrize(("size", "offset"), [(17, 0), (18, 1), (18, -1)])
+        def it_raises_without_writing_when_the_value_does_not_fit(size, offset):
+            buffer = bytearray(size)
+
+            with pytest.raises(ValueError, match="offset"):
+                CnpjFormatter().format_into(buffer, offset, "12ABC34500DE99")
+
+            assert buffer == bytearray(size)
+
+        @pytest.mark.parametrize("buffer", [bytes(18), "x" * 18])
+        def it_raises_for_a_buffer_that_is_not_writable(buffer):
+            with pytest.raises(TypeError):
+                CnpjFormatter().format_into(buffer, 0, "12ABC34500DE99")
+
+    def describe_format_many_to_bytes_method():
+        def it_joins_fixed_width_records_with_the_separator():
+            data, failed_indices = CnpjFormatter().format_many_to_bytes(
+                ["12ABC34500DE99", "123", b"91415732000793"], separator=b"\r\n"
+            )
+
+            assert bytes(data) == (
+                b"12.ABC.345/00DE-99\r\n"
+                + b" " * 18
+                + b"\r\n"
+                + b"91.415.732/0007-93\r\n"
+            )
+            assert failed_indices == [1]
+
+        def it_encodes_each_record_like_format():
+            formatter = CnpjFormatter(
+                hidden=True, hidden_key="•", slash_key="%", escape=True
+            )
+            cnpj_inputs = ["12ABC34500DE99", ["91415732", "000793"]]
+
+            data, _ = formatter.format_many_to_bytes(cnpj_inputs)
+
+            assert (
+                bytes(data)
+                == "".join(formatter.format(value) for value in cnpj_inputs).encode()
+            )
+
+        def it_writes_into_the_buffer_at_the_offset():
+            buffer = bytearray(b"#" * 40)
+
+            data, _ = CnpjFormatter().format_many_to_bytes(
+                ["12ABC34500DE99", "91415732000793"],
+                buffer=buffer,
+                offset=1,
+                separator=b"\n",
+            )
+
+            assert data.nbytes == 38
+            assert buffer == b"#12.ABC.345/00DE-99\n91.415.732/0007-93\n#"
+
+        def it_returns_no_bytes_for_no_inputs():
+            data, failed_indices = CnpjFormatter().format_many_to_bytes(
+                [], separator=b"\n"
+            )
+
+            assert (bytes(data), failed_indices) == (b"", [])
+
+        def it_does_not_call_on_fail():
+            formatter = CnpjFormatter(
+                on_fail=lambda _value, _error: pytest.fail("on_fail called")
+            )
+
+            assert formatter.format_many_to_bytes(["1"])[1] == [0]
+
+        def it_raises_without_writing_when_the_records_do_not_fit():
+            buffer = bytearray(36)
+
+            with pytest.raises(ValueError, match="do not fit"):
+                CnpjFormatter().format_many_to_bytes(
+                    ["12ABC34500DE99"] * 2, buffer=buffer, offset=1
+                )
+
+            assert buffer == bytearray(36)
+
+        def it_raises_for_a_non_ascii_separator():
+            with pytest.raises(ValueError, match="separator"):
+                CnpjFormatter().format_many_to_bytes([], separator="é".encode())
+
+    def describe_when_on_fail_is_the_default():
+        def it_returns_an_empty_string_without_building_an_exception(monkeypatch):
+            built = []
+            monkeypatch.setattr(
+                cnpj_formatter_module,
+                "CnpjFormatterInputLengthException",
+                lambda *args: built.append(args),
+            )
+            formatter = CnpjFormatter()
+
+            assert formatter.format("not an id") == ""
+            assert formatter.format_many(["not an id"], errors="callback") == (
+                [""],
+                [0],
+            )
+            assert built == []
+
+        def it_still_builds_the_exception_for_a_custom_callback():
+            exceptions = []
+            formatter = CnpjFormatter(
+                on_fail=lambda _, exception: exceptions.append(exception) or ""
+            )
+
+            formatter.format("not an id")
+
+            assert isinstance(exceptions[0], CnpjFormatterInputLengthException)
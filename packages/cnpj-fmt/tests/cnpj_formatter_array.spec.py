@@ -0,0 +1,124 @@
+"""Spec for :meth:`cnpj_fmt.CnpjFormatter.format_array`.
+
+:meth:`CnpjFormatter.format` is the reference: every element of the array
+must get the string it gets on its own under the same options, or an empty
+string where ``format`` would call ``on_fail``. Skipped when the optional
+``numpy`` extra is not installed.
+"""
+
+import random
+
+import pytest
+from cnpj_fmt import CnpjFormatter, CnpjFormatterInputTypeError
+
+np = pytest.importorskip("numpy")
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcxyz"
+
+
+def _sample_inputs() -> list[str]:
+    rng = random.Random(0)
+    inputs = [
+        "",
+        "03603568000195",
+        "12.abc.345/00de-99",
+        " RK.0CM.T3W/0001-00 ",
+        "12ABC34500DE9",
+        "12ABC34500DE999",
+        "12ABC34500DE9é",
+        "12ABC34500DE99é",
+    ]
+
+    for _ in range(500):
+        size = rng.choice([12, 13, 14, 14, 14, 15])
+        cnpj = "".join(rng.choices(_ALPHABET, k=size))
+        inputs.extend(
+            [cnpj, f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"]
+        )
+
+    return inputs
+
+
+SAMPLE_INPUTS = _sample_inputs()
+
+OPTION_CASES = [
+    {},
+    {"hidden": True},
+    {"hidden": True, "hidden_start": 0, "hidden_end": 13, "hidden_key": "#"},
+    {"dot_key": "", "slash_key": "|", "dash_key": " - "},
+    {"hidden": True, "hidden_key": "<%>", "slash_key": "&", "escape": True},
+    {"hidden": True, "hidden_key": "•", "dash_key": "/", "encode": True},
+    {"hidden": True, "hidden_key": "&", "escape": True, "encode": True},
+    {"template": "CNPJ ## ### ### #### ##", "hidden": True},
+    {"template": "<##############>", "escape": True},
+]
+
+
+def describe_format_array_method():
+    @pytest.mark.parametrize("options", OPTION_CASES)
+    @pytest.mark.parametrize("dtype", ["U", "S"])
+    def it_matches_format_for_every_element(options, dtype):
+        formatter = CnpjFormatter()
+        inputs = [value for value in SAMPLE_INPUTS if dtype == "U" or value.isascii()]
+        array = np.array(inputs).astype(dtype)
+
+        assert formatter.format_array(array, **options).tolist() == [
+            formatter.format(value, **options) for value in inputs
+        ]
+
+    def it_returns_a_fixed_width_array_of_the_formatted_length():
+        result = CnpjFormatter().format_array(
+            np.array(["03603568000195", "0360356800019"])
+        )
+
+        assert result.dtype == np.dtype("U18")
+        assert result.tolist() == ["03.603.568/0001-95", ""]
+
+    def it_honors_the_instance_default_options():
+        formatter = CnpjFormatter(hidden=True, hidden_key="#")
+
+        assert formatter.format_array(np.array(["03603568000195"])).tolist() == [
+            "03.603.###/####-##"
+        ]
+
+    def it_does_not_call_on_fail():
+        formatter = CnpjFormatter(
+            on_fail=lambda _value, _error: pytest.fail("on_fail called")
+        )
+
+        assert formatter.format_array(np.array(["123"])).tolist() == [""]
+
+    def it_keeps_the_shape_of_the_input_array():
+        array = np.array([["03603568000195", "123"]] * 3)
+
+        result = CnpjFormatter().format_array(array)
+
+        assert result.shape == (3, 2)
+        assert result.tolist() == [["03.603.568/0001-95", ""]] * 3
+
+    def it_accepts_non_contiguous_and_big_endian_arrays():
+        array = np.array(["03603568000195", "x", "12ABC34500DE99"], dtype=">U18")
+
+        assert CnpjFormatter().format_array(array[::2]).tolist() == [
+            "03.603.568/0001-95",
+            "12.ABC.345/00DE-99",
+        ]
+
+    def it_returns_an_empty_array_for_an_empty_array():
+        result = CnpjFormatter().format_array(np.array([], dtype="U14"))
+
+        assert result.shape == (0,)
+        assert result.dtype == np.dtype("U18")
+
+    @pytest.mark.parametrize(
+        "cnpj_array",
+        [
+            "03603568000195",
+            ["03603568000195"],
+            np.array([3603568000195]),
+            np.array(["03603568000195"], dtype=object),
+        ],
+    )
+    def it_raises_cnpj_formatter_input_type_error(cnpj_array):
+        with pytest.raises(CnpjFormatterInputTypeError):
+            CnpjFormatter().format_array(cnpj_array)
@@ -17,6 +17,7 @@ from cnpj_fmt import (
     CnpjFormatterOptions,
     CnpjFormatterOptionsForbiddenKeyCharacterException,
     CnpjFormatterOptionsHiddenRangeInvalidException,
+    CnpjFormatterOptionsTemplateInvalidException,
     CnpjFormatterOptionsTypeError,
 )
 
@@ -28,6 +29,7 @@ DEFAULT_PARAMETERS = {
     "dot_key": CnpjFormatterOptions.DEFAULT_DOT_KEY,
     "slash_key": CnpjFormatterOptions.DEFAULT_SLASH_KEY,
     "dash_key": CnpjFormatterOptions.DEFAULT_DASH_KEY,
+    "template": CnpjFormatterOptions.DEFAULT_TEMPLATE,
     "escape": CnpjFormatterOptions.DEFAULT_ESCAPE,
     "encode": CnpjFormatterOptions.DEFAULT_ENCODE,
     "on_fail": CnpjFormatterOptions.DEFAULT_ON_FAIL,
@@ -65,6 +67,7 @@ def describe_cnpj_formatter_options():
                         "dot_key": None,
                         "slash_key": None,
                         "dash_key": None,
+                        "template": None,
                         "escape": None,
                         "encode": None,
                         "on_fail": None,
@@ -86,6 +89,7 @@ def describe_cnpj_formatter_options():
                     "dot_key": "|",
                     "slash_key": "_",
                     "dash_key": "~",
+                    "template": "##############",
                     "escape": True,
                     "encode": True,
                     "on_fail": on_fail,
@@ -647,6 +651,60 @@ def describe_cnpj_formatter_options():
 
                 assert str(exc_info.value) == message
 
+    def describe_template_property():
+        def describe_when_setting_to_a_string_value():
+            @pytest.mark.parametrize(
+                "template",
+                ["##.###.###/####-##", "########/####-##", "CNPJ ## ### ### #### ##"],
+            )
+            def it_sets_template_to_the_provided_value(template):
+                options = CnpjFormatterOptions()
+
+                options.template = template
+
+                assert options.template == template
+
+        def describe_when_setting_to_a_nullish_value():
+            def it_sets_default_value_for_none():
+                options = CnpjFormatterOptions({"template": "##############"})
+
+                options.template = None
+
+                assert options.template is None
+
+        def describe_when_setting_to_a_non_string_value():
+            def it_raises_cnpj_formatter_options_type_error_with_a_number():
+                options = CnpjFormatterOptions()
+
+                with _raises_message(
+                    CnpjFormatterOptionsTypeError,
+                    'CNPJ formatting option "template" must be of type string. Got integer number.',
+                ):
+                    options.template = 123
+
+        def describe_when_setting_to_a_string_without_14_slots():
+            @pytest.mark.parametrize(
+                "template", ["", "##.###.###/####-#", "###############"]
+            )
+            def it_raises_cnpj_formatter_options_template_invalid_exception(template):
+                options = CnpjFormatterOptions()
+
+                with _raises_message(
+                    CnpjFormatterOptionsTemplateInvalidException,
+                    f'must have 14 "#" slots. Got {template.count("#")} in "{template}".',
+                ):
+                    options.template = template
+
+                assert options.template is None
+
+        def describe_when_setting_to_a_string_containing_a_forbidden_key_character():
+            def it_raises_cnpj_formatter_options_forbidden_key_character_exception():
+                options = CnpjFormatterOptions()
+                forbidden_char = CnpjFormatterOptions.DISALLOWED_KEY_CHARACTERS[0]
+
+                with pytest.raises(CnpjFormatterOptionsForbiddenKeyCharacterException):
+                    options.template = f"{forbidden_char}##############"
+
     def describe_escape_property():
         def describe_when_setting_to_a_boolean_value():
             def it_sets_escape_to_true():
@@ -1028,3 +1086,22 @@ def describe_cnpj_formatter_options():
                         'CNPJ formatting option "hidden_end" must be of type integer. Got float number.',
                     ):
                         options.set_hidden_range(0, 1.5)
+
+    def describe_version_getter():
+        def it_grows_whenever_an_option_is_set():
+            options = CnpjFormatterOptions()
+            versions = [options.version]
+
+            options.hidden = True
+            versions.append(options.version)
+            options.set_hidden_range(2, 4)
+            versions.append(options.version)
+            options.set({"dash_key": "_"})
+            versions.append(options.version)
+
+            assert versions == sorted(set(versions))
+
+        def it_restarts_on_copies():
+            options = CnpjFormatterOptions(hidden=True)
+
+            assert options.copy().version == 0
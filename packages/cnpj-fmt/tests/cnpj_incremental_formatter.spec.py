@@ -0,0 +1,181 @@
+"""Spec for :class:`cnpj_fmt.CnpjIncrementalFormatter`.
+
+:meth:`CnpjFormatter.format` is the reference: once a CNPJ is fully typed,
+the incremental value must be the string it gets under the same options.
+"""
+
+import random
+
+import pytest
+from cnpj_fmt import (
+    CnpjFormatter,
+    CnpjFormatterInputTypeError,
+    CnpjFormatterOptions,
+    CnpjFormatterOptionsTemplateInvalidException,
+    CnpjIncrementalFormatter,
+)
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcxyz"
+
+OPTION_CASES = [
+    {},
+    {"hidden": True},
+    {"hidden": True, "hidden_start": 0, "hidden_end": 13, "hidden_key": ""},
+    {"dot_key": "", "slash_key": " | ", "dash_key": " - "},
+    {"hidden": True, "hidden_key": "<%>", "slash_key": "&", "escape": True},
+    {"hidden": True, "hidden_key": "•", "dash_key": "/", "encode": True},
+    {"template": "CNPJ: ## ### ### #### ##."},
+]
+
+
+def describe_cnpj_incremental_formatter():
+    def describe_push_method():
+        def it_writes_each_delimiter_with_the_character_after_it():
+            formatter = CnpjIncrementalFormatter()
+            values = []
+
+            for char in "12ABC34500DE99":
+                formatter.push(char)
+                values.append(formatter.value)
+
+            assert values[:6] == ["1", "12", "12.A", "12.AB", "12.ABC", "12.ABC.3"]
+            assert values[-3:] == [
+                "12.ABC.345/00DE",
+                "12.ABC.345/00DE-9",
+                "12.ABC.345/00DE-99",
+            ]
+
+        def it_uppercases_letters_and_skips_other_characters():
+            formatter = CnpjIncrementalFormatter()
+
+            assert formatter.push("12.abc") == 5
+            assert formatter.raw == "12ABC"
+            assert formatter.value == "12.ABC"
+
+        def it_stops_taking_characters_once_the_cnpj_is_complete():
+            formatter = CnpjIncrementalFormatter()
+
+            assert formatter.push("12ABC34500DE99") == 14
+            assert formatter.push("7") == 0
+            assert formatter.is_complete
+            assert formatter.value == "12.ABC.345/00DE-99"
+
+        def it_skips_non_ascii_letters_and_digits():
+            formatter = CnpjIncrementalFormatter()
+
+            assert formatter.push("1é²") == 1
+            assert formatter.value == "1"
+
+        @pytest.mark.parametrize("value", [None, 1, b"1", ["1"]])
+        def it_raises_cnpj_formatter_input_type_error_for_non_strings(value):
+            with pytest.raises(CnpjFormatterInputTypeError):
+                CnpjIncrementalFormatter().push(value)
+
+    def describe_pop_method():
+        def it_removes_the_last_character_with_the_delimiter_before_it():
+            formatter = CnpjIncrementalFormatter()
+            formatter.push("12ABC3")
+
+            assert formatter.pop() == "3"
+            assert formatter.value == "12.ABC"
+            assert formatter.raw == "12ABC"
+
+        def it_returns_an_empty_string_when_nothing_was_typed():
+            formatter = CnpjIncrementalFormatter()
+
+            assert formatter.pop() == ""
+            assert formatter.value == ""
+
+        def it_removes_the_trailing_template_text_of_a_complete_cnpj():
+            formatter = CnpjIncrementalFormatter(template="[##############]")
+            formatter.push("12ABC34500DE99")
+
+            assert formatter.pop() == "9"
+            assert formatter.value == "[12ABC34500DE9"
+
+    def describe_clear_method():
+        def it_removes_every_character():
+            formatter = CnpjIncrementalFormatter()
+            formatter.push("12ABC")
+
+            formatter.clear()
+
+            assert (formatter.value, formatter.raw, len(formatter)) == ("", "", 0)
+
+    def describe_cursor_mapping():
+        def it_maps_raw_positions_to_the_end_of_their_character():
+            formatter = CnpjIncrementalFormatter()
+            formatter.push("12ABC3")
+
+            assert [formatter.masked_position(index) for index in range(7)] == [
+                0,
+                1,
+                2,
+                4,
+                5,
+                6,
+                8,
+            ]
+
+        def it_maps_masked_positions_to_the_characters_before_them():
+            formatter = CnpjIncrementalFormatter()
+            formatter.push("12ABC3")
+
+            positions = [formatter.raw_position(index) for index in range(9)]
+
+            assert positions == [0, 1, 2, 2, 3, 4, 5, 5, 6]
+
+        def it_round_trips_raw_positions():
+            formatter = CnpjIncrementalFormatter(
+                hidden=True, hidden_key="<*>", escape=True
+            )
+            formatter.push("12ABC34500DE99")
+
+            for index in range(15):
+                assert formatter.raw_position(formatter.masked_position(index)) == index
+
+        @pytest.mark.parametrize("position", [-1, 4])
+        def it_raises_value_error_for_raw_positions_out_of_range(position):
+            formatter = CnpjIncrementalFormatter()
+            formatter.push("12A")
+
+            with pytest.raises(ValueError, match="raw_position"):
+                formatter.masked_position(position)
+
+        @pytest.mark.parametrize("position", [-1, 5])
+        def it_raises_value_error_for_masked_positions_out_of_range(position):
+            formatter = CnpjIncrementalFormatter()
+            formatter.push("12A")
+
+            with pytest.raises(ValueError, match="masked_position"):
+                formatter.raw_position(position)
+
+    def describe_options():
+        @pytest.mark.parametrize("options", OPTION_CASES)
+        def it_matches_cnpj_formatter_once_complete(options):
+            rng = random.Random(0)
+            reference = CnpjFormatter(options)
+            formatter = CnpjIncrementalFormatter(options)
+
+            for _ in range(50):
+                cnpj = "".join(rng.choices(_ALPHABET, k=14))
+                formatter.clear()
+
+                for char in cnpj:
+                    formatter.push(char)
+
+                assert formatter.value == reference.format(cnpj)
+
+        def it_re_masks_the_typed_characters_when_the_options_change():
+            options = CnpjFormatterOptions()
+            formatter = CnpjIncrementalFormatter(options)
+            formatter.push("12ABC345")
+
+            options.hidden = True
+
+            assert formatter.value == "12.ABC.***"
+            assert formatter.masked_position(8) == 10
+
+        def it_raises_for_invalid_options():
+            with pytest.raises(CnpjFormatterOptionsTemplateInvalidException):
+                CnpjIncrementalFormatter(template="##")
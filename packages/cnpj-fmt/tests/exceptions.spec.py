@@ -18,6 +18,7 @@ from cnpj_fmt import (
     CnpjFormatterInputTypeError,
     CnpjFormatterOptionsForbiddenKeyCharacterException,
     CnpjFormatterOptionsHiddenRangeInvalidException,
+    CnpjFormatterOptionsTemplateInvalidException,
     CnpjFormatterOptionsTypeError,
     CnpjFormatterTypeError,
 )
@@ -351,3 +352,35 @@ def describe_cnpj_formatter_options_forbidden_key_character_exception():
                 str(exception)
                 == 'Value "å" for CNPJ formatting option "dot_key" contains disallowed characters ("å", "ë", "ï", "ð").'
             )
+
+
+def describe_cnpj_formatter_options_template_invalid_exception():
+    def describe_when_instantiated():
+        def it_is_an_instance_of_cnpj_formatter_exception():
+            exception = CnpjFormatterOptionsTemplateInvalidException("###", "#", 14)
+
+            assert isinstance(exception, CnpjFormatterException)
+
+        def it_has_the_correct_name():
+            exception = CnpjFormatterOptionsTemplateInvalidException("###", "#", 14)
+
+            assert (
+                type(exception).__name__
+                == "CnpjFormatterOptionsTemplateInvalidException"
+            )
+
+        def it_sets_its_properties():
+            exception = CnpjFormatterOptionsTemplateInvalidException("##-##", "#", 14)
+
+            assert exception.option_name == "template"
+            assert exception.actual_input == "##-##"
+            assert exception.slot == "#"
+            assert exception.expected_slots == 14
+
+        def it_generates_a_message_describing_the_exception():
+            exception = CnpjFormatterOptionsTemplateInvalidException("##-##", "#", 14)
+
+            assert (
+                str(exception)
+                == 'CNPJ formatting option "template" must have 14 "#" slots. Got 4 in "##-##".'
+            )
@@ -0,0 +1,55 @@
+"""Benchmark ``CnpjGenerator.generate_many`` and ``iter_generate`` against
+one ``generate`` call per value.
+
+Run from the package root with ``python benchmarks/generate_many.py``. Prints
+the throughput, in CNPJ values per second, of generating the same number of
+unformatted and formatted values through each path, with the default CSPRNG
+and with a seeded ``random.Random``.
+"""
+
+import random
+import timeit
+from functools import partial
+from itertools import islice
+
+from cnpj_gen import CnpjGenerator
+
+_COUNT = 100_000
+_REPEAT = 5
+
+
+def _generate_path(generator: CnpjGenerator, format: bool) -> list[str]:
+    return [generator.generate(format=format) for _ in range(_COUNT)]
+
+
+def _generate_many_path(generator: CnpjGenerator, format: bool) -> list[str]:
+    return generator.generate_many(_COUNT, format=format)
+
+
+def _iter_generate_path(generator: CnpjGenerator, format: bool) -> list[str]:
+    return list(islice(generator.iter_generate(format=format), _COUNT))
+
+
+def _run_paths(rng_label: str, generator: CnpjGenerator) -> None:
+    for format in (False, True):
+        for label, path in (
+            ("generate", _generate_path),
+            ("generate_many", _generate_many_path),
+            ("iter_generate", _iter_generate_path),
+        ):
+            best = min(
+                timeit.repeat(
+                    partial(path, generator, format), number=1, repeat=_REPEAT
+                )
+            )
+            title = f"{rng_label} {label} (format={format})"
+            print(f"{title:>36}: {_COUNT / best:12,.0f} IDs/s")
+
+
+def main() -> None:
+    for rng_label, rng in (("secrets", None), ("seeded", random.Random(0))):
+        _run_paths(rng_label, CnpjGenerator(rng=rng))
+
+
+if __name__ == "__main__":
+    main()
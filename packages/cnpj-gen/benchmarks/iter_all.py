@@ -0,0 +1,57 @@
+"""Benchmark ``CnpjGenerator.iter_all`` against completing every base under
+the same prefix with ``CnpjCheckDigits``.
+
+Run from the package root with ``python benchmarks/iter_all.py``. Prints the
+throughput, in CNPJ values per second, of listing every valid CNPJ of one
+company (an 8-character base ID prefix) through each path, under each
+``type``.
+"""
+
+import timeit
+from functools import partial
+from itertools import product
+
+from cnpj_dv import CnpjCheckDigits
+from cnpj_gen import CnpjGenerator
+
+_PREFIX = "12345678"
+_CHARACTERS_BY_TYPE = {
+    "numeric": "0123456789",
+    "alphanumeric": "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+}
+_REPEAT = 5
+
+
+def _bases(type: str) -> list[str]:
+    characters = _CHARACTERS_BY_TYPE[type]
+
+    return [_PREFIX + "".join(chars) for chars in product(characters, repeat=4)]
+
+
+def _complete_many_path(type: str) -> list[str]:
+    return [
+        cnpj for cnpj in CnpjCheckDigits.complete_many(_bases(type)) if cnpj is not None
+    ]
+
+
+def _iter_all_path(generator: CnpjGenerator, type: str) -> list[str]:
+    return list(generator.iter_all(prefix=_PREFIX, type=type))
+
+
+def main() -> None:
+    generator = CnpjGenerator()
+
+    for type in _CHARACTERS_BY_TYPE:
+        count = len(_iter_all_path(generator, type))
+
+        for label, path in (
+            ("complete_many", partial(_complete_many_path, type)),
+            ("iter_all", partial(_iter_all_path, generator, type)),
+        ):
+            best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+            title = f"{label} ({type}, {count:,} values)"
+            print(f"{title:>48}: {count / best:12,.0f} IDs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark ``CnpjGenerator.sample_unique`` against deduplicating the output
+of ``generate_many`` in a set.
+
+Run from the package root with ``python benchmarks/sample_unique.py``. Prints
+the throughput, in distinct CNPJ values per second, of drawing the same number
+of distinct unformatted values through each path, under each ``type``.
+"""
+
+import timeit
+from functools import partial
+from itertools import islice
+
+from cnpj_gen import CnpjGenerator
+
+_COUNT = 100_000
+_REPEAT = 5
+
+
+def _dedupe_path(generator: CnpjGenerator, type: str) -> set[str]:
+    seen: set[str] = set()
+
+    while len(seen) < _COUNT:
+        seen.update(generator.generate_many(_COUNT - len(seen), type=type))
+
+    return seen
+
+
+def _take_path(generator: CnpjGenerator, type: str) -> list[str]:
+    return generator.sample_unique(type=type).take(_COUNT)
+
+
+def _iterate_path(generator: CnpjGenerator, type: str) -> list[str]:
+    return list(islice(generator.sample_unique(type=type), _COUNT))
+
+
+def main() -> None:
+    generator = CnpjGenerator()
+
+    for type in ("numeric", "alphabetic", "alphanumeric"):
+        for label, path in (
+            ("generate_many + set", _dedupe_path),
+            ("sample_unique take", _take_path),
+            ("sample_unique iterate", _iterate_path),
+        ):
+            best = min(
+                timeit.repeat(partial(path, generator, type), number=1, repeat=_REPEAT)
+            )
+            title = f"{label} ({type})"
+            print(f"{title:>36}: {_COUNT / best:12,.0f} IDs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from .cnpj_gen import cnpj_gen
-from .cnpj_generator import CnpjGenerator
+from .cnpj_generator import CnpjGenerator, CnpjUniqueSampler
 from .cnpj_generator_options import (
     CNPJ_LENGTH,
     CNPJ_PREFIX_MAX_LENGTH,
@@ -27,6 +27,7 @@ __all__ = [
     "CnpjGeneratorOptionsTypeError",
     "CnpjGeneratorTypeError",
     "CnpjType",
+    "CnpjUniqueSampler",
     "cnpj_gen",
 ]
 
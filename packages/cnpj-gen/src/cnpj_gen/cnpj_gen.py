@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 from .cnpj_generator import CnpjGenerator
 
 if TYPE_CHECKING:
+    from lacus.utils import RandomSource
+
     from .types import CnpjGeneratorOptionsInput, CnpjType
 
 
@@ -18,6 +20,7 @@ def cnpj_gen(
     format: bool | None = None,
     prefix: str | None = None,
     type: CnpjType | None = None,
+    rng: RandomSource = None,
 ) -> str:
     """Helper function to simplify the usage of :class:`CnpjGenerator`.
 
@@ -29,7 +32,8 @@ def cnpj_gen(
     Generates a valid 14-character CNPJ (``prefix``, random body for the
     chosen :data:`~cnpj_gen.types.CnpjType`, and computed check digits).
     With default options the result is unformatted alphanumeric; pass
-    ``format=True`` for ``00.000.000/0000-00`` style output.
+    ``format=True`` for ``00.000.000/0000-00`` style output. Pass a seeded
+    ``rng`` (e.g. ``random.Random(seed)``) for reproducible output.
 
     Raises:
         ``CnpjGeneratorOptionsTypeError``: If any option has an invalid type.
@@ -46,6 +50,7 @@ def cnpj_gen(
         format=format,
         prefix=prefix,
         type=type,
+        rng=rng,
     ).generate()
 
 
@@ -2,22 +2,210 @@
 
 from __future__ import annotations
 
+from functools import cache
+from itertools import product
 from typing import TYPE_CHECKING, Any
 
-from cnpj_dv import CnpjCheckDigits
+from cnpj_dv import (
+    CNPJ_CHECK_DIGIT_BY_REMAINDER,
+    CNPJ_FIRST_WEIGHTS,
+    CNPJ_SECOND_DIGIT_WEIGHT,
+    CNPJ_SECOND_WEIGHTS,
+    CnpjCheckDigits,
+    CnpjCheckDigitsStatus,
+)
 from cnpj_dv.exceptions import CnpjCheckDigitsException
-from lacus.utils import generate_random_sequence
+from lacus.utils import (
+    KeyedPermutation,
+    LruCache,
+    generate_random_sequence,
+    generate_random_sequences,
+)
 
 from .cnpj_generator_options import CNPJ_PREFIX_MAX_LENGTH, CnpjGeneratorOptions
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from lacus.utils import RandomSource
+
     from .types import CnpjGeneratorOptionsInput, CnpjType
 
 
+_RESOLVED_OPTIONS_CACHE_SIZE = 32
+_ITER_BATCH_SIZE = 1024
+_CHARACTERS_BY_TYPE = {
+    "numeric": "0123456789",
+    "alphabetic": "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "alphanumeric": "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+}
+_CHUNK_LENGTH_BY_TYPE = {"numeric": 4, "alphabetic": 3, "alphanumeric": 3}
+_DELTA_FACTOR = ord("0")
+_CNPJ_BASE_ID_LENGTH = 8
+_CNPJ_HEAD_LENGTH = CNPJ_PREFIX_MAX_LENGTH - 1
+_ZEROED_BASE_ID = "0" * _CNPJ_BASE_ID_LENGTH
+_ZEROED_BRANCH_HEAD = "0" * (_CNPJ_HEAD_LENGTH - _CNPJ_BASE_ID_LENGTH)
+
+
+def _items_key(mapping: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple((name, value.__class__, value) for name, value in mapping.items())
+
+
+def _override_key(
+    options: CnpjGeneratorOptionsInput | None, keyword_overrides: dict[str, Any]
+) -> tuple[Any, ...] | None:
+    """Return a hashable key identifying a set of per-call overrides, or
+    ``None`` when one of them cannot be hashed.
+
+    Values are keyed along with their class, so ``1`` does not share the
+    entry of ``True`` and still fails the type checks.
+    """
+    if options is None:
+        options_key = None
+    elif isinstance(options, CnpjGeneratorOptions):
+        options_key = _items_key(options.all)
+    elif isinstance(options, dict):
+        options_key = _items_key(options)
+    else:
+        return None
+
+    key = (options_key, _items_key(keyword_overrides))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
 def _format_cnpj(raw: str) -> str:
     return f"{raw[:2]}.{raw[2:5]}.{raw[5:8]}/{raw[8:12]}-{raw[12:14]}"
 
 
+@cache
+def _chunk_table(characters: str, chunk_length: int) -> tuple[str, ...]:
+    """Return every string of ``chunk_length`` characters of ``characters``,
+    so that the string at index ``n`` spells ``n`` in that base.
+    """
+    return tuple("".join(chunk) for chunk in product(characters, repeat=chunk_length))
+
+
+@cache
+def _suffix_table(characters: str, format: bool) -> tuple[tuple[str, ...], ...]:
+    """Return, for each pair of remainders modulo 11 of the weighted sums of
+    the first 11 characters, the tails (last base character and both check
+    digits, with the dash when ``format`` is on) completing a CNPJ with each
+    character of ``characters``, in order.
+
+    The check digits only depend on those remainders and on the last
+    character, so a CNPJ is completed by concatenating its first 11
+    characters with one of these tails.
+    """
+    dash = "-" if format else ""
+    first_weight = CNPJ_FIRST_WEIGHTS[-1]
+    second_weight = CNPJ_SECOND_WEIGHTS[-1]
+    table: list[tuple[str, ...]] = []
+
+    for first_remainder, second_remainder in product(range(11), repeat=2):
+        suffixes: list[str] = []
+
+        for char in characters:
+            value = ord(char) - _DELTA_FACTOR
+            first_digit = CNPJ_CHECK_DIGIT_BY_REMAINDER[
+                (first_remainder + value * first_weight) % 11
+            ]
+            second_digit = CNPJ_CHECK_DIGIT_BY_REMAINDER[
+                (
+                    second_remainder
+                    + value * second_weight
+                    + first_digit * CNPJ_SECOND_DIGIT_WEIGHT
+                )
+                % 11
+            ]
+            suffixes.append(f"{char}{dash}{first_digit}{second_digit}")
+
+        table.append(tuple(suffixes))
+
+    return tuple(table)
+
+
+def _enumerate_cnpjs(prefix: str, characters: str, format: bool) -> Iterator[str]:
+    """Yield every valid CNPJ starting with ``prefix`` whose other base
+    characters come from ``characters``, in ascending order.
+
+    The first 11 characters (the head) advance like an odometer, each step
+    only adjusting the weighted sums by the characters that changed, and
+    every head is completed from :func:`_suffix_table`. Heads with a zeroed
+    base ID are skipped, as are the tails making a zeroed branch ID or 12
+    repeated digits.
+    """
+    if len(prefix) == CNPJ_PREFIX_MAX_LENGTH:
+        tail_characters = prefix[-1]
+        prefix = prefix[:-1]
+    else:
+        tail_characters = characters
+
+    suffix_table = _suffix_table(tail_characters, format)
+    free_positions = range(len(prefix), _CNPJ_HEAD_LENGTH)
+    head_chars = list(prefix) + [characters[0]] * len(free_positions)
+    indexes = [0] * len(free_positions)
+    first_sum = second_sum = 0
+
+    for index, char in enumerate(head_chars):
+        value = ord(char) - _DELTA_FACTOR
+        first_sum += value * CNPJ_FIRST_WEIGHTS[index]
+        second_sum += value * CNPJ_SECOND_WEIGHTS[index]
+
+    values = [ord(char) - _DELTA_FACTOR for char in characters]
+    last_index = len(characters) - 1
+
+    while True:
+        head = "".join(head_chars)
+
+        if head[:_CNPJ_BASE_ID_LENGTH] != _ZEROED_BASE_ID:
+            suffixes = suffix_table[first_sum % 11 * 11 + second_sum % 11]
+            ineligible_chars = set()
+
+            if head.endswith(_ZEROED_BRANCH_HEAD):
+                ineligible_chars.add("0")
+
+            if head[0].isdigit() and head == head[0] * _CNPJ_HEAD_LENGTH:
+                ineligible_chars.add(head[0])
+
+            if ineligible_chars:
+                suffixes = tuple(
+                    suffix for suffix in suffixes if suffix[0] not in ineligible_chars
+                )
+
+            if format:
+                head = f"{head[:2]}.{head[2:5]}.{head[5:8]}/{head[8:]}"
+
+            for suffix in suffixes:
+                yield head + suffix
+
+        position = len(free_positions) - 1
+
+        while position >= 0 and indexes[position] == last_index:
+            indexes[position] = 0
+            index = free_positions[position]
+            delta = values[0] - values[last_index]
+            first_sum += delta * CNPJ_FIRST_WEIGHTS[index]
+            second_sum += delta * CNPJ_SECOND_WEIGHTS[index]
+            head_chars[index] = characters[0]
+            position -= 1
+
+        if position < 0:
+            return
+
+        indexes[position] += 1
+        index = free_positions[position]
+        delta = values[indexes[position]] - values[indexes[position] - 1]
+        first_sum += delta * CNPJ_FIRST_WEIGHTS[index]
+        second_sum += delta * CNPJ_SECOND_WEIGHTS[index]
+        head_chars[index] = characters[indexes[position]]
+
+
 class CnpjGenerator:
     """Generator for CNPJ identifiers.
 
@@ -28,7 +216,7 @@ class CnpjGenerator:
     formatted (``00.000.000/0000-00``).
     """
 
-    __slots__ = ("_options",)
+    __slots__ = ("_options", "_resolved_options", "_rng")
 
     def __init__(
         self,
@@ -37,6 +225,7 @@ class CnpjGenerator:
         format: bool | None = None,
         prefix: str | None = None,
         type: CnpjType | None = None,
+        rng: RandomSource = None,
     ) -> None:
         """Create a new :class:`CnpjGenerator` with optional defaults.
 
@@ -52,6 +241,12 @@ class CnpjGenerator:
         per-call options. When a plain mapping or ``None`` is passed, a
         new :class:`CnpjGeneratorOptions` instance is created from it.
 
+        ``rng`` is the source of randomness of every generated CNPJ:
+        ``None`` (default) uses the cryptographically secure ``secrets``
+        module, while a ``random.Random`` or NumPy ``Generator`` seeded by the
+        caller makes the output reproducible (e.g. for test fixtures) and
+        faster, but predictable.
+
         Raises:
             ``CnpjGeneratorOptionsTypeError``: If any option has an invalid
                 type.
@@ -70,6 +265,18 @@ class CnpjGenerator:
                 type=type,
             )
 
+        self._resolved_options: (
+            LruCache[tuple[Any, ...], CnpjGeneratorOptions] | None
+        ) = None
+        self._rng = rng
+
+    @property
+    def rng(self) -> RandomSource:
+        """Return the source of randomness of the generated CNPJs (``None``
+        for the default ``secrets`` module).
+        """
+        return self._rng
+
     @property
     def options(self) -> CnpjGeneratorOptions:
         """Return default options used when per-call options are omitted.
@@ -107,15 +314,12 @@ class CnpjGenerator:
             ``CnpjGeneratorOptionTypeInvalidException``: If the ``type`` option
                 is not one of the allowed values.
         """
-        if options is None and format is None and prefix is None and type is None:
-            actual_options = self._options
-        else:
-            actual_options = self._merge_options(options, format, prefix, type)
-
+        actual_options = self._resolve_options(options, format, prefix, type)
         characters_to_generate = CNPJ_PREFIX_MAX_LENGTH - len(actual_options.prefix)
         generated_cnpj = actual_options.prefix + generate_random_sequence(
             characters_to_generate,
             actual_options.type,
+            self._rng,
         )
 
         try:
@@ -128,6 +332,204 @@ class CnpjGenerator:
 
         return generated_cnpj
 
+    def generate_many(
+        self,
+        count: int,
+        options: CnpjGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+        type: CnpjType | None = None,
+    ) -> list[str]:
+        """Generate ``count`` valid CNPJ values in a single call.
+
+        Each value is built as by :meth:`generate`, but options are resolved
+        once for the whole batch, the random characters of every value come
+        from one entropy draw, and the check digits are computed by
+        :meth:`CnpjCheckDigits.complete_many <cnpj_dv.CnpjCheckDigits.complete_many>`
+        without one :class:`~cnpj_dv.CnpjCheckDigits` instance per value.
+        Ineligible random values (e.g. a zeroed branch ID) are replaced by a
+        new draw, so exactly ``count`` values are returned.
+
+        Raises:
+            ``ValueError``: If ``count`` is negative.
+            ``CnpjGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of characters.
+            ``CnpjGeneratorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+
+        actual_options = self._resolve_options(options, format, prefix, type)
+
+        return self._generate_batch(count, actual_options)
+
+    def iter_generate(
+        self,
+        options: CnpjGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+        type: CnpjType | None = None,
+    ) -> Iterator[str]:
+        """Return an endless iterator of valid CNPJ values.
+
+        Options are resolved (and validated) once, when this method is
+        called, and values are generated lazily in batches of
+        :meth:`generate_many`, so taking a few values stays cheap while
+        streaming millions of them (e.g. with :func:`itertools.islice`)
+        does not hold them all in memory.
+
+        Raises:
+            ``CnpjGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of characters.
+            ``CnpjGeneratorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        actual_options = self._resolve_options(options, format, prefix, type)
+
+        return self._iter_batches(actual_options)
+
+    def sample_unique(
+        self,
+        options: CnpjGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+        type: CnpjType | None = None,
+        key: int | None = None,
+        cursor: int = 0,
+    ) -> CnpjUniqueSampler:
+        """Return a :class:`CnpjUniqueSampler` over the CNPJ values allowed
+        by the resolved options, which never repeats a value.
+
+        Unlike :meth:`generate_many`, which draws every value independently
+        and may repeat one, the sampler walks a keyed permutation of every
+        possible base, in constant memory. Its ``key`` is drawn from this
+        generator's ``rng`` when omitted; pass a saved ``key`` and
+        ``cursor`` to resume an earlier sampler.
+
+        Raises:
+            ``CnpjGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of characters.
+            ``CnpjGeneratorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+            ``TypeError``: If ``key`` or ``cursor`` is not an integer.
+            ``ValueError``: If ``cursor`` is out of range.
+        """
+        actual_options = self._resolve_options(options, format, prefix, type)
+
+        return CnpjUniqueSampler(actual_options, key=key, cursor=cursor, rng=self._rng)
+
+    def iter_all(
+        self,
+        options: CnpjGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+        type: CnpjType | None = None,
+    ) -> Iterator[str]:
+        """Return an iterator over every valid CNPJ allowed by the options,
+        in ascending order.
+
+        The characters after ``prefix`` run through the ``type`` character
+        set like an odometer, and the weighted sums of the check digits are
+        updated by each step instead of recomputed, so every value costs
+        about one string concatenation. Ineligible bases (zeroed base or
+        branch ID, repeated digits) are skipped. Values are yielded lazily,
+        in constant memory; the options are resolved when this method is
+        called.
+
+        Raises:
+            ``CnpjGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of characters.
+            ``CnpjGeneratorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        actual_options = self._resolve_options(options, format, prefix, type)
+
+        return _enumerate_cnpjs(
+            actual_options.prefix,
+            _CHARACTERS_BY_TYPE[actual_options.type],
+            actual_options.format,
+        )
+
+    def _iter_batches(self, actual_options: CnpjGeneratorOptions) -> Iterator[str]:
+        while True:
+            yield from self._generate_batch(_ITER_BATCH_SIZE, actual_options)
+
+    def _generate_batch(
+        self, count: int, actual_options: CnpjGeneratorOptions
+    ) -> list[str]:
+        """Generate ``count`` CNPJ values under already resolved options."""
+        cnpj_prefix = actual_options.prefix
+        characters_to_generate = CNPJ_PREFIX_MAX_LENGTH - len(cnpj_prefix)
+        generated_cnpjs: list[str] = []
+
+        while len(generated_cnpjs) < count:
+            sequences = generate_random_sequences(
+                count - len(generated_cnpjs),
+                characters_to_generate,
+                actual_options.type,
+                self._rng,
+            )
+            completed_cnpjs = CnpjCheckDigits.complete_many(
+                [cnpj_prefix + sequence for sequence in sequences]
+            )
+            generated_cnpjs.extend(cnpj for cnpj in completed_cnpjs if cnpj is not None)
+
+        if actual_options.format:
+            return [_format_cnpj(cnpj) for cnpj in generated_cnpjs]
+
+        return generated_cnpjs
+
+    def _resolve_options(
+        self,
+        options: CnpjGeneratorOptionsInput | None,
+        format: bool | None,
+        prefix: str | None,
+        type: CnpjType | None,
+    ) -> CnpjGeneratorOptions:
+        """Return the instance defaults, or merge per-call overrides over them.
+
+        Merged options are memoized per defaults
+        :attr:`~CnpjGeneratorOptions.version` and overrides, so repeating the
+        same overrides skips building and validating a new options instance.
+        """
+        if options is None and format is None and prefix is None and type is None:
+            return self._options
+
+        override_key = _override_key(
+            options, {"format": format, "prefix": prefix, "type": type}
+        )
+
+        if override_key is None:
+            return self._merge_options(options, format, prefix, type)
+
+        resolved_options = self._resolved_options
+
+        if resolved_options is None:
+            resolved_options = LruCache(_RESOLVED_OPTIONS_CACHE_SIZE)
+            self._resolved_options = resolved_options
+
+        resolved_key = (self._options.version, override_key)
+        actual_options = resolved_options.get(resolved_key)
+
+        if actual_options is None:
+            actual_options = self._merge_options(options, format, prefix, type)
+            resolved_options.put(resolved_key, actual_options)
+
+        return actual_options
+
     def _merge_options(
         self,
         options: CnpjGeneratorOptionsInput | None,
@@ -154,4 +556,177 @@ class CnpjGenerator:
         return CnpjGeneratorOptions(*layers)
 
 
-__all__ = ["CnpjGenerator"]
+class CnpjUniqueSampler:
+    """Iterator over distinct valid CNPJ values, in a shuffled order.
+
+    The bases that the options allow (the ``prefix`` followed by every
+    combination of characters of the configured ``type``) are numbered from
+    0 to :attr:`size` - 1 and visited in the order of a
+    :class:`~lacus.utils.KeyedPermutation` of that range, so no CNPJ is
+    ever repeated, and only the permutation ``key`` and a :attr:`cursor`
+    are kept in memory, however many values are drawn. Bases that are not
+    eligible for check digits (a zeroed branch ID, repeated digits) are
+    skipped. Iteration stops once every base was visited.
+
+    To resume later, save :attr:`key` and :attr:`cursor` and create a new
+    sampler with the same options and those values: it continues where
+    this one stopped, without repeating any value.
+    """
+
+    __slots__ = (
+        "_chunk_length",
+        "_chunk_radix",
+        "_chunks",
+        "_cursor",
+        "_format",
+        "_free_length",
+        "_numeric",
+        "_permutation",
+        "_prefix",
+    )
+
+    def __init__(
+        self,
+        options: CnpjGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+        type: CnpjType | None = None,
+        key: int | None = None,
+        cursor: int = 0,
+        rng: RandomSource = None,
+    ) -> None:
+        """Create a sampler over the CNPJ values allowed by the options.
+
+        Options are handled as by :class:`CnpjGenerator`, but read only
+        here: changing them later does not affect this sampler. ``key``
+        selects the order of the values and is drawn from ``rng`` (as
+        for :class:`CnpjGenerator`) when omitted; ``cursor`` is the
+        position to start from.
+
+        Raises:
+            ``CnpjGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of characters.
+            ``CnpjGeneratorOptionTypeInvalidException``: If the ``type``
+                option is not one of the allowed values.
+            ``TypeError``: If ``key`` or ``cursor`` is not an integer.
+            ``ValueError``: If ``cursor`` is not between 0 and :attr:`size`.
+        """
+        if not isinstance(options, CnpjGeneratorOptions):
+            options = CnpjGeneratorOptions(
+                options, format=format, prefix=prefix, type=type
+            )
+
+        self._format = options.format
+        self._prefix = options.prefix
+        characters = _CHARACTERS_BY_TYPE[options.type]
+        self._numeric = options.type == "numeric"
+        self._chunk_length = _CHUNK_LENGTH_BY_TYPE[options.type]
+        self._chunk_radix = len(characters) ** self._chunk_length
+        self._chunks = _chunk_table(characters, self._chunk_length)
+        self._free_length = CNPJ_PREFIX_MAX_LENGTH - len(self._prefix)
+        self._permutation = KeyedPermutation(
+            len(characters) ** self._free_length, key, rng
+        )
+
+        if isinstance(cursor, bool) or not isinstance(cursor, int):
+            raise TypeError(
+                f"cursor must be an integer, got {cursor.__class__.__name__}"
+            )
+
+        if not 0 <= cursor <= self.size:
+            raise ValueError(f"cursor must be between 0 and {self.size}, got {cursor}")
+
+        self._cursor = cursor
+
+    @property
+    def key(self) -> int:
+        """Key of the permutation that orders the values."""
+        return self._permutation.key
+
+    @property
+    def cursor(self) -> int:
+        """Number of bases visited so far, including skipped ones."""
+        return self._cursor
+
+    @property
+    def size(self) -> int:
+        """Number of bases the options allow, an upper bound on the number
+        of values this sampler yields.
+        """
+        return self._permutation.size
+
+    def take(self, count: int) -> list[str]:
+        """Return the next ``count`` values, or fewer if the sampler runs
+        out of bases.
+
+        Completes the check digits of the whole batch with
+        :meth:`CnpjCheckDigits.complete_many <cnpj_dv.CnpjCheckDigits.complete_many>`,
+        which is faster than taking the values one by one.
+
+        Raises:
+            ``ValueError``: If ``count`` is negative.
+        """
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+
+        prefix = self._prefix
+        size = self.size
+        taken_cnpjs: list[str] = []
+
+        while len(taken_cnpjs) < count and self._cursor < size:
+            stop = min(self._cursor + count - len(taken_cnpjs), size)
+            bases = [
+                prefix + self._spell(base_index)
+                for base_index in self._permutation.permute_range(self._cursor, stop)
+            ]
+            self._cursor = stop
+            completed_cnpjs = CnpjCheckDigits.complete_many(bases)
+            taken_cnpjs.extend(cnpj for cnpj in completed_cnpjs if cnpj is not None)
+
+        if self._format:
+            return [_format_cnpj(cnpj) for cnpj in taken_cnpjs]
+
+        return taken_cnpjs
+
+    def __iter__(self) -> CnpjUniqueSampler:
+        return self
+
+    def __next__(self) -> str:
+        while self._cursor < self.size:
+            base = self._prefix + self._spell(self._permutation.permute(self._cursor))
+            self._cursor += 1
+            status, check_digits = CnpjCheckDigits.classify(base)
+
+            if status is CnpjCheckDigitsStatus.OK:
+                cnpj = base + check_digits
+
+                return _format_cnpj(cnpj) if self._format else cnpj
+
+        raise StopIteration
+
+    def _spell(self, base_index: int) -> str:
+        """Spell ``base_index`` with the characters of the configured type,
+        padded to the number of characters after the prefix.
+        """
+        length = self._free_length
+
+        if self._numeric:
+            return str(base_index).zfill(length)
+
+        chunks = self._chunks
+        chunk_length = self._chunk_length
+        chunk_radix = self._chunk_radix
+        spelled = ""
+
+        while length > chunk_length:
+            base_index, remainder = divmod(base_index, chunk_radix)
+            spelled = chunks[remainder] + spelled
+            length -= chunk_length
+
+        return chunks[base_index][chunk_length - length :] + spelled
+
+
+__all__ = ["CnpjGenerator", "CnpjUniqueSampler"]
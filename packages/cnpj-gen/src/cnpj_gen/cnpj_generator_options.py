@@ -89,6 +89,8 @@ class CnpjGeneratorOptions:
                 is not one of the allowed values.
         """
         self._options: dict[str, Any] = {}
+        # Bumped by every setter; see the ``version`` property.
+        self._version = 0
 
         if isinstance(options, CnpjGeneratorOptions):
             self.format = options.format
@@ -121,6 +123,16 @@ class CnpjGeneratorOptions:
 
         return MappingProxyType(snapshot)  # type: ignore[return-value]
 
+    @property
+    def version(self) -> int:
+        """Return a counter that grows every time an option is set.
+
+        Two reads that return the same number saw the same options, which
+        lets caches built on top of this instance tell when to drop their
+        entries.
+        """
+        return self._version
+
     @property
     def format(self) -> bool:
         """Return whether the generated CNPJ will use standard formatting.
@@ -142,6 +154,7 @@ class CnpjGeneratorOptions:
         )
 
         self._options["format"] = actual_format
+        self._version += 1
 
     @property
     def prefix(self) -> str:
@@ -188,6 +201,7 @@ class CnpjGeneratorOptions:
         self._validate_prefix_non_repeated_digits(actual_prefix)
 
         self._options["prefix"] = actual_prefix
+        self._version += 1
 
     @property
     def type(self) -> CnpjType:
@@ -224,6 +238,7 @@ class CnpjGeneratorOptions:
             )
 
         self._options["type"] = actual_type
+        self._version += 1
 
     def set(self, options: CnpjGeneratorOptionsInput) -> CnpjGeneratorOptions:
         """Update multiple options at once, preserving omitted fields.
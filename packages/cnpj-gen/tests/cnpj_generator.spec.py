@@ -13,12 +13,15 @@ Dropped cases:
   artifacts; not applicable to the Python package layout).
 """
 
+import random
 import re
 from collections.abc import Callable
+from itertools import islice
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+from cnpj_dv import CnpjCheckDigits
 from cnpj_gen import (
     CnpjGenerator,
     CnpjGeneratorOptionPrefixInvalidException,
@@ -26,6 +29,7 @@ from cnpj_gen import (
     CnpjGeneratorOptionsTypeError,
     CnpjGeneratorOptionTypeInvalidException,
 )
+from lacus.utils import generate_random_sequences
 
 GenerateFn = Callable[..., str]
 GeneratorFactory = Callable[[dict[str, Any]], GenerateFn]
@@ -503,10 +507,10 @@ def describe_cnpj_generator():
                     assert len(result) == 14
                     assert result.startswith("12345678")
                     assert mock_sequence.call_count == 2
-                    mock_sequence.assert_any_call(4, "alphanumeric")
+                    mock_sequence.assert_any_call(4, "alphanumeric", None)
                     assert mock_sequence.call_args_list == [
-                        ((4, "alphanumeric"),),
-                        ((4, "alphanumeric"),),
+                        ((4, "alphanumeric", None),),
+                        ((4, "alphanumeric", None),),
                     ]
 
             def it_retries_with_the_same_per_call_options():
@@ -535,3 +539,239 @@ def describe_cnpj_generator():
                             {"format": False, "prefix": "00", "type": "alphanumeric"},
                         ),
                     ]
+
+    def describe_per_call_options_resolution():
+        def it_reuses_the_options_resolved_for_repeated_overrides():
+            generator = CnpjGenerator()
+
+            with patch.object(
+                CnpjGeneratorOptions,
+                "set",
+                autospec=True,
+                side_effect=CnpjGeneratorOptions.set,
+            ) as set_spy:
+                generator.generate(prefix="12")
+                merges_after_first_call = set_spy.call_count
+
+                for _ in range(3):
+                    assert generator.generate(prefix="12").startswith("12")
+
+            assert set_spy.call_count == merges_after_first_call
+
+        def it_resolves_again_after_the_default_options_change():
+            generator = CnpjGenerator()
+
+            assert len(generator.generate(prefix="12")) == 14
+
+            generator.options.format = True
+
+            assert len(generator.generate(prefix="12")) == 18
+
+        def it_still_raises_for_invalid_overrides_after_valid_ones():
+            generator = CnpjGenerator()
+
+            generator.generate(prefix="12")
+
+            with pytest.raises(CnpjGeneratorOptionsTypeError):
+                generator.generate(prefix=12)
+
+    def describe_generate_many_method():
+        def it_returns_the_requested_number_of_valid_cnpjs():
+            results = CnpjGenerator().generate_many(500)
+
+            assert len(results) == 500
+            assert len(set(results)) >= 498
+
+            for result in results:
+                assert re.fullmatch(r"[0-9A-Z]{12}\d{2}", result)
+                assert CnpjCheckDigits(result[:12]).cnpj == result
+
+        def it_returns_an_empty_list_for_zero():
+            assert CnpjGenerator().generate_many(0) == []
+
+        def it_raises_value_error_for_a_negative_count():
+            with pytest.raises(ValueError, match="count must be non-negative"):
+                CnpjGenerator().generate_many(-1)
+
+        @pytest.mark.parametrize(("type_name", "pattern"), TYPE_CONTEXTS)
+        def it_applies_the_per_call_options(type_name, pattern):
+            results = CnpjGenerator().generate_many(
+                50, {"prefix": "AB123CDE"}, format=True, type=type_name
+            )
+
+            for result in results:
+                assert re.fullmatch(rf"AB\.123\.CDE/{pattern}{{4}}-\d{{2}}", result)
+
+        def it_uses_the_default_options():
+            generator = CnpjGenerator(prefix="123456780001")
+
+            assert generator.generate_many(3) == [generator.generate()] * 3
+
+        def it_replaces_ineligible_random_values():
+            with patch(
+                "cnpj_gen.cnpj_generator.generate_random_sequences",
+            ) as mock_sequences:
+                mock_sequences.side_effect = [
+                    ["0000", "0001", "0000"],
+                    ["0002", "0000"],
+                    ["0003"],
+                ]
+
+                results = CnpjGenerator(prefix="12345678").generate_many(3)
+
+            assert [result[:12] for result in results] == [
+                "123456780001",
+                "123456780002",
+                "123456780003",
+            ]
+            assert mock_sequences.call_args_list == [
+                ((3, 4, "alphanumeric", None),),
+                ((2, 4, "alphanumeric", None),),
+                ((1, 4, "alphanumeric", None),),
+            ]
+
+        def it_still_raises_for_invalid_options():
+            with pytest.raises(CnpjGeneratorOptionTypeInvalidException):
+                CnpjGenerator().generate_many(1, type="hex")
+
+    def describe_iter_generate_method():
+        def it_yields_valid_cnpjs_lazily():
+            with patch(
+                "cnpj_gen.cnpj_generator.generate_random_sequences",
+                wraps=generate_random_sequences,
+            ) as mock_sequences:
+                results = list(
+                    islice(CnpjGenerator().iter_generate(format=True), 2_000)
+                )
+
+            assert len(results) == 2_000
+            assert mock_sequences.call_count == 2
+
+            for result in results:
+                raw = re.sub(r"[./-]", "", result)
+
+                assert CnpjCheckDigits(raw[:12]).cnpj == raw
+
+        def it_resolves_the_options_when_called():
+            with pytest.raises(CnpjGeneratorOptionPrefixInvalidException):
+                CnpjGenerator().iter_generate(prefix="00000000")
+
+        def it_keeps_the_options_resolved_when_called():
+            generator = CnpjGenerator()
+            results = generator.iter_generate(prefix="AB")
+
+            generator.options.prefix = "CD"
+
+            assert all(result.startswith("AB") for result in islice(results, 10))
+
+    def describe_iter_all_method():
+        def it_yields_every_valid_cnpj_under_the_prefix_in_order():
+            results = list(
+                CnpjGenerator().iter_all(prefix="1234567800", type="numeric")
+            )
+            expected = [
+                CnpjCheckDigits(f"1234567800{suffix:02d}").cnpj
+                for suffix in range(1, 100)
+            ]
+
+            assert results == expected
+
+        @pytest.mark.parametrize(("type_name", "pattern"), TYPE_CONTEXTS)
+        def it_walks_the_characters_of_the_type(type_name, pattern):
+            results = list(
+                CnpjGenerator().iter_all(prefix="AB123CDE00", type=type_name)
+            )
+
+            assert results == sorted(set(results))
+
+            for result in results:
+                assert re.fullmatch(rf"AB123CDE00{pattern}{{2}}\d{{2}}", result)
+                assert CnpjCheckDigits(result[:12]).cnpj == result
+
+        def it_skips_zeroed_branch_ids_and_repeated_digits():
+            results = list(
+                CnpjGenerator().iter_all(prefix="1111111111", type="numeric")
+            )
+
+            assert len(results) == 99
+            assert not any(result.startswith("111111111111") for result in results)
+
+            results = list(
+                CnpjGenerator().iter_all(prefix="1234567800", type="alphanumeric")
+            )
+
+            assert len(results) == 36**2 - 1
+            assert not any(result.startswith("123456780000") for result in results)
+
+        def it_skips_zeroed_base_ids():
+            results = list(
+                islice(CnpjGenerator(type="numeric").iter_all(prefix="0000000"), 3)
+            )
+
+            assert [result[:12] for result in results] == [
+                "000000010001",
+                "000000010002",
+                "000000010003",
+            ]
+
+        def it_yields_the_single_cnpj_of_a_full_prefix():
+            assert list(CnpjGenerator().iter_all(prefix="123456780001")) == [
+                "12345678000195"
+            ]
+
+        def it_applies_the_format_option():
+            results = list(CnpjGenerator(format=True).iter_all(prefix="AB123CDE00"))
+
+            assert results[:2] == ["AB.123.CDE/0001-55", "AB.123.CDE/0002-36"]
+
+            for result in results:
+                assert re.fullmatch(r"AB\.123\.CDE/00[0-9A-Z]{2}-\d{2}", result)
+
+        def it_resolves_the_options_when_called():
+            with pytest.raises(CnpjGeneratorOptionPrefixInvalidException):
+                CnpjGenerator().iter_all(prefix="00000000")
+
+        def it_keeps_the_options_resolved_when_called():
+            generator = CnpjGenerator()
+            results = generator.iter_all(prefix="AB")
+
+            generator.options.prefix = "CD"
+
+            assert all(result.startswith("AB") for result in islice(results, 10))
+
+    def describe_rng():
+        def it_uses_secrets_by_default():
+            assert CnpjGenerator().rng is None
+
+        def it_exposes_the_given_rng():
+            rng = random.Random(7)
+
+            assert CnpjGenerator(rng=rng).rng is rng
+
+        def it_reproduces_the_values_of_a_seeded_random():
+            first = CnpjGenerator(format=True, rng=random.Random(7))
+            second = CnpjGenerator(format=True, rng=random.Random(7))
+
+            assert [first.generate() for _ in range(20)] == [
+                second.generate() for _ in range(20)
+            ]
+            assert first.generate_many(100) == second.generate_many(100)
+            assert list(islice(first.iter_generate(), 100)) == list(
+                islice(second.iter_generate(), 100)
+            )
+
+        def it_generates_valid_values_with_a_seeded_random():
+            for result in CnpjGenerator(rng=random.Random(7)).generate_many(200):
+                assert CnpjCheckDigits(result[:12]).cnpj == result
+
+        def it_reproduces_the_values_of_a_seeded_numpy_generator():
+            np = pytest.importorskip("numpy")
+
+            first = CnpjGenerator(rng=np.random.default_rng(7)).generate_many(100)
+            second = CnpjGenerator(rng=np.random.default_rng(7)).generate_many(100)
+
+            assert first == second
+
+        def it_raises_type_error_for_an_unsupported_rng():
+            with pytest.raises(TypeError, match="rng must be"):
+                CnpjGenerator(rng=42).generate()
@@ -0,0 +1,157 @@
+import random
+import re
+from itertools import islice
+
+import pytest
+from cnpj_dv import CnpjCheckDigits
+from cnpj_gen import (
+    CnpjGenerator,
+    CnpjGeneratorOptionPrefixInvalidException,
+    CnpjGeneratorOptions,
+    CnpjGeneratorOptionTypeInvalidException,
+    CnpjUniqueSampler,
+)
+
+
+def describe_cnpj_unique_sampler():
+    def describe_when_created():
+        def it_counts_the_bases_allowed_by_the_options():
+            assert CnpjUniqueSampler(key=1).size == 36**12
+            assert CnpjUniqueSampler(type="numeric", key=1).size == 10**12
+            assert (
+                CnpjUniqueSampler(prefix="AB123CDE00", type="alphabetic", key=1).size
+                == 676
+            )
+            assert CnpjUniqueSampler(prefix="123456780001", key=1).size == 1
+
+        def it_accepts_an_options_instance():
+            options = CnpjGeneratorOptions(prefix="1234567800", type="numeric")
+
+            assert CnpjUniqueSampler(options, key=1).size == 100
+
+        def it_exposes_the_key_and_cursor():
+            sampler = CnpjUniqueSampler(key=42, cursor=7)
+
+            assert (sampler.key, sampler.cursor) == (42, 7)
+
+        def it_draws_the_key_from_the_given_rng():
+            first = CnpjUniqueSampler(rng=random.Random(7))
+            second = CnpjUniqueSampler(rng=random.Random(7))
+
+            assert first.key == second.key
+
+        def it_raises_for_invalid_options():
+            with pytest.raises(CnpjGeneratorOptionTypeInvalidException):
+                CnpjUniqueSampler(type="hex")
+
+            with pytest.raises(CnpjGeneratorOptionPrefixInvalidException):
+                CnpjUniqueSampler(prefix="00000000")
+
+        @pytest.mark.parametrize("cursor", [-1, 101])
+        def it_rejects_a_cursor_out_of_range(cursor):
+            with pytest.raises(ValueError, match="cursor must be between 0 and 100"):
+                CnpjUniqueSampler(prefix="1234567800", type="numeric", cursor=cursor)
+
+        @pytest.mark.parametrize("cursor", [1.5, "3", True, None])
+        def it_rejects_a_non_integer_cursor(cursor):
+            with pytest.raises(TypeError, match="cursor must be an integer"):
+                CnpjUniqueSampler(cursor=cursor)
+
+        def it_rejects_a_non_integer_key():
+            with pytest.raises(TypeError, match="key must be an integer"):
+                CnpjUniqueSampler(key="1")
+
+    def describe_take():
+        def it_returns_distinct_valid_cnpjs():
+            results = CnpjUniqueSampler(key=3).take(2_000)
+
+            assert len(set(results)) == 2_000
+
+            for result in results:
+                assert re.fullmatch(r"[0-9A-Z]{12}\d{2}", result)
+                assert CnpjCheckDigits(result[:12]).cnpj == result
+
+        @pytest.mark.parametrize(
+            ("type_name", "pattern"),
+            [
+                ("alphabetic", r"[A-Z]{4}"),
+                ("alphanumeric", r"[0-9A-Z]{4}"),
+                ("numeric", r"\d{4}"),
+            ],
+        )
+        def it_applies_the_options(type_name, pattern):
+            results = CnpjUniqueSampler(
+                prefix="AB123CDE", type=type_name, format=True, key=3
+            ).take(100)
+
+            for result in results:
+                assert re.fullmatch(rf"AB\.123\.CDE/{pattern}-\d{{2}}", result)
+
+        def it_visits_every_base_once_and_skips_ineligible_ones():
+            sampler = CnpjUniqueSampler(prefix="1234567800", type="numeric", key=3)
+            results = sampler.take(1_000)
+
+            assert sorted(result[:12] for result in results) == [
+                f"1234567800{suffix:02d}" for suffix in range(1, 100)
+            ]
+            assert sampler.cursor == sampler.size == 100
+            assert sampler.take(10) == []
+
+        def it_returns_an_empty_list_for_zero():
+            assert CnpjUniqueSampler(key=3).take(0) == []
+
+        def it_raises_value_error_for_a_negative_count():
+            with pytest.raises(ValueError, match="count must be non-negative"):
+                CnpjUniqueSampler(key=3).take(-1)
+
+        def it_follows_the_order_of_the_key():
+            first = CnpjUniqueSampler(key=5).take(100)
+
+            assert CnpjUniqueSampler(key=5).take(100) == first
+            assert CnpjUniqueSampler(key=6).take(100) != first
+
+    def describe_iteration():
+        def it_yields_the_same_values_as_take():
+            sampler = CnpjUniqueSampler(prefix="AB123CDE00", format=True, key=9)
+
+            assert list(islice(sampler, 300)) == CnpjUniqueSampler(
+                prefix="AB123CDE00", format=True, key=9
+            ).take(300)
+            assert sampler.cursor >= 300
+
+        def it_stops_when_every_base_was_visited():
+            results = list(CnpjUniqueSampler(prefix="AB123CDE00", key=9))
+
+            assert len(results) == len(set(results)) == 36**2 - 1
+
+    def describe_resuming():
+        def it_continues_from_the_saved_key_and_cursor():
+            sampler = CnpjUniqueSampler(type="numeric", key=11)
+            first = sampler.take(500)
+            resumed = CnpjUniqueSampler(
+                type="numeric", key=sampler.key, cursor=sampler.cursor
+            )
+
+            assert first + resumed.take(500) == CnpjUniqueSampler(
+                type="numeric", key=11
+            ).take(1_000)
+
+    def describe_generator_sample_unique_method():
+        def it_resolves_the_generator_options():
+            generator = CnpjGenerator(prefix="1234567800", type="numeric")
+            sampler = generator.sample_unique(format=True, key=3)
+
+            generator.options.prefix = "AB"
+
+            assert sampler.size == 100
+            assert all(
+                re.fullmatch(r"12\.345\.678/00\d{2}-\d{2}", result)
+                for result in sampler.take(10)
+            )
+
+        def it_draws_the_key_from_the_generator_rng():
+            first = CnpjGenerator(rng=random.Random(7)).sample_unique()
+            second = CnpjGenerator(rng=random.Random(7)).sample_unique()
+
+            assert first.key == second.key
+            assert first.take(50) == second.take(50)
@@ -12,6 +12,7 @@ from cnpj_fmt import (
     CnpjFormatterOptions,
     CnpjFormatterOptionsForbiddenKeyCharacterException,
     CnpjFormatterOptionsHiddenRangeInvalidException,
+    CnpjFormatterOptionsTemplateInvalidException,
     CnpjFormatterOptionsTypeError,
     CnpjFormatterTypeError,
     cnpj_fmt,
@@ -47,6 +48,7 @@ __all__ = [
     "CnpjFormatterOptions",
     "CnpjFormatterOptionsForbiddenKeyCharacterException",
     "CnpjFormatterOptionsHiddenRangeInvalidException",
+    "CnpjFormatterOptionsTemplateInvalidException",
     "CnpjFormatterOptionsTypeError",
     "CnpjFormatterTypeError",
     "CnpjGenerator",
@@ -60,6 +60,8 @@ class CnpjUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CnpjFormatterOptionsForbiddenKeyCharacterException``: If any
                 formatter key option contains a disallowed character.
+            ``CnpjFormatterOptionsTemplateInvalidException``: If the formatter
+                ``template`` does not have exactly 14 ``#`` slots.
             ``CnpjGeneratorOptionsTypeError``: If generator options have an
                 invalid type.
             ``CnpjGeneratorOptionPrefixInvalidException``: If generator
@@ -152,6 +154,8 @@ class CnpjUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CnpjFormatterOptionsForbiddenKeyCharacterException``: If any key
                 option contains a disallowed character.
+            ``CnpjFormatterOptionsTemplateInvalidException``: If ``template``
+                does not have exactly 14 ``#`` slots.
         """
         self._formatter = self._resolve_formatter(value)
 
@@ -235,6 +239,7 @@ class CnpjUtils:
         dot_key: str | None = None,
         slash_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: Any | None = None,
@@ -252,6 +257,8 @@ class CnpjUtils:
 
         When valid, the result may be further transformed according to options:
 
+        - If ``template`` is set, the characters fill its ``#`` slots instead
+          of the mask built from ``dot_key``, ``slash_key`` and ``dash_key``.
         - If ``hidden`` is ``True``, characters between ``hidden_start`` and
           ``hidden_end`` (inclusive) are replaced with ``hidden_key``.
         - If ``escape`` is ``True``, HTML special characters are escaped.
@@ -269,6 +276,8 @@ class CnpjUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CnpjFormatterOptionsForbiddenKeyCharacterException``: If any key
                 option contains a disallowed character.
+            ``CnpjFormatterOptionsTemplateInvalidException``: If ``template``
+                does not have exactly 14 ``#`` slots.
         """
         format_kwargs = _format_forward_kwargs(
             hidden=hidden,
@@ -278,6 +287,7 @@ class CnpjUtils:
             dot_key=dot_key,
             slash_key=slash_key,
             dash_key=dash_key,
+            template=template,
             escape=escape,
             encode=encode,
             on_fail=on_fail,
@@ -395,6 +405,7 @@ def _format_forward_kwargs(
     dot_key: str | None,
     slash_key: str | None,
     dash_key: str | None,
+    template: str | None,
     escape: bool | None,
     encode: bool | None,
     on_fail: Any | None,
@@ -422,6 +433,9 @@ def _format_forward_kwargs(
     if dash_key is not None:
         result["dash_key"] = dash_key
 
+    if template is not None:
+        result["template"] = template
+
     if escape is not None:
         result["escape"] = escape
 
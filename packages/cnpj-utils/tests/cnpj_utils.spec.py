@@ -31,6 +31,7 @@ from cnpj_fmt import (
     CnpjFormatterOptions,
     CnpjFormatterOptionsForbiddenKeyCharacterException,
     CnpjFormatterOptionsHiddenRangeInvalidException,
+    CnpjFormatterOptionsTemplateInvalidException,
 )
 from cnpj_gen import (
     CnpjGenerator,
@@ -665,6 +666,17 @@ def describe_cnpj_utils():
 
             assert "#" in result
 
+        def it_forwards_the_template_option():
+            utils = CnpjUtils()
+
+            assert utils.format("12ABC34500DE99", template="##-###-###-####-##") == (
+                "12-ABC-345-00DE-99"
+            )
+
+        def it_throws_template_invalid_exception_for_a_template_without_14_slots():
+            with pytest.raises(CnpjFormatterOptionsTemplateInvalidException):
+                CnpjUtils().format("12ABC34500DE99", template="##.###")
+
         def describe_format_contexts():
             @pytest.mark.parametrize("format_cnpj", FORMAT_FACTORIES)
             def it_matches_cnpj_formatter_format_behavior(format_cnpj: FormatFn):
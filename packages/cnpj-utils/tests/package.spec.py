@@ -70,6 +70,7 @@ def describe_the_cnpj_utils_package_api():
                 "CnpjFormatterInputLengthException",
                 "CnpjFormatterOptionsHiddenRangeInvalidException",
                 "CnpjFormatterOptionsForbiddenKeyCharacterException",
+                "CnpjFormatterOptionsTemplateInvalidException",
                 "cnpj_gen",
                 "CnpjGenerator",
                 "CnpjGeneratorOptions",
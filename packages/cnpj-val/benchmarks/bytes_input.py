@@ -0,0 +1,53 @@
+"""Benchmark ``CnpjValidator.is_valid`` on bytes-like input against ``str``.
+
+Run from the package root with ``python benchmarks/bytes_input.py``. Prints
+the per-item cost of validating formatted CNPJs given as ``str``, as
+``bytes`` and as ``memoryview`` slices of a single buffer, as read from a
+binary file.
+"""
+
+import random
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import CnpjValidator
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+    cnpjs = CnpjCheckDigits.complete_many(
+        "".join(rng.choices(_ALPHABET, k=12)) for _ in range(_SAMPLE_SIZE)
+    )
+
+    return [f"{c[:2]}.{c[2:5]}.{c[5:8]}/{c[8:12]}-{c[12:]}" for c in cnpjs if c]
+
+
+def main() -> None:
+    validator = CnpjValidator()
+    str_cnpjs = _sample_cnpjs()
+    bytes_cnpjs = [cnpj.encode() for cnpj in str_cnpjs]
+    buffer = memoryview(b"".join(bytes_cnpjs))
+    size = len(bytes_cnpjs[0])
+    memoryview_cnpjs = [buffer[i : i + size] for i in range(0, len(buffer), size)]
+
+    for label, cnpj_inputs in (
+        ("str", str_cnpjs),
+        ("bytes", bytes_cnpjs),
+        ("memoryview", memoryview_cnpjs),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda i=cnpj_inputs: [validator.is_valid(cnpj) for cnpj in i],
+                number=1,
+                repeat=_REPEAT,
+            )
+        )
+        print(f"{label:>10}: {best / len(cnpj_inputs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark ``CnpjIncrementalValidator`` against re-validating the whole
+field on every keystroke.
+
+Run from the package root with ``python benchmarks/incremental.py``. Feeds the
+same CNPJs one character at a time and prints the per-character cost of
+pushing into an incremental validator and of calling ``CnpjValidator.is_valid``
+on the text received so far.
+"""
+
+import random
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import CnpjIncrementalValidator, CnpjValidator
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 2_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+
+    return [
+        CnpjCheckDigits("".join(rng.choices(_ALPHABET, k=12))).cnpj
+        for _ in range(_SAMPLE_SIZE)
+    ]
+
+
+def _push_each_character(cnpjs: list[str]) -> None:
+    validator = CnpjIncrementalValidator()
+
+    for cnpj in cnpjs:
+        validator.reset()
+
+        for char in cnpj:
+            validator.push(char)
+            validator.is_valid  # noqa: B018
+
+
+def _revalidate_each_character(cnpjs: list[str]) -> None:
+    validator = CnpjValidator()
+
+    for cnpj in cnpjs:
+        for end in range(1, len(cnpj) + 1):
+            validator.is_valid(cnpj[:end])
+
+
+def main() -> None:
+    cnpjs = _sample_cnpjs()
+    chars = sum(len(cnpj) for cnpj in cnpjs)
+
+    for label, run in (
+        ("incremental", _push_each_character),
+        ("revalidate", _revalidate_each_character),
+    ):
+        best = min(timeit.repeat(lambda run=run: run(cnpjs), number=1, repeat=_REPEAT))
+        print(f"{label:>11}: {best / chars * 1e9:8.1f} ns/char")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark ``CnpjValidator.inspect`` against ``is_valid``.
+
+Run from the package root with ``python benchmarks/inspect.py``. Prints the
+per-item cost of validating the same mix of valid and invalid CNPJs with
+``is_valid``, with ``inspect`` and with the batch ``inspect_many``.
+"""
+
+import random
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import CnpjValidator
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+    cnpjs = CnpjCheckDigits.complete_many(
+        "".join(rng.choices(_ALPHABET, k=12)) for _ in range(_SAMPLE_SIZE)
+    )
+
+    return [
+        f"{c[:2]}.{c[2:5]}.{c[5:8]}/{c[8:12]}-{c[12]}{rng.choice('0123456789')}"
+        for c in cnpjs
+        if c
+    ]
+
+
+def main() -> None:
+    validator = CnpjValidator()
+    cnpjs = _sample_cnpjs()
+
+    for label, path in (
+        ("is_valid", lambda: [validator.is_valid(cnpj) for cnpj in cnpjs]),
+        ("inspect", lambda: [validator.inspect(cnpj) for cnpj in cnpjs]),
+        ("inspect_many", lambda: validator.inspect_many(cnpjs)),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+        print(f"{label:>12}: {best / len(cnpjs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark ``CnpjValidator.is_valid_array`` against per-item ``is_valid``.
+
+Run from the package root with ``python benchmarks/is_valid_array.py``
+(requires the ``numpy`` extra). Prints the per-row cost of validating the
+same formatted CNPJs one ``is_valid`` call at a time and as a single NumPy
+``U18`` array.
+"""
+
+import random
+import timeit
+
+import numpy as np
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import CnpjValidator
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 200_000
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+    cnpjs = CnpjCheckDigits.complete_many(
+        "".join(rng.choices(_ALPHABET, k=12)) for _ in range(_SAMPLE_SIZE)
+    )
+
+    return [f"{c[:2]}.{c[2:5]}.{c[5:8]}/{c[8:12]}-{c[12:]}" for c in cnpjs if c]
+
+
+def main() -> None:
+    validator = CnpjValidator()
+    cnpjs = _sample_cnpjs()
+    array = np.array(cnpjs, dtype="U18")
+
+    for label, path in (
+        ("is_valid", lambda: [validator.is_valid(cnpj) for cnpj in cnpjs]),
+        ("is_valid_array", lambda: validator.is_valid_array(array)),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+        print(f"{label:>14}: {best / len(cnpjs) * 1e9:8.1f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark ``CnpjValidator.is_valid_many`` against per-item ``is_valid``.
+
+Run from the package root with ``python benchmarks/is_valid_many.py``. Prints
+the per-item cost of validating many branches of a few companies, the shape
+of a typical mass-branch feed, one call at a time and in a single batch.
+"""
+
+import random
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import CnpjValidator
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_BASE_ID_COUNT = 20
+_BRANCHES_PER_BASE_ID = 500
+_REPEAT = 5
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+    cnpjs: list[str] = []
+
+    for _ in range(_BASE_ID_COUNT):
+        base_id = "".join(rng.choices(_ALPHABET, k=8))
+        cnpjs.extend(
+            CnpjCheckDigits.complete_branches(
+                base_id,
+                [f"{branch:04d}" for branch in range(1, _BRANCHES_PER_BASE_ID + 1)],
+            )
+        )
+
+    rng.shuffle(cnpjs)
+
+    return cnpjs
+
+
+def main() -> None:
+    cnpjs = _sample_cnpjs()
+    validator = CnpjValidator()
+
+    for label, path in (
+        ("is_valid", lambda: [validator.is_valid(cnpj) for cnpj in cnpjs]),
+        ("is_valid_many", lambda: validator.is_valid_many(cnpjs)),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+        print(f"{label:>14}: {best / len(cnpjs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark ``CnpjValidator.validate_file`` throughput.
+
+Run from the package root with ``python benchmarks/validate_file.py``.
+Writes a temporary file of formatted CNPJs, one per line, and a CSV with the
+CNPJ in its second column, and prints how many MB/s ``validate_file`` scans
+in each layout.
+"""
+
+import os
+import random
+import tempfile
+import timeit
+
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import CnpjValidator
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_SAMPLE_SIZE = 500_000
+_REPEAT = 3
+
+
+def _sample_cnpjs() -> list[str]:
+    rng = random.Random(0)
+    cnpjs = CnpjCheckDigits.complete_many(
+        "".join(rng.choices(_ALPHABET, k=12)) for _ in range(_SAMPLE_SIZE)
+    )
+
+    return [f"{c[:2]}.{c[2:5]}.{c[5:8]}/{c[8:12]}-{c[12:]}" for c in cnpjs if c]
+
+
+def _write_file(directory: str, name: str, lines: list[str]) -> str:
+    path = os.path.join(directory, name)
+
+    with open(path, "w", encoding="ascii") as file:
+        file.write("\n".join(lines))
+        file.write("\n")
+
+    return path
+
+
+def main() -> None:
+    validator = CnpjValidator()
+    cnpjs = _sample_cnpjs()
+
+    with tempfile.TemporaryDirectory() as directory:
+        layouts = (
+            ("one per line", _write_file(directory, "cnpjs.txt", cnpjs), {}),
+            (
+                "csv column",
+                _write_file(
+                    directory,
+                    "cnpjs.csv",
+                    [f"{i},{cnpj},Company {i}" for i, cnpj in enumerate(cnpjs)],
+                ),
+                {"column": 1},
+            ),
+        )
+
+        for label, path, kwargs in layouts:
+            size_mb = os.path.getsize(path) / 1e6
+            best = min(
+                timeit.repeat(
+                    lambda path=path, kwargs=kwargs: validator.validate_file(
+                        path, **kwargs
+                    ).finish(),
+                    number=1,
+                    repeat=_REPEAT,
+                )
+            )
+            print(
+                f"{label:>12}: {size_mb / best:7.1f} MB/s ({len(cnpjs) / best:,.0f} lines/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
+from .cnpj_file_report import CnpjFileReport
+from .cnpj_incremental_validator import CnpjIncrementalValidator
+from .cnpj_inspection import CnpjInspection
 from .cnpj_val import cnpj_val
-from .cnpj_validator import CNPJ_LENGTH, CnpjValidator
+from .cnpj_validator import CNPJ_LENGTH, CnpjValidator, CnpjValidatorReason
 from .cnpj_validator_options import CnpjValidatorOptions
 from .exceptions import (
     CnpjValidatorException,
@@ -17,7 +20,10 @@ from .types import (
 
 __all__ = [
     "CNPJ_LENGTH",
+    "CnpjFileReport",
+    "CnpjIncrementalValidator",
     "CnpjInput",
+    "CnpjInspection",
     "CnpjType",
     "CnpjValidator",
     "CnpjValidatorException",
@@ -27,6 +33,7 @@ __all__ = [
     "CnpjValidatorOptionsInput",
     "CnpjValidatorOptionsType",
     "CnpjValidatorOptionsTypeError",
+    "CnpjValidatorReason",
     "CnpjValidatorTypeError",
     "cnpj_val",
 ]
@@ -0,0 +1,29 @@
+"""Line-by-line outcome of validating a file of CNPJ values."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lacus.utils import FileReport
+
+if TYPE_CHECKING:
+    from .cnpj_validator import CnpjValidatorReason  # noqa: F401
+
+
+class CnpjFileReport(FileReport["CnpjValidatorReason"]):
+    """Outcome of :meth:`CnpjValidator.validate_file
+    <cnpj_val.CnpjValidator.validate_file>`, filled in while it is iterated.
+
+    Iterating yields ``(line_number, reason)`` for each invalid line, with
+    1-based line numbers and a :class:`~cnpj_val.CnpjValidatorReason`. The
+    counts cover the lines scanned so far and are final once the iteration
+    is exhausted (see :meth:`finish`). The scan is the one of
+    :class:`lacus.utils.FileReport`: the file is opened on the first
+    iteration, memory use does not grow with its size, and it is closed when
+    the scan ends or when :meth:`close` is called.
+    """
+
+    __slots__ = ()
+
+
+__all__ = ["CnpjFileReport"]
@@ -0,0 +1,208 @@
+"""Incremental validator for CNPJ (Cadastro Nacional da Pessoa Jurídica)
+identifiers fed one character at a time."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cnpj_dv import (
+    CNPJ_CHECK_DIGIT_BY_REMAINDER,
+    CNPJ_FIRST_WEIGHTS,
+    CNPJ_SECOND_DIGIT_WEIGHT,
+    CNPJ_SECOND_WEIGHTS,
+)
+
+from .cnpj_sanitization import ALPHANUMERIC_KEEP, NUMERIC_KEEP
+from .cnpj_validator_options import CNPJ_LENGTH, CnpjValidatorOptions
+from .exceptions import CnpjValidatorInputTypeError
+
+if TYPE_CHECKING:
+    from .types import CnpjType, CnpjValidatorOptionsInput
+
+_ALPHANUMERIC_CHARS = frozenset(ALPHANUMERIC_KEEP)
+_NUMERIC_CHARS = frozenset(NUMERIC_KEEP)
+_DIGIT_CHARS = frozenset("0123456789")
+_LOWERCASE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz")
+_DELTA_FACTOR = ord("0")
+_CNPJ_BASE_ID_LAST_INDEX = 7
+_CNPJ_BRANCH_ID_FIRST_INDEX = 8
+_CNPJ_BRANCH_ID_LAST_INDEX = 11
+_CNPJ_CHECK_DIGITS_INDEX = 12
+
+
+class CnpjIncrementalValidator:
+    """Validator for a CNPJ fed one character at a time, as by a streaming
+    parser or keystroke events.
+
+    Characters are taken as :meth:`CnpjValidator.is_valid
+    <cnpj_val.CnpjValidator.is_valid>` sanitizes them under the same options
+    (skipping the ones ``type`` does not allow, uppercasing when
+    ``case_sensitive`` is off), and both weighted sums of the check digits
+    grow as they arrive, so nothing is re-scanned. The CNPJ is rejected the
+    moment a character makes it ineligible: a lowercase letter under
+    case-sensitive validation, an all-zero base or branch ID, 12 repeated
+    digits, a wrong check digit or a 15th character. Call :meth:`reset` to
+    reuse the validator for the next field.
+    """
+
+    __slots__ = (
+        "_allowed_chars",
+        "_case_sensitive",
+        "_count",
+        "_first_char",
+        "_first_sum",
+        "_options",
+        "_rejected",
+        "_repeated",
+        "_second_sum",
+        "_zeros",
+    )
+
+    def __init__(
+        self,
+        options: CnpjValidatorOptionsInput = None,
+        *,
+        case_sensitive: bool | None = None,
+        type: CnpjType | None = None,
+    ) -> None:
+        """Create a new, empty incremental validator.
+
+        Options are handled as by :class:`CnpjValidator
+        <cnpj_val.CnpjValidator>`: a :class:`CnpjValidatorOptions` instance is
+        used directly, and a plain mapping or keyword arguments build a new
+        instance. They are read here and on every :meth:`reset`, so changes
+        apply from the next field on.
+
+        Raises:
+            ``CnpjValidatorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjValidatorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        if isinstance(options, CnpjValidatorOptions):
+            self._options = options
+        else:
+            self._options = CnpjValidatorOptions(
+                options,
+                case_sensitive=case_sensitive,
+                type=type,
+            )
+
+        self.reset()
+
+    @property
+    def options(self) -> CnpjValidatorOptions:
+        """Return the options used by this validator.
+
+        The returned object is the same instance used internally; mutating
+        it affects the validator from the next :meth:`reset` on.
+        """
+        return self._options
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether the characters taken so far are a valid CNPJ."""
+        return self._count == CNPJ_LENGTH and not self._rejected
+
+    @property
+    def is_rejected(self) -> bool:
+        """Return whether no further characters can make the CNPJ valid."""
+        return self._rejected
+
+    def push(self, chars: str) -> bool:
+        """Feed ``chars`` to the validator and return whether the CNPJ can
+        still be valid.
+
+        Usually gets one character at a time, but any chunk of the input
+        works. Characters fed after the CNPJ is rejected are ignored.
+
+        Raises:
+            ``CnpjValidatorInputTypeError``: If ``chars`` is not a string.
+        """
+        if not isinstance(chars, str):
+            raise CnpjValidatorInputTypeError(chars, "string")
+
+        if self._rejected:
+            return False
+
+        if not self._case_sensitive:
+            chars = chars.upper()
+
+        allowed_chars = self._allowed_chars
+
+        for char in chars:
+            if char not in allowed_chars:
+                continue
+
+            if not self._take(char):
+                self._rejected = True
+
+                return False
+
+        return True
+
+    def reset(self) -> None:
+        """Forget the characters taken so far and re-read the options, to
+        validate the next CNPJ.
+        """
+        options = self._options
+        self._case_sensitive = options.case_sensitive
+        self._allowed_chars = (
+            _NUMERIC_CHARS if options.type == "numeric" else _ALPHANUMERIC_CHARS
+        )
+        self._count = 0
+        self._first_sum = 0
+        self._second_sum = 0
+        self._first_char = ""
+        self._repeated = False
+        self._zeros = False
+        self._rejected = False
+
+    def _take(self, char: str) -> bool:
+        """Take one allowed character, returning whether the CNPJ can still
+        be valid.
+        """
+        index = self._count
+
+        if index >= CNPJ_LENGTH or char in _LOWERCASE_CHARS:
+            return False
+
+        self._count = index + 1
+        value = ord(char) - _DELTA_FACTOR
+
+        if index < _CNPJ_CHECK_DIGITS_INDEX:
+            self._first_sum += value * CNPJ_FIRST_WEIGHTS[index]
+            self._second_sum += value * CNPJ_SECOND_WEIGHTS[index]
+
+            if index == 0:
+                self._first_char = char
+                self._repeated = char in _DIGIT_CHARS
+            else:
+                self._repeated = self._repeated and char == self._first_char
+
+            if index in (0, _CNPJ_BRANCH_ID_FIRST_INDEX):
+                self._zeros = char == "0"
+            else:
+                self._zeros = self._zeros and char == "0"
+
+            if (
+                index in (_CNPJ_BASE_ID_LAST_INDEX, _CNPJ_BRANCH_ID_LAST_INDEX)
+                and self._zeros
+            ):
+                return False
+
+            return not (index == _CNPJ_BRANCH_ID_LAST_INDEX and self._repeated)
+
+        if char not in _DIGIT_CHARS:
+            return False
+
+        if index == _CNPJ_CHECK_DIGITS_INDEX:
+            first_digit = CNPJ_CHECK_DIGIT_BY_REMAINDER[self._first_sum % 11]
+            self._second_sum += first_digit * CNPJ_SECOND_DIGIT_WEIGHT
+
+            return value == first_digit
+
+        return value == CNPJ_CHECK_DIGIT_BY_REMAINDER[self._second_sum % 11]
+
+
+__all__ = ["CnpjIncrementalValidator"]
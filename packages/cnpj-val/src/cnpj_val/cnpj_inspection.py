@@ -0,0 +1,75 @@
+"""Detailed outcome of validating a single CNPJ."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cnpj_validator import CnpjValidatorReason
+
+
+class CnpjInspection:
+    """Outcome of :meth:`CnpjValidator.inspect
+    <cnpj_val.CnpjValidator.inspect>`: why the CNPJ is valid or not, the
+    value that was checked and the check digits it should have.
+    """
+
+    __slots__ = ("_expected_check_digits", "_reason", "_sanitized")
+
+    def __init__(
+        self,
+        reason: CnpjValidatorReason,
+        sanitized: str,
+        expected_check_digits: str | None,
+    ) -> None:
+        self._reason = reason
+        self._sanitized = sanitized
+        self._expected_check_digits = expected_check_digits
+
+    @property
+    def reason(self) -> CnpjValidatorReason:
+        """Return why the CNPJ is rejected, or ``VALID``."""
+        return self._reason
+
+    @property
+    def sanitized(self) -> str:
+        """Return the input stripped of the characters its options do not
+        allow (uppercased when validation is not case-sensitive).
+        """
+        return self._sanitized
+
+    @property
+    def expected_check_digits(self) -> str | None:
+        """Return the check digits calculated from the first 12 characters,
+        or ``None`` when the sanitized value is not an eligible CNPJ base
+        (wrong length, lowercase letters, zeroed base or branch ID, or
+        repeated digits).
+        """
+        return self._expected_check_digits
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether the CNPJ is valid."""
+        return not self._reason
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CnpjInspection):
+            return NotImplemented
+
+        return (self._reason, self._sanitized, self._expected_check_digits) == (
+            other._reason,
+            other._sanitized,
+            other._expected_check_digits,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._reason, self._sanitized, self._expected_check_digits))
+
+    def __repr__(self) -> str:
+        return (
+            f"CnpjInspection(reason={self._reason.name}, sanitized={self._sanitized!r}, "
+            f"expected_check_digits={self._expected_check_digits!r})"
+        )
+
+
+__all__ = ["CnpjInspection"]
@@ -0,0 +1,15 @@
+"""Characters kept when sanitizing a CNPJ, shared by the validators."""
+
+from __future__ import annotations
+
+ALPHANUMERIC_KEEP = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+"""Characters kept when validating alphanumeric CNPJs."""
+
+NUMERIC_KEEP = "0123456789"
+"""Characters kept when validating numeric CNPJs."""
+
+
+__all__ = [
+    "ALPHANUMERIC_KEEP",
+    "NUMERIC_KEEP",
+]
@@ -2,28 +2,219 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any
 
-from cnpj_dv import CnpjCheckDigits
+from cnpj_dv import CnpjCheckDigits, CnpjCheckDigitsStatus
+from lacus.utils import LruCache
 
+from .cnpj_file_report import CnpjFileReport
+from .cnpj_inspection import CnpjInspection
+from .cnpj_sanitization import ALPHANUMERIC_KEEP, NUMERIC_KEEP
 from .cnpj_validator_options import CNPJ_LENGTH, CnpjValidatorOptions
 from .exceptions import CnpjValidatorInputTypeError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+    from types import ModuleType
+
+    import numpy as np
+
     from .types import CnpjInput, CnpjType, CnpjValidatorOptionsInput
 
 
+class CnpjValidatorReason(IntEnum):
+    """Why a CNPJ is rejected by :class:`CnpjValidator`, or ``VALID`` when it
+    is not. ``VALID`` is the only falsy member.
+    """
+
+    VALID = 0
+    """The CNPJ is valid."""
+
+    INVALID_LENGTH = 1
+    """The sanitized CNPJ does not have 14 ASCII letters and digits."""
+
+    INVALID_CHECK_CHARACTERS = 2
+    """The last 2 characters (check digits) are not numeric digits."""
+
+    LOWERCASE_LETTERS = 3
+    """Case-sensitive validation kept lowercase letters."""
+
+    INVALID_BASE_ID = 4
+    """The base ID (first 8 characters) is all zeros."""
+
+    INVALID_BRANCH_ID = 5
+    """The branch ID (characters 9-12) is all zeros."""
+
+    REPEATED_DIGITS = 6
+    """The first 12 characters are the same numeric digit."""
+
+    CHECK_DIGITS_MISMATCH = 7
+    """The check digits differ from the calculated ones."""
+
+
 def _delete_table(*, keep: str) -> dict[int, int | None]:
     return str.maketrans(
         "", "", "".join(chr(code) for code in range(256) if chr(code) not in keep)
     )
 
 
-_ALPHANUMERIC_KEEP = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-_NUMERIC_KEEP = "0123456789"
-_ALPHANUMERIC_DELETE_TABLE = _delete_table(keep=_ALPHANUMERIC_KEEP)
-_NUMERIC_DELETE_TABLE = _delete_table(keep=_NUMERIC_KEEP)
+_ALPHANUMERIC_DELETE_TABLE = _delete_table(keep=ALPHANUMERIC_KEEP)
+_NUMERIC_DELETE_TABLE = _delete_table(keep=NUMERIC_KEEP)
+_ALPHANUMERIC_DELETE_BYTES = bytes(
+    code for code in range(256) if chr(code) not in ALPHANUMERIC_KEEP
+)
+_NUMERIC_DELETE_BYTES = bytes(
+    code for code in range(256) if chr(code) not in NUMERIC_KEEP
+)
+_BYTES_INPUT_TYPES = (bytes, bytearray, memoryview)
+_CACHEABLE_INPUT_TYPES = (str, bytes)
+_CHECK_DIGITS_BY_BYTES = {
+    f"{number:02d}".encode(): f"{number:02d}" for number in range(100)
+}
+_EXPECTED_INPUT_TYPE = "string, bytes or string[]"
+_EXPECTED_ARRAY_TYPE = "string or bytes array"
+_CNPJ_BASE_ID_LENGTH = 8
+_CNPJ_CHECK_DIGITS_INDEX = 12
+_ARRAY_CHUNK_SIZE = 1 << 16
+_ASCII_LIMIT = 0x80
+_RESOLVED_OPTIONS_CACHE_SIZE = 32
+_REASON_BY_STATUS = {
+    CnpjCheckDigitsStatus.INVALID_BASE_ID: CnpjValidatorReason.INVALID_BASE_ID,
+    CnpjCheckDigitsStatus.INVALID_BRANCH_ID: CnpjValidatorReason.INVALID_BRANCH_ID,
+    CnpjCheckDigitsStatus.REPEATED_DIGITS: CnpjValidatorReason.REPEATED_DIGITS,
+}
+
+
+def _items_key(mapping: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple((name, value.__class__, value) for name, value in mapping.items())
+
+
+def _override_key(
+    options: CnpjValidatorOptionsInput | None, keyword_overrides: dict[str, Any]
+) -> tuple[Any, ...] | None:
+    """Return a hashable key identifying a set of per-call overrides, or
+    ``None`` when one of them cannot be hashed.
+
+    Values are keyed along with their class, so ``1`` does not share the
+    entry of ``True`` and still fails the type checks.
+    """
+    if options is None:
+        options_key = None
+    elif isinstance(options, CnpjValidatorOptions):
+        options_key = _items_key(options.all)
+    elif isinstance(options, dict):
+        options_key = _items_key(options)
+    else:
+        return None
+
+    key = (options_key, _items_key(keyword_overrides))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _check_digits_of(sanitized_cnpj: str | bytes) -> str:
+    """Return the check digits of a sanitized CNPJ as a string, looking the
+    two ASCII digits of bytes input up instead of decoding them.
+    """
+    check_digits = sanitized_cnpj[_CNPJ_CHECK_DIGITS_INDEX:]
+
+    if isinstance(check_digits, bytes):
+        return _CHECK_DIGITS_BY_BYTES[check_digits]
+
+    return check_digits
+
+
+def _inspect_sanitized(
+    sanitized_cnpj: str | bytes,
+) -> tuple[CnpjValidatorReason, str | None]:
+    """Return why a CNPJ stripped of the characters its options do not
+    allow is rejected (or ``VALID``), with its expected check digits when
+    its first 12 characters are an eligible base.
+    """
+    if len(sanitized_cnpj) != CNPJ_LENGTH or not sanitized_cnpj.isascii():
+        return CnpjValidatorReason.INVALID_LENGTH, None
+
+    if sanitized_cnpj != sanitized_cnpj.upper():
+        return CnpjValidatorReason.LOWERCASE_LETTERS, None
+
+    status, check_digits = CnpjCheckDigits.classify(sanitized_cnpj)
+
+    if status is not CnpjCheckDigitsStatus.OK:
+        return _REASON_BY_STATUS[status], None
+
+    if not sanitized_cnpj[_CNPJ_CHECK_DIGITS_INDEX:].isdigit():
+        return CnpjValidatorReason.INVALID_CHECK_CHARACTERS, check_digits
+
+    if _check_digits_of(sanitized_cnpj) != check_digits:
+        return CnpjValidatorReason.CHECK_DIGITS_MISMATCH, check_digits
+
+    return CnpjValidatorReason.VALID, check_digits
+
+
+def _import_numpy() -> ModuleType:
+    """Import NumPy for the array API, pointing to the optional extra when it
+    is not installed.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            'NumPy is required for array input. Install it with "pip install cnpj-val[numpy]".'
+        ) from error
+
+    return numpy
+
+
+def _is_valid_char_codes(
+    np: ModuleType, char_codes: np.ndarray, options: CnpjValidatorOptions
+) -> np.ndarray:
+    """Validate a matrix of ASCII character codes, one CNPJ per row.
+
+    Mirrors :meth:`CnpjValidator.is_valid` for ASCII rows: kept characters are compacted to
+    the left of each row through their running count, rows that do not keep
+    exactly 14 characters or keep lowercase letters are rejected, and the
+    check digits come from :meth:`CnpjCheckDigits.calculate_array`.
+    """
+    if not options.case_sensitive:
+        is_lowercase = (char_codes >= ord("a")) & (char_codes <= ord("z"))
+        char_codes = np.where(
+            is_lowercase, char_codes - (ord("a") - ord("A")), char_codes
+        )
+
+    is_digit = (char_codes >= ord("0")) & (char_codes <= ord("9"))
+
+    if options.type == "numeric":
+        keep = is_digit
+    else:
+        keep = (
+            is_digit
+            | ((char_codes >= ord("A")) & (char_codes <= ord("Z")))
+            | ((char_codes >= ord("a")) & (char_codes <= ord("z")))
+        )
+
+    positions = np.cumsum(keep, axis=1) - 1
+    rows, columns = np.nonzero(keep & (positions < CNPJ_LENGTH))
+    sanitized = np.zeros((len(char_codes), CNPJ_LENGTH), np.uint8)
+    sanitized[rows, positions[rows, columns]] = char_codes[rows, columns]
+
+    check_digits, eligible = CnpjCheckDigits.calculate_array(sanitized)
+    actual_digits = sanitized[:, _CNPJ_CHECK_DIGITS_INDEX:].astype(np.int16) - ord("0")
+
+    return (
+        (keep.sum(axis=1) == CNPJ_LENGTH)
+        & eligible
+        & (actual_digits == check_digits).all(axis=1)
+        & ~((sanitized >= ord("a")) & (sanitized <= ord("z"))).any(axis=1)
+    )
 
 
 class CnpjValidator:
@@ -39,6 +230,7 @@ class CnpjValidator:
         *,
         case_sensitive: bool | None = None,
         type: CnpjType | None = None,
+        cache_size: int | None = None,
     ) -> None:
         """Create a new :class:`CnpjValidator` with optional defaults.
 
@@ -53,6 +245,10 @@ class CnpjValidator:
         options. When a plain mapping or nothing is passed, a new
         :class:`CnpjValidatorOptions` instance is created from it.
 
+        A positive ``cache_size`` enables an LRU cache of up to that many
+        :meth:`is_valid` results, keyed by the raw ``str`` or ``bytes`` input
+        and the resolved options (see :attr:`cache`).
+
         Raises:
             ``CnpjValidatorOptionsTypeError``: If any option has an invalid
                 type.
@@ -68,6 +264,25 @@ class CnpjValidator:
                 type=type,
             )
 
+        self._cache: LruCache[tuple[Any, ...], bool] | None = (
+            LruCache(cache_size) if cache_size else None
+        )
+        self._cache_version = self._options.version
+        self._resolved_options: (
+            LruCache[tuple[Any, ...], CnpjValidatorOptions] | None
+        ) = None
+
+    @property
+    def cache(self) -> LruCache[tuple[Any, ...], bool] | None:
+        """Return the :meth:`is_valid` cache enabled by ``cache_size``, or
+        ``None``.
+
+        Its ``hits``, ``misses`` and ``evictions`` counters show how well it
+        serves the traffic. Entries for the default options are dropped as
+        soon as :attr:`options` is mutated.
+        """
+        return self._cache
+
     @property
     def options(self) -> CnpjValidatorOptions:
         """Return default options used when per-call options are omitted.
@@ -93,47 +308,389 @@ class CnpjValidator:
         for this call only; the instance defaults are unchanged.
 
         Raises:
-            ``CnpjValidatorInputTypeError``: If the input is not a string or
-                sequence of strings.
+            ``CnpjValidatorInputTypeError``: If the input is not a string,
+                bytes-like object or sequence of strings.
             ``CnpjValidatorOptionsTypeError``: If any option has an invalid
                 type.
             ``CnpjValidatorOptionTypeInvalidException``: If the ``type`` option
                 is not one of the allowed values.
         """
-        if options is None and case_sensitive is None and type is None:
-            actual_options = self._options
+        actual_options = self._resolve_options(options, case_sensitive, type)
+        cache = self._cache
+
+        if cache is None or cnpj_input.__class__ not in _CACHEABLE_INPUT_TYPES:
+            return self._is_valid(cnpj_input, actual_options)
+
+        cache_key = self._cache_key(cnpj_input, actual_options)
+        result = cache.get(cache_key)
+
+        if result is None:
+            result = self._is_valid(cnpj_input, actual_options)
+            cache.put(cache_key, result)
+
+        return result
+
+    def is_valid_many(
+        self,
+        cnpj_inputs: Iterable[CnpjInput],
+        options: CnpjValidatorOptionsInput = None,
+        *,
+        case_sensitive: bool | None = None,
+        type: CnpjType | None = None,
+    ) -> list[bool]:
+        """Validate many CNPJ inputs in a single call.
+
+        Returns one boolean per input, in input order, with the same result
+        :meth:`is_valid` gives for each item under the same options. Options
+        are resolved once for the whole batch, and inputs are grouped by
+        base ID so each company's weighted sums are computed only once no
+        matter how many of its branches are present.
+
+        Raises:
+            ``CnpjValidatorInputTypeError``: If any input is not a string,
+                bytes-like object or sequence of strings.
+            ``CnpjValidatorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjValidatorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        actual_options = self._resolve_options(options, case_sensitive, type)
+        results: list[bool] = []
+        branches_by_base_id: dict[str | bytes, list[tuple[int, str | bytes]]] = {}
+
+        for index, cnpj_input in enumerate(cnpj_inputs):
+            results.append(False)
+            sanitized_cnpj = self._sanitize(cnpj_input, actual_options)
+
+            if sanitized_cnpj is not None:
+                base_id = sanitized_cnpj[:_CNPJ_BASE_ID_LENGTH]
+                branches_by_base_id.setdefault(base_id, []).append(
+                    (index, sanitized_cnpj)
+                )
+
+        for base_id, branches in branches_by_base_id.items():
+            completed_cnpjs = CnpjCheckDigits.complete_branches(
+                base_id,
+                [
+                    sanitized_cnpj[_CNPJ_BASE_ID_LENGTH:]
+                    for _, sanitized_cnpj in branches
+                ],
+            )
+
+            for (index, sanitized_cnpj), completed_cnpj in zip(
+                branches, completed_cnpjs, strict=True
+            ):
+                results[index] = (
+                    completed_cnpj is not None
+                    and _check_digits_of(sanitized_cnpj)
+                    == completed_cnpj[_CNPJ_CHECK_DIGITS_INDEX:]
+                )
+
+        return results
+
+    def is_valid_array(
+        self,
+        cnpj_array: np.ndarray,
+        options: CnpjValidatorOptionsInput = None,
+        *,
+        case_sensitive: bool | None = None,
+        type: CnpjType | None = None,
+    ) -> np.ndarray:
+        """Validate a NumPy array of CNPJ strings without per-row Python calls.
+
+        Accepts fixed-width unicode (e.g. ``U14``, ``U18``) or bytes (e.g.
+        ``S18``) arrays of any shape and returns a boolean array of the same
+        shape, with the result :meth:`is_valid` gives for each element under
+        the same options. The array is viewed as a matrix of character codes
+        and sanitized, length-checked and validated with vectorized
+        operations, in chunks to bound memory use. Unicode rows holding
+        non-ASCII characters, which uppercasing may turn into letters (e.g.
+        ``"ß"`` into ``"SS"``), are validated with :meth:`is_valid` instead.
+
+        Requires the ``numpy`` extra (``pip install cnpj-val[numpy]``).
+
+        Raises:
+            ``CnpjValidatorInputTypeError``: If the input is not a NumPy
+                unicode or bytes array.
+            ``CnpjValidatorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjValidatorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        np = _import_numpy()
+
+        if not (isinstance(cnpj_array, np.ndarray) and cnpj_array.dtype.kind in "US"):
+            raise CnpjValidatorInputTypeError(cnpj_array, _EXPECTED_ARRAY_TYPE)
+
+        actual_options = self._resolve_options(options, case_sensitive, type)
+        flat_array = np.ascontiguousarray(cnpj_array).reshape(-1)
+        results = np.zeros(len(flat_array), bool)
+
+        code_dtype = np.dtype(np.uint32 if flat_array.dtype.kind == "U" else np.uint8)
+        code_dtype = code_dtype.newbyteorder(flat_array.dtype.byteorder)
+        char_codes = flat_array.view(code_dtype).reshape(
+            len(flat_array), flat_array.dtype.itemsize // code_dtype.itemsize
+        )
+
+        for start in range(0, len(flat_array), _ARRAY_CHUNK_SIZE):
+            stop = start + _ARRAY_CHUNK_SIZE
+            results[start:stop] = _is_valid_char_codes(
+                np, char_codes[start:stop], actual_options
+            )
+
+        if flat_array.dtype.kind == "U":
+            for index in np.flatnonzero((char_codes >= _ASCII_LIMIT).any(axis=1)):
+                results[index] = self._is_valid(str(flat_array[index]), actual_options)
+
+        return results.reshape(cnpj_array.shape)
+
+    def inspect(
+        self,
+        cnpj_input: CnpjInput,
+        options: CnpjValidatorOptionsInput = None,
+        *,
+        case_sensitive: bool | None = None,
+        type: CnpjType | None = None,
+    ) -> CnpjInspection:
+        """Validate a CNPJ input and report why it is rejected.
+
+        Returns a :class:`CnpjInspection` with the :class:`CnpjValidatorReason`
+        (``VALID`` exactly when :meth:`is_valid` returns ``True`` under the
+        same options), the sanitized value and the expected check digits, all
+        gathered in the same pass that validates the input.
+
+        Raises:
+            ``CnpjValidatorInputTypeError``: If the input is not a string,
+                bytes-like object or sequence of strings.
+            ``CnpjValidatorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjValidatorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        actual_options = self._resolve_options(options, case_sensitive, type)
+        sanitized_cnpj = self._strip(cnpj_input, actual_options)
+        reason, check_digits = _inspect_sanitized(sanitized_cnpj)
+
+        if isinstance(sanitized_cnpj, bytes):
+            sanitized_cnpj = sanitized_cnpj.decode("ascii")
+
+        return CnpjInspection(reason, sanitized_cnpj, check_digits)
+
+    def inspect_many(
+        self,
+        cnpj_inputs: Iterable[CnpjInput],
+        options: CnpjValidatorOptionsInput = None,
+        *,
+        case_sensitive: bool | None = None,
+        type: CnpjType | None = None,
+    ) -> Counter[CnpjValidatorReason]:
+        """Count the :class:`CnpjValidatorReason` of many CNPJ inputs.
+
+        Each input gets the reason :meth:`inspect` reports for it under the
+        same options, resolved once for the whole batch; reasons that never
+        occur are absent from the returned :class:`~collections.Counter`
+        (and read as ``0``).
+
+        Raises:
+            ``CnpjValidatorInputTypeError``: If any input is not a string,
+                bytes-like object or sequence of strings.
+            ``CnpjValidatorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjValidatorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        actual_options = self._resolve_options(options, case_sensitive, type)
+        strip = self._strip
+
+        return Counter(
+            _inspect_sanitized(strip(cnpj_input, actual_options))[0]
+            for cnpj_input in cnpj_inputs
+        )
+
+    def validate_file(
+        self,
+        path: str | PathLike[str],
+        options: CnpjValidatorOptionsInput = None,
+        *,
+        column: int | None = None,
+        delimiter: str | bytes = ",",
+        header: bool = False,
+        case_sensitive: bool | None = None,
+        type: CnpjType | None = None,
+    ) -> CnpjFileReport:
+        """Validate a file holding one CNPJ per line, or one column of a
+        delimited (e.g. CSV) file.
+
+        The file is memory-mapped and scanned in chunks of lines as bytes, so
+        memory use is bounded regardless of its size, even when its lines
+        are long. Each line (or its
+        ``column``-th field, zero-based, split on ``delimiter``) gets the
+        result :meth:`is_valid` gives for it under the same options; a line
+        without that field counts as an empty value. Blank lines, and the
+        first line when ``header`` is set, are skipped but keep their line
+        numbers. Fields are split on every ``delimiter``, so quoted fields
+        must not contain it.
+
+        The returned :class:`CnpjFileReport` is scanned lazily: iterate it for
+        the ``(line_number, reason)`` of each invalid line, and read its
+        counts once it is exhausted (or after :meth:`CnpjFileReport.finish`).
+        The file is only opened on the first iteration, so an ``OSError`` for
+        a file that cannot be opened is raised from there.
+
+        Raises:
+            ``CnpjValidatorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CnpjValidatorOptionTypeInvalidException``: If the ``type`` option
+                is not one of the allowed values.
+        """
+        actual_options = self._resolve_options(options, case_sensitive, type)
+        upper = not actual_options.case_sensitive
+
+        if actual_options.type == "numeric":
+            delete_bytes = _NUMERIC_DELETE_BYTES
         else:
+            delete_bytes = _ALPHANUMERIC_DELETE_BYTES
+
+        def sanitize(field: bytes) -> bytes:
+            if upper:
+                field = field.upper()
+
+            return field.translate(None, delete_bytes)
+
+        def reason_of(sanitized_field: bytes) -> CnpjValidatorReason:
+            return _inspect_sanitized(sanitized_field)[0]
+
+        if isinstance(delimiter, str):
+            delimiter = delimiter.encode()
+
+        return CnpjFileReport(path, column, delimiter, header, sanitize, reason_of)
+
+    def _resolve_options(
+        self,
+        options: CnpjValidatorOptionsInput | None,
+        case_sensitive: bool | None,
+        type: CnpjType | None,
+    ) -> CnpjValidatorOptions:
+        """Return the instance defaults, or merge per-call overrides over them.
+
+        Merged options are memoized per defaults
+        :attr:`~CnpjValidatorOptions.version` and overrides, so repeating the
+        same overrides skips building and validating a new options instance.
+        """
+        if options is None and case_sensitive is None and type is None:
+            return self._options
+
+        override_key = _override_key(
+            options, {"case_sensitive": case_sensitive, "type": type}
+        )
+
+        if override_key is None:
+            return self._merge_options(options, case_sensitive, type)
+
+        resolved_options = self._resolved_options
+
+        if resolved_options is None:
+            resolved_options = LruCache(_RESOLVED_OPTIONS_CACHE_SIZE)
+            self._resolved_options = resolved_options
+
+        resolved_key = (self._options.version, override_key)
+        actual_options = resolved_options.get(resolved_key)
+
+        if actual_options is None:
             actual_options = self._merge_options(options, case_sensitive, type)
+            resolved_options.put(resolved_key, actual_options)
+
+        return actual_options
+
+    def _is_valid(self, cnpj_input: CnpjInput, options: CnpjValidatorOptions) -> bool:
+        """Validate a CNPJ input under already resolved options."""
+        sanitized_cnpj = self._sanitize(cnpj_input, options)
+
+        if sanitized_cnpj is None:
+            return False
+
+        status, check_digits = CnpjCheckDigits.classify(sanitized_cnpj)
+
+        return (
+            status is CnpjCheckDigitsStatus.OK
+            and _check_digits_of(sanitized_cnpj) == check_digits
+        )
+
+    def _cache_key(
+        self, cnpj_input: str | bytes, options: CnpjValidatorOptions
+    ) -> tuple[Any, ...]:
+        """Return the cache key of an input under the resolved options.
+
+        Calls with the instance defaults share one options slot, and the
+        whole cache is dropped when those defaults have changed since the
+        last call; per-call options are keyed by their values.
+        """
+        if options is not self._options:
+            return (cnpj_input, options.case_sensitive, options.type)
+
+        if self._cache_version != options.version:
+            self._cache.clear()  # type: ignore[union-attr]
+            self._cache_version = options.version
+
+        return (cnpj_input,)
+
+    def _strip(
+        self, cnpj_input: CnpjInput, options: CnpjValidatorOptions
+    ) -> str | bytes:
+        """Strip the input down to the characters allowed by ``options``,
+        uppercasing it first when validation is not case-sensitive.
+        Bytes-like input is stripped with ``bytes.translate`` delete tables,
+        without decoding.
+
+        Raises:
+            ``CnpjValidatorInputTypeError``: If the input is not a string,
+                bytes-like object or sequence of strings.
+        """
+        if isinstance(cnpj_input, _BYTES_INPUT_TYPES):
+            actual_bytes = bytes(cnpj_input)
+            working_bytes = (
+                actual_bytes if options.case_sensitive else actual_bytes.upper()
+            )
+
+            if options.type == "numeric":
+                return working_bytes.translate(None, _NUMERIC_DELETE_BYTES)
+
+            return working_bytes.translate(None, _ALPHANUMERIC_DELETE_BYTES)
 
         actual_input = self._to_string_input(cnpj_input)
+        working_input = actual_input if options.case_sensitive else actual_input.upper()
 
-        case_sensitive = actual_options.case_sensitive
-        cnpj_type = actual_options.type
+        if options.type == "numeric":
+            return working_input.translate(_NUMERIC_DELETE_TABLE)
 
-        working_input = actual_input if case_sensitive else actual_input.upper()
+        return working_input.translate(_ALPHANUMERIC_DELETE_TABLE)
 
-        if cnpj_type == "numeric":
-            sanitized_cnpj = working_input.translate(_NUMERIC_DELETE_TABLE)
-        else:
-            sanitized_cnpj = working_input.translate(_ALPHANUMERIC_DELETE_TABLE)
+    def _sanitize(
+        self, cnpj_input: CnpjInput, options: CnpjValidatorOptions
+    ) -> str | bytes | None:
+        """Strip the input with :meth:`_strip`.
 
-        if len(sanitized_cnpj) != CNPJ_LENGTH:
-            return False
+        Returns ``None`` when the result cannot be a valid CNPJ because of
+        its length, non-ASCII characters (which ``str.translate`` keeps),
+        non-numeric check digits or lowercase letters kept by
+        case-sensitive validation.
 
-        if (
-            sanitized_cnpj[12] < "0"
-            or sanitized_cnpj[12] > "9"
-            or sanitized_cnpj[13] < "0"
-            or sanitized_cnpj[13] > "9"
-        ):
-            return False
+        Raises:
+            ``CnpjValidatorInputTypeError``: If the input is not a string,
+                bytes-like object or sequence of strings.
+        """
+        sanitized_cnpj = self._strip(cnpj_input, options)
 
-        try:
-            cnpj_check_digits = CnpjCheckDigits(sanitized_cnpj)
-        except Exception:
-            return False
+        if len(sanitized_cnpj) != CNPJ_LENGTH or not sanitized_cnpj.isascii():
+            return None
+
+        if not sanitized_cnpj[_CNPJ_CHECK_DIGITS_INDEX:].isdigit():
+            return None
+
+        if sanitized_cnpj != sanitized_cnpj.upper():
+            return None
 
-        return sanitized_cnpj == cnpj_check_digits.cnpj
+        return sanitized_cnpj
 
     def _merge_options(
         self,
@@ -176,12 +733,12 @@ class CnpjValidator:
                 if not isinstance(item, str):
                     raise CnpjValidatorInputTypeError(
                         cnpj_input,
-                        "string or string[]",
+                        _EXPECTED_INPUT_TYPE,
                     )
 
             return "".join(cnpj_input)
 
-        raise CnpjValidatorInputTypeError(cnpj_input, "string or string[]")
+        raise CnpjValidatorInputTypeError(cnpj_input, _EXPECTED_INPUT_TYPE)
 
 
-__all__ = ["CNPJ_LENGTH", "CnpjValidator"]
+__all__ = ["CNPJ_LENGTH", "CnpjValidator", "CnpjValidatorReason"]
@@ -69,6 +69,8 @@ class CnpjValidatorOptions:
                 is not one of the allowed values.
         """
         self._options: dict[str, Any] = {}
+        # Bumped by every setter; see the ``version`` property.
+        self._version = 0
 
         self.case_sensitive = case_sensitive
         self.type = type
@@ -97,6 +99,16 @@ class CnpjValidatorOptions:
 
         return MappingProxyType(snapshot)  # type: ignore[return-value]
 
+    @property
+    def version(self) -> int:
+        """Return a counter that grows every time an option is set.
+
+        Two reads that return the same number saw the same options, which
+        lets caches built on top of this instance tell when to drop their
+        entries.
+        """
+        return self._version
+
     @property
     def case_sensitive(self) -> bool:
         """Return whether the CNPJ is validated case-sensitively."""
@@ -112,6 +124,7 @@ class CnpjValidatorOptions:
         )
 
         self._options["case_sensitive"] = actual_case_sensitive
+        self._version += 1
 
     @property
     def type(self) -> CnpjType:
@@ -144,6 +157,7 @@ class CnpjValidatorOptions:
             )
 
         self._options["type"] = actual_type
+        self._version += 1
 
     def set(self, options: CnpjValidatorOptionsInput) -> CnpjValidatorOptions:
         """Set multiple options at once.
@@ -34,12 +34,13 @@ class CnpjValidatorOptionsType(TypedDict):
     type: CnpjType
 
 
-CnpjInput: TypeAlias = str | Sequence[str]
+CnpjInput: TypeAlias = str | bytes | bytearray | memoryview | Sequence[str]
 """Valid input types for CNPJ validation.
 
 A CNPJ may be given as:
 
 - A string of alphanumeric characters (with or without formatting).
+- A ``bytes``, ``bytearray`` or ``memoryview`` with the same ASCII content.
 - A sequence of strings, each representing one or more alphanumeric characters.
 """
 
@@ -0,0 +1,174 @@
+"""Spec for :class:`cnpj_val.CnpjIncrementalValidator`.
+
+:meth:`CnpjValidator.is_valid` is the reference: feeding an input one
+character at a time must end in the same verdict under the same options.
+"""
+
+import random
+
+import pytest
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import (
+    CnpjIncrementalValidator,
+    CnpjValidator,
+    CnpjValidatorInputTypeError,
+    CnpjValidatorOptions,
+    CnpjValidatorOptionTypeInvalidException,
+)
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcxyz./- "
+
+OPTION_CASES = [
+    {},
+    {"case_sensitive": False},
+    {"type": "numeric"},
+    {"type": "numeric", "case_sensitive": False},
+]
+
+
+def _sample_inputs() -> list[str]:
+    rng = random.Random(0)
+    inputs = [
+        "",
+        "11222333000181",
+        "11.222.333/0001-81",
+        "00000000000191",
+        "11111111111180",
+    ]
+
+    for _ in range(300):
+        cnpj = CnpjCheckDigits("".join(rng.choices("0123456789ABCXYZ", k=12))).cnpj
+        inputs.extend(
+            [
+                cnpj,
+                cnpj.lower(),
+                f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}",
+                "".join(rng.choices(_ALPHABET, k=rng.choice([13, 14, 15]))),
+            ]
+        )
+
+    return inputs
+
+
+SAMPLE_INPUTS = _sample_inputs()
+
+
+def _feed(validator: CnpjIncrementalValidator, value: str) -> bool:
+    validator.reset()
+
+    for char in value:
+        validator.push(char)
+
+    return validator.is_valid
+
+
+def describe_cnpj_incremental_validator():
+    def describe_push_method():
+        def it_is_valid_once_the_last_check_digit_matches():
+            validator = CnpjIncrementalValidator()
+
+            validator.push("1122233300018")
+
+            assert not validator.is_valid
+            assert validator.push("1")
+            assert validator.is_valid
+
+        def it_skips_characters_the_type_does_not_allow():
+            validator = CnpjIncrementalValidator(type="numeric")
+
+            assert validator.push("11.222.333/0001-81 AB")
+            assert validator.is_valid
+
+        @pytest.mark.parametrize(
+            ("chars", "rejected_at"),
+            [
+                ("00000000", 8),
+                ("123456780000", 12),
+                ("111111111111", 12),
+                ("11222333000191", 13),
+                ("11222333000182", 14),
+                ("11222333000181", None),
+                ("12ABC34500DE", None),
+                ("112223330001A1", 13),
+            ],
+        )
+        def it_rejects_the_cnpj_as_soon_as_it_becomes_ineligible(chars, rejected_at):
+            validator = CnpjIncrementalValidator()
+            verdicts = [validator.push(char) for char in chars]
+
+            expected_index = None if rejected_at is None else rejected_at - 1
+
+            assert (
+                next((i for i, ok in enumerate(verdicts) if not ok), None)
+                == expected_index
+            )
+
+        def it_rejects_a_15th_character():
+            validator = CnpjIncrementalValidator()
+            validator.push("11222333000181")
+
+            assert not validator.push("1")
+            assert validator.is_rejected
+            assert not validator.is_valid
+
+        def it_ignores_characters_fed_after_the_rejection():
+            validator = CnpjIncrementalValidator()
+            validator.push("00000000")
+
+            assert not validator.push("000191")
+            assert not validator.is_valid
+
+        def it_rejects_lowercase_letters_when_case_sensitive():
+            validator = CnpjIncrementalValidator()
+
+            assert not validator.push("a")
+            assert validator.is_rejected
+
+        def it_uppercases_letters_when_not_case_sensitive():
+            cnpj = CnpjCheckDigits("12ABC34500DE").cnpj
+            validator = CnpjIncrementalValidator(case_sensitive=False)
+
+            assert validator.push(cnpj.lower())
+            assert validator.is_valid
+
+        @pytest.mark.parametrize("value", [None, 1, b"1", ["1"]])
+        def it_raises_cnpj_validator_input_type_error_for_non_strings(value):
+            with pytest.raises(CnpjValidatorInputTypeError):
+                CnpjIncrementalValidator().push(value)
+
+    def describe_reset_method():
+        def it_reuses_the_validator_for_the_next_field():
+            validator = CnpjIncrementalValidator()
+            validator.push("00000000")
+
+            validator.reset()
+
+            assert not validator.is_rejected
+            assert validator.push("11222333000181")
+            assert validator.is_valid
+
+        def it_applies_option_changes():
+            options = CnpjValidatorOptions()
+            validator = CnpjIncrementalValidator(options)
+
+            options.case_sensitive = False
+            validator.push("a")
+
+            assert validator.is_rejected
+
+            validator.reset()
+
+            assert validator.push("a")
+
+    def describe_options():
+        @pytest.mark.parametrize("options", OPTION_CASES)
+        def it_matches_cnpj_validator(options):
+            reference = CnpjValidator(options)
+            validator = CnpjIncrementalValidator(options)
+
+            for value in SAMPLE_INPUTS:
+                assert _feed(validator, value) is reference.is_valid(value), value
+
+        def it_raises_for_invalid_options():
+            with pytest.raises(CnpjValidatorOptionTypeInvalidException):
+                CnpjIncrementalValidator(type="hex")
@@ -13,16 +13,20 @@ Dropped cases:
 """
 
 import re
+from collections import Counter
 from collections.abc import Callable, Sequence
 from typing import Any
 
 import pytest
+from cnpj_dv import CnpjCheckDigits
 from cnpj_val import (
+    CnpjInspection,
     CnpjValidator,
     CnpjValidatorInputTypeError,
     CnpjValidatorOptions,
     CnpjValidatorOptionsTypeError,
     CnpjValidatorOptionTypeInvalidException,
+    CnpjValidatorReason,
 )
 
 IsValidFn = Callable[..., bool]
@@ -58,7 +62,9 @@ def _assert_options_snapshots_match(actual: dict, expected: dict) -> None:
     assert actual == expected
 
 
-def _create_inputs_set(cnpj: str) -> list[tuple[str, str | Sequence[str]]]:
+def _create_inputs_set(
+    cnpj: str,
+) -> list[tuple[str, str | bytes | memoryview | Sequence[str]]]:
     unformatted_string = cnpj
     formatted_string = re.sub(
         r"([0-9A-Z]{2})([0-9A-Z]{3})([0-9A-Z]{3})([0-9A-Z]{4})(\d+)",
@@ -76,6 +82,9 @@ def _create_inputs_set(cnpj: str) -> list[tuple[str, str | Sequence[str]]]:
         ("array", unformatted_array),
         ("formatted array", formatted_array),
         ("grouped array", grouped_array),
+        ("bytes", unformatted_string.encode()),
+        ("formatted bytes", formatted_string.encode()),
+        ("memoryview", memoryview(formatted_string.encode())),
     ]
 
 
@@ -147,6 +156,21 @@ def _create_validator_with_options_instance_in_method(
     return is_valid
 
 
+def _create_validator_with_batch_method(
+    options: dict[str, Any],
+) -> IsValidFn:
+    validator = CnpjValidator(options)
+
+    def is_valid(
+        cnpj_input: str | Sequence[str],
+        options_override: Any = None,
+    ) -> bool:
+        [result] = validator.is_valid_many([cnpj_input], options_override)
+        return result
+
+    return is_valid
+
+
 IS_VALID_FACTORIES = [
     pytest.param(
         _create_validator_with_literal_options_in_constructor,
@@ -164,6 +188,10 @@ IS_VALID_FACTORIES = [
         _create_validator_with_options_instance_in_method,
         id="method_options",
     ),
+    pytest.param(
+        _create_validator_with_batch_method,
+        id="batch_method",
+    ),
 ]
 
 
@@ -351,6 +379,19 @@ def describe_cnpj_validator():
 
                     assert is_valid(input_value) is False
 
+            @pytest.mark.parametrize("create_validator", IS_VALID_FACTORIES)
+            @pytest.mark.parametrize(
+                "input_value", ["€1111111100292", "1234€678000195"]
+            )
+            def it_returns_false_for_a_cnpj_with_a_non_ascii_character(
+                create_validator,
+                input_value,
+            ):
+                is_valid = create_validator({})
+
+                assert is_valid(input_value) is False
+                assert CnpjValidator().is_valid_many([input_value]) == [False]
+
         def describe_when_case_sensitive_option_is_false():
             @pytest.mark.parametrize("create_validator", IS_VALID_FACTORIES)
             @pytest.mark.parametrize(
@@ -410,10 +451,304 @@ def describe_cnpj_validator():
 
                 error = exc_info.value
 
-                assert error.expected_type == "string or string[]"
+                assert error.expected_type == "string, bytes or string[]"
                 assert error.actual_input is input_value
                 assert error.actual_type == actual_type
                 assert (
                     str(error)
-                    == f"CNPJ input must be of type string or string[]. Got {actual_type}."
+                    == f"CNPJ input must be of type string, bytes or string[]. Got {actual_type}."
+                )
+
+    def describe_is_valid_many_method():
+        def it_returns_the_is_valid_result_for_each_input_in_order():
+            validator = CnpjValidator()
+            cnpj_inputs = [
+                "1QB5UKALPYFP59",
+                "96.206.256/1208-84",
+                "96.206.256/1208-85",
+                "AB123CDE00015",
+                "00000000000000",
+                "11111111111180",
+                list("96206256120884"),
+            ]
+
+            assert validator.is_valid_many(cnpj_inputs) == [
+                validator.is_valid(cnpj_input) for cnpj_input in cnpj_inputs
+            ]
+
+        def it_validates_many_branches_sharing_a_base_id():
+            validator = CnpjValidator()
+            branches = CnpjCheckDigits.complete_many(
+                [f"91415732{branch:04d}" for branch in range(1, 51)]
+            )
+            tampered = [f"{cnpj[:-1]}{(int(cnpj[-1]) + 1) % 10}" for cnpj in branches]
+
+            assert validator.is_valid_many(
+                [*branches, *tampered, "91415732000000"]
+            ) == [
+                *([True] * len(branches)),
+                *([False] * len(tampered)),
+                False,
+            ]
+
+        def it_groups_bytes_and_string_branches_of_the_same_base_id():
+            validator = CnpjValidator()
+            buffer = memoryview(b"91415732000793;91415732000794")
+
+            assert validator.is_valid_many(
+                [buffer[:14], buffer[15:], b"91.415.732/0007-93", "91415732000793"]
+            ) == [True, False, True, True]
+
+        def it_accepts_any_iterable_and_returns_an_empty_list_when_empty():
+            validator = CnpjValidator()
+
+            assert validator.is_valid_many(iter(["1QB5UKALPYFP59"])) == [True]
+            assert validator.is_valid_many([]) == []
+
+        def it_applies_per_call_options_without_changing_instance_defaults():
+            validator = CnpjValidator()
+
+            assert validator.is_valid_many(
+                ["1QB5UKALpyfp59"], case_sensitive=False
+            ) == [True]
+            assert validator.is_valid_many(["1QB5UKALPYFP59"], {"type": "numeric"}) == [
+                False
+            ]
+            assert validator.is_valid_many(["1QB5UKALpyfp59"]) == [False]
+
+        @pytest.mark.parametrize(("input_value", "actual_type"), INVALID_INPUT_CASES)
+        def it_raises_cnpj_validator_input_type_error(input_value, actual_type):
+            validator = CnpjValidator()
+
+            with pytest.raises(CnpjValidatorInputTypeError) as exc_info:
+                validator.is_valid_many(["1QB5UKALPYFP59", input_value])
+
+            assert exc_info.value.actual_type == actual_type
+
+    def describe_inspect_method():
+        @pytest.mark.parametrize(
+            ("cnpj_input", "reason", "sanitized", "expected_check_digits"),
+            [
+                ("1QB5UKALPYFP59", CnpjValidatorReason.VALID, "1QB5UKALPYFP59", "59"),
+                (
+                    b"91.415.732/0007-93",
+                    CnpjValidatorReason.VALID,
+                    "91415732000793",
+                    "93",
+                ),
+                (
+                    "91.415.732/0007-94",
+                    CnpjValidatorReason.CHECK_DIGITS_MISMATCH,
+                    "91415732000794",
+                    "93",
+                ),
+                (
+                    "9141573200079",
+                    CnpjValidatorReason.INVALID_LENGTH,
+                    "9141573200079",
+                    None,
+                ),
+                (
+                    "1234€678000195",
+                    CnpjValidatorReason.INVALID_LENGTH,
+                    "1234€678000195",
+                    None,
+                ),
+                (
+                    "1QB5UKALPYFPAB",
+                    CnpjValidatorReason.INVALID_CHECK_CHARACTERS,
+                    "1QB5UKALPYFPAB",
+                    "59",
+                ),
+                (
+                    "1QB5UKALpyfp59",
+                    CnpjValidatorReason.LOWERCASE_LETTERS,
+                    "1QB5UKALpyfp59",
+                    None,
+                ),
+                (
+                    "00000000000191",
+                    CnpjValidatorReason.INVALID_BASE_ID,
+                    "00000000000191",
+                    None,
+                ),
+                (
+                    "91415732000000",
+                    CnpjValidatorReason.INVALID_BRANCH_ID,
+                    "91415732000000",
+                    None,
+                ),
+                (
+                    "11111111111180",
+                    CnpjValidatorReason.REPEATED_DIGITS,
+                    "11111111111180",
+                    None,
+                ),
+            ],
+        )
+        def it_reports_the_reason_sanitized_value_and_expected_check_digits(
+            cnpj_input, reason, sanitized, expected_check_digits
+        ):
+            inspection = CnpjValidator().inspect(cnpj_input)
+
+            assert isinstance(inspection, CnpjInspection)
+            assert inspection.reason is reason
+            assert inspection.sanitized == sanitized
+            assert inspection.expected_check_digits == expected_check_digits
+            assert inspection.is_valid is (reason is CnpjValidatorReason.VALID)
+
+        def it_agrees_with_is_valid_for_every_option_set():
+            cnpj_inputs = [
+                "1QB5UKALPYFP59",
+                "1qb5ukalpyfp59",
+                "96.206.256/1208-84",
+                "96.206.256/1208-85",
+                "AB123CDE00015",
+                "00000000000000",
+                list("96206256120884"),
+            ]
+
+            for options in [{}, {"case_sensitive": False}, {"type": "numeric"}]:
+                validator = CnpjValidator(options)
+
+                for cnpj_input in cnpj_inputs:
+                    assert validator.inspect(cnpj_input).is_valid is validator.is_valid(
+                        cnpj_input
+                    )
+
+        def it_applies_per_call_options():
+            inspection = CnpjValidator().inspect("1qb5ukalpyfp59", case_sensitive=False)
+
+            assert inspection == CnpjInspection(
+                CnpjValidatorReason.VALID, "1QB5UKALPYFP59", "59"
+            )
+
+        @pytest.mark.parametrize(("input_value", "actual_type"), INVALID_INPUT_CASES)
+        def it_raises_cnpj_validator_input_type_error(input_value, actual_type):
+            with pytest.raises(CnpjValidatorInputTypeError) as exc_info:
+                CnpjValidator().inspect(input_value)
+
+            assert exc_info.value.actual_type == actual_type
+
+    def describe_inspect_many_method():
+        def it_counts_the_reason_of_each_input():
+            validator = CnpjValidator()
+
+            assert validator.inspect_many(
+                [
+                    "1QB5UKALPYFP59",
+                    b"91415732000793",
+                    "91415732000794",
+                    "91415732000795",
+                    "1qb5ukalpyfp59",
+                    "",
+                ]
+            ) == Counter(
+                {
+                    CnpjValidatorReason.VALID: 2,
+                    CnpjValidatorReason.CHECK_DIGITS_MISMATCH: 2,
+                    CnpjValidatorReason.LOWERCASE_LETTERS: 1,
+                    CnpjValidatorReason.INVALID_LENGTH: 1,
+                }
+            )
+
+        def it_applies_per_call_options_and_returns_an_empty_counter_when_empty():
+            validator = CnpjValidator()
+
+            assert validator.inspect_many(
+                ["1qb5ukalpyfp59"], case_sensitive=False
+            ) == Counter({CnpjValidatorReason.VALID: 1})
+            assert validator.inspect_many([]) == Counter()
+
+    def describe_cache():
+        def it_is_disabled_by_default():
+            assert CnpjValidator().cache is None
+
+        def it_caches_results_by_raw_input():
+            validator = CnpjValidator(cache_size=8)
+
+            assert validator.is_valid("91.415.732/0007-93") is True
+            assert validator.is_valid("91.415.732/0007-93") is True
+            assert validator.is_valid(b"91415732000794") is False
+            assert validator.is_valid(b"91415732000794") is False
+
+            cache = validator.cache
+            assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+
+        def it_keys_per_call_options_separately():
+            validator = CnpjValidator(cache_size=8)
+
+            assert validator.is_valid("1qb5ukalpyfp59") is False
+            assert validator.is_valid("1qb5ukalpyfp59", case_sensitive=False) is True
+            assert (
+                validator.is_valid("1qb5ukalpyfp59", {"case_sensitive": False}) is True
+            )
+            assert validator.is_valid("1qb5ukalpyfp59") is False
+            assert (validator.cache.hits, validator.cache.misses) == (2, 2)
+
+        def it_drops_the_cache_when_the_default_options_change():
+            validator = CnpjValidator(cache_size=8)
+
+            assert validator.is_valid("1QB5UKALPYFP59") is True
+
+            validator.options.type = "numeric"
+
+            assert validator.is_valid("1QB5UKALPYFP59") is False
+            assert len(validator.cache) == 1
+
+        def it_evicts_the_least_recently_used_input():
+            validator = CnpjValidator(cache_size=1)
+
+            validator.is_valid("91415732000793")
+            validator.is_valid("1QB5UKALPYFP59")
+
+            assert ("1QB5UKALPYFP59",) in validator.cache
+            assert ("91415732000793",) not in validator.cache
+            assert validator.cache.evictions == 1
+
+        def it_rejects_an_invalid_cache_size():
+            with pytest.raises(ValueError, match="max_size"):
+                CnpjValidator(cache_size=-1)
+
+    def describe_per_call_options_resolution():
+        def it_reuses_the_options_resolved_for_repeated_overrides(monkeypatch):
+            merges = []
+            original_set = CnpjValidatorOptions.set
+
+            def counting_set(options, overrides):
+                merges.append(overrides)
+
+                return original_set(options, overrides)
+
+            monkeypatch.setattr(CnpjValidatorOptions, "set", counting_set)
+            validator = CnpjValidator()
+
+            for _ in range(3):
+                assert (
+                    validator.is_valid("1qb5ukalpyfp59", case_sensitive=False) is True
+                )
+                assert (
+                    validator.is_valid("1QB5UKALPYFP59", {"type": "numeric"}) is False
                 )
+
+            merges_after_first_round = len(merges)
+            validator.is_valid("1qb5ukalpyfp59", case_sensitive=False)
+
+            assert len(merges) == merges_after_first_round
+
+        def it_resolves_again_after_the_default_options_change():
+            validator = CnpjValidator()
+
+            assert validator.is_valid("1qb5ukalpyfp59", case_sensitive=False) is True
+
+            validator.options.type = "numeric"
+
+            assert validator.is_valid("1qb5ukalpyfp59", case_sensitive=False) is False
+
+        def it_still_raises_for_invalid_overrides_after_valid_ones():
+            validator = CnpjValidator()
+
+            assert validator.is_valid("91415732000793", type="numeric") is True
+
+            with pytest.raises(CnpjValidatorOptionTypeInvalidException):
+                validator.is_valid("91415732000793", type="hex")
@@ -0,0 +1,137 @@
+"""Spec for :meth:`cnpj_val.CnpjValidator.is_valid_array`.
+
+:meth:`CnpjValidator.is_valid` is the reference: every element of the array
+must get the same result it gets on its own under the same options. Skipped
+when the optional ``numpy`` extra is not installed.
+"""
+
+import random
+
+import pytest
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import CnpjValidator, CnpjValidatorInputTypeError
+
+np = pytest.importorskip("numpy")
+
+_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _sample_inputs() -> list[str]:
+    rng = random.Random(0)
+    cnpjs = CnpjCheckDigits.complete_many(
+        "".join(rng.choices(_ALPHABET, k=12)) for _ in range(300)
+    )
+    cnpjs.extend(
+        CnpjCheckDigits.complete_many(
+            f"{rng.randrange(10**12):012d}" for _ in range(300)
+        )
+    )
+    inputs = [
+        "",
+        "00000000000000",
+        "11111111111180",
+        "AB123CDE00015",
+        "91.415.732/0007-93 ",
+        "91 415 732 0007 93 x",
+        "1QB5UKALPYFP59",
+        "1QB5UKALpyfp59",
+        "1qb5ukalpyfp59",
+        "1QB5UKALPYFP5A",
+        "9141573200079é",
+        "11.222.333/0001-81 €",
+        "11222333000181\u2010",
+        CnpjCheckDigits("12ABCDEFGHSS").cnpj.replace("SS", "\u00df"),
+        CnpjCheckDigits("12ABCDEFGHIJ").cnpj.replace("I", "\u0131"),
+    ]
+
+    for cnpj in cnpjs:
+        if cnpj is None:
+            continue
+
+        formatted = f"{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}"
+        inputs.extend(
+            [cnpj, formatted, cnpj.lower(), f"{cnpj[:-1]}{(int(cnpj[-1]) + 1) % 10}"]
+        )
+
+    return inputs
+
+
+SAMPLE_INPUTS = _sample_inputs()
+
+OPTION_CASES = [
+    {},
+    {"case_sensitive": False},
+    {"type": "numeric"},
+    {"case_sensitive": False, "type": "numeric"},
+]
+
+
+def describe_is_valid_array_method():
+    @pytest.mark.parametrize("options", OPTION_CASES)
+    @pytest.mark.parametrize("dtype", ["U", "S"])
+    def it_matches_is_valid_for_every_element(options, dtype):
+        validator = CnpjValidator()
+        inputs = [value for value in SAMPLE_INPUTS if dtype == "U" or value.isascii()]
+        array = np.array(inputs).astype(dtype)
+
+        assert validator.is_valid_array(array, **options).tolist() == [
+            validator.is_valid(value, **options) for value in inputs
+        ]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "11.222.333/0001-81 €",
+            "11222333000181\u2010",
+            "€1111111100292",
+            "1234€678000195",
+        ],
+    )
+    def it_rejects_rows_with_characters_outside_latin_1(value):
+        assert CnpjValidator().is_valid(value) is False
+        assert CnpjValidator().is_valid_array(np.array([value])).tolist() == [False]
+
+    def it_uppercases_non_ascii_letters_like_is_valid():
+        value = CnpjCheckDigits("12ABCDEFGHSS").cnpj.replace("SS", "\u00df")
+        array = np.array([value, "91415732000793"])
+
+        assert CnpjValidator(case_sensitive=False).is_valid_array(array).tolist() == [
+            True,
+            True,
+        ]
+        assert CnpjValidator().is_valid_array(array).tolist() == [False, True]
+
+    def it_honors_the_instance_default_options():
+        validator = CnpjValidator(case_sensitive=False)
+
+        assert validator.is_valid_array(np.array(["1QB5UKALpyfp59"])).tolist() == [True]
+
+    def it_keeps_the_shape_of_the_input_array():
+        array = np.array([["91.415.732/0007-93", "91415732000794"]] * 3)
+
+        result = CnpjValidator().is_valid_array(array)
+
+        assert result.dtype == np.bool_
+        assert result.shape == (3, 2)
+        assert result.tolist() == [[True, False]] * 3
+
+    def it_accepts_non_contiguous_and_big_endian_arrays():
+        array = np.array(["91415732000793", "x", "1QB5UKALPYFP59"], dtype=">U18")
+
+        assert CnpjValidator().is_valid_array(array[::2]).tolist() == [True, True]
+
+    def it_returns_an_empty_mask_for_an_empty_array():
+        assert CnpjValidator().is_valid_array(np.array([], dtype="U14")).tolist() == []
+
+    @pytest.mark.parametrize(
+        "cnpj_array",
+        [
+            "91415732000793",
+            ["91415732000793"],
+            np.array([91415732000793]),
+            np.array(["91415732000793"], dtype=object),
+        ],
+    )
+    def it_raises_cnpj_validator_input_type_error(cnpj_array):
+        with pytest.raises(CnpjValidatorInputTypeError):
+            CnpjValidator().is_valid_array(cnpj_array)
@@ -0,0 +1,180 @@
+"""Spec for :meth:`cnpj_val.CnpjValidator.validate_file` and
+:class:`cnpj_val.CnpjFileReport`.
+
+:meth:`CnpjValidator.is_valid` is the reference: a line is reported invalid
+exactly when ``is_valid`` rejects its value under the same options.
+"""
+
+import random
+
+import pytest
+from cnpj_dv import CnpjCheckDigits
+from cnpj_val import (
+    CnpjFileReport,
+    CnpjValidator,
+    CnpjValidatorOptionTypeInvalidException,
+    CnpjValidatorReason,
+)
+from lacus.utils import file_report as file_report_module
+
+VALID_LINES = ["91.415.732/0007-93", "91415732000793", "1QB5UKALPYFP59"]
+
+INVALID_LINES = [
+    ("91415732000794", CnpjValidatorReason.CHECK_DIGITS_MISMATCH),
+    ("9141573200079", CnpjValidatorReason.INVALID_LENGTH),
+    ("1QB5UKALPYFPA9", CnpjValidatorReason.INVALID_CHECK_CHARACTERS),
+    ("1qb5ukalpyfp59", CnpjValidatorReason.LOWERCASE_LETTERS),
+    ("00000000000191", CnpjValidatorReason.INVALID_BASE_ID),
+    ("91415732000000", CnpjValidatorReason.INVALID_BRANCH_ID),
+    ("11111111111180", CnpjValidatorReason.REPEATED_DIGITS),
+]
+
+
+def _write(tmp_path, content: bytes):
+    path = tmp_path / "cnpjs.txt"
+    path.write_bytes(content)
+
+    return path
+
+
+def describe_validate_file_method():
+    def describe_when_given_one_cnpj_per_line():
+        def it_reports_the_line_number_and_reason_of_each_invalid_line(tmp_path):
+            lines = [
+                VALID_LINES[0],
+                *(line for line, _ in INVALID_LINES),
+                VALID_LINES[1],
+            ]
+            path = _write(tmp_path, "\n".join(lines).encode())
+
+            report = CnpjValidator().validate_file(path)
+
+            assert isinstance(report, CnpjFileReport)
+            assert list(report) == [
+                (index, reason)
+                for index, (_, reason) in enumerate(INVALID_LINES, start=2)
+            ]
+            assert (report.total, report.valid, report.invalid) == (9, 2, 7)
+
+        def it_matches_is_valid_for_every_line(tmp_path):
+            rng = random.Random(0)
+            cnpjs = CnpjCheckDigits.complete_many(
+                f"{rng.randrange(10**12):012d}" for _ in range(200)
+            )
+            lines = []
+
+            for cnpj in filter(None, cnpjs):
+                lines.extend(
+                    [cnpj, f"{cnpj[:-1]}{(int(cnpj[-1]) + 1) % 10}", cnpj.lower()]
+                )
+
+            path = _write(tmp_path, "\n".join(lines).encode() + b"\n")
+            validator = CnpjValidator()
+
+            invalid_line_numbers = [
+                line_number for line_number, _ in validator.validate_file(path)
+            ]
+
+            assert invalid_line_numbers == [
+                index
+                for index, line in enumerate(lines, start=1)
+                if not validator.is_valid(line)
+            ]
+
+        def it_skips_blank_lines_and_keeps_their_line_numbers(tmp_path):
+            path = _write(tmp_path, b"\n91415732000794\r\n  \n\n91415732000793\n\n")
+
+            report = CnpjValidator().validate_file(path)
+
+            assert list(report) == [(2, CnpjValidatorReason.CHECK_DIGITS_MISMATCH)]
+            assert report.total == 2
+
+        def it_validates_lines_across_chunk_boundaries(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 7)
+            path = _write(tmp_path, b"91415732000793\n91415732000794\n1QB5UKALPYFP59")
+
+            report = CnpjValidator().validate_file(path)
+
+            assert list(report) == [(2, CnpjValidatorReason.CHECK_DIGITS_MISMATCH)]
+            assert (report.total, report.valid) == (3, 2)
+
+        def it_validates_lines_longer_than_a_chunk_like_is_valid(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 8)
+            lines = [
+                "91.415.732/" + " " * 30 + "0007-93",
+                "-" * 40 + "1qb5ukalpyfp59",
+                "9" * 40,
+            ]
+            path = _write(tmp_path, "\n".join(lines).encode())
+            validator = CnpjValidator(case_sensitive=False)
+
+            assert [
+                line_number for line_number, _ in validator.validate_file(path)
+            ] == [
+                index
+                for index, line in enumerate(lines, start=1)
+                if not validator.is_valid(line)
+            ]
+
+        def it_reports_no_lines_for_an_empty_file(tmp_path):
+            report = CnpjValidator().validate_file(_write(tmp_path, b"")).finish()
+
+            assert (report.total, report.valid, report.invalid) == (0, 0, 0)
+
+    def describe_when_given_a_column():
+        def it_validates_that_field_of_each_line(tmp_path):
+            path = _write(
+                tmp_path,
+                b"cnpj;name\n91.415.732/0007-93;a\nb;91415732000793\n1QB5UKALPYFP59;c",
+            )
+
+            report = CnpjValidator().validate_file(
+                path, column=0, delimiter=";", header=True
+            )
+
+            assert list(report) == [(3, CnpjValidatorReason.INVALID_LENGTH)]
+            assert (report.total, report.valid, report.invalid) == (3, 2, 1)
+
+        def it_treats_a_missing_field_as_an_empty_value(tmp_path):
+            path = _write(tmp_path, b"a,91415732000793\nb\n")
+
+            report = CnpjValidator().validate_file(path, column=1)
+
+            assert list(report) == [(2, CnpjValidatorReason.INVALID_LENGTH)]
+
+    def describe_when_given_options():
+        def it_honors_per_call_and_instance_options(tmp_path):
+            path = _write(tmp_path, b"1qb5ukalpyfp59\n1QB5UKALPYFP59\n")
+
+            assert list(CnpjValidator().validate_file(path, case_sensitive=False)) == []
+            assert list(CnpjValidator(type="numeric").validate_file(path)) == [
+                (1, CnpjValidatorReason.INVALID_LENGTH),
+                (2, CnpjValidatorReason.INVALID_LENGTH),
+            ]
+
+        def it_raises_for_an_invalid_type_option(tmp_path):
+            with pytest.raises(CnpjValidatorOptionTypeInvalidException):
+                CnpjValidator().validate_file(_write(tmp_path, b""), type="hex")
+
+    def describe_the_report():
+        def it_closes_the_file_once_exhausted(tmp_path):
+            report = CnpjValidator().validate_file(
+                _write(tmp_path, b"91415732000793\n")
+            )
+
+            assert report.closed is False
+            assert report.finish() is report
+            assert report.closed is True
+
+        def it_closes_the_file_when_leaving_a_with_block(tmp_path):
+            with CnpjValidator().validate_file(_write(tmp_path, b"x\ny\n")) as report:
+                assert next(report) == (1, CnpjValidatorReason.INVALID_LENGTH)
+
+            assert report.closed is True
+            assert list(report) == []
+
+        def it_raises_on_iteration_when_the_file_does_not_exist(tmp_path):
+            report = CnpjValidator().validate_file(tmp_path / "missing.txt")
+
+            with pytest.raises(FileNotFoundError):
+                next(report)
@@ -240,3 +240,15 @@ def describe_cnpj_validator_options():
 
             assert isinstance(options.all["case_sensitive"], bool)
             assert isinstance(options.all["type"], str)
+
+    def describe_version_getter():
+        def it_grows_whenever_an_option_is_set():
+            options = CnpjValidatorOptions()
+            versions = [options.version]
+
+            options.case_sensitive = False
+            versions.append(options.version)
+            options.set({"type": "numeric"})
+            versions.append(options.version)
+
+            assert versions == sorted(set(versions))
@@ -32,6 +32,10 @@ def describe_the_cnpj_val_package_api():
             expected_names = {
                 "cnpj_val",
                 "CnpjValidator",
+                "CnpjValidatorReason",
+                "CnpjFileReport",
+                "CnpjInspection",
+                "CnpjIncrementalValidator",
                 "CnpjValidatorOptions",
                 "CnpjValidatorTypeError",
                 "CnpjValidatorInputTypeError",
@@ -0,0 +1,54 @@
+"""Benchmark bytes-like input against the equivalent ``str`` input.
+
+Run from the package root with ``python benchmarks/bytes_input.py``. Prints
+the per-item cost of ``CpfCheckDigits.classify`` over formatted CPF bases
+given as ``str``, as ``bytes`` and as ``memoryview`` slices of a single
+buffer, as read from a binary file.
+"""
+
+import random
+import timeit
+
+from cpf_dv import CpfCheckDigits
+
+_ALPHABET = "0123456789"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_bases() -> list[str]:
+    rng = random.Random(0)
+    bases = ["".join(rng.choices(_ALPHABET, k=9)) for _ in range(_SAMPLE_SIZE)]
+
+    return [f"{b[:3]}.{b[3:6]}.{b[6:]}" for b in bases]
+
+
+def _classify_all(cpf_inputs: list) -> None:
+    classify = CpfCheckDigits.classify
+
+    for cpf_input in cpf_inputs:
+        classify(cpf_input)
+
+
+def main() -> None:
+    str_bases = _sample_bases()
+    bytes_bases = [base.encode() for base in str_bases]
+    buffer = memoryview(b"".join(bytes_bases))
+    size = len(bytes_bases[0])
+    memoryview_bases = [buffer[i : i + size] for i in range(0, len(buffer), size)]
+
+    for label, cpf_inputs in (
+        ("str", str_bases),
+        ("bytes", bytes_bases),
+        ("memoryview", memoryview_bases),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda i=cpf_inputs: _classify_all(i), number=1, repeat=_REPEAT
+            )
+        )
+        print(f"{label:>10}: {best / len(cpf_inputs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 from .cpf_check_digits import (
+    CPF_CHECK_DIGIT_BY_REMAINDER,
+    CPF_FIRST_WEIGHTS,
     CPF_MAX_LENGTH,
     CPF_MIN_LENGTH,
+    CPF_SECOND_DIGIT_WEIGHT,
+    CPF_SECOND_WEIGHTS,
     CpfCheckDigits,
+    CpfCheckDigitsStatus,
 )
 from .exceptions import (
     CpfCheckDigitsException,
@@ -13,13 +18,18 @@ from .exceptions import (
 from .types import CpfInput
 
 __all__ = [
+    "CPF_CHECK_DIGIT_BY_REMAINDER",
+    "CPF_FIRST_WEIGHTS",
     "CPF_MAX_LENGTH",
     "CPF_MIN_LENGTH",
+    "CPF_SECOND_DIGIT_WEIGHT",
+    "CPF_SECOND_WEIGHTS",
     "CpfCheckDigits",
     "CpfCheckDigitsException",
     "CpfCheckDigitsInputInvalidException",
     "CpfCheckDigitsInputLengthException",
     "CpfCheckDigitsInputTypeError",
+    "CpfCheckDigitsStatus",
     "CpfCheckDigitsTypeError",
     "CpfInput",
 ]
@@ -3,12 +3,26 @@
 Validates length and rejects repeated-digit sequences.
 """
 
+from __future__ import annotations
+
+import re
+from enum import IntEnum
+from operator import getitem
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     CpfCheckDigitsInputInvalidException,
     CpfCheckDigitsInputLengthException,
     CpfCheckDigitsInputTypeError,
 )
-from .types import CpfInput
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    import numpy as np
+
+    from .types import CpfInput
 
 CPF_MIN_LENGTH = 9
 """Minimum number of digits required for the CPF check digits calculation."""
@@ -18,10 +32,254 @@ CPF_MAX_LENGTH = 11
 calculation.
 """
 
+CPF_FIRST_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+"""Weights of the base digits in the first check digit sum."""
+
+CPF_SECOND_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3)
+"""Weights of the base digits in the second check digit sum."""
+
+CPF_SECOND_DIGIT_WEIGHT = 2
+"""Weight of the first check digit in the second check digit sum."""
+
+CPF_CHECK_DIGIT_BY_REMAINDER = (0, 0, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+"""Check digit for each remainder of a weighted sum divided by 11."""
+
+
+class CpfCheckDigitsStatus(IntEnum):
+    """Eligibility of a CPF base for the check digits calculation, as
+    reported by :meth:`CpfCheckDigits.classify`.
+    """
+
+    OK = 0
+    """The base is eligible and its check digits were calculated."""
+
+    INVALID_LENGTH = 1
+    """The digit count is not between 9 and 11."""
+
+    REPEATED_DIGITS = 2
+    """The first 9 digits are all the same."""
+
+
 _DELTA_FACTOR = ord("0")
-_FIRST_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
-_SECOND_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_SECOND_SUM_SHIFT = 16
+_FIRST_SUM_MASK = (1 << _SECOND_SUM_SHIFT) - 1
 _DIGIT_CHARS = "0123456789"
+_NON_DIGIT_PATTERN = re.compile(r"[^0-9]")
+_NON_DIGIT_BYTES = bytes(code for code in range(256) if not 0x30 <= code <= 0x39)
+_BYTES_INPUT_TYPES = (bytes, bytearray, memoryview)
+_EXPECTED_INPUT_TYPE = "string, integer, bytes or string[]"
+_EXPECTED_ARRAY_TYPE = "uint8 array of shape (N, 9)"
+
+
+def _build_weighted_tables() -> tuple[dict[str | int, int], ...]:
+    """Build one lookup table per base position mapping each digit, and its
+    byte value, to its packed contribution to both weighted sums.
+
+    The first-digit contribution sits in the low bits and the second-digit
+    contribution is shifted by ``_SECOND_SUM_SHIFT``, so adding the packed
+    values of all positions yields both sums at once.
+    """
+    tables: list[dict[str | int, int]] = []
+
+    for first_weight, second_weight in zip(
+        CPF_FIRST_WEIGHTS, CPF_SECOND_WEIGHTS, strict=True
+    ):
+        table: dict[str | int, int] = {}
+
+        for char in _DIGIT_CHARS:
+            code = ord(char)
+            table[char] = table[code] = (code - _DELTA_FACTOR) * (
+                first_weight + (second_weight << _SECOND_SUM_SHIFT)
+            )
+
+        tables.append(table)
+
+    return tuple(tables)
+
+
+_WEIGHTED_TABLES = _build_weighted_tables()
+
+
+def _build_value_by_char_code() -> tuple[int, ...]:
+    """Build a 256-entry table mapping each byte value to its digit value,
+    with every non-digit byte mapped to ``-1``.
+    """
+    values = [-1] * 256
+
+    for char in _DIGIT_CHARS:
+        values[ord(char)] = ord(char) - _DELTA_FACTOR
+
+    return tuple(values)
+
+
+_VALUE_BY_CHAR_CODE = _build_value_by_char_code()
+_INT_CHUNK_SIZE = 3
+_INT_CHUNK_BASE = 10**_INT_CHUNK_SIZE
+_INT_BASE_LIMIT = 10**CPF_MIN_LENGTH
+_INT_CPF_LIMIT = 10**CPF_MAX_LENGTH
+_INT_CHECK_DIGITS_MODULUS = 10 ** (CPF_MAX_LENGTH - CPF_MIN_LENGTH)
+_INT_REPEATED_DIGITS_DIVISOR = _INT_BASE_LIMIT // 9
+
+
+def _build_int_chunk_tables() -> tuple[tuple[int, ...], ...]:
+    """Build one table per 3-digit chunk of a 9-digit base, indexed by the
+    chunk value, holding the packed contribution of its digits to both
+    weighted sums.
+
+    Splitting an integer base with ``divmod`` and summing three table hits
+    yields the same packed sums as the per-character tables, without
+    formatting the integer as a string.
+    """
+    return tuple(
+        tuple(
+            sum(
+                map(
+                    getitem,
+                    _WEIGHTED_TABLES[offset : offset + _INT_CHUNK_SIZE],
+                    f"{chunk:0{_INT_CHUNK_SIZE}d}",
+                )
+            )
+            for chunk in range(_INT_CHUNK_BASE)
+        )
+        for offset in range(0, CPF_MIN_LENGTH, _INT_CHUNK_SIZE)
+    )
+
+
+_HIGH_CHUNK_TABLE, _MIDDLE_CHUNK_TABLE, _LOW_CHUNK_TABLE = _build_int_chunk_tables()
+
+
+def _calculate_digits(cpf_base: str | bytes) -> tuple[int, int]:
+    """Compute both check digits of 9 sanitized base digits (or their byte
+    values) in a single table-driven pass of the standard CPF modulo-11
+    algorithm.
+    """
+    return _digits_from_sums(sum(map(getitem, _WEIGHTED_TABLES, cpf_base)))
+
+
+def _calculate_int_digits(cpf_base: int) -> tuple[int, int]:
+    """Compute both check digits of a 9-digit integer base arithmetically,
+    splitting it into 3-digit chunks with ``divmod``.
+    """
+    high_chunk, rest = divmod(cpf_base, _INT_CHUNK_BASE * _INT_CHUNK_BASE)
+    middle_chunk, low_chunk = divmod(rest, _INT_CHUNK_BASE)
+
+    return _digits_from_sums(
+        _HIGH_CHUNK_TABLE[high_chunk]
+        + _MIDDLE_CHUNK_TABLE[middle_chunk]
+        + _LOW_CHUNK_TABLE[low_chunk]
+    )
+
+
+def _digits_from_sums(sums: int) -> tuple[int, int]:
+    """Derive both check digits from the packed weighted sums of a base."""
+    first_digit = CPF_CHECK_DIGIT_BY_REMAINDER[(sums & _FIRST_SUM_MASK) % 11]
+    second_sum = (sums >> _SECOND_SUM_SHIFT) + first_digit * CPF_SECOND_DIGIT_WEIGHT
+
+    return first_digit, CPF_CHECK_DIGIT_BY_REMAINDER[second_sum % 11]
+
+
+def _classify(cpf_digits: str | bytes) -> CpfCheckDigitsStatus:
+    """Report whether sanitized digits (or bytes) are eligible for the check
+    digits calculation, without raising.
+    """
+    if not CPF_MIN_LENGTH <= len(cpf_digits) <= CPF_MAX_LENGTH:
+        return CpfCheckDigitsStatus.INVALID_LENGTH
+
+    if cpf_digits[:CPF_MIN_LENGTH] == cpf_digits[:1] * CPF_MIN_LENGTH:
+        return CpfCheckDigitsStatus.REPEATED_DIGITS
+
+    return CpfCheckDigitsStatus.OK
+
+
+def _classify_int(cpf_number: int) -> CpfCheckDigitsStatus:
+    """Report whether an integer CPF (11 digits, leading zeros implied) is
+    eligible for the check digits calculation, without raising.
+    """
+    if not 0 <= cpf_number < _INT_CPF_LIMIT:
+        return CpfCheckDigitsStatus.INVALID_LENGTH
+
+    if cpf_number // _INT_CHECK_DIGITS_MODULUS % _INT_REPEATED_DIGITS_DIVISOR == 0:
+        return CpfCheckDigitsStatus.REPEATED_DIGITS
+
+    return CpfCheckDigitsStatus.OK
+
+
+def _complete(cpf_digits: str | bytes) -> str | None:
+    """Return the full CPF for sanitized digits (or bytes), or ``None`` when
+    they are not eligible for the check digits calculation.
+    """
+    if _classify(cpf_digits) is not CpfCheckDigitsStatus.OK:
+        return None
+
+    cpf_base = cpf_digits[:CPF_MIN_LENGTH]
+    first_digit, second_digit = _calculate_digits(cpf_base)
+
+    if isinstance(cpf_base, bytes):
+        cpf_base = cpf_base.decode("ascii")
+
+    return cpf_base + _DIGIT_CHARS[first_digit] + _DIGIT_CHARS[second_digit]
+
+
+def _complete_int(cpf_number: int) -> str | None:
+    """Return the full CPF for an integer CPF, or ``None`` when it is not
+    eligible for the check digits calculation.
+    """
+    if _classify_int(cpf_number) is not CpfCheckDigitsStatus.OK:
+        return None
+
+    cpf_base = cpf_number // _INT_CHECK_DIGITS_MODULUS
+    first_digit, second_digit = _calculate_int_digits(cpf_base)
+
+    return f"{cpf_base * 100 + first_digit * 10 + second_digit:011d}"
+
+
+def _is_int_input(cpf_input: object) -> bool:
+    """Tell integer CPFs apart from other inputs, excluding ``bool``."""
+    return isinstance(cpf_input, int) and not isinstance(cpf_input, bool)
+
+
+def _import_numpy() -> ModuleType:
+    """Import NumPy for the array API, pointing to the optional extra when it
+    is not installed.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            'NumPy is required for array input. Install it with "pip install cpf-dv[numpy]".'
+        ) from error
+
+    return numpy
+
+
+def _sanitize_bytes(cpf_bytes: bytes | bytearray | memoryview) -> bytes:
+    """Strip non-digit bytes, without decoding."""
+    cpf_bytes = bytes(cpf_bytes)
+
+    if cpf_bytes.isdigit():
+        return cpf_bytes
+
+    return cpf_bytes.translate(None, _NON_DIGIT_BYTES)
+
+
+def _sanitize_input(cpf_input: object) -> str | bytes:
+    """Sanitize a string, bytes-like object or list of strings without
+    creating an instance. Bytes-like input stays ``bytes``.
+
+    Raises:
+        ``CpfCheckDigitsInputTypeError``: When input is not a ``str``,
+            ``int``, bytes-like object or ``list[str]``.
+    """
+    if isinstance(cpf_input, str):
+        return _NON_DIGIT_PATTERN.sub("", cpf_input)
+
+    if isinstance(cpf_input, _BYTES_INPUT_TYPES):
+        return _sanitize_bytes(cpf_input)
+
+    if isinstance(cpf_input, list) and all(isinstance(item, str) for item in cpf_input):
+        return _NON_DIGIT_PATTERN.sub("", "".join(cpf_input))
+
+    raise CpfCheckDigitsInputTypeError(cpf_input, _EXPECTED_INPUT_TYPE)
 
 
 class CpfCheckDigits:
@@ -34,41 +292,49 @@ class CpfCheckDigits:
         """Create a calculator for the given CPF base (9 to 11 digits).
 
         Args:
-            ``cpf_input``: Digits with or without formatting, or a list of
-                strings.
+            ``cpf_input``: Digits with or without formatting, as a string or
+                bytes-like object, a list of strings, or an ``int`` holding
+                the full 11-digit CPF (leading zeros implied, e.g.
+                ``5449651910`` for ``054.496.519-10``), whose last 2 digits
+                are ignored like those of an 11-digit string.
 
         Raises:
-            ``CpfCheckDigitsInputTypeError``: When input is not a ``str`` or
-                ``list[str]``.
+            ``CpfCheckDigitsInputTypeError``: When input is not a ``str``,
+                ``int``, bytes-like object or ``list[str]``.
             ``CpfCheckDigitsInputLengthException``: When digit count is not
-                between 9 and 11.
+                between 9 and 11, or an ``int`` input is negative or has more
+                than 11 digits.
             ``CpfCheckDigitsInputInvalidException``: When all digits are the
                 same (repeated digits, e.g. ``777.777.777-...``).
         """
-        parsed_input = self._parse_input(cpf_input)
+        if _is_int_input(cpf_input):
+            self._validate_int(cpf_input)
+            self._cpf_base: str | int = cpf_input // _INT_CHECK_DIGITS_MODULUS
+        else:
+            parsed_input = self._parse_input(cpf_input)
+
+            self._validate_length(parsed_input, cpf_input)
+            self._validate_non_repeated_digits(parsed_input, cpf_input)
 
-        self._validate_length(parsed_input, cpf_input)
-        self._validate_non_repeated_digits(parsed_input, cpf_input)
+            self._cpf_base = parsed_input[:CPF_MIN_LENGTH]
 
-        self._cpf_digits: tuple[str, ...] = tuple(parsed_input[:CPF_MIN_LENGTH])
-        self._cached_first_digit: int | None = None
-        self._cached_second_digit: int | None = None
+        self._cached_digits: tuple[int, int] | None = None
 
     @property
     def first(self) -> str:
         """First check digit (10th digit of the full CPF)."""
-        if self._cached_first_digit is None:
-            self._cached_first_digit = self._calculate(self._cpf_digits)
+        if self._cached_digits is None:
+            self._cached_digits = self._calculate(self._cpf_base)
 
-        return _DIGIT_CHARS[self._cached_first_digit]
+        return _DIGIT_CHARS[self._cached_digits[0]]
 
     @property
     def second(self) -> str:
         """Second check digit (11th digit of the full CPF)."""
-        if self._cached_second_digit is None:
-            self._cached_second_digit = self._calculate((*self._cpf_digits, self.first))
+        if self._cached_digits is None:
+            self._cached_digits = self._calculate(self._cpf_base)
 
-        return _DIGIT_CHARS[self._cached_second_digit]
+        return _DIGIT_CHARS[self._cached_digits[1]]
 
     @property
     def both(self) -> str:
@@ -80,36 +346,153 @@ class CpfCheckDigits:
         """Full 11-digit CPF (base 9 digits concatenated with the 2 check
         digits).
         """
-        return "".join(self._cpf_digits) + self.both
+        if isinstance(self._cpf_base, int):
+            return f"{self._cpf_base:0{CPF_MIN_LENGTH}d}" + self.both
 
-    def _parse_input(self, cpf_input: object) -> list[str]:
-        """Parse a string or list of strings into digit characters.
+        return self._cpf_base + self.both
+
+    @staticmethod
+    def complete_many(cpf_inputs: Iterable[CpfInput]) -> list[str | None]:
+        """Calculate the full CPF for many bases in a single call.
+
+        Each item accepts the same formats as the constructor and is mapped
+        to its full 11-digit CPF, in input order. Items the constructor would
+        reject with a ``CpfCheckDigitsException`` (invalid length, repeated
+        digits) are mapped to ``None`` instead, and no :class:`CpfCheckDigits`
+        instance is created per item. Integer CPFs, such as the items of an
+        ``array("q")`` or a ``range``, are read like the constructor reads
+        them and completed arithmetically.
 
         Raises:
-            ``CpfCheckDigitsInputTypeError``: When input is not a ``str`` or
-                ``list[str]``.
+            ``CpfCheckDigitsInputTypeError``: When any item is not a ``str``,
+                ``int``, bytes-like object or ``list[str]``.
+        """
+        results: list[str | None] = []
+        append = results.append
+
+        for cpf_input in cpf_inputs:
+            if _is_int_input(cpf_input):
+                append(_complete_int(cpf_input))
+            else:
+                append(_complete(_sanitize_input(cpf_input)))
+
+        return results
+
+    @staticmethod
+    def classify(cpf_input: CpfInput) -> tuple[CpfCheckDigitsStatus, str | None]:
+        """Classify a CPF base and calculate its check digits without raising
+        for ineligible values.
+
+        Accepts the same formats as the constructor. Returns
+        ``CpfCheckDigitsStatus.OK`` with both check digits when the base is
+        eligible, or the status matching the ``CpfCheckDigitsException`` the
+        constructor would raise together with ``None``. This keeps rejected
+        inputs as cheap as accepted ones on dirty datasets. An ``int`` input
+        is read as the full 11-digit CPF and classified arithmetically; a
+        negative one or one with more than 11 digits reports
+        ``INVALID_LENGTH``. Bytes-like input is classified on its byte
+        values, without decoding.
+
+        Raises:
+            ``CpfCheckDigitsInputTypeError``: When input is not a ``str``,
+                ``int``, bytes-like object or ``list[str]``.
+        """
+        if _is_int_input(cpf_input):
+            status = _classify_int(cpf_input)
+
+            if status is not CpfCheckDigitsStatus.OK:
+                return status, None
+
+            first_digit, second_digit = _calculate_int_digits(
+                cpf_input // _INT_CHECK_DIGITS_MODULUS
+            )
+
+            return status, _DIGIT_CHARS[first_digit] + _DIGIT_CHARS[second_digit]
+
+        cpf_digits = _sanitize_input(cpf_input)
+        status = _classify(cpf_digits)
+
+        if status is not CpfCheckDigitsStatus.OK:
+            return status, None
+
+        first_digit, second_digit = _calculate_digits(cpf_digits[:CPF_MIN_LENGTH])
+
+        return status, _DIGIT_CHARS[first_digit] + _DIGIT_CHARS[second_digit]
+
+    @staticmethod
+    def calculate_array(cpf_chars: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the check digits of many CPF bases at once with NumPy.
+
+        Takes a ``uint8`` matrix of ASCII character values with one base per
+        row, such as ``np.frombuffer(data, np.uint8).reshape(-1, 9)``. Rows
+        may hold 9 to 11 columns; like the constructor, only the first 9 are
+        used. Both check digits of every row are derived from two dot
+        products with the weights, a modulo 11 and ``np.where``, with no
+        per-row Python work.
+
+        Returns a ``(check_digits, eligible)`` pair: an ``(N, 2)`` ``uint8``
+        matrix of digit values (``0`` to ``9``) and an ``(N,)`` boolean mask
+        that is ``False`` for rows the constructor would reject (repeated
+        digits) or that hold a non-digit character. Check digits of
+        ineligible rows carry no meaning.
+
+        Requires the ``numpy`` extra (``pip install cpf-dv[numpy]``).
+
+        Raises:
+            ``CpfCheckDigitsInputTypeError``: When input is not a
+                2-dimensional ``uint8`` array with 9 to 11 columns.
+        """
+        np = _import_numpy()
+
+        if not (
+            isinstance(cpf_chars, np.ndarray)
+            and cpf_chars.dtype == np.uint8
+            and cpf_chars.ndim == 2
+            and CPF_MIN_LENGTH <= cpf_chars.shape[1] <= CPF_MAX_LENGTH
+        ):
+            raise CpfCheckDigitsInputTypeError(cpf_chars, _EXPECTED_ARRAY_TYPE)
+
+        values = np.array(_VALUE_BY_CHAR_CODE, np.int32)[cpf_chars[:, :CPF_MIN_LENGTH]]
+
+        first_remainder = values @ np.array(CPF_FIRST_WEIGHTS, np.int32) % 11
+        first_digits = np.where(first_remainder < 2, 0, 11 - first_remainder)
+        second_remainder = (
+            values @ np.array(CPF_SECOND_WEIGHTS, np.int32)
+            + first_digits * CPF_SECOND_DIGIT_WEIGHT
+        ) % 11
+        second_digits = np.where(second_remainder < 2, 0, 11 - second_remainder)
+
+        eligible = (values >= 0).all(axis=1) & ~(values == values[:, :1]).all(axis=1)
+
+        return (
+            np.stack([first_digits, second_digits], axis=1).astype(np.uint8),
+            eligible,
+        )
+
+    def _parse_input(self, cpf_input: object) -> str:
+        """Parse a string, bytes-like object or list of strings into digit
+        characters.
+
+        Raises:
+            ``CpfCheckDigitsInputTypeError``: When input is not a ``str``,
+                ``int``, bytes-like object or ``list[str]``.
         """
         if isinstance(cpf_input, str):
             return self._parse_string_input(cpf_input)
 
+        if isinstance(cpf_input, _BYTES_INPUT_TYPES):
+            return _sanitize_bytes(cpf_input).decode("ascii")
+
         if isinstance(cpf_input, list):
             return self._parse_list_input(cpf_input)
 
-        raise CpfCheckDigitsInputTypeError(cpf_input, "string or string[]")
-
-    def _parse_string_input(self, cpf_string: str) -> list[str]:
-        """Strip non-digit characters and keep the remainder as characters."""
-        result: list[str] = []
-        append = result.append
+        raise CpfCheckDigitsInputTypeError(cpf_input, _EXPECTED_INPUT_TYPE)
 
-        for char in cpf_string:
-            code = ord(char)
-            if 48 <= code <= 57:
-                append(char)
+    def _parse_string_input(self, cpf_string: str) -> str:
+        """Strip non-digit characters and keep the remainder."""
+        return _NON_DIGIT_PATTERN.sub("", cpf_string)
 
-        return result
-
-    def _parse_list_input(self, cpf_list: list[object]) -> list[str]:
+    def _parse_list_input(self, cpf_list: list[object]) -> str:
         """Concatenate a list of strings and parse the result.
 
         Raises:
@@ -117,16 +500,16 @@ class CpfCheckDigits:
                 ``list[str]``.
         """
         if not cpf_list:
-            return []
+            return ""
 
         is_string_list = all(isinstance(item, str) for item in cpf_list)
 
         if not is_string_list:
-            raise CpfCheckDigitsInputTypeError(cpf_list, "string or string[]")
+            raise CpfCheckDigitsInputTypeError(cpf_list, _EXPECTED_INPUT_TYPE)
 
         return self._parse_string_input("".join(cpf_list))
 
-    def _validate_length(self, cpf_digits: list[str], original_input: CpfInput) -> None:
+    def _validate_length(self, cpf_digits: str, original_input: CpfInput) -> None:
         """Ensure digit count is between ``CPF_MIN_LENGTH`` and
         ``CPF_MAX_LENGTH``.
 
@@ -139,13 +522,13 @@ class CpfCheckDigits:
         if digits_count < CPF_MIN_LENGTH or digits_count > CPF_MAX_LENGTH:
             raise CpfCheckDigitsInputLengthException(
                 original_input,
-                "".join(cpf_digits),
+                cpf_digits,
                 CPF_MIN_LENGTH,
                 CPF_MAX_LENGTH,
             )
 
     def _validate_non_repeated_digits(
-        self, cpf_digits: list[str], original_input: CpfInput
+        self, cpf_digits: str, original_input: CpfInput
     ) -> None:
         """Reject inputs where all first 9 digits are the same.
 
@@ -161,18 +544,37 @@ class CpfCheckDigits:
                 "Repeated digits are not considered valid.",
             )
 
-    def _calculate(self, cpf_sequence: tuple[str, ...] | list[str]) -> int:
-        """Compute a single check digit using the standard CPF modulo-11
-        algorithm.
+    def _validate_int(self, cpf_number: int) -> None:
+        """Ensure an integer CPF fits 11 digits and its base is not a
+        repeated digit.
+
+        Raises:
+            ``CpfCheckDigitsInputLengthException``: When the integer is
+                negative or has more than 11 digits.
+            ``CpfCheckDigitsInputInvalidException``: When all 9 base digits
+                (leading zeros included) are the same.
         """
-        length = len(cpf_sequence)
-        weights = _FIRST_WEIGHTS if length == CPF_MIN_LENGTH else _SECOND_WEIGHTS
-        sum_result = 0
+        status = _classify_int(cpf_number)
 
-        for index in range(length):
-            char_value = ord(cpf_sequence[index]) - _DELTA_FACTOR
-            sum_result += char_value * weights[index]
+        if status is CpfCheckDigitsStatus.INVALID_LENGTH:
+            raise CpfCheckDigitsInputLengthException(
+                cpf_number,
+                str(abs(cpf_number)),
+                CPF_MIN_LENGTH,
+                CPF_MAX_LENGTH,
+            )
+
+        if status is CpfCheckDigitsStatus.REPEATED_DIGITS:
+            raise CpfCheckDigitsInputInvalidException(
+                cpf_number,
+                "Repeated digits are not considered valid.",
+            )
 
-        remainder = 11 - (sum_result % 11)
+    def _calculate(self, cpf_base: str | int) -> tuple[int, int]:
+        """Compute both check digits using the standard CPF modulo-11
+        algorithm.
+        """
+        if isinstance(cpf_base, int):
+            return _calculate_int_digits(cpf_base)
 
-        return 0 if remainder > 9 else remainder
+        return _calculate_digits(cpf_base)
@@ -21,6 +21,9 @@ def _format_actual_input(actual_input: Any) -> str:
     if isinstance(actual_input, str):
         return f'"{actual_input}"'
 
+    if isinstance(actual_input, (bytes, bytearray, memoryview)):
+        return repr(bytes(actual_input))
+
     return json.dumps(actual_input, separators=(",", ":"), ensure_ascii=False)
 
 
@@ -46,7 +49,7 @@ class CpfCheckDigitsTypeError(TypeError):
 
 class CpfCheckDigitsInputTypeError(CpfCheckDigitsTypeError):
     """Error raised when the input provided to :class:`CpfCheckDigits` is not
-    of the expected type (``str`` or ``list[str]``).
+    of the expected type (``str``, ``int``, bytes-like object or ``list[str]``).
 
     The error message includes both the actual type of the input and the
     expected type.
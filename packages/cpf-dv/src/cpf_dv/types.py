@@ -1,8 +1,11 @@
-CpfInput = str | list[str]
+CpfInput = str | int | bytes | bytearray | memoryview | list[str]
 """Represents valid input types for CPF check digits.
 
 A CPF can be provided as:
 
 - A string containing digits (with or without formatting)
+- An integer holding the 9-digit base, with leading zeros implied
+- A ``bytes``, ``bytearray`` or ``memoryview`` with the same ASCII content
+  as a string
 - A list of strings, where each string represents a digit or group of digits.
 """
@@ -6,12 +6,15 @@ suite (``php/packages/cpf-dv/tests/Specs/CpfCheckDigits.spec.php``), following
 the business rules documented in ``AGENTS.md``.
 """
 
+from array import array
+
 import pytest
 from cpf_dv import (
     CpfCheckDigits,
     CpfCheckDigitsInputInvalidException,
     CpfCheckDigitsInputLengthException,
     CpfCheckDigitsInputTypeError,
+    CpfCheckDigitsStatus,
 )
 
 # Shared conformance fixtures: (9-digit base, expected 11-digit CPF).
@@ -113,7 +116,8 @@ INVALID_LENGTH_INPUTS = [
 ]
 
 INVALID_TYPE_INPUTS = [
-    12345678901,
+    123456789.0,
+    True,
     None,
     {"cpf": "12345678901"},
     [1, 2, 3, 4, 5, 6, 7, 8, 9],
@@ -132,9 +136,9 @@ class _CpfCheckDigitsWithCalculateSpy(CpfCheckDigits):
         self.calculate_call_count = 0
         super().__init__(cpf_input)
 
-    def _calculate(self, cpf_sequence):
+    def _calculate(self, cpf_base):
         self.calculate_call_count += 1
-        return super()._calculate(cpf_sequence)
+        return super()._calculate(cpf_base)
 
 
 def describe_cpf_check_digits():
@@ -159,6 +163,32 @@ def describe_cpf_check_digits():
                 ):
                     CpfCheckDigits(cpf_input)
 
+        def describe_when_given_an_integer():
+            @pytest.mark.parametrize("full", [full for _, full in TEST_CASES])
+            def it_reads_it_as_a_zero_padded_11_digit_cpf(full):
+                assert CpfCheckDigits(int(full)).cpf == full
+
+            @pytest.mark.parametrize("base", [base for base, _ in TEST_CASES])
+            def it_ignores_the_last_2_digits_like_an_11_digit_string(base):
+                assert (
+                    CpfCheckDigits(int(base) * 100).cpf
+                    == CpfCheckDigits(base + "00").cpf
+                )
+
+            @pytest.mark.parametrize(
+                "cpf_input", [-1, 100_000_000_000, 123_456_789_091]
+            )
+            def it_raises_input_length_exception_when_out_of_range(cpf_input):
+                with pytest.raises(CpfCheckDigitsInputLengthException):
+                    CpfCheckDigits(cpf_input)
+
+            @pytest.mark.parametrize("digit", range(10))
+            def it_raises_input_invalid_exception_for_repeated_digits(digit):
+                with pytest.raises(
+                    CpfCheckDigitsInputInvalidException, match=r"(?i)repeated digits"
+                ):
+                    CpfCheckDigits(int(str(digit) * 11))
+
     def describe_first_digit():
         @pytest.mark.parametrize(("base", "full"), TEST_CASES)
         def it_returns_the_first_digit_for_a_string(base, full):
@@ -201,7 +231,14 @@ def describe_cpf_check_digits():
                 }
 
                 assert len(second_results) == 1
-                assert cpf_check_digits.calculate_call_count == 2
+                assert cpf_check_digits.calculate_call_count == 1
+
+            def it_shares_a_single_calculation_with_the_first_digit():
+                cpf_check_digits = _CpfCheckDigitsWithCalculateSpy("123456789")
+
+                assert cpf_check_digits.first == "0"
+                assert cpf_check_digits.second == "9"
+                assert cpf_check_digits.calculate_call_count == 1
 
     def describe_both_digits():
         @pytest.mark.parametrize(("base", "full"), TEST_CASES)
@@ -248,3 +285,161 @@ def describe_cpf_check_digits():
                 assert cpf_check_digits.first == "0"
                 assert cpf_check_digits.second == "9"
                 assert cpf_check_digits.cpf == "12345678909"
+
+    def describe_when_given_bytes_like_input():
+        @pytest.mark.parametrize("bytes_type", [bytes, bytearray, memoryview])
+        @pytest.mark.parametrize(("base", "full"), TEST_CASES)
+        def it_matches_the_string_input(bytes_type, base, full):
+            cpf_input = bytes_type(base.encode())
+
+            assert CpfCheckDigits(cpf_input).cpf == full
+            assert CpfCheckDigits.complete_many([cpf_input]) == [full]
+            assert CpfCheckDigits.classify(cpf_input) == (
+                CpfCheckDigitsStatus.OK,
+                full[-2:],
+            )
+
+        def it_strips_formatting_from_the_bytes():
+            assert CpfCheckDigits(b"054.496.519-10").cpf == "05449651910"
+
+        def it_accepts_memoryview_slices():
+            buffer = memoryview(b"05449651910;12345678909")
+
+            assert CpfCheckDigits.complete_many([buffer[:9], buffer[12:21]]) == [
+                "05449651910",
+                "12345678909",
+            ]
+
+        @pytest.mark.parametrize(
+            ("cpf_input", "status"),
+            [
+                (b"12345678", CpfCheckDigitsStatus.INVALID_LENGTH),
+                (b"777.777.777", CpfCheckDigitsStatus.REPEATED_DIGITS),
+            ],
+        )
+        def it_classifies_ineligible_bytes_without_raising(cpf_input, status):
+            assert CpfCheckDigits.classify(cpf_input) == (status, None)
+
+        def it_raises_length_exception_showing_the_original_bytes():
+            with pytest.raises(CpfCheckDigitsInputLengthException) as exc_info:
+                CpfCheckDigits(b"123")
+
+            assert str(exc_info.value) == (
+                "CPF input b'123' does not contain 9 to 11 digits. Got 3 in \"123\"."
+            )
+
+    def describe_complete_many():
+        def it_returns_the_full_cpf_for_each_base_in_order():
+            bases = [base for base, _ in TEST_CASES]
+
+            assert CpfCheckDigits.complete_many(bases) == [
+                full for _, full in TEST_CASES
+            ]
+
+        def it_accepts_any_iterable_of_supported_inputs():
+            cpf_inputs = iter(["054.496.519", ["054", "496", "519"]])
+
+            assert CpfCheckDigits.complete_many(cpf_inputs) == [
+                "05449651910",
+                "05449651910",
+            ]
+
+        def it_returns_an_empty_list_for_an_empty_iterable():
+            assert CpfCheckDigits.complete_many([]) == []
+
+        @pytest.mark.parametrize(
+            "cpf_input",
+            [*INVALID_LENGTH_INPUTS, *REPEATED_DIGIT_INPUTS],
+        )
+        def it_maps_ineligible_inputs_to_none(cpf_input):
+            assert CpfCheckDigits.complete_many(["054496519", cpf_input]) == [
+                "05449651910",
+                None,
+            ]
+
+        @pytest.mark.parametrize("cpf_input", INVALID_TYPE_INPUTS)
+        def it_raises_input_type_error_for_invalid_items(cpf_input):
+            with pytest.raises(CpfCheckDigitsInputTypeError):
+                CpfCheckDigits.complete_many(["054496519", cpf_input])
+
+        def it_completes_integer_cpfs_from_an_array_or_range():
+            cpf_numbers = array("q", [int(full) for _, full in TEST_CASES])
+
+            assert CpfCheckDigits.complete_many(cpf_numbers) == [
+                full for _, full in TEST_CASES
+            ]
+            assert CpfCheckDigits.complete_many(
+                range(11_111_111_000, 11_111_111_300, 100)
+            ) == [
+                CpfCheckDigits("111111110").cpf,
+                None,
+                CpfCheckDigits("111111112").cpf,
+            ]
+
+        def it_maps_out_of_range_integer_cpfs_to_none():
+            assert CpfCheckDigits.complete_many([-1, 100_000_000_000, 5449651900]) == [
+                None,
+                None,
+                "05449651910",
+            ]
+
+    def describe_classify():
+        @pytest.mark.parametrize(("base", "full"), TEST_CASES)
+        def it_returns_ok_and_both_check_digits_for_eligible_bases(base, full):
+            assert CpfCheckDigits.classify(base) == (CpfCheckDigitsStatus.OK, full[-2:])
+
+        def it_accepts_the_same_formats_as_the_constructor():
+            assert CpfCheckDigits.classify(["123", ".456", ".789-09"]) == (
+                CpfCheckDigitsStatus.OK,
+                "09",
+            )
+
+        @pytest.mark.parametrize("cpf_input", INVALID_LENGTH_INPUTS)
+        def it_returns_invalid_length_without_raising(cpf_input):
+            assert CpfCheckDigits.classify(cpf_input) == (
+                CpfCheckDigitsStatus.INVALID_LENGTH,
+                None,
+            )
+
+        @pytest.mark.parametrize("cpf_input", REPEATED_DIGIT_INPUTS)
+        def it_returns_repeated_digits_without_raising(cpf_input):
+            assert CpfCheckDigits.classify(cpf_input) == (
+                CpfCheckDigitsStatus.REPEATED_DIGITS,
+                None,
+            )
+
+        @pytest.mark.parametrize("cpf_input", INVALID_TYPE_INPUTS)
+        def it_raises_input_type_error_for_invalid_types(cpf_input):
+            with pytest.raises(CpfCheckDigitsInputTypeError):
+                CpfCheckDigits.classify(cpf_input)
+
+        @pytest.mark.parametrize("full", [full for _, full in TEST_CASES])
+        def it_classifies_integer_cpfs_arithmetically(full):
+            assert CpfCheckDigits.classify(int(full)) == (
+                CpfCheckDigitsStatus.OK,
+                full[-2:],
+            )
+
+        @pytest.mark.parametrize(
+            ("cpf_input", "status"),
+            [
+                (-1, CpfCheckDigitsStatus.INVALID_LENGTH),
+                (100_000_000_000, CpfCheckDigitsStatus.INVALID_LENGTH),
+                (0, CpfCheckDigitsStatus.REPEATED_DIGITS),
+                (77_777_777_712, CpfCheckDigitsStatus.REPEATED_DIGITS),
+            ],
+        )
+        def it_returns_the_status_of_ineligible_integer_cpfs(cpf_input, status):
+            assert CpfCheckDigits.classify(cpf_input) == (status, None)
+
+        @pytest.mark.parametrize("cpf_input", [-1, 100_000_000_000, 0, 77_777_777_712])
+        def it_agrees_with_the_exception_the_constructor_raises(cpf_input):
+            status, _ = CpfCheckDigits.classify(cpf_input)
+            expected_exception = (
+                CpfCheckDigitsInputLengthException
+                if status is CpfCheckDigitsStatus.INVALID_LENGTH
+                else CpfCheckDigitsInputInvalidException
+            )
+
+            with pytest.raises(expected_exception):
+                CpfCheckDigits(cpf_input)
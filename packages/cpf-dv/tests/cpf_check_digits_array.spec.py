@@ -0,0 +1,89 @@
+"""Spec for :meth:`cpf_dv.CpfCheckDigits.calculate_array`.
+
+The pure-Python API is the reference: every row of the matrix must yield the
+same check digits and eligibility as :meth:`CpfCheckDigits.classify` on the
+same characters. Skipped when the optional ``numpy`` extra is not installed.
+"""
+
+import random
+
+import pytest
+from cpf_dv import CpfCheckDigits, CpfCheckDigitsInputTypeError, CpfCheckDigitsStatus
+
+np = pytest.importorskip("numpy")
+
+
+def _to_matrix(bases: list[str]):
+    return np.frombuffer("".join(bases).encode(), np.uint8).reshape(len(bases), -1)
+
+
+def describe_calculate_array():
+    def describe_when_given_eligible_bases():
+        def it_matches_the_pure_python_check_digits():
+            rng = random.Random(0)
+            bases = [f"{rng.randrange(10**9):09d}" for _ in range(2_000)]
+            bases.extend(digit * 9 for digit in "0123456789")
+
+            check_digits, eligible = CpfCheckDigits.calculate_array(_to_matrix(bases))
+
+            for base, row_digits, row_eligible in zip(
+                bases, check_digits.tolist(), eligible.tolist(), strict=True
+            ):
+                status, expected_digits = CpfCheckDigits.classify(base)
+
+                assert row_eligible is (status is CpfCheckDigitsStatus.OK)
+
+                if row_eligible:
+                    assert row_digits == [int(digit) for digit in expected_digits]
+
+        def it_returns_uint8_digits_and_a_boolean_mask():
+            check_digits, eligible = CpfCheckDigits.calculate_array(
+                _to_matrix(["054496519", "123456789"])
+            )
+
+            assert check_digits.dtype == np.uint8
+            assert check_digits.tolist() == [[1, 0], [0, 9]]
+            assert eligible.dtype == np.bool_
+            assert eligible.tolist() == [True, True]
+
+        def it_ignores_the_check_digit_columns_of_full_cpfs():
+            check_digits, _ = CpfCheckDigits.calculate_array(
+                _to_matrix(["12345678910"])
+            )
+
+            assert check_digits.tolist() == [[0, 9]]
+
+        def it_returns_empty_results_for_an_empty_matrix():
+            check_digits, eligible = CpfCheckDigits.calculate_array(
+                np.empty((0, 9), np.uint8)
+            )
+
+            assert check_digits.shape == (0, 2)
+            assert eligible.shape == (0,)
+
+    def describe_when_given_ineligible_bases():
+        @pytest.mark.parametrize(
+            "base", ["777777777", "000000000", "123.45678", "12345678A"]
+        )
+        def it_masks_the_row_out(base):
+            _, eligible = CpfCheckDigits.calculate_array(
+                _to_matrix(["054496519", base])
+            )
+
+            assert eligible.tolist() == [True, False]
+
+    def describe_when_given_an_invalid_array():
+        @pytest.mark.parametrize(
+            "cpf_chars",
+            [
+                "054496519",
+                [[48, 53, 52, 52, 57, 54, 53, 49, 57]],
+                np.zeros((2, 9), np.int64),
+                np.zeros(9, np.uint8),
+                np.zeros((2, 8), np.uint8),
+                np.zeros((2, 12), np.uint8),
+            ],
+        )
+        def it_raises_input_type_error(cpf_chars):
+            with pytest.raises(CpfCheckDigitsInputTypeError):
+                CpfCheckDigits.calculate_array(cpf_chars)
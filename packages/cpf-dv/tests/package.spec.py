@@ -14,8 +14,12 @@ Python ``cpf_dv`` exposes length constants at module scope only, mirroring
 
 import cpf_dv
 from cpf_dv import (
+    CPF_CHECK_DIGIT_BY_REMAINDER,
+    CPF_FIRST_WEIGHTS,
     CPF_MAX_LENGTH,
     CPF_MIN_LENGTH,
+    CPF_SECOND_DIGIT_WEIGHT,
+    CPF_SECOND_WEIGHTS,
     CpfCheckDigits,
     CpfCheckDigitsException,
     CpfCheckDigitsInputInvalidException,
@@ -33,6 +37,14 @@ def describe_the_cpf_dv_package_api():
         def it_exposes_cpf_max_length():
             assert CPF_MAX_LENGTH == 11
 
+        def it_exposes_the_check_digit_weights():
+            assert CPF_FIRST_WEIGHTS == (10, 9, 8, 7, 6, 5, 4, 3, 2)
+            assert CPF_SECOND_WEIGHTS == (11, 10, 9, 8, 7, 6, 5, 4, 3)
+            assert CPF_SECOND_DIGIT_WEIGHT == 2
+
+        def it_exposes_the_check_digit_by_remainder_table():
+            assert CPF_CHECK_DIGIT_BY_REMAINDER == (0, 0, 9, 8, 7, 6, 5, 4, 3, 2, 1)
+
     def describe_when_inspecting_public_names():
         def it_exports_all_public_resources():
             expected_names = {
@@ -42,9 +54,14 @@ def describe_the_cpf_dv_package_api():
                 "CpfCheckDigitsException",
                 "CpfCheckDigitsInputInvalidException",
                 "CpfCheckDigitsInputLengthException",
+                "CpfCheckDigitsStatus",
                 "CpfInput",
                 "CPF_MIN_LENGTH",
                 "CPF_MAX_LENGTH",
+                "CPF_FIRST_WEIGHTS",
+                "CPF_SECOND_WEIGHTS",
+                "CPF_SECOND_DIGIT_WEIGHT",
+                "CPF_CHECK_DIGIT_BY_REMAINDER",
             }
 
             assert expected_names.issubset(set(dir(cpf_dv)))
@@ -0,0 +1,47 @@
+"""Benchmark ``CpfFormatter.format`` on bytes-like input against ``str``.
+
+Run from the package root with ``python benchmarks/bytes_input.py``. Prints
+the per-item cost of formatting raw CPFs given as ``str``, as ``bytes`` and
+as ``memoryview`` slices of a single buffer, as read from a binary file.
+"""
+
+import random
+import timeit
+
+from cpf_fmt import CpfFormatter
+
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+
+    return [f"{rng.randrange(10**11):011d}" for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    formatter = CpfFormatter()
+    str_cpfs = _sample_cpfs()
+    bytes_cpfs = [cpf.encode() for cpf in str_cpfs]
+    buffer = memoryview(b"".join(bytes_cpfs))
+    size = len(bytes_cpfs[0])
+    memoryview_cpfs = [buffer[i : i + size] for i in range(0, len(buffer), size)]
+
+    for label, cpf_inputs in (
+        ("str", str_cpfs),
+        ("bytes", bytes_cpfs),
+        ("memoryview", memoryview_cpfs),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda i=cpf_inputs: [formatter.format(cpf) for cpf in i],
+                number=1,
+                repeat=_REPEAT,
+            )
+        )
+        print(f"{label:>10}: {best / len(cpf_inputs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark ``CpfFormatter.format_array`` against ``format_many``.
+
+Run from the package root with ``python benchmarks/format_array.py``
+(requires the ``numpy`` extra). Prints the per-row cost of masking the same
+raw CPFs with ``format_many`` and as a single NumPy ``U11`` array.
+"""
+
+import random
+import timeit
+
+import numpy as np
+from cpf_fmt import CpfFormatter
+
+_SAMPLE_SIZE = 200_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+
+    return [f"{rng.randrange(10**11):011d}" for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    formatter = CpfFormatter(hidden=True)
+    cpfs = _sample_cpfs()
+    array = np.array(cpfs, dtype="U11")
+
+    for label, run in (
+        ("format_many", lambda: formatter.format_many(cpfs)),
+        ("format_array", lambda: formatter.format_array(array)),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=_REPEAT))
+        print(f"{label:>12}: {best / len(cpfs) * 1e9:8.1f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
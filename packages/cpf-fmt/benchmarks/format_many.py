@@ -0,0 +1,50 @@
+"""Benchmark ``CpfFormatter.format_many`` against per-item ``format`` calls.
+
+Run from the package root with ``python benchmarks/format_many.py``. Prints
+the per-item cost of formatting a report column in which one value in ten
+has an invalid length, with masking and per-call options, for each way of
+handling the invalid values.
+"""
+
+import random
+import timeit
+
+from cpf_fmt import CpfFormatter
+
+_DIGITS = "0123456789"
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+    cpfs = []
+
+    for index in range(_SAMPLE_SIZE):
+        size = 10 if index % 10 == 0 else 11
+        cpfs.append("".join(rng.choices(_DIGITS, k=size)))
+
+    return cpfs
+
+
+def main() -> None:
+    formatter = CpfFormatter()
+    cpfs = _sample_cpfs()
+
+    def per_item() -> list[str]:
+        return [formatter.format(cpf, hidden=True) for cpf in cpfs]
+
+    for label, run in (
+        ("format", per_item),
+        ("collect", lambda: formatter.format_many(cpfs, hidden=True)),
+        (
+            "callback",
+            lambda: formatter.format_many(cpfs, hidden=True, errors="callback"),
+        ),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=_REPEAT))
+        print(f"{label:>10}: {best / len(cpfs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark ``CpfFormatter.format_many_to_bytes`` against encoding and
+joining per-item ``format`` results.
+
+Run from the package root with ``python benchmarks/format_many_to_bytes.py``.
+Prints the per-item cost of turning a column of raw CPFs into
+newline-separated bytes, as a CSV or HTTP writer would, and of writing the
+same records into a preallocated ``bytearray``.
+"""
+
+import random
+import timeit
+
+from cpf_fmt import CpfFormatter
+
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+
+    return [f"{rng.randrange(10**11):011d}" for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    formatter = CpfFormatter()
+    cpfs = _sample_cpfs()
+    buffer = bytearray(15 * len(cpfs))
+
+    def encode_and_join() -> bytes:
+        return b"".join(formatter.format(cpf).encode() + b"\n" for cpf in cpfs)
+
+    for label, run in (
+        ("format", encode_and_join),
+        ("to_bytes", lambda: formatter.format_many_to_bytes(cpfs, separator=b"\n")),
+        (
+            "into buffer",
+            lambda: formatter.format_many_to_bytes(
+                cpfs, buffer=buffer, separator=b"\n"
+            ),
+        ),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=_REPEAT))
+        print(f"{label:>11}: {best / len(cpfs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
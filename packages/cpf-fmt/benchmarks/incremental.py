@@ -0,0 +1,58 @@
+"""Benchmark ``CpfIncrementalFormatter`` against re-formatting the whole
+field on every keystroke.
+
+Run from the package root with ``python benchmarks/incremental.py``. Types
+the same CPFs one character at a time, reading the masked value after each
+keystroke, and prints the per-keystroke cost of pushing into an incremental
+formatter and of calling ``CpfFormatter.format`` on the text typed so far
+(which goes through ``on_fail`` until the CPF is complete).
+"""
+
+import random
+import timeit
+
+from cpf_fmt import CpfFormatter, CpfIncrementalFormatter
+
+_SAMPLE_SIZE = 2_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+
+    return [f"{rng.randrange(10**11):011d}" for _ in range(_SAMPLE_SIZE)]
+
+
+def _type_incrementally(cpfs: list[str]) -> None:
+    formatter = CpfIncrementalFormatter()
+
+    for cpf in cpfs:
+        formatter.clear()
+
+        for char in cpf:
+            formatter.push(char)
+            formatter.value  # noqa: B018
+
+
+def _reformat_each_keystroke(cpfs: list[str]) -> None:
+    formatter = CpfFormatter(on_fail=lambda value, _error: value)
+
+    for cpf in cpfs:
+        for end in range(1, len(cpf) + 1):
+            formatter.format(cpf[:end])
+
+
+def main() -> None:
+    cpfs = _sample_cpfs()
+    keystrokes = sum(len(cpf) for cpf in cpfs)
+
+    for label, run in (
+        ("incremental", _type_incrementally),
+        ("reformat", _reformat_each_keystroke),
+    ):
+        best = min(timeit.repeat(lambda run=run: run(cpfs), number=1, repeat=_REPEAT))
+        print(f"{label:>11}: {best / keystrokes * 1e9:8.1f} ns/keystroke")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark ``CpfFormatter.format`` with ``template`` masks against the
+built-in mask.
+
+Run from the package root with ``python benchmarks/template.py``. Prints the
+per-call cost of formatting the same CPFs with the default options, with a
+template equal to the built-in mask and with custom templates. Templates
+compile into the same kind of plan as the delimiter keys, so all of them
+should cost about the same.
+"""
+
+import random
+import timeit
+
+from cpf_fmt import CpfFormatter
+
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+
+    return [f"{rng.randrange(10**11):011d}" for _ in range(_SAMPLE_SIZE)]
+
+
+def main() -> None:
+    cpfs = _sample_cpfs()
+
+    for label, formatter in (
+        ("built-in", CpfFormatter()),
+        ("same mask", CpfFormatter(template="###.###.###-##")),
+        ("no dots", CpfFormatter(template="#########-##")),
+        ("spaced", CpfFormatter(template="### ### ### ##")),
+        ("hidden", CpfFormatter(template="### ### ### ##", hidden=True)),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda formatter=formatter: [formatter.format(cpf) for cpf in cpfs],
+                number=1,
+                repeat=_REPEAT,
+            )
+        )
+        print(f"{label:>9}: {best / len(cpfs) * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 from .cpf_fmt import cpf_fmt
 from .cpf_formatter import CpfFormatter
 from .cpf_formatter_options import CPF_LENGTH, CpfFormatterOptions
+from .cpf_incremental_formatter import CpfIncrementalFormatter
 from .exceptions import (
     CpfFormatterException,
     CpfFormatterInputLengthException,
     CpfFormatterInputTypeError,
     CpfFormatterOptionsForbiddenKeyCharacterException,
     CpfFormatterOptionsHiddenRangeInvalidException,
+    CpfFormatterOptionsTemplateInvalidException,
     CpfFormatterOptionsTypeError,
     CpfFormatterTypeError,
 )
@@ -21,8 +23,10 @@ __all__ = [
     "CpfFormatterOptions",
     "CpfFormatterOptionsForbiddenKeyCharacterException",
     "CpfFormatterOptionsHiddenRangeInvalidException",
+    "CpfFormatterOptionsTemplateInvalidException",
     "CpfFormatterOptionsTypeError",
     "CpfFormatterTypeError",
+    "CpfIncrementalFormatter",
     "CpfInput",
     "cpf_fmt",
 ]
@@ -18,6 +18,7 @@ def cpf_fmt(
     hidden_end: int | None = None,
     dot_key: str | None = None,
     dash_key: str | None = None,
+    template: str | None = None,
     escape: bool | None = None,
     encode: bool | None = None,
     on_fail: OnFailCallback | None = None,
@@ -38,6 +39,8 @@ def cpf_fmt(
             ``hidden_start`` or ``hidden_end`` are out of valid range.
         CpfFormatterOptionsForbiddenKeyCharacterException: If any key
             option contains a disallowed character.
+        CpfFormatterOptionsTemplateInvalidException: If ``template``
+            does not have exactly 11 ``#`` slots.
 
     See Also:
         :class:`CpfFormatter` for detailed option descriptions.
@@ -50,6 +53,7 @@ def cpf_fmt(
         hidden_end=hidden_end,
         dot_key=dot_key,
         dash_key=dash_key,
+        template=template,
         escape=escape,
         encode=encode,
         on_fail=on_fail,
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import html
 import re
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
+from lacus.utils import LruCache
+
 from .cpf_formatter_options import CPF_LENGTH, CpfFormatterOptions
 from .exceptions import (
     CpfFormatterInputLengthException,
@@ -16,24 +19,59 @@ from .exceptions import (
 )
 
 if TYPE_CHECKING:
-    from .types import CpfFormatterOptionsInput, CpfInput, OnFailCallback
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    import numpy as np
 
-HIDDEN_KEY_PLACEHOLDER = CpfFormatterOptions.DISALLOWED_KEY_CHARACTERS[0]
-"""A rarely-used 1-length character that is replaced with ``hidden_key``
-when ``hidden`` is ``True``.
-"""
+    from .types import (
+        CpfFormatterOptionsInput,
+        CpfInput,
+        FormatManyErrors,
+        OnFailCallback,
+    )
 
-_NON_DIGIT_PATTERN = re.compile(r"\D")
+_NON_DIGIT_PATTERN = re.compile(r"[^0-9]")
+_NON_DIGIT_BYTES = bytes(code for code in range(256) if not 0x30 <= code <= 0x39)
+_BYTES_INPUT_TYPES = (bytes, bytearray, memoryview)
+_EXPECTED_INPUT_TYPE = "string, bytes or string[]"
+_EXPECTED_ARRAY_TYPE = "string or bytes array"
+_ARRAY_CHUNK_SIZE = 1 << 16
+_CACHEABLE_INPUT_TYPES = (str, bytes)
+_RESOLVED_OPTIONS_CACHE_SIZE = 32
+_FORMAT_PLAN_CACHE_SIZE = 64
+_FORMAT_MANY_ERRORS = ("collect", "callback", "raise")
 
 
 def _sanitize_cpf_input(value: str) -> str:
-    """Strip non-digit characters from the input."""
+    """Strip every character but the ASCII digits from the input."""
     if len(value) == CPF_LENGTH and value.isascii() and value.isdigit():
         return value
 
     return _NON_DIGIT_PATTERN.sub("", value)
 
 
+def _sanitize_cpf_bytes(value: bytes | bytearray | memoryview) -> str:
+    """Strip non-digit bytes with ``bytes.translate``, decoding only the
+    remaining ASCII digits.
+    """
+    return bytes(value).translate(None, _NON_DIGIT_BYTES).decode("ascii")
+
+
+def _import_numpy() -> ModuleType:
+    """Import NumPy for the array API, pointing to the optional extra when it
+    is not installed.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            'NumPy is required for array input. Install it with "pip install cpf-fmt[numpy]".'
+        ) from error
+
+    return numpy
+
+
 def _has_per_call_overrides(
     options: CpfFormatterOptionsInput,
     *,
@@ -43,6 +81,7 @@ def _has_per_call_overrides(
     hidden_end: int | None = None,
     dot_key: str | None = None,
     dash_key: str | None = None,
+    template: str | None = None,
     escape: bool | None = None,
     encode: bool | None = None,
     on_fail: OnFailCallback | None = None,
@@ -55,6 +94,7 @@ def _has_per_call_overrides(
         or hidden_end is not None
         or dot_key is not None
         or dash_key is not None
+        or template is not None
         or escape is not None
         or encode is not None
         or on_fail is not None
@@ -69,6 +109,7 @@ def _per_call_option_overrides(
     hidden_end: int | None = None,
     dot_key: str | None = None,
     dash_key: str | None = None,
+    template: str | None = None,
     escape: bool | None = None,
     encode: bool | None = None,
     on_fail: OnFailCallback | None = None,
@@ -87,6 +128,8 @@ def _per_call_option_overrides(
         overrides["dot_key"] = dot_key
     if dash_key is not None:
         overrides["dash_key"] = dash_key
+    if template is not None:
+        overrides["template"] = template
     if escape is not None:
         overrides["escape"] = escape
     if encode is not None:
@@ -97,6 +140,209 @@ def _per_call_option_overrides(
     return overrides
 
 
+def _items_key(mapping: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple((name, value.__class__, value) for name, value in mapping.items())
+
+
+def _override_key(
+    options: CpfFormatterOptionsInput, keyword_overrides: dict[str, Any]
+) -> tuple[Any, ...] | None:
+    """Return a hashable key identifying a set of per-call overrides, or
+    ``None`` when one of them cannot be hashed.
+
+    Values are keyed along with their class, so ``1`` does not share the
+    entry of ``True`` and still fails the type checks.
+    """
+    if options is None:
+        options_key = None
+    elif isinstance(options, CpfFormatterOptions):
+        options_key = _items_key(options.all)
+    elif isinstance(options, dict):
+        options_key = _items_key(options)
+    else:
+        return None
+
+    key = (options_key, _items_key(keyword_overrides))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _encode_literal(text: str, escape: bool, encode: bool) -> str:
+    """HTML-escape and URL-encode a delimiter or ``hidden_key``.
+
+    Formatted CPFs only get these transformations applied to their literal
+    parts, since both leave the sanitized ASCII digits unchanged and work
+    character by character.
+    """
+    if escape:
+        text = html.escape(text, quote=True)
+
+    if encode:
+        text = quote(text, safe="")
+
+    return text
+
+
+def _mask_literals(template: str | None, dot_key: str, dash_key: str) -> list[str]:
+    """Return the 12 literal runs of a mask: the text before the first CPF
+    digit, between each pair of digits, and after the last one.
+
+    They are the parts of ``template`` around its ``#`` slots or, without a
+    template, the delimiter keys placed as in ``XXX.XXX.XXX-XX``.
+    """
+    if template is not None:
+        return template.split(CpfFormatterOptions.TEMPLATE_SLOT)
+
+    literals = [""] * (CPF_LENGTH + 1)
+    literals[3] = literals[6] = dot_key
+    literals[9] = dash_key
+
+    return literals
+
+
+@lru_cache(maxsize=_FORMAT_PLAN_CACHE_SIZE)
+def _compile_format_plan(
+    hidden: bool,
+    hidden_key: str,
+    hidden_start: int,
+    hidden_end: int,
+    dot_key: str,
+    dash_key: str,
+    template: str | None,
+    escape: bool,
+    encode: bool,
+) -> str:
+    """Compile formatting options into a ``%``-template that formats a
+    sanitized CPF in one step: ``plan % tuple(sanitized_cpf)``.
+
+    Each character is a ``%s`` field, or a ``%.0s`` field (which consumes the
+    character without printing it) followed by ``hidden_key`` when it is
+    hidden, with the literal runs of the mask in between.
+    """
+    hidden_field = "%.0s" + _encode_literal(hidden_key, escape, encode).replace(
+        "%", "%%"
+    )
+    literals = [
+        _encode_literal(literal, escape, encode).replace("%", "%%")
+        for literal in _mask_literals(template, dot_key, dash_key)
+    ]
+    parts = [literals[0]]
+
+    for index in range(CPF_LENGTH):
+        parts.append(
+            hidden_field if hidden and hidden_start <= index <= hidden_end else "%s"
+        )
+        parts.append(literals[index + 1])
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=_FORMAT_PLAN_CACHE_SIZE)
+def _compile_column_layout(
+    hidden: bool,
+    hidden_key: str,
+    hidden_start: int,
+    hidden_end: int,
+    dot_key: str,
+    dash_key: str,
+    template: str | None,
+    escape: bool,
+    encode: bool,
+) -> tuple[int | str, ...]:
+    """Compile formatting options into the column layout of a formatted
+    CPF: for each output character, either the index of the sanitized digit
+    copied there or the literal character written there.
+
+    Every formatted CPF has the same layout, so :meth:`CpfFormatter.format_array`
+    fills whole columns at a time, and hidden digits are simply left out of
+    the copied ones.
+    """
+    hidden_columns = tuple(_encode_literal(hidden_key, escape, encode))
+    literals = [
+        _encode_literal(literal, escape, encode)
+        for literal in _mask_literals(template, dot_key, dash_key)
+    ]
+    columns: list[int | str] = list(literals[0])
+
+    for index in range(CPF_LENGTH):
+        if hidden and hidden_start <= index <= hidden_end:
+            columns.extend(hidden_columns)
+        else:
+            columns.append(index)
+
+        columns.extend(literals[index + 1])
+
+    return tuple(columns)
+
+
+def _format_plan_of(options: CpfFormatterOptions) -> str:
+    return _compile_format_plan(
+        options.hidden,
+        options.hidden_key,
+        options.hidden_start,
+        options.hidden_end,
+        options.dot_key,
+        options.dash_key,
+        options.template,
+        options.escape,
+        options.encode,
+    )
+
+
+def _column_layout_of(options: CpfFormatterOptions) -> tuple[int | str, ...]:
+    return _compile_column_layout(
+        options.hidden,
+        options.hidden_key,
+        options.hidden_start,
+        options.hidden_end,
+        options.dot_key,
+        options.dash_key,
+        options.template,
+        options.escape,
+        options.encode,
+    )
+
+
+def _format_char_codes(
+    np: ModuleType,
+    char_codes: np.ndarray,
+    layout: tuple[int | str, ...],
+    output: np.ndarray,
+) -> None:
+    """Format a matrix of character codes, one CPF per row, into the rows of
+    ``output`` (a zeroed matrix of output character codes).
+
+    Mirrors :meth:`CpfFormatter.format`: ASCII digits are kept, and rows
+    that keep exactly 11 of them get the digits scattered into their layout
+    columns and the literal characters broadcast into the others. Other rows
+    stay zeroed, which reads as an empty string.
+    """
+    keep = (char_codes >= ord("0")) & (char_codes <= ord("9"))
+    rows = np.flatnonzero(keep.sum(axis=1) == CPF_LENGTH)
+
+    if not len(rows):
+        return
+
+    sanitized = char_codes[rows][keep[rows]].reshape(len(rows), CPF_LENGTH)
+    source_columns = [
+        column for column, item in enumerate(layout) if item.__class__ is int
+    ]
+    literal_columns = [
+        column for column, item in enumerate(layout) if item.__class__ is str
+    ]
+    formatted = np.zeros((len(rows), output.shape[1]), output.dtype)
+    formatted[:, source_columns] = sanitized[
+        :, [layout[column] for column in source_columns]
+    ]
+    formatted[:, literal_columns] = [ord(layout[column]) for column in literal_columns]
+    output[rows] = formatted
+
+
 def _invoke_on_fail(
     on_fail: OnFailCallback,
     cpf_input: CpfInput,
@@ -110,6 +356,34 @@ def _invoke_on_fail(
     return result
 
 
+def _writable_view(
+    buffer: bytearray | memoryview, offset: int, size: int
+) -> memoryview:
+    """Return the ``size`` bytes of ``buffer`` starting at ``offset`` as a
+    writable byte view.
+
+    Raises:
+        TypeError: If ``buffer`` is not a writable buffer.
+        ValueError: If ``offset`` is negative or the buffer is too small.
+    """
+    view = memoryview(buffer)
+
+    if view.readonly:
+        raise TypeError("buffer must be writable")
+
+    view = view.cast("B")
+
+    if offset < 0:
+        raise ValueError(f"offset must not be negative, got {offset}")
+
+    if offset + size > len(view):
+        raise ValueError(
+            f"{size} bytes do not fit in a buffer of {len(view)} bytes at offset {offset}"
+        )
+
+    return view[offset : offset + size]
+
+
 class CpfFormatter:
     """Formatter for CPF identifiers.
 
@@ -120,7 +394,14 @@ class CpfFormatter:
     callback instead of throwing.
     """
 
-    __slots__ = ("_options",)
+    __slots__ = (
+        "_cache",
+        "_cache_version",
+        "_options",
+        "_plan",
+        "_plan_version",
+        "_resolved_options",
+    )
 
     def __init__(
         self,
@@ -132,9 +413,11 @@ class CpfFormatter:
         hidden_end: int | None = None,
         dot_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: OnFailCallback | None = None,
+        cache_size: int | None = None,
     ) -> None:
         """Create a new formatter with optional default options.
 
@@ -150,6 +433,11 @@ class CpfFormatter:
         per-call options. When a plain mapping or nothing is passed, a
         new :class:`CpfFormatterOptions` instance is created from it.
 
+        A positive ``cache_size`` enables an LRU cache of up to that many
+        formatted results, keyed by the raw ``str`` or ``bytes`` input and
+        the resolved options (see :attr:`cache`). Results of failed
+        formatting are not cached, so ``on_fail`` runs on every call.
+
         Raises:
             CpfFormatterOptionsTypeError: If any option has an invalid
                 type.
@@ -158,6 +446,8 @@ class CpfFormatter:
                 range.
             CpfFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
         """
         if isinstance(options, CpfFormatterOptions):
             self._options = options
@@ -170,11 +460,32 @@ class CpfFormatter:
                 hidden_end=hidden_end,
                 dot_key=dot_key,
                 dash_key=dash_key,
+                template=template,
                 escape=escape,
                 encode=encode,
                 on_fail=on_fail,
             )
 
+        self._cache: LruCache[tuple[Any, ...], str] | None = (
+            LruCache(cache_size) if cache_size else None
+        )
+        self._cache_version = self._options.version
+        self._resolved_options: (
+            LruCache[tuple[Any, ...], CpfFormatterOptions] | None
+        ) = None
+        self._plan = ""
+        self._plan_version = -1
+
+    @property
+    def cache(self) -> LruCache[tuple[Any, ...], str] | None:
+        """Return the result cache enabled by ``cache_size``, or ``None``.
+
+        Its ``hits``, ``misses`` and ``evictions`` counters show how well
+        it serves the traffic. Entries for the default options are dropped
+        as soon as :attr:`options` is mutated.
+        """
+        return self._cache
+
     @property
     def options(self) -> CpfFormatterOptions:
         """Return the default options used by this formatter.
@@ -197,20 +508,23 @@ class CpfFormatter:
         hidden_end: int | None = None,
         dot_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: OnFailCallback | None = None,
     ) -> str:
         """Format a CPF value into a human-readable string.
 
-        Input is normalized by stripping non-digit characters. If the
-        result length is not exactly 11, the configured ``on_fail``
+        Input is normalized by stripping non-digit characters (with
+        ``bytes.translate`` for bytes-like input). If the result length is not exactly 11, the configured ``on_fail``
         callback is invoked with the original value and an error; its
         return value is used as the result.
 
         When valid, the result may be further transformed according to
         options:
 
+        - If ``template`` is set, the digits fill its ``#`` slots instead
+          of the mask built from ``dot_key`` and ``dash_key``.
         - If ``hidden`` is ``True``, digits between ``hidden_start`` and
           ``hidden_end`` (inclusive) are replaced with ``hidden_key``.
         - If ``escape`` is ``True``, HTML special characters are
@@ -224,8 +538,8 @@ class CpfFormatter:
         keyword parameters are provided, ``options`` takes precedence.
 
         Raises:
-            CpfFormatterInputTypeError: If the input is not a ``str``
-                or sequence of ``str``.
+            CpfFormatterInputTypeError: If the input is not a ``str``,
+                bytes-like object or sequence of ``str``.
             CpfFormatterOptionsTypeError: If any option has an invalid
                 type.
             CpfFormatterOptionsHiddenRangeInvalidException: If
@@ -233,10 +547,116 @@ class CpfFormatter:
                 range.
             CpfFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
         """
-        actual_input = self._to_string_input(cpf_input)
+        cache = self._cache
+        cache_key = None
+
+        if cache is not None and cpf_input.__class__ in _CACHEABLE_INPUT_TYPES:
+            actual_options = self._resolve_options(
+                options,
+                hidden,
+                hidden_key,
+                hidden_start,
+                hidden_end,
+                dot_key,
+                dash_key,
+                template,
+                escape,
+                encode,
+                on_fail,
+            )
+            cache_key = self._cache_key(cpf_input, actual_options)
+            cached_cpf = cache.get(cache_key)
+
+            if cached_cpf is not None:
+                return cached_cpf
+
+        formatted_cpf = self._sanitize(cpf_input)
+
+        if cache_key is None:
+            actual_options = self._resolve_options(
+                options,
+                hidden,
+                hidden_key,
+                hidden_start,
+                hidden_end,
+                dot_key,
+                dash_key,
+                template,
+                escape,
+                encode,
+                on_fail,
+            )
+
+        if len(formatted_cpf) != CPF_LENGTH:
+            if actual_options.on_fail is CpfFormatterOptions.DEFAULT_ON_FAIL:
+                # The default callback returns "" whatever it is given, so
+                # skip building an exception just for it to be discarded.
+                return ""
+
+            exception = CpfFormatterInputLengthException(
+                cpf_input,
+                formatted_cpf,
+                CPF_LENGTH,
+            )
+
+            return _invoke_on_fail(actual_options.on_fail, cpf_input, exception)
+
+        formatted_cpf = self._format_plan(actual_options) % tuple(formatted_cpf)
+
+        if cache_key is not None:
+            cache.put(cache_key, formatted_cpf)  # type: ignore[union-attr]
+
+        return formatted_cpf
+
+    def format_into(
+        self,
+        buffer: bytearray | memoryview,
+        offset: int,
+        cpf_input: CpfInput,
+        options: CpfFormatterOptionsInput = None,
+        *,
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+        on_fail: OnFailCallback | None = None,
+    ) -> int:
+        """Format a CPF value straight into a writable buffer.
 
-        if _has_per_call_overrides(
+        Writes the UTF-8 encoding of what :meth:`format` returns under the
+        same options (plain ASCII unless a key option is not) into
+        ``buffer`` at ``offset`` and returns the number of bytes written,
+        so the next value goes at ``offset`` plus that number. With the
+        default ``on_fail``, an invalid-length input writes nothing and
+        returns ``0``.
+
+        Raises:
+            TypeError: If ``buffer`` is not a writable buffer.
+            ValueError: If ``offset`` is negative or the formatted value
+                does not fit in ``buffer`` at ``offset``; nothing is
+                written then.
+            CpfFormatterInputTypeError: If the input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+            CpfFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CpfFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CpfFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
+        """
+        data = self.format(
+            cpf_input,
             options,
             hidden=hidden,
             hidden_key=hidden_key,
@@ -244,74 +664,419 @@ class CpfFormatter:
             hidden_end=hidden_end,
             dot_key=dot_key,
             dash_key=dash_key,
+            template=template,
             escape=escape,
             encode=encode,
             on_fail=on_fail,
-        ):
-            actual_options = self._options.copy()
-            keyword_overrides = _per_call_option_overrides(
-                hidden=hidden,
-                hidden_key=hidden_key,
-                hidden_start=hidden_start,
-                hidden_end=hidden_end,
-                dot_key=dot_key,
-                dash_key=dash_key,
-                escape=escape,
-                encode=encode,
-                on_fail=on_fail,
-            )
+        ).encode("utf-8")
+        _writable_view(buffer, offset, len(data))[:] = data
 
-            if keyword_overrides:
-                actual_options.set(keyword_overrides)
+        return len(data)
 
-            if options is not None:
-                actual_options.set(options)
-        else:
-            actual_options = self._options
+    def format_many(
+        self,
+        cpf_inputs: Iterable[CpfInput],
+        options: CpfFormatterOptionsInput = None,
+        *,
+        errors: FormatManyErrors = "collect",
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+        on_fail: OnFailCallback | None = None,
+    ) -> tuple[list[str], list[int]]:
+        """Format many CPF values in a single call.
 
-        formatted_cpf = _sanitize_cpf_input(actual_input)
+        Returns the formatted values, in input order, and the indices of the
+        inputs whose sanitized length is not 11. Options are resolved and
+        compiled once for the whole batch, and valid inputs are formatted
+        exactly as :meth:`format` formats them. ``errors`` chooses what
+        happens to the invalid ones:
 
-        if len(formatted_cpf) != CPF_LENGTH:
-            exception = CpfFormatterInputLengthException(
-                cpf_input,
-                formatted_cpf,
-                CPF_LENGTH,
+        - ``"collect"`` (default): an empty string takes their place, and no
+          exception is built nor ``on_fail`` called.
+        - ``"callback"``: ``on_fail`` is called for each of them, as
+          :meth:`format` does, and its return value takes their place.
+        - ``"raise"``: the :class:`CpfFormatterInputLengthException` of the
+          first one is raised.
+
+        Raises:
+            ValueError: If ``errors`` is not one of the values above.
+            CpfFormatterInputTypeError: If any input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+            CpfFormatterInputLengthException: If ``errors`` is ``"raise"``
+                and any input has an invalid length.
+            CpfFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CpfFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CpfFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
+        """
+        if errors not in _FORMAT_MANY_ERRORS:
+            raise ValueError(
+                f'errors must be "collect", "callback" or "raise", got {errors!r}'
             )
 
-            return _invoke_on_fail(actual_options.on_fail, cpf_input, exception)
+        actual_options = self._resolve_options(
+            options,
+            hidden,
+            hidden_key,
+            hidden_start,
+            hidden_end,
+            dot_key,
+            dash_key,
+            template,
+            escape,
+            encode,
+            on_fail,
+        )
+        plan = self._format_plan(actual_options)
+        blank_failures = errors == "collect" or (
+            errors == "callback"
+            and actual_options.on_fail is CpfFormatterOptions.DEFAULT_ON_FAIL
+        )
+        formatted_cpfs: list[str] = []
+        failed_indices: list[int] = []
 
-        if actual_options.hidden:
-            starting_part = formatted_cpf[: actual_options.hidden_start]
-            ending_part = formatted_cpf[actual_options.hidden_end + 1 :]
-            hidden_part_length = (
-                actual_options.hidden_end - actual_options.hidden_start + 1
-            )
-            hidden_part = HIDDEN_KEY_PLACEHOLDER * hidden_part_length
-            formatted_cpf = starting_part + hidden_part + ending_part
-
-        formatted_cpf = (
-            formatted_cpf[:3]
-            + actual_options.dot_key
-            + formatted_cpf[3:6]
-            + actual_options.dot_key
-            + formatted_cpf[6:9]
-            + actual_options.dash_key
-            + formatted_cpf[9:11]
+        for index, cpf_input in enumerate(cpf_inputs):
+            sanitized_cpf = self._sanitize(cpf_input)
+
+            if len(sanitized_cpf) == CPF_LENGTH:
+                formatted_cpfs.append(plan % tuple(sanitized_cpf))
+                continue
+
+            if blank_failures:
+                formatted_cpfs.append("")
+            else:
+                exception = CpfFormatterInputLengthException(
+                    cpf_input,
+                    sanitized_cpf,
+                    CPF_LENGTH,
+                )
+
+                if errors == "raise":
+                    raise exception
+
+                formatted_cpfs.append(
+                    _invoke_on_fail(actual_options.on_fail, cpf_input, exception)
+                )
+
+            failed_indices.append(index)
+
+        return formatted_cpfs, failed_indices
+
+    def format_many_to_bytes(
+        self,
+        cpf_inputs: Iterable[CpfInput],
+        options: CpfFormatterOptionsInput = None,
+        *,
+        buffer: bytearray | memoryview | None = None,
+        offset: int = 0,
+        separator: bytes = b"",
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+    ) -> tuple[memoryview, list[int]]:
+        """Format many CPF values into fixed-width byte records.
+
+        Each input becomes one record: the UTF-8 encoding of what
+        :meth:`format` returns for it, followed by ``separator`` (e.g.
+        ``b"\\n"`` or ``b"\\r\\n"``). Only ASCII digits are kept by the
+        sanitizer, so every formatted CPF has the same width under the same
+        options and records have a fixed stride; the records of
+        invalid-length inputs are filled with spaces instead (``on_fail``
+        is not called).
+
+        The records are written into ``buffer`` at ``offset`` (or into new
+        ``bytes`` when no buffer is given) and returned as a ``memoryview``
+        over the written bytes, ready for ``file.write`` or
+        ``socket.sendall``, along with the indices of the invalid inputs.
+        Options are resolved and compiled once for the whole batch, and the
+        records are encoded in one pass instead of one ``encode()`` per
+        value.
+
+        Raises:
+            TypeError: If ``buffer`` is not a writable buffer.
+            ValueError: If ``separator`` is not ASCII, ``offset`` is
+                negative or the records do not fit in ``buffer`` at
+                ``offset``; nothing is written then.
+            CpfFormatterInputTypeError: If any input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+            CpfFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CpfFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CpfFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
+        """
+        if not separator.isascii():
+            raise ValueError(f"separator must be ASCII bytes, got {separator!r}")
+
+        actual_options = self._resolve_options(
+            options,
+            hidden,
+            hidden_key,
+            hidden_start,
+            hidden_end,
+            dot_key,
+            dash_key,
+            template,
+            escape,
+            encode,
+            None,
+        )
+        text_separator = separator.decode("ascii")
+        plan = self._format_plan(actual_options) + text_separator.replace("%", "%%")
+        record_width = len((plan % (("0",) * CPF_LENGTH)).encode("utf-8")) - len(
+            separator
         )
+        blank_record = " " * record_width + text_separator
+        records: list[str] = []
+        failed_indices: list[int] = []
 
-        if actual_options.hidden:
-            formatted_cpf = formatted_cpf.replace(
-                HIDDEN_KEY_PLACEHOLDER,
-                actual_options.hidden_key,
-            )
+        for index, cpf_input in enumerate(cpf_inputs):
+            sanitized_cpf = self._sanitize(cpf_input)
 
-        if actual_options.escape:
-            formatted_cpf = html.escape(formatted_cpf, quote=True)
+            if len(sanitized_cpf) == CPF_LENGTH:
+                records.append(plan % tuple(sanitized_cpf))
+            else:
+                records.append(blank_record)
+                failed_indices.append(index)
 
-        if actual_options.encode:
-            formatted_cpf = quote(formatted_cpf, safe="")
+        data = "".join(records).encode("utf-8")
 
-        return formatted_cpf
+        if buffer is None:
+            return memoryview(data), failed_indices
+
+        view = _writable_view(buffer, offset, len(data))
+        view[:] = data
+
+        return view, failed_indices
+
+    def format_array(
+        self,
+        cpf_array: np.ndarray,
+        options: CpfFormatterOptionsInput = None,
+        *,
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+    ) -> np.ndarray:
+        """Format a NumPy array of CPF values without per-row Python calls.
+
+        Accepts fixed-width unicode (e.g. ``U11``) or bytes (e.g. ``S11``)
+        arrays of any shape and returns a fixed-width unicode array of the
+        same shape, preallocated to the formatted length (14 characters with
+        the default options). Each element holds what :meth:`format` returns
+        for it under the same options, or an empty string when it does not
+        have exactly 11 ASCII digits: ``on_fail`` is not called, so the
+        failed rows are found with ``result == ""``.
+
+        The array is viewed as a matrix of character codes and sanitized
+        with vectorized operations, in chunks to bound memory use; the
+        digits and the delimiter (or ``hidden_key``) columns are then
+        written straight into the output matrix.
+
+        Requires the ``numpy`` extra (``pip install cpf-fmt[numpy]``).
+
+        Raises:
+            CpfFormatterInputTypeError: If the input is not a NumPy unicode
+                or bytes array.
+            CpfFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CpfFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CpfFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
+        """
+        np = _import_numpy()
+
+        if not (isinstance(cpf_array, np.ndarray) and cpf_array.dtype.kind in "US"):
+            raise CpfFormatterInputTypeError(cpf_array, _EXPECTED_ARRAY_TYPE)
+
+        actual_options = self._resolve_options(
+            options,
+            hidden,
+            hidden_key,
+            hidden_start,
+            hidden_end,
+            dot_key,
+            dash_key,
+            template,
+            escape,
+            encode,
+            None,
+        )
+        layout = _column_layout_of(actual_options)
+        width = max(len(layout), 1)
+        flat_array = np.ascontiguousarray(cpf_array).reshape(-1)
+        output = np.zeros((len(flat_array), width), np.uint32)
+
+        code_dtype = np.dtype(np.uint32 if flat_array.dtype.kind == "U" else np.uint8)
+        code_dtype = code_dtype.newbyteorder(flat_array.dtype.byteorder)
+        char_codes = flat_array.view(code_dtype).reshape(
+            len(flat_array), flat_array.dtype.itemsize // code_dtype.itemsize
+        )
+
+        for start in range(0, len(flat_array), _ARRAY_CHUNK_SIZE):
+            stop = start + _ARRAY_CHUNK_SIZE
+            _format_char_codes(np, char_codes[start:stop], layout, output[start:stop])
+
+        return output.view(f"U{width}").reshape(cpf_array.shape)
+
+    def _sanitize(self, cpf_input: CpfInput) -> str:
+        """Strip the input down to its digit characters.
+
+        Raises:
+            CpfFormatterInputTypeError: If the input is not a ``str``,
+                bytes-like object or sequence of ``str``.
+        """
+        if isinstance(cpf_input, _BYTES_INPUT_TYPES):
+            return _sanitize_cpf_bytes(cpf_input)
+
+        return _sanitize_cpf_input(self._to_string_input(cpf_input))
+
+    def _format_plan(self, options: CpfFormatterOptions) -> str:
+        """Return the compiled format plan of ``options``, recompiling the
+        one of the instance defaults only after they change.
+        """
+        if options is not self._options:
+            return _format_plan_of(options)
+
+        if self._plan_version != options.version:
+            self._plan = _format_plan_of(options)
+            self._plan_version = options.version
+
+        return self._plan
+
+    def _resolve_options(
+        self,
+        options: CpfFormatterOptionsInput,
+        hidden: bool | None,
+        hidden_key: str | None,
+        hidden_start: int | None,
+        hidden_end: int | None,
+        dot_key: str | None,
+        dash_key: str | None,
+        template: str | None,
+        escape: bool | None,
+        encode: bool | None,
+        on_fail: OnFailCallback | None,
+    ) -> CpfFormatterOptions:
+        """Return the instance defaults, or a copy of them with the per-call
+        overrides applied (keyword arguments first, then ``options``).
+
+        Resolved copies are memoized per defaults :attr:`~CpfFormatterOptions.version`
+        and overrides, so repeating the same overrides skips building and
+        validating a new options instance.
+        """
+        if not _has_per_call_overrides(
+            options,
+            hidden=hidden,
+            hidden_key=hidden_key,
+            hidden_start=hidden_start,
+            hidden_end=hidden_end,
+            dot_key=dot_key,
+            dash_key=dash_key,
+            template=template,
+            escape=escape,
+            encode=encode,
+            on_fail=on_fail,
+        ):
+            return self._options
+
+        keyword_overrides = _per_call_option_overrides(
+            hidden=hidden,
+            hidden_key=hidden_key,
+            hidden_start=hidden_start,
+            hidden_end=hidden_end,
+            dot_key=dot_key,
+            dash_key=dash_key,
+            template=template,
+            escape=escape,
+            encode=encode,
+            on_fail=on_fail,
+        )
+        override_key = _override_key(options, keyword_overrides)
+
+        if override_key is None:
+            return self._merge_options(options, keyword_overrides)
+
+        resolved_options = self._resolved_options
+
+        if resolved_options is None:
+            resolved_options = LruCache(_RESOLVED_OPTIONS_CACHE_SIZE)
+            self._resolved_options = resolved_options
+
+        resolved_key = (self._options.version, override_key)
+        actual_options = resolved_options.get(resolved_key)
+
+        if actual_options is None:
+            actual_options = self._merge_options(options, keyword_overrides)
+            resolved_options.put(resolved_key, actual_options)
+
+        return actual_options
+
+    def _merge_options(
+        self, options: CpfFormatterOptionsInput, keyword_overrides: dict[str, Any]
+    ) -> CpfFormatterOptions:
+        """Return a copy of the instance defaults with the per-call overrides
+        applied (keyword arguments first, then ``options``).
+        """
+        actual_options = self._options.copy()
+
+        if keyword_overrides:
+            actual_options.set(keyword_overrides)
+
+        if options is not None:
+            actual_options.set(options)
+
+        return actual_options
+
+    def _cache_key(
+        self, cpf_input: str | bytes, actual_options: CpfFormatterOptions
+    ) -> tuple[Any, ...]:
+        """Return the cache key of an input under the resolved options.
+
+        Calls with the instance defaults share one options slot, and the
+        whole cache is dropped when those defaults have changed since the
+        last call; per-call options are keyed by their values.
+        """
+        if actual_options is not self._options:
+            return (cpf_input, *actual_options.all.values())
+
+        if self._cache_version != actual_options.version:
+            self._cache.clear()  # type: ignore[union-attr]
+            self._cache_version = actual_options.version
+
+        return (cpf_input,)
 
     @staticmethod
     def _to_string_input(cpf_input: Any) -> str:
@@ -327,11 +1092,11 @@ class CpfFormatter:
         if isinstance(cpf_input, Sequence) and not isinstance(cpf_input, (str, bytes)):
             for item in cpf_input:
                 if not isinstance(item, str):
-                    raise CpfFormatterInputTypeError(cpf_input, "string or string[]")
+                    raise CpfFormatterInputTypeError(cpf_input, _EXPECTED_INPUT_TYPE)
 
             return "".join(cpf_input)
 
-        raise CpfFormatterInputTypeError(cpf_input, "string or string[]")
+        raise CpfFormatterInputTypeError(cpf_input, _EXPECTED_INPUT_TYPE)
 
 
 __all__ = ["CpfFormatter"]
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from .exceptions import (
     CpfFormatterOptionsForbiddenKeyCharacterException,
     CpfFormatterOptionsHiddenRangeInvalidException,
+    CpfFormatterOptionsTemplateInvalidException,
     CpfFormatterOptionsTypeError,
 )
 
@@ -104,6 +105,18 @@ class CpfFormatterOptions:
     the end (``XXXX-XX``).
     """
 
+    DEFAULT_TEMPLATE = None
+    """Default value for the ``template`` option.
+
+    When ``None``, the mask is built from ``dot_key`` and ``dash_key``
+    (``XXX.XXX.XXX-XX``).
+    """
+
+    TEMPLATE_SLOT = "#"
+    """Character marking, in the ``template`` option, where each of the 11
+    CPF digits goes.
+    """
+
     DEFAULT_ESCAPE = False
     """Default value for the ``escape`` option.
 
@@ -124,7 +137,7 @@ class CpfFormatterOptions:
 
     DISALLOWED_KEY_CHARACTERS = ("\u00e5", "\u00eb", "\u00ef", "\u00f6")
     """Characters not allowed in key options (``hidden_key``, ``dot_key``,
-    ``dash_key``).
+    ``dash_key``) nor in ``template``.
 
     They are reserved for internal formatting logic. For now, the first
     character is only used to replace the hidden key placeholder in
@@ -142,6 +155,7 @@ class CpfFormatterOptions:
         hidden_end: int | None = None,
         dot_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: OnFailCallback | None = None,
@@ -169,13 +183,18 @@ class CpfFormatterOptions:
                 range.
             CpfFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
         """
         self._options: CpfFormatterOptionsType = {}  # type: ignore[typeddict-item]
+        # Bumped by every setter; see the ``version`` property.
+        self._version = 0
 
         self.hidden = hidden
         self.hidden_key = hidden_key
         self.dot_key = dot_key
         self.dash_key = dash_key
+        self.template = template
         self.escape = escape
         self.encode = encode
         self.on_fail = on_fail
@@ -200,6 +219,16 @@ class CpfFormatterOptions:
         """
         return {**self._options}
 
+    @property
+    def version(self) -> int:
+        """Return a counter that grows every time an option is set.
+
+        Two reads that return the same number saw the same options, which
+        lets caches built on top of this instance tell when to drop their
+        entries.
+        """
+        return self._version
+
     @property
     def hidden(self) -> bool:
         """Return whether hidden digit replacement is enabled.
@@ -221,6 +250,7 @@ class CpfFormatterOptions:
         """
         actual_hidden = self.DEFAULT_HIDDEN if value is None else bool(value)
         self._options["hidden"] = actual_hidden
+        self._version += 1
 
     @property
     def hidden_key(self) -> str:
@@ -253,6 +283,7 @@ class CpfFormatterOptions:
 
         self._assert_no_disallowed_key_characters("hidden_key", actual_hidden_key)
         self._options["hidden_key"] = actual_hidden_key
+        self._version += 1
 
     @property
     def hidden_start(self) -> int:
@@ -337,6 +368,7 @@ class CpfFormatterOptions:
 
         self._assert_no_disallowed_key_characters("dot_key", actual_dot_key)
         self._options["dot_key"] = actual_dot_key
+        self._version += 1
 
     @property
     def dash_key(self) -> str:
@@ -367,6 +399,50 @@ class CpfFormatterOptions:
 
         self._assert_no_disallowed_key_characters("dash_key", actual_dash_key)
         self._options["dash_key"] = actual_dash_key
+        self._version += 1
+
+    @property
+    def template(self) -> str | None:
+        """Return the mask the CPF is formatted into, or ``None``.
+
+        Each ``#`` slot of the template takes one of the 11 CPF digits, in
+        order, and the text around the slots is kept as is (e.g.
+        ``"###.###.###-##"``). When ``None``, the mask is built from
+        ``dot_key`` and ``dash_key``, which a template overrides.
+        """
+        return self._options["template"]
+
+    @template.setter
+    def template(self, value: str | None) -> None:
+        """Set the mask the CPF is formatted into.
+
+        Each ``#`` slot of the template takes one of the 11 CPF digits, in
+        order, and the text around the slots is kept as is (e.g.
+        ``"#########-##"`` or ``"### ### ### ##"``). The hidden range still
+        refers to CPF digits, so hidden slots are replaced with
+        ``hidden_key``. ``None`` restores the mask built from the delimiter
+        keys.
+
+        Raises:
+            CpfFormatterOptionsTypeError: If the value is not a ``str``.
+            CpfFormatterOptionsForbiddenKeyCharacterException: If the
+                value contains any disallowed key character.
+            CpfFormatterOptionsTemplateInvalidException: If the value does
+                not have exactly 11 ``#`` slots.
+        """
+        if value is not None:
+            if not isinstance(value, str):
+                raise CpfFormatterOptionsTypeError("template", value, "string")
+
+            self._assert_no_disallowed_key_characters("template", value)
+
+            if value.count(self.TEMPLATE_SLOT) != CPF_LENGTH:
+                raise CpfFormatterOptionsTemplateInvalidException(
+                    value, self.TEMPLATE_SLOT, CPF_LENGTH
+                )
+
+        self._options["template"] = value
+        self._version += 1
 
     @property
     def escape(self) -> bool:
@@ -392,6 +468,7 @@ class CpfFormatterOptions:
         """
         actual_escape = self.DEFAULT_ESCAPE if value is None else bool(value)
         self._options["escape"] = actual_escape
+        self._version += 1
 
     @property
     def encode(self) -> bool:
@@ -413,6 +490,7 @@ class CpfFormatterOptions:
         """
         actual_encode = self.DEFAULT_ENCODE if value is None else bool(value)
         self._options["encode"] = actual_encode
+        self._version += 1
 
     @property
     def on_fail(self) -> OnFailCallback:
@@ -444,6 +522,7 @@ class CpfFormatterOptions:
             raise CpfFormatterOptionsTypeError("on_fail", value, "function")
 
         self._options["on_fail"] = actual_on_fail
+        self._version += 1
 
     def set_hidden_range(
         self,
@@ -508,6 +587,7 @@ class CpfFormatterOptions:
 
         self._options["hidden_start"] = actual_hidden_start
         self._options["hidden_end"] = actual_hidden_end
+        self._version += 1
 
         return self
 
@@ -516,6 +596,7 @@ class CpfFormatterOptions:
         duplicate = object.__new__(type(self))
 
         object.__setattr__(duplicate, "_options", self._options.copy())
+        object.__setattr__(duplicate, "_version", 0)
 
         return duplicate
 
@@ -535,6 +616,8 @@ class CpfFormatterOptions:
                 range.
             CpfFormatterOptionsForbiddenKeyCharacterException: If any
                 key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
         """
         if options is None:
             return self
@@ -558,6 +641,7 @@ class CpfFormatterOptions:
         self.hidden_key = coalesce("hidden_key", self.hidden_key)
         self.dot_key = coalesce("dot_key", self.dot_key)
         self.dash_key = coalesce("dash_key", self.dash_key)
+        self.template = coalesce("template", self.template)
         self.escape = coalesce("escape", self.escape)
         self.encode = coalesce("encode", self.encode)
         self.on_fail = coalesce("on_fail", self.on_fail)
@@ -0,0 +1,277 @@
+"""As-you-type formatter for CPF (Cadastro de Pessoas Físicas)
+identifiers."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .cpf_formatter import _encode_literal, _mask_literals
+from .cpf_formatter_options import CPF_LENGTH, CpfFormatterOptions
+from .exceptions import CpfFormatterInputTypeError
+
+if TYPE_CHECKING:
+    from .types import CpfFormatterOptionsInput
+
+_TYPING_STEPS_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=_TYPING_STEPS_CACHE_SIZE)
+def _compile_typing_steps(
+    hidden: bool,
+    hidden_key: str,
+    hidden_start: int,
+    hidden_end: int,
+    dot_key: str,
+    dash_key: str,
+    template: str | None,
+    escape: bool,
+    encode: bool,
+) -> tuple[tuple[str, ...], tuple[str | None, ...]]:
+    """Compile formatting options into the steps of typing a CPF: the 12
+    encoded literal runs of the mask and, for each of the 11 digits, the
+    encoded ``hidden_key`` written in its place or ``None`` when the digit
+    itself is written.
+    """
+    literals = tuple(
+        _encode_literal(literal, escape, encode)
+        for literal in _mask_literals(template, dot_key, dash_key)
+    )
+    hidden_text = _encode_literal(hidden_key, escape, encode)
+    masks = tuple(
+        hidden_text if hidden and hidden_start <= index <= hidden_end else None
+        for index in range(CPF_LENGTH)
+    )
+
+    return literals, masks
+
+
+class CpfIncrementalFormatter:
+    """As-you-type formatter for CPF identifiers.
+
+    Keeps the partial mask of a CPF being typed one keystroke at a time:
+    :meth:`push` appends digits and :meth:`pop` removes the last one, each
+    in constant time, and :attr:`value` is the masked text so far. Each
+    literal run of the mask is written together with the digit that
+    follows it, so ``"0544"`` reads ``"054.4"`` and the text never ends
+    with a dangling delimiter. Once all 11 digits are typed,
+    :attr:`value` equals what :meth:`CpfFormatter.format
+    <cpf_fmt.CpfFormatter.format>` returns for them under the same
+    options.
+    """
+
+    __slots__ = (
+        "_chars",
+        "_ends",
+        "_literals",
+        "_masks",
+        "_options",
+        "_steps_version",
+        "_value",
+    )
+
+    def __init__(
+        self,
+        options: CpfFormatterOptionsInput = None,
+        *,
+        hidden: bool | None = None,
+        hidden_key: str | None = None,
+        hidden_start: int | None = None,
+        hidden_end: int | None = None,
+        dot_key: str | None = None,
+        dash_key: str | None = None,
+        template: str | None = None,
+        escape: bool | None = None,
+        encode: bool | None = None,
+    ) -> None:
+        """Create a new, empty incremental formatter.
+
+        Options are handled as by :class:`CpfFormatter
+        <cpf_fmt.CpfFormatter>`: a :class:`CpfFormatterOptions` instance
+        is used directly, so mutating it later re-masks the digits typed
+        so far; a plain mapping or keyword arguments build a new instance.
+        ``on_fail`` is never called, since a partial CPF is not a failure.
+
+        Raises:
+            CpfFormatterOptionsTypeError: If any option has an invalid
+                type.
+            CpfFormatterOptionsHiddenRangeInvalidException: If
+                ``hidden_start`` or ``hidden_end`` are out of valid
+                range.
+            CpfFormatterOptionsForbiddenKeyCharacterException: If any
+                key option contains a disallowed character.
+            CpfFormatterOptionsTemplateInvalidException: If ``template``
+                does not have exactly 11 ``#`` slots.
+        """
+        if isinstance(options, CpfFormatterOptions):
+            self._options = options
+        else:
+            self._options = CpfFormatterOptions(
+                options,
+                hidden=hidden,
+                hidden_key=hidden_key,
+                hidden_start=hidden_start,
+                hidden_end=hidden_end,
+                dot_key=dot_key,
+                dash_key=dash_key,
+                template=template,
+                escape=escape,
+                encode=encode,
+            )
+
+        self._chars: list[str] = []
+        self._ends: list[int] = []
+        self._value = ""
+        self._steps_version = -1
+        self._literals: tuple[str, ...] = ()
+        self._masks: tuple[str | None, ...] = ()
+
+    @property
+    def options(self) -> CpfFormatterOptions:
+        """Return the options used by this formatter.
+
+        The returned object is the same instance used internally; mutating
+        it re-masks the digits typed so far on the next access.
+        """
+        return self._options
+
+    @property
+    def value(self) -> str:
+        """Return the masked text typed so far."""
+        self._sync()
+
+        return self._value
+
+    @property
+    def raw(self) -> str:
+        """Return the digits typed so far, without the mask."""
+        return "".join(self._chars)
+
+    @property
+    def is_complete(self) -> bool:
+        """Return whether all 11 CPF digits were typed."""
+        return len(self._chars) == CPF_LENGTH
+
+    def push(self, chars: str) -> int:
+        """Type ``chars`` at the end of the CPF and return how many of them
+        were taken.
+
+        A keystroke usually carries one character, but pasted text works
+        too. Digits are taken until the CPF is complete; anything else,
+        such as typed delimiters, is skipped.
+
+        Raises:
+            CpfFormatterInputTypeError: If ``chars`` is not a string.
+        """
+        if not isinstance(chars, str):
+            raise CpfFormatterInputTypeError(chars, "string")
+
+        self._sync()
+        taken = 0
+
+        for char in chars:
+            index = len(self._chars)
+
+            if index == CPF_LENGTH:
+                break
+
+            if not "0" <= char <= "9":
+                continue
+
+            mask = self._masks[index]
+            piece = self._literals[index] + (char if mask is None else mask)
+
+            if index == CPF_LENGTH - 1:
+                piece += self._literals[CPF_LENGTH]
+
+            self._chars.append(char)
+            self._value += piece
+            self._ends.append(len(self._value))
+            taken += 1
+
+        return taken
+
+    def pop(self) -> str:
+        """Remove the last typed digit, together with the literal run
+        written before it, and return it (``""`` when nothing was typed).
+        """
+        if not self._chars:
+            return ""
+
+        self._sync()
+        self._ends.pop()
+        self._value = self._value[: self._ends[-1] if self._ends else 0]
+
+        return self._chars.pop()
+
+    def clear(self) -> None:
+        """Remove every typed digit."""
+        self._chars.clear()
+        self._ends.clear()
+        self._value = ""
+
+    def masked_position(self, raw_position: int) -> int:
+        """Return the position in :attr:`value` of the cursor placed after
+        the first ``raw_position`` typed digits.
+
+        Raises:
+            ValueError: If ``raw_position`` is negative or greater than the
+                number of typed digits.
+        """
+        if not 0 <= raw_position <= len(self._chars):
+            raise ValueError(
+                f"raw_position must be between 0 and {len(self._chars)}, got {raw_position}"
+            )
+
+        self._sync()
+
+        return self._ends[raw_position - 1] if raw_position else 0
+
+    def raw_position(self, masked_position: int) -> int:
+        """Return how many typed digits lie before the cursor at
+        ``masked_position`` in :attr:`value`.
+
+        Raises:
+            ValueError: If ``masked_position`` is negative or greater than
+                the length of :attr:`value`.
+        """
+        self._sync()
+
+        if not 0 <= masked_position <= len(self._value):
+            raise ValueError(
+                f"masked_position must be between 0 and {len(self._value)}, got {masked_position}"
+            )
+
+        return bisect_right(self._ends, masked_position)
+
+    def __len__(self) -> int:
+        return len(self._chars)
+
+    def _sync(self) -> None:
+        """Recompile the typing steps when the options changed, re-masking
+        the digits typed so far.
+        """
+        options = self._options
+
+        if options.version == self._steps_version:
+            return
+
+        self._literals, self._masks = _compile_typing_steps(
+            options.hidden,
+            options.hidden_key,
+            options.hidden_start,
+            options.hidden_end,
+            options.dot_key,
+            options.dash_key,
+            options.template,
+            options.escape,
+            options.encode,
+        )
+        self._steps_version = options.version
+        chars = self.raw
+        self.clear()
+        self.push(chars)
+
+
+__all__ = ["CpfIncrementalFormatter"]
@@ -1,17 +1,18 @@
 """Type aliases for the ``cpf_fmt`` package."""
 
 from collections.abc import Callable, Mapping, Sequence
-from typing import Any, TypeAlias, TypedDict
+from typing import Any, Literal, TypeAlias, TypedDict
 
 from .cpf_formatter_options import CpfFormatterOptions
 from .exceptions import CpfFormatterException
 
-CpfInput = str | Sequence[str]
+CpfInput = str | bytes | bytearray | memoryview | Sequence[str]
 """Represents valid input types for CPF formatting.
 
 A CPF can be provided as:
 
 - A string containing digits (with or without formatting)
+- A ``bytes``, ``bytearray`` or ``memoryview`` with the same ASCII content
 - A sequence of strings, where each string represents a digit or group of
   digits.
 """
@@ -25,6 +26,20 @@ callback receives the original input value and the exception object, and
 should return a string to use as the fallback output.
 """
 
+FormatManyErrors = Literal["collect", "callback", "raise"]
+"""How :meth:`CpfFormatter.format_many` handles inputs of invalid length.
+
+- ``"collect"``: leave an empty string in their place, without building an
+  exception or calling ``on_fail``.
+- ``"callback"``: call ``on_fail`` with the input and a
+  :class:`CpfFormatterInputLengthException`, as :meth:`CpfFormatter.format`
+  does, and use its return value.
+- ``"raise"``: raise the :class:`CpfFormatterInputLengthException` of the
+  first one.
+
+Their indices are reported in every mode but ``"raise"``.
+"""
+
 CpfFormatterOptionsInput: TypeAlias = CpfFormatterOptions | Mapping[str, Any] | None
 
 
@@ -45,6 +60,8 @@ class CpfFormatterOptionsType(TypedDict):
         hidden_end: Inclusive end index (0-10) for hiding digits.
         dot_key: Dot delimiter between the first digit groups.
         dash_key: Dash delimiter before the final check digits.
+        template: Mask with one ``#`` slot per CPF digit, overriding the
+            delimiter keys; ``None`` keeps the delimiter-based mask.
         escape: When ``True``, HTML special characters are escaped.
         encode: When ``True``, the formatted string is URL-encoded.
         on_fail: Callback invoked when normalized input length is not 11;
@@ -57,6 +74,7 @@ class CpfFormatterOptionsType(TypedDict):
     hidden_end: int
     dot_key: str
     dash_key: str
+    template: str | None
     escape: bool
     encode: bool
     on_fail: OnFailCallback
@@ -66,5 +84,6 @@ __all__ = [
     "CpfFormatterOptionsInput",
     "CpfFormatterOptionsType",
     "CpfInput",
+    "FormatManyErrors",
     "OnFailCallback",
 ]
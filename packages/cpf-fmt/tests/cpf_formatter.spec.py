@@ -22,6 +22,7 @@ from cpf_fmt import (
     CpfFormatterOptionsHiddenRangeInvalidException,
     CpfFormatterOptionsTypeError,
 )
+from cpf_fmt import cpf_formatter as cpf_formatter_module
 
 INVALID_LENGTH_CASES = [
     ("1", 1),
@@ -161,6 +162,9 @@ def describe_cpf_formatter():
             def it_strips_mixed_non_digit_separators():
                 assert _format("809765110 dv 61") == "809.765.110-61"
 
+            def it_strips_non_ascii_digits():
+                assert _format("\u0661809765\uff1811061") == "809.765.110-61"
+
         def describe_when_input_is_a_sequence_of_strings():
             def it_handles_sequence_of_only_digits():
                 result = _format(
@@ -193,6 +197,32 @@ def describe_cpf_formatter():
                     == "123.456.789-10"
                 )
 
+        def describe_when_input_is_bytes_like():
+            @pytest.mark.parametrize("bytes_type", [bytes, bytearray, memoryview])
+            def it_formats_the_same_as_a_string(bytes_type):
+                assert _format(bytes_type(b"12345678909")) == "123.456.789-09"
+
+            def it_strips_punctuation_bytes():
+                assert _format(b"123.456.789-09") == "123.456.789-09"
+
+            def it_accepts_memoryview_slices():
+                buffer = memoryview(b"05449651910;12345678909")
+
+                assert _format(buffer[12:]) == "123.456.789-09"
+
+            def it_fails_with_the_original_bytes_when_length_is_not_11():
+                def on_fail(value, error):
+                    assert value == b"1.2.3"
+                    assert isinstance(error, CpfFormatterInputLengthException)
+                    assert error.evaluated_input == "123"
+                    assert str(error) == (
+                        "CPF input b'1.2.3' does not contain 11 digits. Got 3 in \"123\"."
+                    )
+
+                    return "ERROR"
+
+                assert _format(b"1.2.3", on_fail=on_fail) == "ERROR"
+
         def describe_when_input_is_not_string_or_sequence_of_strings():
             @pytest.mark.parametrize(("input_value", "actual_type"), INVALID_TYPE_CASES)
             def it_raises_cpf_formatter_input_type_error(input_value, actual_type):
@@ -201,7 +231,7 @@ def describe_cpf_formatter():
 
                 error = exc_info.value
 
-                assert error.expected_type == "string or string[]"
+                assert error.expected_type == "string, bytes or string[]"
                 assert error.actual_input is input_value
                 assert error.actual_type == actual_type
 
@@ -213,7 +243,7 @@ def describe_cpf_formatter():
 
                 error = exc_info.value
 
-                assert error.expected_type == "string or string[]"
+                assert error.expected_type == "string, bytes or string[]"
                 assert error.actual_input == input_value
 
         def describe_when_sanitized_input_length_is_not_11():
@@ -484,3 +514,399 @@ def describe_cpf_formatter():
                 )
 
                 assert result == "123[.][*][*][*][.][*][*]9[-]10"
+
+    def describe_cache():
+        def it_is_disabled_by_default():
+            assert CpfFormatter().cache is None
+
+        def it_caches_formatted_results_by_raw_input():
+            formatter = CpfFormatter(cache_size=8)
+
+            assert formatter.format("05449651910") == "054.496.519-10"
+            assert formatter.format("05449651910") == "054.496.519-10"
+            assert formatter.format(b"05449651910") == "054.496.519-10"
+
+            cache = formatter.cache
+            assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+        def it_keys_per_call_options_separately():
+            formatter = CpfFormatter(cache_size=8)
+
+            assert formatter.format("05449651910", hidden=True) == "054.***.***-**"
+            assert formatter.format("05449651910", {"hidden": True}) == "054.***.***-**"
+            assert formatter.format("05449651910") == "054.496.519-10"
+            assert (formatter.cache.hits, formatter.cache.misses) == (1, 2)
+
+        def it_drops_the_cache_when_the_default_options_change():
+            formatter = CpfFormatter(cache_size=8)
+
+            assert formatter.format("05449651910") == "054.496.519-10"
+
+            formatter.options.dash_key = "_"
+
+            assert formatter.format("05449651910") == "054.496.519_10"
+            assert len(formatter.cache) == 1
+
+        def it_does_not_cache_failures():
+            calls = []
+            formatter = CpfFormatter(
+                cache_size=8, on_fail=lambda value, _: calls.append(value) or "fail"
+            )
+
+            assert formatter.format("123") == "fail"
+            assert formatter.format("123") == "fail"
+            assert calls == ["123", "123"]
+            assert len(formatter.cache) == 0
+
+        def it_evicts_the_least_recently_used_input():
+            formatter = CpfFormatter(cache_size=1)
+
+            formatter.format("05449651910")
+            formatter.format("82911017366")
+
+            assert len(formatter.cache) == 1
+            assert formatter.cache.evictions == 1
+
+    def describe_per_call_options_resolution():
+        def it_reuses_the_options_resolved_for_repeated_overrides(monkeypatch):
+            copies = []
+            original_copy = CpfFormatterOptions.copy
+
+            def counting_copy(options):
+                copies.append(options)
+
+                return original_copy(options)
+
+            monkeypatch.setattr(CpfFormatterOptions, "copy", counting_copy)
+            formatter = CpfFormatter()
+
+            for _ in range(3):
+                assert formatter.format("05449651910", hidden=True) == "054.***.***-**"
+                assert (
+                    formatter.format("05449651910", {"dash_key": "_"})
+                    == "054.496.519_10"
+                )
+
+            assert len(copies) == 2
+
+        def it_resolves_again_after_the_default_options_change():
+            formatter = CpfFormatter()
+
+            assert formatter.format("05449651910", hidden=True) == "054.***.***-**"
+
+            formatter.options.hidden_key = "#"
+
+            assert formatter.format("05449651910", hidden=True) == "054.###.###-##"
+
+        def it_still_raises_for_invalid_overrides_after_valid_ones():
+            formatter = CpfFormatter()
+
+            assert (
+                formatter.format("05449651910", hidden=True, hidden_start=2)
+                == "05*.***.***-**"
+            )
+
+            with pytest.raises(CpfFormatterOptionsTypeError):
+                formatter.format("05449651910", hidden=True, hidden_start=2.0)
+
+            with pytest.raises(CpfFormatterOptionsTypeError):
+                formatter.format("05449651910", {"hidden": True, "hidden_start": 2.0})
+
+    def describe_format_plan():
+        def it_keeps_percent_signs_in_keys_literal():
+            formatter = CpfFormatter(hidden=True, hidden_key="%s", dash_key="%")
+
+            assert formatter.format("05449651910") == "054.%s%s%s.%s%s%s%%s%s"
+
+        def it_escapes_and_encodes_only_the_keys():
+            formatter = CpfFormatter(
+                dot_key="&", dash_key=" ", escape=True, encode=True
+            )
+
+            assert formatter.format("05449651910") == "054%26amp%3B496%26amp%3B519%2010"
+
+        def it_strips_non_ascii_digits_so_encoded_output_stays_url_safe():
+            formatter = CpfFormatter(encode=True)
+
+            assert formatter.format("\u06612345678901") == ""
+            assert formatter.format("\u066105449651910") == "054.496.519-10"
+
+        def it_recompiles_after_the_default_options_change():
+            formatter = CpfFormatter()
+
+            assert formatter.format("05449651910") == "054.496.519-10"
+
+            formatter.options.set_hidden_range(0, 1)
+            formatter.options.hidden = True
+
+            assert formatter.format("05449651910") == "**4.496.519-10"
+
+    def describe_template_option():
+        @pytest.mark.parametrize(
+            ("template", "expected"),
+            [
+                ("###.###.###-##", "054.496.519-10"),
+                ("#########-##", "054496519-10"),
+                ("### ### ### ##", "054 496 519 10"),
+                ("CPF: ###########.", "CPF: 05449651910."),
+            ],
+        )
+        def it_fills_the_slots_of_the_template(template, expected):
+            assert CpfFormatter().format("05449651910", template=template) == expected
+
+        def it_overrides_the_delimiter_keys():
+            formatter = CpfFormatter(dot_key="|", dash_key="|")
+
+            assert (
+                formatter.format("05449651910", template="###-###-###-##")
+                == "054-496-519-10"
+            )
+
+        def it_hides_the_slots_in_the_hidden_range():
+            formatter = CpfFormatter(
+                template="### ### ### ##", hidden=True, hidden_key="•"
+            )
+
+            assert formatter.format("05449651910") == "054 ••• ••• ••"
+
+        def it_escapes_and_encodes_the_template_text():
+            formatter = CpfFormatter(template="<###########> 100%", escape=True)
+
+            assert formatter.format("05449651910") == "&lt;05449651910&gt; 100%"
+            assert (
+                formatter.format("05449651910", encode=True)
+                == "%26lt%3B05449651910%26gt%3B%20100%25"
+            )
+
+        def it_applies_to_the_batch_and_array_methods():
+            formatter = CpfFormatter(template="#########-##")
+
+            assert formatter.format_many(["05449651910"]) == (["054496519-10"], [])
+            assert (
+                bytes(formatter.format_many_to_bytes(["05449651910"])[0])
+                == b"054496519-10"
+            )
+
+        def it_recompiles_the_plan_when_the_template_changes():
+            formatter = CpfFormatter()
+            formatter.format("05449651910")
+
+            formatter.options.template = "###########"
+
+            assert formatter.format("05449651910") == "05449651910"
+
+    def describe_format_many_method():
+        def it_formats_each_input_like_format():
+            formatter = CpfFormatter(hidden=True)
+            cpf_inputs = ["05449651910", b"82911017366", ["05449", "651910"]]
+
+            formatted, failed_indices = formatter.format_many(cpf_inputs)
+
+            assert formatted == [
+                formatter.format(cpf_input) for cpf_input in cpf_inputs
+            ]
+            assert failed_indices == []
+
+        def it_applies_per_call_options_to_the_whole_batch():
+            formatted, _ = CpfFormatter().format_many(
+                ["05449651910", "82911017366"], {"dash_key": "_"}, escape=True
+            )
+
+            assert formatted == ["054.496.519_10", "829.110.173_66"]
+
+        def describe_when_errors_is_collect():
+            def it_leaves_empty_strings_and_reports_the_failed_indices():
+                calls = []
+                formatter = CpfFormatter(
+                    on_fail=lambda value, _: calls.append(value) or "fail"
+                )
+
+                formatted, failed_indices = formatter.format_many(
+                    ["1", "05449651910", "", "829110173661"]
+                )
+
+                assert formatted == ["", "054.496.519-10", "", ""]
+                assert failed_indices == [0, 2, 3]
+                assert calls == []
+
+        def describe_when_errors_is_callback():
+            def it_calls_on_fail_for_each_failure():
+                calls = []
+
+                def on_fail(value, exception):
+                    calls.append((value, exception.evaluated_input))
+
+                    return "fail"
+
+                formatted, failed_indices = CpfFormatter(on_fail=on_fail).format_many(
+                    ["05449651910", "1-2"], errors="callback"
+                )
+
+                assert formatted == ["054.496.519-10", "fail"]
+                assert failed_indices == [1]
+                assert calls == [("1-2", "12")]
+
+        def describe_when_errors_is_raise():
+            def it_raises_for_the_first_failure():
+                with pytest.raises(CpfFormatterInputLengthException) as exc_info:
+                    CpfFormatter().format_many(
+                        ["05449651910", "12", "1"], errors="raise"
+                    )
+
+                assert exc_info.value.actual_input == "12"
+
+        def it_raises_for_an_unknown_errors_mode():
+            with pytest.raises(ValueError, match="errors"):
+                CpfFormatter().format_many([], errors="ignore")
+
+        def it_raises_for_an_invalid_input_type():
+            with pytest.raises(CpfFormatterInputTypeError):
+                CpfFormatter().format_many(["05449651910", 123])
+
+    def describe_format_into_method():
+        def it_writes_the_encoded_result_of_format_at_the_offset():
+            buffer = bytearray(b"." * 18)
+
+            written = CpfFormatter().format_into(buffer, 2, "05449651910")
+
+            assert written == 14
+            assert buffer == b"..054.496.519-10.."
+
+        def it_accepts_a_memoryview_and_per_call_options():
+            buffer = bytearray(40)
+
+            written = CpfFormatter().format_into(
+                memoryview(buffer), 0, b"05449651910", hidden=True, hidden_key="•"
+            )
+
+            assert bytes(buffer[:written]).decode() == "054.•••.•••-••"
+
+        def it_writes_what_on_fail_returns_for_an_invalid_length():
+            buffer = bytearray(8)
+
+            assert CpfFormatter().format_into(buffer, 0, "123") == 0
+            assert (
+                CpfFormatter(on_fail=lambda _value, _error: "n/a").format_into(
+                    buffer, 0, "123"
+                )
+                == 3
+            )
+            assert buffer == b"n/a\0\0\0\0\0"
+
+        @pytest.mark.parametrize(("size", "offset"), [(13, 0), (14, 1), (14, -1)])
+        def it_raises_without_writing_when_the_value_does_not_fit(size, offset):
+            buffer = bytearray(size)
+
+            with pytest.raises(ValueError, match="offset"):
+                CpfFormatter().format_into(buffer, offset, "05449651910")
+
+            assert buffer == bytearray(size)
+
+        @pytest.mark.parametrize("buffer", [bytes(14), "x" * 14])
+        def it_raises_for_a_buffer_that_is_not_writable(buffer):
+            with pytest.raises(TypeError):
+                CpfFormatter().format_into(buffer, 0, "05449651910")
+
+    def describe_format_many_to_bytes_method():
+        def it_joins_fixed_width_records_with_the_separator():
+            data, failed_indices = CpfFormatter().format_many_to_bytes(
+                ["05449651910", "123", b"82911017366"], separator=b"\r\n"
+            )
+
+            assert (
+                bytes(data)
+                == b"054.496.519-10\r\n" + b" " * 14 + b"\r\n" + b"829.110.173-66\r\n"
+            )
+            assert failed_indices == [1]
+
+        def it_keeps_the_stride_fixed_for_non_ascii_digits():
+            data, failed_indices = CpfFormatter().format_many_to_bytes(
+                ["\u06612345678901", "\u066105449651910", "12345678901"],
+                separator=b"\n",
+            )
+
+            assert [len(record) for record in bytes(data).split(b"\n")[:-1]] == [
+                14,
+                14,
+                14,
+            ]
+            assert bytes(data).split(b"\n")[1] == b"054.496.519-10"
+            assert failed_indices == [0]
+
+        def it_encodes_each_record_like_format():
+            formatter = CpfFormatter(
+                hidden=True, hidden_key="•", dash_key="%", escape=True
+            )
+            cpf_inputs = ["05449651910", ["054496", "51910"]]
+
+            data, _ = formatter.format_many_to_bytes(cpf_inputs)
+
+            assert (
+                bytes(data)
+                == "".join(formatter.format(value) for value in cpf_inputs).encode()
+            )
+
+        def it_writes_into_the_buffer_at_the_offset():
+            buffer = bytearray(b"#" * 32)
+
+            data, _ = CpfFormatter().format_many_to_bytes(
+                ["05449651910", "82911017366"], buffer=buffer, offset=1, separator=b"\n"
+            )
+
+            assert data.nbytes == 30
+            assert buffer == b"#054.496.519-10\n829.110.173-66\n#"
+
+        def it_returns_no_bytes_for_no_inputs():
+            data, failed_indices = CpfFormatter().format_many_to_bytes(
+                [], separator=b"\n"
+            )
+
+            assert (bytes(data), failed_indices) == (b"", [])
+
+        def it_does_not_call_on_fail():
+            formatter = CpfFormatter(
+                on_fail=lambda _value, _error: pytest.fail("on_fail called")
+            )
+
+            assert formatter.format_many_to_bytes(["1"])[1] == [0]
+
+        def it_raises_without_writing_when_the_records_do_not_fit():
+            buffer = bytearray(28)
+
+            with pytest.raises(ValueError, match="do not fit"):
+                CpfFormatter().format_many_to_bytes(
+                    ["05449651910"] * 2, buffer=buffer, offset=1
+                )
+
+            assert buffer == bytearray(28)
+
+        def it_raises_for_a_non_ascii_separator():
+            with pytest.raises(ValueError, match="separator"):
+                CpfFormatter().format_many_to_bytes([], separator="é".encode())
+
+    def describe_when_on_fail_is_the_default():
+        def it_returns_an_empty_string_without_building_an_exception(monkeypatch):
+            built = []
+            monkeypatch.setattr(
+                cpf_formatter_module,
+                "CpfFormatterInputLengthException",
+                lambda *args: built.append(args),
+            )
+            formatter = CpfFormatter()
+
+            assert formatter.format("not an id") == ""
+            assert formatter.format_many(["not an id"], errors="callback") == (
+                [""],
+                [0],
+            )
+            assert built == []
+
+        def it_still_builds_the_exception_for_a_custom_callback():
+            exceptions = []
+            formatter = CpfFormatter(
+                on_fail=lambda _, exception: exceptions.append(exception) or ""
+            )
+
+            formatter.format("not an id")
+
+            assert isinstance(exceptions[0], CpfFormatterInputLengthException)
@@ -0,0 +1,126 @@
+"""Spec for :meth:`cpf_fmt.CpfFormatter.format_array`.
+
+:meth:`CpfFormatter.format` is the reference: every element of the array
+must get the string it gets on its own under the same options, or an empty
+string where ``format`` would call ``on_fail``. Skipped when the optional
+``numpy`` extra is not installed.
+"""
+
+import random
+
+import pytest
+from cpf_fmt import CpfFormatter, CpfFormatterInputTypeError
+
+np = pytest.importorskip("numpy")
+
+
+def _sample_inputs() -> list[str]:
+    rng = random.Random(0)
+    inputs = [
+        "",
+        "05449651910",
+        "054.496.519-10",
+        " 054 496 519 10 x ",
+        "0544965191",
+        "054496519100",
+        "0544965191é",
+        "05449651910é",
+        "\u06612345678901",
+        "\u066105449651910",
+        "05449651910\uff11",
+    ]
+
+    for _ in range(500):
+        cpf = "".join(rng.choices("0123456789", k=rng.choice([10, 11, 11, 11, 12])))
+        inputs.extend([cpf, f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"])
+
+    return inputs
+
+
+SAMPLE_INPUTS = _sample_inputs()
+
+OPTION_CASES = [
+    {},
+    {"hidden": True},
+    {"hidden": True, "hidden_start": 0, "hidden_end": 10, "hidden_key": "#"},
+    {"dot_key": "", "dash_key": " - "},
+    {"hidden": True, "hidden_key": "<%>", "dash_key": "&", "escape": True},
+    {"hidden": True, "hidden_key": "•", "dash_key": "/", "encode": True},
+    {"hidden": True, "hidden_key": "&", "escape": True, "encode": True},
+    {"template": "CPF ### ### ### ##", "hidden": True},
+    {"template": "<###########>", "escape": True},
+]
+
+
+def describe_format_array_method():
+    @pytest.mark.parametrize("options", OPTION_CASES)
+    @pytest.mark.parametrize("dtype", ["U", "S"])
+    def it_matches_format_for_every_element(options, dtype):
+        formatter = CpfFormatter()
+        inputs = [value for value in SAMPLE_INPUTS if dtype == "U" or value.isascii()]
+        array = np.array(inputs).astype(dtype)
+
+        assert formatter.format_array(array, **options).tolist() == [
+            formatter.format(value, **options) for value in inputs
+        ]
+
+    def it_returns_a_fixed_width_array_of_the_formatted_length():
+        result = CpfFormatter().format_array(np.array(["05449651910", "0544965191"]))
+
+        assert result.dtype == np.dtype("U14")
+        assert result.tolist() == ["054.496.519-10", ""]
+
+    def it_skips_non_ascii_digits_like_format():
+        array = np.array(["\u06612345678901", "\u066105449651910"])
+
+        assert CpfFormatter().format_array(array).tolist() == ["", "054.496.519-10"]
+        assert CpfFormatter().format("\u06612345678901") == ""
+
+    def it_honors_the_instance_default_options():
+        formatter = CpfFormatter(hidden=True, hidden_key="#")
+
+        assert formatter.format_array(np.array(["05449651910"])).tolist() == [
+            "054.###.###-##"
+        ]
+
+    def it_does_not_call_on_fail():
+        formatter = CpfFormatter(
+            on_fail=lambda _value, _error: pytest.fail("on_fail called")
+        )
+
+        assert formatter.format_array(np.array(["123"])).tolist() == [""]
+
+    def it_keeps_the_shape_of_the_input_array():
+        array = np.array([["05449651910", "123"]] * 3)
+
+        result = CpfFormatter().format_array(array)
+
+        assert result.shape == (3, 2)
+        assert result.tolist() == [["054.496.519-10", ""]] * 3
+
+    def it_accepts_non_contiguous_and_big_endian_arrays():
+        array = np.array(["05449651910", "x", "82911017366"], dtype=">U14")
+
+        assert CpfFormatter().format_array(array[::2]).tolist() == [
+            "054.496.519-10",
+            "829.110.173-66",
+        ]
+
+    def it_returns_an_empty_array_for_an_empty_array():
+        result = CpfFormatter().format_array(np.array([], dtype="U11"))
+
+        assert result.shape == (0,)
+        assert result.dtype == np.dtype("U14")
+
+    @pytest.mark.parametrize(
+        "cpf_array",
+        [
+            "05449651910",
+            ["05449651910"],
+            np.array([5449651910]),
+            np.array(["05449651910"], dtype=object),
+        ],
+    )
+    def it_raises_cpf_formatter_input_type_error(cpf_array):
+        with pytest.raises(CpfFormatterInputTypeError):
+            CpfFormatter().format_array(cpf_array)
@@ -20,6 +20,7 @@ from cpf_fmt import (
     CpfFormatterOptions,
     CpfFormatterOptionsForbiddenKeyCharacterException,
     CpfFormatterOptionsHiddenRangeInvalidException,
+    CpfFormatterOptionsTemplateInvalidException,
     CpfFormatterOptionsTypeError,
 )
 
@@ -30,6 +31,7 @@ DEFAULT_PARAMETERS = {
     "hidden_end": CpfFormatterOptions.DEFAULT_HIDDEN_END,
     "dot_key": CpfFormatterOptions.DEFAULT_DOT_KEY,
     "dash_key": CpfFormatterOptions.DEFAULT_DASH_KEY,
+    "template": CpfFormatterOptions.DEFAULT_TEMPLATE,
     "escape": CpfFormatterOptions.DEFAULT_ESCAPE,
     "encode": CpfFormatterOptions.DEFAULT_ENCODE,
     "on_fail": CpfFormatterOptions.DEFAULT_ON_FAIL,
@@ -66,6 +68,7 @@ def describe_cpf_formatter_options():
                         "hidden_end": None,
                         "dot_key": None,
                         "dash_key": None,
+                        "template": None,
                         "escape": None,
                         "encode": None,
                         "on_fail": None,
@@ -86,6 +89,7 @@ def describe_cpf_formatter_options():
                     "hidden_end": 8,
                     "dot_key": "|",
                     "dash_key": "~",
+                    "template": "###########",
                     "escape": True,
                     "encode": True,
                     "on_fail": on_fail,
@@ -603,6 +607,57 @@ def describe_cpf_formatter_options():
 
                 assert str(exc_info.value) == message
 
+    def describe_template_property():
+        def describe_when_setting_to_a_string_value():
+            @pytest.mark.parametrize(
+                "template", ["###.###.###-##", "#########-##", "CPF ### ### ### ##"]
+            )
+            def it_sets_template_to_the_provided_value(template):
+                options = CpfFormatterOptions()
+
+                options.template = template
+
+                assert options.template == template
+
+        def describe_when_setting_to_a_nullish_value():
+            def it_sets_default_value_for_none():
+                options = CpfFormatterOptions({"template": "###########"})
+
+                options.template = None
+
+                assert options.template is None
+
+        def describe_when_setting_to_a_non_string_value():
+            def it_raises_cpf_formatter_options_type_error_with_a_number():
+                options = CpfFormatterOptions()
+
+                with _raises_message(
+                    CpfFormatterOptionsTypeError,
+                    'CPF formatting option "template" must be of type string. Got integer number.',
+                ):
+                    options.template = 123
+
+        def describe_when_setting_to_a_string_without_11_slots():
+            @pytest.mark.parametrize("template", ["", "###.###.###-#", "############"])
+            def it_raises_cpf_formatter_options_template_invalid_exception(template):
+                options = CpfFormatterOptions()
+
+                with _raises_message(
+                    CpfFormatterOptionsTemplateInvalidException,
+                    f'must have 11 "#" slots. Got {template.count("#")} in "{template}".',
+                ):
+                    options.template = template
+
+                assert options.template is None
+
+        def describe_when_setting_to_a_string_containing_a_forbidden_key_character():
+            def it_raises_cpf_formatter_options_forbidden_key_character_exception():
+                options = CpfFormatterOptions()
+                forbidden_char = CpfFormatterOptions.DISALLOWED_KEY_CHARACTERS[0]
+
+                with pytest.raises(CpfFormatterOptionsForbiddenKeyCharacterException):
+                    options.template = f"{forbidden_char}###########"
+
     def describe_escape_property():
         def describe_when_setting_to_a_boolean_value():
             def it_sets_escape_to_true():
@@ -983,3 +1038,22 @@ def describe_cpf_formatter_options():
                         'CPF formatting option "hidden_end" must be of type integer. Got float number.',
                     ):
                         options.set_hidden_range(0, 1.5)
+
+    def describe_version_getter():
+        def it_grows_whenever_an_option_is_set():
+            options = CpfFormatterOptions()
+            versions = [options.version]
+
+            options.hidden = True
+            versions.append(options.version)
+            options.set_hidden_range(2, 4)
+            versions.append(options.version)
+            options.set({"dash_key": "_"})
+            versions.append(options.version)
+
+            assert versions == sorted(set(versions))
+
+        def it_restarts_on_copies():
+            options = CpfFormatterOptions(hidden=True)
+
+            assert options.copy().version == 0
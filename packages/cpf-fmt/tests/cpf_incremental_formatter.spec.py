@@ -0,0 +1,169 @@
+"""Spec for :class:`cpf_fmt.CpfIncrementalFormatter`.
+
+:meth:`CpfFormatter.format` is the reference: once a CPF is fully typed,
+the incremental value must be the string it gets under the same options.
+"""
+
+import random
+
+import pytest
+from cpf_fmt import (
+    CpfFormatter,
+    CpfFormatterInputTypeError,
+    CpfFormatterOptions,
+    CpfFormatterOptionsTemplateInvalidException,
+    CpfIncrementalFormatter,
+)
+
+OPTION_CASES = [
+    {},
+    {"hidden": True},
+    {"hidden": True, "hidden_start": 0, "hidden_end": 10, "hidden_key": ""},
+    {"dot_key": "", "dash_key": " - "},
+    {"hidden": True, "hidden_key": "<%>", "dash_key": "&", "escape": True},
+    {"hidden": True, "hidden_key": "•", "dash_key": "/", "encode": True},
+    {"template": "CPF: ### ### ### ##."},
+]
+
+
+def describe_cpf_incremental_formatter():
+    def describe_push_method():
+        def it_writes_each_delimiter_with_the_digit_after_it():
+            formatter = CpfIncrementalFormatter()
+            values = []
+
+            for char in "05449651910":
+                formatter.push(char)
+                values.append(formatter.value)
+
+            assert values[:5] == ["0", "05", "054", "054.4", "054.49"]
+            assert values[-3:] == ["054.496.519", "054.496.519-1", "054.496.519-10"]
+
+        def it_skips_non_digit_characters():
+            formatter = CpfIncrementalFormatter()
+
+            assert formatter.push("054.4a") == 4
+            assert formatter.raw == "0544"
+            assert formatter.value == "054.4"
+
+        def it_stops_taking_digits_once_the_cpf_is_complete():
+            formatter = CpfIncrementalFormatter()
+
+            assert formatter.push("05449651910") == 11
+            assert formatter.push("7") == 0
+            assert formatter.is_complete
+            assert formatter.value == "054.496.519-10"
+
+        def it_skips_non_ascii_digits():
+            formatter = CpfIncrementalFormatter()
+
+            assert formatter.push("1٣²") == 1
+            assert formatter.value == "1"
+
+        @pytest.mark.parametrize("value", [None, 1, b"1", ["1"]])
+        def it_raises_cpf_formatter_input_type_error_for_non_strings(value):
+            with pytest.raises(CpfFormatterInputTypeError):
+                CpfIncrementalFormatter().push(value)
+
+    def describe_pop_method():
+        def it_removes_the_last_digit_with_the_delimiter_before_it():
+            formatter = CpfIncrementalFormatter()
+            formatter.push("0544")
+
+            assert formatter.pop() == "4"
+            assert formatter.value == "054"
+            assert formatter.raw == "054"
+
+        def it_returns_an_empty_string_when_nothing_was_typed():
+            formatter = CpfIncrementalFormatter()
+
+            assert formatter.pop() == ""
+            assert formatter.value == ""
+
+        def it_removes_the_trailing_template_text_of_a_complete_cpf():
+            formatter = CpfIncrementalFormatter(template="[###########]")
+            formatter.push("05449651910")
+
+            assert formatter.pop() == "0"
+            assert formatter.value == "[0544965191"
+
+    def describe_clear_method():
+        def it_removes_every_digit():
+            formatter = CpfIncrementalFormatter()
+            formatter.push("0544")
+
+            formatter.clear()
+
+            assert (formatter.value, formatter.raw, len(formatter)) == ("", "", 0)
+
+    def describe_cursor_mapping():
+        def it_maps_raw_positions_to_the_end_of_their_digit():
+            formatter = CpfIncrementalFormatter()
+            formatter.push("054496")
+
+            positions = [formatter.masked_position(index) for index in range(7)]
+
+            assert positions == [0, 1, 2, 3, 5, 6, 7]
+
+        def it_maps_masked_positions_to_the_digits_before_them():
+            formatter = CpfIncrementalFormatter()
+            formatter.push("054496")
+
+            positions = [formatter.raw_position(index) for index in range(8)]
+
+            assert positions == [0, 1, 2, 3, 3, 4, 5, 6]
+
+        def it_round_trips_raw_positions():
+            formatter = CpfIncrementalFormatter(
+                hidden=True, hidden_key="<*>", escape=True
+            )
+            formatter.push("05449651910")
+
+            for index in range(12):
+                assert formatter.raw_position(formatter.masked_position(index)) == index
+
+        @pytest.mark.parametrize("position", [-1, 4])
+        def it_raises_value_error_for_raw_positions_out_of_range(position):
+            formatter = CpfIncrementalFormatter()
+            formatter.push("054")
+
+            with pytest.raises(ValueError, match="raw_position"):
+                formatter.masked_position(position)
+
+        @pytest.mark.parametrize("position", [-1, 4])
+        def it_raises_value_error_for_masked_positions_out_of_range(position):
+            formatter = CpfIncrementalFormatter()
+            formatter.push("054")
+
+            with pytest.raises(ValueError, match="masked_position"):
+                formatter.raw_position(position)
+
+    def describe_options():
+        @pytest.mark.parametrize("options", OPTION_CASES)
+        def it_matches_cpf_formatter_once_complete(options):
+            rng = random.Random(0)
+            reference = CpfFormatter(options)
+            formatter = CpfIncrementalFormatter(options)
+
+            for _ in range(50):
+                cpf = f"{rng.randrange(10**11):011d}"
+                formatter.clear()
+
+                for char in cpf:
+                    formatter.push(char)
+
+                assert formatter.value == reference.format(cpf)
+
+        def it_re_masks_the_typed_digits_when_the_options_change():
+            options = CpfFormatterOptions()
+            formatter = CpfIncrementalFormatter(options)
+            formatter.push("0544965")
+
+            options.hidden = True
+
+            assert formatter.value == "054.***.*"
+            assert formatter.masked_position(7) == 9
+
+        def it_raises_for_invalid_options():
+            with pytest.raises(CpfFormatterOptionsTemplateInvalidException):
+                CpfIncrementalFormatter(template="##")
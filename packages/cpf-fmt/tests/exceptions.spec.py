@@ -17,6 +17,7 @@ from cpf_fmt import (
     CpfFormatterInputTypeError,
     CpfFormatterOptionsForbiddenKeyCharacterException,
     CpfFormatterOptionsHiddenRangeInvalidException,
+    CpfFormatterOptionsTemplateInvalidException,
     CpfFormatterOptionsTypeError,
     CpfFormatterTypeError,
 )
@@ -350,3 +351,35 @@ def describe_cpf_formatter_options_forbidden_key_character_exception():
                 str(exception)
                 == 'Value "å" for CPF formatting option "dot_key" contains disallowed characters ("å", "ë", "ï", "ð").'
             )
+
+
+def describe_cpf_formatter_options_template_invalid_exception():
+    def describe_when_instantiated():
+        def it_is_an_instance_of_cpf_formatter_exception():
+            exception = CpfFormatterOptionsTemplateInvalidException("###", "#", 11)
+
+            assert isinstance(exception, CpfFormatterException)
+
+        def it_has_the_correct_name():
+            exception = CpfFormatterOptionsTemplateInvalidException("###", "#", 11)
+
+            assert (
+                type(exception).__name__
+                == "CpfFormatterOptionsTemplateInvalidException"
+            )
+
+        def it_sets_its_properties():
+            exception = CpfFormatterOptionsTemplateInvalidException("##-##", "#", 11)
+
+            assert exception.option_name == "template"
+            assert exception.actual_input == "##-##"
+            assert exception.slot == "#"
+            assert exception.expected_slots == 11
+
+        def it_generates_a_message_describing_the_exception():
+            exception = CpfFormatterOptionsTemplateInvalidException("##-##", "#", 11)
+
+            assert (
+                str(exception)
+                == 'CPF formatting option "template" must have 11 "#" slots. Got 4 in "##-##".'
+            )
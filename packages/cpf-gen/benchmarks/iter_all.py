@@ -0,0 +1,51 @@
+"""Benchmark ``CpfGenerator.iter_all`` against completing every base under
+the same prefix with ``CpfCheckDigits``.
+
+Run from the package root with ``python benchmarks/iter_all.py``. Prints the
+throughput, in CPF values per second, of listing every valid CPF under a
+4-digit prefix through each path, unformatted and formatted.
+"""
+
+import timeit
+from functools import partial
+
+from cpf_dv import CpfCheckDigits
+from cpf_gen import CpfGenerator
+
+_PREFIX = "1234"
+_FREE_DIGITS = 5
+_REPEAT = 5
+
+
+def _format_cpf(raw: str) -> str:
+    return f"{raw[:3]}.{raw[3:6]}.{raw[6:9]}-{raw[9:11]}"
+
+
+def _complete_many_path(format: bool) -> list[str]:
+    bases = [f"{_PREFIX}{index:0{_FREE_DIGITS}d}" for index in range(10**_FREE_DIGITS)]
+    cpfs = [cpf for cpf in CpfCheckDigits.complete_many(bases) if cpf is not None]
+
+    return [_format_cpf(cpf) for cpf in cpfs] if format else cpfs
+
+
+def _iter_all_path(generator: CpfGenerator, format: bool) -> list[str]:
+    return list(generator.iter_all(prefix=_PREFIX, format=format))
+
+
+def main() -> None:
+    generator = CpfGenerator()
+
+    for format in (False, True):
+        count = len(_iter_all_path(generator, format))
+
+        for label, path in (
+            ("complete_many", partial(_complete_many_path, format)),
+            ("iter_all", partial(_iter_all_path, generator, format)),
+        ):
+            best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+            title = f"{label} (format={format}, {count:,} values)"
+            print(f"{title:>48}: {count / best:12,.0f} IDs/s")
+
+
+if __name__ == "__main__":
+    main()
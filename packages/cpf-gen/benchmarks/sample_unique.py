@@ -0,0 +1,55 @@
+"""Benchmark ``CpfGenerator.sample_unique`` against deduplicating the output
+of ``generate_many`` in a set.
+
+Run from the package root with ``python benchmarks/sample_unique.py``. Prints
+the throughput, in distinct CPF values per second, of drawing the same number
+of distinct values through each path, unformatted and formatted.
+"""
+
+import timeit
+from functools import partial
+from itertools import islice
+
+from cpf_gen import CpfGenerator
+
+_COUNT = 100_000
+_REPEAT = 5
+
+
+def _dedupe_path(generator: CpfGenerator, format: bool) -> set[str]:
+    seen: set[str] = set()
+
+    while len(seen) < _COUNT:
+        seen.update(generator.generate_many(_COUNT - len(seen), format=format))
+
+    return seen
+
+
+def _take_path(generator: CpfGenerator, format: bool) -> list[str]:
+    return generator.sample_unique(format=format).take(_COUNT)
+
+
+def _iterate_path(generator: CpfGenerator, format: bool) -> list[str]:
+    return list(islice(generator.sample_unique(format=format), _COUNT))
+
+
+def main() -> None:
+    generator = CpfGenerator()
+
+    for format in (False, True):
+        for label, path in (
+            ("generate_many + set", _dedupe_path),
+            ("sample_unique take", _take_path),
+            ("sample_unique iterate", _iterate_path),
+        ):
+            best = min(
+                timeit.repeat(
+                    partial(path, generator, format), number=1, repeat=_REPEAT
+                )
+            )
+            title = f"{label} (format={format})"
+            print(f"{title:>36}: {_COUNT / best:12,.0f} IDs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from .cpf_gen import cpf_gen
-from .cpf_generator import CpfGenerator
+from .cpf_generator import CpfGenerator, CpfUniqueSampler
 from .cpf_generator_options import (
     CPF_LENGTH,
     CPF_PREFIX_MAX_LENGTH,
@@ -24,6 +24,7 @@ __all__ = [
     "CpfGeneratorOptionsType",
     "CpfGeneratorOptionsTypeError",
     "CpfGeneratorTypeError",
+    "CpfUniqueSampler",
     "cpf_gen",
 ]
 
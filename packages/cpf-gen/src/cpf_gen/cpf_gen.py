@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 from .cpf_generator import CpfGenerator
 
 if TYPE_CHECKING:
+    from lacus.utils import RandomSource
+
     from .types import CpfGeneratorOptionsInput
 
 
@@ -15,6 +17,7 @@ def cpf_gen(
     *,
     format: bool | None = None,
     prefix: str | None = None,
+    rng: RandomSource = None,
 ) -> str:
     """Helper function to simplify the usage of :class:`CpfGenerator`.
 
@@ -22,7 +25,7 @@ def cpf_gen(
     CPF (e.g. ``"12345678901"``) using default settings. If options are provided, they control
     ``prefix`` and whether the result is formatted.
 
-    Generates a valid 11-digit CPF (``prefix``, random body, and computed check digits). With default options the result is unformatted numeric; pass ``format=True`` for ``000.000.000-00`` style output.
+    Generates a valid 11-digit CPF (``prefix``, random body, and computed check digits). With default options the result is unformatted numeric; pass ``format=True`` for ``000.000.000-00`` style output. Pass a seeded ``rng`` (e.g. ``random.Random(seed)``) for reproducible output.
 
     Raises:
         ``CpfGeneratorOptionsTypeError``: If any option has an invalid type.
@@ -36,6 +39,7 @@ def cpf_gen(
         options,
         format=format,
         prefix=prefix,
+        rng=rng,
     ).generate()
 
 
@@ -2,22 +2,166 @@
 
 from __future__ import annotations
 
+from functools import cache
+from itertools import product
 from typing import TYPE_CHECKING, Any
 
-from cpf_dv import CpfCheckDigits
+from cpf_dv import (
+    CPF_CHECK_DIGIT_BY_REMAINDER,
+    CPF_FIRST_WEIGHTS,
+    CPF_SECOND_DIGIT_WEIGHT,
+    CPF_SECOND_WEIGHTS,
+    CpfCheckDigits,
+    CpfCheckDigitsStatus,
+)
 from cpf_dv.exceptions import CpfCheckDigitsException
-from lacus.utils import generate_random_sequence
+from lacus.utils import (
+    KeyedPermutation,
+    LruCache,
+    generate_random_sequence,
+    generate_random_sequences,
+)
 
 from .cpf_generator_options import CPF_PREFIX_MAX_LENGTH, CpfGeneratorOptions
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from lacus.utils import RandomSource
+
     from .types import CpfGeneratorOptionsInput
 
 
+_RESOLVED_OPTIONS_CACHE_SIZE = 32
+_ITER_BATCH_SIZE = 1024
+_DIGITS = "0123456789"
+_CPF_HEAD_LENGTH = CPF_PREFIX_MAX_LENGTH - 1
+
+
+def _items_key(mapping: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple((name, value.__class__, value) for name, value in mapping.items())
+
+
+def _override_key(
+    options: CpfGeneratorOptionsInput | None, keyword_overrides: dict[str, Any]
+) -> tuple[Any, ...] | None:
+    """Return a hashable key identifying a set of per-call overrides, or
+    ``None`` when one of them cannot be hashed.
+
+    Values are keyed along with their class, so ``1`` does not share the
+    entry of ``True`` and still fails the type checks.
+    """
+    if options is None:
+        options_key = None
+    elif isinstance(options, CpfGeneratorOptions):
+        options_key = _items_key(options.all)
+    elif isinstance(options, dict):
+        options_key = _items_key(options)
+    else:
+        return None
+
+    key = (options_key, _items_key(keyword_overrides))
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
 def _format_cpf(raw: str) -> str:
     return f"{raw[:3]}.{raw[3:6]}.{raw[6:9]}-{raw[9:11]}"
 
 
+@cache
+def _suffix_table(digits: str, format: bool) -> tuple[tuple[str, ...], ...]:
+    """Return, for each pair of remainders modulo 11 of the weighted sums of
+    the first 8 digits, the tails (last base digit and both check digits,
+    with the dash when ``format`` is on) completing a CPF with each digit of
+    ``digits``, in order.
+
+    The check digits only depend on those remainders and on the last digit,
+    so a CPF is completed by concatenating its first 8 digits with one of
+    these tails.
+    """
+    dash = "-" if format else ""
+    first_weight = CPF_FIRST_WEIGHTS[-1]
+    second_weight = CPF_SECOND_WEIGHTS[-1]
+    table: list[tuple[str, ...]] = []
+
+    for first_remainder, second_remainder in product(range(11), repeat=2):
+        suffixes: list[str] = []
+
+        for digit in digits:
+            value = int(digit)
+            first_digit = CPF_CHECK_DIGIT_BY_REMAINDER[
+                (first_remainder + value * first_weight) % 11
+            ]
+            second_digit = CPF_CHECK_DIGIT_BY_REMAINDER[
+                (
+                    second_remainder
+                    + value * second_weight
+                    + first_digit * CPF_SECOND_DIGIT_WEIGHT
+                )
+                % 11
+            ]
+            suffixes.append(f"{digit}{dash}{first_digit}{second_digit}")
+
+        table.append(tuple(suffixes))
+
+    return tuple(table)
+
+
+def _enumerate_cpfs(prefix: str, format: bool) -> Iterator[str]:
+    """Yield every valid CPF starting with ``prefix``, in ascending order.
+
+    The first 8 digits (the head) advance like an odometer, each step only
+    adjusting the weighted sums by the digits that changed, and every head
+    is completed from :func:`_suffix_table`. The tail making 9 repeated
+    digits is skipped.
+    """
+    if len(prefix) == CPF_PREFIX_MAX_LENGTH:
+        tail_digits = prefix[-1]
+        prefix = prefix[:-1]
+    else:
+        tail_digits = _DIGITS
+
+    suffix_table = _suffix_table(tail_digits, format)
+    free_positions = range(len(prefix), _CPF_HEAD_LENGTH)
+    values = [int(digit) for digit in prefix] + [0] * len(free_positions)
+    first_sum = sum(map(int.__mul__, values, CPF_FIRST_WEIGHTS))
+    second_sum = sum(map(int.__mul__, values, CPF_SECOND_WEIGHTS))
+
+    while True:
+        head = "".join(_DIGITS[value] for value in values)
+        suffixes = suffix_table[first_sum % 11 * 11 + second_sum % 11]
+
+        if head == head[0] * _CPF_HEAD_LENGTH:
+            suffixes = tuple(suffix for suffix in suffixes if suffix[0] != head[0])
+
+        if format:
+            head = f"{head[:3]}.{head[3:6]}.{head[6:]}"
+
+        for suffix in suffixes:
+            yield head + suffix
+
+        position = free_positions.stop - 1
+
+        while position >= free_positions.start and values[position] == 9:
+            values[position] = 0
+            first_sum -= 9 * CPF_FIRST_WEIGHTS[position]
+            second_sum -= 9 * CPF_SECOND_WEIGHTS[position]
+            position -= 1
+
+        if position < free_positions.start:
+            return
+
+        values[position] += 1
+        first_sum += CPF_FIRST_WEIGHTS[position]
+        second_sum += CPF_SECOND_WEIGHTS[position]
+
+
 class CpfGenerator:
     """Generator for CPF identifiers.
 
@@ -26,7 +170,7 @@ class CpfGenerator:
     ``prefix`` and whether the result is formatted (``000.000.000-00``).
     """
 
-    __slots__ = ("_options",)
+    __slots__ = ("_options", "_resolved_options", "_rng")
 
     def __init__(
         self,
@@ -34,6 +178,7 @@ class CpfGenerator:
         *,
         format: bool | None = None,
         prefix: str | None = None,
+        rng: RandomSource = None,
     ) -> None:
         """Create a new :class:`CpfGenerator` with optional defaults.
 
@@ -48,6 +193,12 @@ class CpfGenerator:
         plain mapping or ``None`` is passed, a new :class:`CpfGeneratorOptions`
         instance is created from it.
 
+        ``rng`` is the source of randomness of every generated CPF:
+        ``None`` (default) uses the cryptographically secure ``secrets``
+        module, while a ``random.Random`` or NumPy ``Generator`` seeded by the
+        caller makes the output reproducible (e.g. for test fixtures) and
+        faster, but predictable.
+
         Raises:
             ``CpfGeneratorOptionsTypeError``: If any option has an invalid
                 type.
@@ -63,6 +214,18 @@ class CpfGenerator:
                 prefix=prefix,
             )
 
+        self._resolved_options: (
+            LruCache[tuple[Any, ...], CpfGeneratorOptions] | None
+        ) = None
+        self._rng = rng
+
+    @property
+    def rng(self) -> RandomSource:
+        """Return the source of randomness of the generated CPFs (``None``
+        for the default ``secrets`` module).
+        """
+        return self._rng
+
     @property
     def options(self) -> CpfGeneratorOptions:
         """Return default options used when per-call options are omitted.
@@ -95,15 +258,12 @@ class CpfGenerator:
             ``CpfGeneratorOptionPrefixInvalidException``: If the ``prefix``
                 option contains an invalid combination of digits.
         """
-        if options is None and format is None and prefix is None:
-            actual_options = self._options
-        else:
-            actual_options = self._merge_options(options, format, prefix)
-
+        actual_options = self._resolve_options(options, format, prefix)
         digits_to_generate = CPF_PREFIX_MAX_LENGTH - len(actual_options.prefix)
         generated_cpf = actual_options.prefix + generate_random_sequence(
             digits_to_generate,
             "numeric",
+            self._rng,
         )
 
         try:
@@ -116,6 +276,184 @@ class CpfGenerator:
 
         return generated_cpf
 
+    def generate_many(
+        self,
+        count: int,
+        options: CpfGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+    ) -> list[str]:
+        """Generate ``count`` valid CPF values in a single call.
+
+        Each value is built as by :meth:`generate`, but options are resolved
+        once for the whole batch, the random digits of every value come from
+        one entropy draw, and the check digits are computed by
+        :meth:`CpfCheckDigits.complete_many <cpf_dv.CpfCheckDigits.complete_many>`
+        without one :class:`~cpf_dv.CpfCheckDigits` instance per value.
+        Ineligible random values (9 repeated digits) are replaced by a new
+        draw, so exactly ``count`` values are returned.
+
+        Raises:
+            ``ValueError``: If ``count`` is negative.
+            ``CpfGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CpfGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of digits.
+        """
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+
+        actual_options = self._resolve_options(options, format, prefix)
+
+        return self._generate_batch(count, actual_options)
+
+    def iter_generate(
+        self,
+        options: CpfGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+    ) -> Iterator[str]:
+        """Return an endless iterator of valid CPF values.
+
+        Options are resolved (and validated) once, when this method is
+        called, and values are generated lazily in batches of
+        :meth:`generate_many`, so taking a few values stays cheap while
+        streaming millions of them (e.g. with :func:`itertools.islice`)
+        does not hold them all in memory.
+
+        Raises:
+            ``CpfGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CpfGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of digits.
+        """
+        actual_options = self._resolve_options(options, format, prefix)
+
+        return self._iter_batches(actual_options)
+
+    def sample_unique(
+        self,
+        options: CpfGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+        key: int | None = None,
+        cursor: int = 0,
+    ) -> CpfUniqueSampler:
+        """Return a :class:`CpfUniqueSampler` over the CPF values allowed by
+        the resolved options, which never repeats a value.
+
+        Unlike :meth:`generate_many`, which draws every value independently
+        and may repeat one, the sampler walks a keyed permutation of every
+        possible base, in constant memory. Its ``key`` is drawn from this
+        generator's ``rng`` when omitted; pass a saved ``key`` and
+        ``cursor`` to resume an earlier sampler.
+
+        Raises:
+            ``CpfGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CpfGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of digits.
+            ``TypeError``: If ``key`` or ``cursor`` is not an integer.
+            ``ValueError``: If ``cursor`` is out of range.
+        """
+        actual_options = self._resolve_options(options, format, prefix)
+
+        return CpfUniqueSampler(actual_options, key=key, cursor=cursor, rng=self._rng)
+
+    def iter_all(
+        self,
+        options: CpfGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+    ) -> Iterator[str]:
+        """Return an iterator over every valid CPF allowed by the options, in
+        ascending order.
+
+        The digits after ``prefix`` run like an odometer, and the weighted
+        sums of the check digits are updated by each step instead of
+        recomputed, so every value costs about one string concatenation.
+        Bases of 9 repeated digits are skipped. Values are yielded lazily,
+        in constant memory; the options are resolved when this method is
+        called.
+
+        Raises:
+            ``CpfGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CpfGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of digits.
+        """
+        actual_options = self._resolve_options(options, format, prefix)
+
+        return _enumerate_cpfs(actual_options.prefix, actual_options.format)
+
+    def _iter_batches(self, actual_options: CpfGeneratorOptions) -> Iterator[str]:
+        while True:
+            yield from self._generate_batch(_ITER_BATCH_SIZE, actual_options)
+
+    def _generate_batch(
+        self, count: int, actual_options: CpfGeneratorOptions
+    ) -> list[str]:
+        """Generate ``count`` CPF values under already resolved options."""
+        cpf_prefix = actual_options.prefix
+        digits_to_generate = CPF_PREFIX_MAX_LENGTH - len(cpf_prefix)
+        generated_cpfs: list[str] = []
+
+        while len(generated_cpfs) < count:
+            sequences = generate_random_sequences(
+                count - len(generated_cpfs),
+                digits_to_generate,
+                "numeric",
+                self._rng,
+            )
+            completed_cpfs = CpfCheckDigits.complete_many(
+                [cpf_prefix + sequence for sequence in sequences]
+            )
+            generated_cpfs.extend(cpf for cpf in completed_cpfs if cpf is not None)
+
+        if actual_options.format:
+            return [_format_cpf(cpf) for cpf in generated_cpfs]
+
+        return generated_cpfs
+
+    def _resolve_options(
+        self,
+        options: CpfGeneratorOptionsInput | None,
+        format: bool | None,
+        prefix: str | None,
+    ) -> CpfGeneratorOptions:
+        """Return the instance defaults, or merge per-call overrides over them.
+
+        Merged options are memoized per defaults
+        :attr:`~CpfGeneratorOptions.version` and overrides, so repeating the
+        same overrides skips building and validating a new options instance.
+        """
+        if options is None and format is None and prefix is None:
+            return self._options
+
+        override_key = _override_key(options, {"format": format, "prefix": prefix})
+
+        if override_key is None:
+            return self._merge_options(options, format, prefix)
+
+        resolved_options = self._resolved_options
+
+        if resolved_options is None:
+            resolved_options = LruCache(_RESOLVED_OPTIONS_CACHE_SIZE)
+            self._resolved_options = resolved_options
+
+        resolved_key = (self._options.version, override_key)
+        actual_options = resolved_options.get(resolved_key)
+
+        if actual_options is None:
+            actual_options = self._merge_options(options, format, prefix)
+            resolved_options.put(resolved_key, actual_options)
+
+        return actual_options
+
     def _merge_options(
         self,
         options: CpfGeneratorOptionsInput | None,
@@ -139,4 +477,133 @@ class CpfGenerator:
         return CpfGeneratorOptions(*layers)
 
 
-__all__ = ["CpfGenerator"]
+class CpfUniqueSampler:
+    """Iterator over distinct valid CPF values, in a shuffled order.
+
+    The bases that the options allow (the ``prefix`` followed by every
+    combination of digits) are numbered from 0 to :attr:`size` - 1 and
+    visited in the order of a :class:`~lacus.utils.KeyedPermutation` of that
+    range, so no CPF is ever repeated, and only the permutation ``key`` and
+    a :attr:`cursor` are kept in memory, however many values are drawn.
+    Bases of 9 repeated digits are skipped. Iteration stops once every base
+    was visited.
+
+    To resume later, save :attr:`key` and :attr:`cursor` and create a new
+    sampler with the same options and those values: it continues where this
+    one stopped, without repeating any value.
+    """
+
+    __slots__ = ("_base_offset", "_cursor", "_format", "_permutation")
+
+    def __init__(
+        self,
+        options: CpfGeneratorOptionsInput | None = None,
+        *,
+        format: bool | None = None,
+        prefix: str | None = None,
+        key: int | None = None,
+        cursor: int = 0,
+        rng: RandomSource = None,
+    ) -> None:
+        """Create a sampler over the CPF values allowed by the options.
+
+        Options are handled as by :class:`CpfGenerator`, but read only here:
+        changing them later does not affect this sampler. ``key`` selects the
+        order of the values and is drawn from ``rng`` (as for
+        :class:`CpfGenerator`) when omitted; ``cursor`` is the position to
+        start from.
+
+        Raises:
+            ``CpfGeneratorOptionsTypeError``: If any option has an invalid
+                type.
+            ``CpfGeneratorOptionPrefixInvalidException``: If the ``prefix``
+                option contains an invalid combination of digits.
+            ``TypeError``: If ``key`` or ``cursor`` is not an integer.
+            ``ValueError``: If ``cursor`` is not between 0 and :attr:`size`.
+        """
+        if not isinstance(options, CpfGeneratorOptions):
+            options = CpfGeneratorOptions(options, format=format, prefix=prefix)
+
+        size = 10 ** (CPF_PREFIX_MAX_LENGTH - len(options.prefix))
+        self._format = options.format
+        self._base_offset = int(options.prefix or "0") * size
+        self._permutation = KeyedPermutation(size, key, rng)
+
+        if isinstance(cursor, bool) or not isinstance(cursor, int):
+            raise TypeError(
+                f"cursor must be an integer, got {cursor.__class__.__name__}"
+            )
+
+        if not 0 <= cursor <= size:
+            raise ValueError(f"cursor must be between 0 and {size}, got {cursor}")
+
+        self._cursor = cursor
+
+    @property
+    def key(self) -> int:
+        """Key of the permutation that orders the values."""
+        return self._permutation.key
+
+    @property
+    def cursor(self) -> int:
+        """Number of bases visited so far, including skipped ones."""
+        return self._cursor
+
+    @property
+    def size(self) -> int:
+        """Number of bases the options allow, an upper bound on the number
+        of values this sampler yields.
+        """
+        return self._permutation.size
+
+    def take(self, count: int) -> list[str]:
+        """Return the next ``count`` values, or fewer if the sampler runs
+        out of bases.
+
+        Completes the check digits of the whole batch with
+        :meth:`CpfCheckDigits.complete_many <cpf_dv.CpfCheckDigits.complete_many>`,
+        which is faster than taking the values one by one.
+
+        Raises:
+            ``ValueError``: If ``count`` is negative.
+        """
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+
+        base_offset = self._base_offset
+        size = self.size
+        taken_cpfs: list[str] = []
+
+        while len(taken_cpfs) < count and self._cursor < size:
+            stop = min(self._cursor + count - len(taken_cpfs), size)
+            cpf_numbers = [
+                (base_offset + base_index) * 100
+                for base_index in self._permutation.permute_range(self._cursor, stop)
+            ]
+            self._cursor = stop
+            completed_cpfs = CpfCheckDigits.complete_many(cpf_numbers)
+            taken_cpfs.extend(cpf for cpf in completed_cpfs if cpf is not None)
+
+        if self._format:
+            return [_format_cpf(cpf) for cpf in taken_cpfs]
+
+        return taken_cpfs
+
+    def __iter__(self) -> CpfUniqueSampler:
+        return self
+
+    def __next__(self) -> str:
+        while self._cursor < self.size:
+            base = self._base_offset + self._permutation.permute(self._cursor)
+            self._cursor += 1
+            status, check_digits = CpfCheckDigits.classify(base * 100)
+
+            if status is CpfCheckDigitsStatus.OK:
+                cpf = f"{base:09d}{check_digits}"
+
+                return _format_cpf(cpf) if self._format else cpf
+
+        raise StopIteration
+
+
+__all__ = ["CpfGenerator", "CpfUniqueSampler"]
@@ -71,6 +71,8 @@ class CpfGeneratorOptions:
                 option contains an invalid combination of digits.
         """
         self._options: dict[str, Any] = {}
+        # Bumped by every setter; see the ``version`` property.
+        self._version = 0
 
         if isinstance(options, CpfGeneratorOptions):
             self.format = options.format
@@ -100,6 +102,16 @@ class CpfGeneratorOptions:
 
         return MappingProxyType(snapshot)  # type: ignore[return-value]
 
+    @property
+    def version(self) -> int:
+        """Return a counter that grows every time an option is set.
+
+        Two reads that return the same number saw the same options, which
+        lets caches built on top of this instance tell when to drop their
+        entries.
+        """
+        return self._version
+
     @property
     def format(self) -> bool:
         """Return whether the generated CPF will use standard formatting.
@@ -121,6 +133,7 @@ class CpfGeneratorOptions:
         )
 
         self._options["format"] = actual_format
+        self._version += 1
 
     @property
     def prefix(self) -> str:
@@ -162,6 +175,7 @@ class CpfGeneratorOptions:
         self._validate_prefix_non_repeated_digits(actual_prefix)
 
         self._options["prefix"] = actual_prefix
+        self._version += 1
 
     def set(self, options: CpfGeneratorOptionsInput) -> CpfGeneratorOptions:
         """Update multiple options at once, preserving omitted fields.
@@ -18,18 +18,22 @@ Dropped cases:
   canonical behavior per ``AGENTS.md`` §8 #6).
 """
 
+import random
 import re
 from collections.abc import Callable
+from itertools import islice
 from typing import Any
 from unittest.mock import patch
 
 import pytest
+from cpf_dv import CpfCheckDigits
 from cpf_gen import (
     CpfGenerator,
     CpfGeneratorOptionPrefixInvalidException,
     CpfGeneratorOptions,
     CpfGeneratorOptionsTypeError,
 )
+from lacus.utils import generate_random_sequences
 
 GenerateFn = Callable[..., str]
 GeneratorFactory = Callable[[dict[str, Any]], GenerateFn]
@@ -351,8 +355,215 @@ def describe_cpf_generator():
                     assert len(result) == 14
                     assert result.startswith("111.222.333-")
                     assert mock_sequence.call_count == 2
-                    mock_sequence.assert_any_call(6, "numeric")
+                    mock_sequence.assert_any_call(6, "numeric", None)
                     assert mock_sequence.call_args_list == [
-                        ((6, "numeric"),),
-                        ((6, "numeric"),),
+                        ((6, "numeric", None),),
+                        ((6, "numeric", None),),
                     ]
+
+    def describe_per_call_options_resolution():
+        def it_reuses_the_options_resolved_for_repeated_overrides():
+            generator = CpfGenerator()
+
+            with patch.object(
+                CpfGeneratorOptions,
+                "set",
+                autospec=True,
+                side_effect=CpfGeneratorOptions.set,
+            ) as set_spy:
+                generator.generate(prefix="12")
+                merges_after_first_call = set_spy.call_count
+
+                for _ in range(3):
+                    assert generator.generate(prefix="12").startswith("12")
+
+            assert set_spy.call_count == merges_after_first_call
+
+        def it_resolves_again_after_the_default_options_change():
+            generator = CpfGenerator()
+
+            assert len(generator.generate(prefix="12")) == 11
+
+            generator.options.format = True
+
+            assert len(generator.generate(prefix="12")) == 14
+
+        def it_still_raises_for_invalid_overrides_after_valid_ones():
+            generator = CpfGenerator()
+
+            generator.generate(prefix="12")
+
+            with pytest.raises(CpfGeneratorOptionsTypeError):
+                generator.generate(prefix=12)
+
+    def describe_generate_many_method():
+        def it_returns_the_requested_number_of_valid_cpfs():
+            results = CpfGenerator().generate_many(500)
+
+            assert len(results) == 500
+            assert len(set(results)) >= 495
+
+            for result in results:
+                assert re.fullmatch(r"\d{11}", result)
+                assert CpfCheckDigits(result[:9]).cpf == result
+
+        def it_returns_an_empty_list_for_zero():
+            assert CpfGenerator().generate_many(0) == []
+
+        def it_raises_value_error_for_a_negative_count():
+            with pytest.raises(ValueError, match="count must be non-negative"):
+                CpfGenerator().generate_many(-1)
+
+        def it_applies_the_per_call_options():
+            results = CpfGenerator().generate_many(
+                50, {"prefix": "123456"}, format=True
+            )
+
+            for result in results:
+                assert re.fullmatch(r"123\.456\.\d{3}-\d{2}", result)
+
+        def it_uses_the_default_options():
+            generator = CpfGenerator(prefix="123456789")
+
+            assert generator.generate_many(3) == [generator.generate()] * 3
+
+        def it_replaces_ineligible_random_values():
+            with patch(
+                "cpf_gen.cpf_generator.generate_random_sequences",
+            ) as mock_sequences:
+                mock_sequences.side_effect = [
+                    ["111", "222", "111"],
+                    ["333", "111"],
+                    ["444"],
+                ]
+
+                results = CpfGenerator(prefix="111111").generate_many(3)
+
+            assert [result[:9] for result in results] == [
+                "111111222",
+                "111111333",
+                "111111444",
+            ]
+            assert mock_sequences.call_args_list == [
+                ((3, 3, "numeric", None),),
+                ((2, 3, "numeric", None),),
+                ((1, 3, "numeric", None),),
+            ]
+
+        def it_still_raises_for_invalid_options():
+            with pytest.raises(CpfGeneratorOptionsTypeError):
+                CpfGenerator().generate_many(1, prefix=12)
+
+    def describe_iter_generate_method():
+        def it_yields_valid_cpfs_lazily():
+            with patch(
+                "cpf_gen.cpf_generator.generate_random_sequences",
+                wraps=generate_random_sequences,
+            ) as mock_sequences:
+                results = list(islice(CpfGenerator().iter_generate(format=True), 2_000))
+
+            assert len(results) == 2_000
+            assert mock_sequences.call_count == 2
+
+            for result in results:
+                raw = re.sub(r"[.-]", "", result)
+
+                assert CpfCheckDigits(raw[:9]).cpf == raw
+
+        def it_resolves_the_options_when_called():
+            with pytest.raises(CpfGeneratorOptionPrefixInvalidException):
+                CpfGenerator().iter_generate(prefix="999999999")
+
+        def it_keeps_the_options_resolved_when_called():
+            generator = CpfGenerator()
+            results = generator.iter_generate(prefix="123")
+
+            generator.options.prefix = "456"
+
+            assert all(result.startswith("123") for result in islice(results, 10))
+
+    def describe_iter_all_method():
+        def it_yields_every_valid_cpf_under_the_prefix_in_order():
+            results = list(CpfGenerator().iter_all(prefix="1234567"))
+            expected = [
+                CpfCheckDigits(f"1234567{suffix:02d}").cpf for suffix in range(100)
+            ]
+
+            assert results == expected
+
+        def it_skips_repeated_digits():
+            results = list(CpfGenerator().iter_all(prefix="1111111"))
+
+            assert len(results) == 99
+            assert not any(result.startswith("111111111") for result in results)
+
+        def it_yields_the_single_cpf_of_a_full_prefix():
+            assert list(CpfGenerator().iter_all(prefix="123456789")) == ["12345678909"]
+
+        def it_applies_the_format_option():
+            results = list(CpfGenerator(format=True).iter_all(prefix="12345"))
+
+            assert len(results) == 10_000
+            assert results[:2] == ["123.450.000-07", "123.450.001-98"]
+
+            for result in results:
+                raw = re.sub(r"[.-]", "", result)
+
+                assert re.fullmatch(r"123\.45\d\.\d{3}-\d{2}", result)
+                assert CpfCheckDigits(raw[:9]).cpf == raw
+
+        def it_starts_from_the_smallest_cpf_without_a_prefix():
+            assert list(islice(CpfGenerator().iter_all(), 3)) == [
+                "00000000191",
+                "00000000272",
+                "00000000353",
+            ]
+
+        def it_resolves_the_options_when_called():
+            with pytest.raises(CpfGeneratorOptionPrefixInvalidException):
+                CpfGenerator().iter_all(prefix="999999999")
+
+        def it_keeps_the_options_resolved_when_called():
+            generator = CpfGenerator()
+            results = generator.iter_all(prefix="123")
+
+            generator.options.prefix = "456"
+
+            assert all(result.startswith("123") for result in islice(results, 10))
+
+    def describe_rng():
+        def it_uses_secrets_by_default():
+            assert CpfGenerator().rng is None
+
+        def it_exposes_the_given_rng():
+            rng = random.Random(7)
+
+            assert CpfGenerator(rng=rng).rng is rng
+
+        def it_reproduces_the_values_of_a_seeded_random():
+            first = CpfGenerator(format=True, rng=random.Random(7))
+            second = CpfGenerator(format=True, rng=random.Random(7))
+
+            assert [first.generate() for _ in range(20)] == [
+                second.generate() for _ in range(20)
+            ]
+            assert first.generate_many(100) == second.generate_many(100)
+            assert list(islice(first.iter_generate(), 100)) == list(
+                islice(second.iter_generate(), 100)
+            )
+
+        def it_generates_valid_values_with_a_seeded_random():
+            for result in CpfGenerator(rng=random.Random(7)).generate_many(200):
+                assert CpfCheckDigits(result[:9]).cpf == result
+
+        def it_reproduces_the_values_of_a_seeded_numpy_generator():
+            np = pytest.importorskip("numpy")
+
+            first = CpfGenerator(rng=np.random.default_rng(7)).generate_many(100)
+            second = CpfGenerator(rng=np.random.default_rng(7)).generate_many(100)
+
+            assert first == second
+
+        def it_raises_type_error_for_an_unsupported_rng():
+            with pytest.raises(TypeError, match="rng must be"):
+                CpfGenerator(rng=42).generate()
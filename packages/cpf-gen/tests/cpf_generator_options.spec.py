@@ -262,3 +262,15 @@ def describe_cpf_generator_options():
 
             assert isinstance(snapshot["format"], bool)
             assert isinstance(snapshot["prefix"], str)
+
+    def describe_version_getter():
+        def it_grows_whenever_an_option_is_set():
+            options = CpfGeneratorOptions()
+            versions = [options.version]
+
+            options.format = True
+            versions.append(options.version)
+            options.set({"prefix": "12"})
+            versions.append(options.version)
+
+            assert versions == sorted(set(versions))
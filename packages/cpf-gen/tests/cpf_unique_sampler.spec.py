@@ -0,0 +1,142 @@
+import random
+import re
+from itertools import islice
+
+import pytest
+from cpf_dv import CpfCheckDigits
+from cpf_gen import (
+    CpfGenerator,
+    CpfGeneratorOptionPrefixInvalidException,
+    CpfGeneratorOptions,
+    CpfUniqueSampler,
+)
+
+
+def describe_cpf_unique_sampler():
+    def describe_when_created():
+        def it_counts_the_bases_allowed_by_the_options():
+            assert CpfUniqueSampler(key=1).size == 10**9
+            assert CpfUniqueSampler(prefix="1234567", key=1).size == 100
+            assert CpfUniqueSampler(prefix="123456789", key=1).size == 1
+
+        def it_accepts_an_options_instance():
+            options = CpfGeneratorOptions(prefix="1234567")
+
+            assert CpfUniqueSampler(options, key=1).size == 100
+
+        def it_exposes_the_key_and_cursor():
+            sampler = CpfUniqueSampler(key=42, cursor=7)
+
+            assert (sampler.key, sampler.cursor) == (42, 7)
+
+        def it_draws_the_key_from_the_given_rng():
+            first = CpfUniqueSampler(rng=random.Random(7))
+            second = CpfUniqueSampler(rng=random.Random(7))
+
+            assert first.key == second.key
+
+        def it_raises_for_invalid_options():
+            with pytest.raises(CpfGeneratorOptionPrefixInvalidException):
+                CpfUniqueSampler(prefix="000000000")
+
+        @pytest.mark.parametrize("cursor", [-1, 101])
+        def it_rejects_a_cursor_out_of_range(cursor):
+            with pytest.raises(ValueError, match="cursor must be between 0 and 100"):
+                CpfUniqueSampler(prefix="1234567", cursor=cursor)
+
+        @pytest.mark.parametrize("cursor", [1.5, "3", True, None])
+        def it_rejects_a_non_integer_cursor(cursor):
+            with pytest.raises(TypeError, match="cursor must be an integer"):
+                CpfUniqueSampler(cursor=cursor)
+
+        def it_rejects_a_non_integer_key():
+            with pytest.raises(TypeError, match="key must be an integer"):
+                CpfUniqueSampler(key="1")
+
+    def describe_take():
+        def it_returns_distinct_valid_cpfs():
+            results = CpfUniqueSampler(key=3).take(2_000)
+
+            assert len(set(results)) == 2_000
+
+            for result in results:
+                assert re.fullmatch(r"\d{11}", result)
+                assert CpfCheckDigits(result[:9]).cpf == result
+
+        def it_applies_the_options():
+            results = CpfUniqueSampler(prefix="1234", format=True, key=3).take(100)
+
+            for result in results:
+                assert re.fullmatch(r"123\.4\d{2}\.\d{3}-\d{2}", result)
+
+        def it_visits_every_base_once_and_skips_ineligible_ones():
+            sampler = CpfUniqueSampler(prefix="1111111", key=3)
+            results = sampler.take(1_000)
+
+            assert sorted(result[:9] for result in results) == [
+                f"1111111{suffix:02d}" for suffix in range(100) if suffix != 11
+            ]
+            assert sampler.cursor == sampler.size == 100
+            assert sampler.take(10) == []
+
+        def it_keeps_the_leading_zeros():
+            results = CpfUniqueSampler(prefix="0", key=3).take(100)
+
+            assert all(
+                len(result) == 11 and result.startswith("0") for result in results
+            )
+
+        def it_returns_an_empty_list_for_zero():
+            assert CpfUniqueSampler(key=3).take(0) == []
+
+        def it_raises_value_error_for_a_negative_count():
+            with pytest.raises(ValueError, match="count must be non-negative"):
+                CpfUniqueSampler(key=3).take(-1)
+
+        def it_follows_the_order_of_the_key():
+            first = CpfUniqueSampler(key=5).take(100)
+
+            assert CpfUniqueSampler(key=5).take(100) == first
+            assert CpfUniqueSampler(key=6).take(100) != first
+
+    def describe_iteration():
+        def it_yields_the_same_values_as_take():
+            sampler = CpfUniqueSampler(prefix="12345", format=True, key=9)
+
+            assert list(islice(sampler, 300)) == CpfUniqueSampler(
+                prefix="12345", format=True, key=9
+            ).take(300)
+            assert sampler.cursor == 300
+
+        def it_stops_when_every_base_was_visited():
+            results = list(CpfUniqueSampler(prefix="1111111", key=9))
+
+            assert len(results) == len(set(results)) == 99
+
+    def describe_resuming():
+        def it_continues_from_the_saved_key_and_cursor():
+            sampler = CpfUniqueSampler(key=11)
+            first = sampler.take(500)
+            resumed = CpfUniqueSampler(key=sampler.key, cursor=sampler.cursor)
+
+            assert first + resumed.take(500) == CpfUniqueSampler(key=11).take(1_000)
+
+    def describe_generator_sample_unique_method():
+        def it_resolves_the_generator_options():
+            generator = CpfGenerator(prefix="1234567")
+            sampler = generator.sample_unique(format=True, key=3)
+
+            generator.options.prefix = "98"
+
+            assert sampler.size == 100
+            assert all(
+                re.fullmatch(r"123\.456\.7\d{2}-\d{2}", result)
+                for result in sampler.take(10)
+            )
+
+        def it_draws_the_key_from_the_generator_rng():
+            first = CpfGenerator(rng=random.Random(7)).sample_unique()
+            second = CpfGenerator(rng=random.Random(7)).sample_unique()
+
+            assert first.key == second.key
+            assert first.take(50) == second.take(50)
@@ -12,6 +12,7 @@ from cpf_fmt import (
     CpfFormatterOptions,
     CpfFormatterOptionsForbiddenKeyCharacterException,
     CpfFormatterOptionsHiddenRangeInvalidException,
+    CpfFormatterOptionsTemplateInvalidException,
     CpfFormatterOptionsTypeError,
     CpfFormatterTypeError,
     cpf_fmt,
@@ -43,6 +44,7 @@ __all__ = [
     "CpfFormatterOptions",
     "CpfFormatterOptionsForbiddenKeyCharacterException",
     "CpfFormatterOptionsHiddenRangeInvalidException",
+    "CpfFormatterOptionsTemplateInvalidException",
     "CpfFormatterOptionsTypeError",
     "CpfFormatterTypeError",
     "CpfGenerator",
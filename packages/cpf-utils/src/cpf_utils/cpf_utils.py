@@ -55,6 +55,8 @@ class CpfUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CpfFormatterOptionsForbiddenKeyCharacterException``: If any
                 formatter key option contains a disallowed character.
+            ``CpfFormatterOptionsTemplateInvalidException``: If the formatter
+                ``template`` does not have exactly 11 ``#`` slots.
             ``CpfGeneratorOptionsTypeError``: If generator options have an
                 invalid type.
             ``CpfGeneratorOptionPrefixInvalidException``: If generator
@@ -133,6 +135,8 @@ class CpfUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CpfFormatterOptionsForbiddenKeyCharacterException``: If any key
                 option contains a disallowed character.
+            ``CpfFormatterOptionsTemplateInvalidException``: If ``template``
+                does not have exactly 11 ``#`` slots.
         """
         self._formatter = self._resolve_formatter(value)
 
@@ -198,6 +202,7 @@ class CpfUtils:
         hidden_end: int | None = None,
         dot_key: str | None = None,
         dash_key: str | None = None,
+        template: str | None = None,
         escape: bool | None = None,
         encode: bool | None = None,
         on_fail: Any | None = None,
@@ -215,6 +220,8 @@ class CpfUtils:
 
         When valid, the result may be further transformed according to options:
 
+        - If ``template`` is set, the characters fill its ``#`` slots instead
+          of the mask built from ``dot_key`` and ``dash_key``.
         - If ``hidden`` is ``True``, characters between ``hidden_start`` and
           ``hidden_end`` (inclusive) are replaced with ``hidden_key``.
         - If ``escape`` is ``True``, HTML special characters are escaped.
@@ -232,6 +239,8 @@ class CpfUtils:
                 ``hidden_start`` or ``hidden_end`` are out of valid range.
             ``CpfFormatterOptionsForbiddenKeyCharacterException``: If any key
                 option contains a disallowed character.
+            ``CpfFormatterOptionsTemplateInvalidException``: If ``template``
+                does not have exactly 11 ``#`` slots.
         """
         format_kwargs = _format_forward_kwargs(
             hidden=hidden,
@@ -240,6 +249,7 @@ class CpfUtils:
             hidden_end=hidden_end,
             dot_key=dot_key,
             dash_key=dash_key,
+            template=template,
             escape=escape,
             encode=encode,
             on_fail=on_fail,
@@ -302,8 +312,8 @@ class CpfUtils:
         Delegates to the instance validator.
 
         Raises:
-            ``CpfValidatorInputTypeError``: If the input is not a string or
-                sequence of strings.
+            ``CpfValidatorInputTypeError``: If the input is not a string,
+                integer or sequence of strings.
         """
         return self._validator.is_valid(cpf_input)
 
@@ -316,6 +326,7 @@ def _format_forward_kwargs(
     hidden_end: int | None,
     dot_key: str | None,
     dash_key: str | None,
+    template: str | None,
     escape: bool | None,
     encode: bool | None,
     on_fail: Any | None,
@@ -340,6 +351,9 @@ def _format_forward_kwargs(
     if dash_key is not None:
         result["dash_key"] = dash_key
 
+    if template is not None:
+        result["template"] = template
+
     if escape is not None:
         result["escape"] = escape
 
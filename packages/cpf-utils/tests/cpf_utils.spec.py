@@ -40,6 +40,7 @@ from cpf_fmt import (
     CpfFormatterOptions,
     CpfFormatterOptionsForbiddenKeyCharacterException,
     CpfFormatterOptionsHiddenRangeInvalidException,
+    CpfFormatterOptionsTemplateInvalidException,
     CpfFormatterOptionsTypeError,
 )
 from cpf_gen import (
@@ -550,6 +551,18 @@ def describe_cpf_utils():
 
             assert "#" in result
 
+        def it_forwards_the_template_option():
+            utils = CpfUtils()
+
+            assert (
+                utils.format("05449651910", template="###-###-###-##")
+                == "054-496-519-10"
+            )
+
+        def it_throws_template_invalid_exception_for_a_template_without_11_slots():
+            with pytest.raises(CpfFormatterOptionsTemplateInvalidException):
+                CpfUtils().format("05449651910", template="###.###")
+
         def describe_format_contexts():
             @pytest.mark.parametrize("format_cpf", FORMAT_FACTORIES)
             def it_matches_cpf_formatter_format_behavior(format_cpf: FormatFn):
@@ -1013,7 +1026,7 @@ def describe_cpf_utils():
                 utils = CpfUtils()
 
                 with pytest.raises(CpfValidatorInputTypeError):
-                    utils.is_valid(123)
+                    utils.is_valid(12.3)
 
             def it_rejects_abc():
                 utils = CpfUtils()
@@ -71,6 +71,7 @@ def describe_the_cpf_utils_package_api():
                 "CpfFormatterInputLengthException",
                 "CpfFormatterOptionsHiddenRangeInvalidException",
                 "CpfFormatterOptionsForbiddenKeyCharacterException",
+                "CpfFormatterOptionsTemplateInvalidException",
                 "cpf_gen",
                 "CpfGenerator",
                 "CpfGeneratorOptions",
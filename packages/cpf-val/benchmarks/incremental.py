@@ -0,0 +1,60 @@
+"""Benchmark ``CpfIncrementalValidator`` against re-validating the whole
+field on every keystroke.
+
+Run from the package root with ``python benchmarks/incremental.py``. Feeds the
+same CPFs one character at a time and prints the per-character cost of
+pushing into an incremental validator and of calling ``CpfValidator.is_valid``
+on the text received so far.
+"""
+
+import random
+import timeit
+
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfIncrementalValidator, CpfValidator
+
+_SAMPLE_SIZE = 2_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+
+    return [
+        CpfCheckDigits(f"{rng.randrange(10**9):09d}").cpf for _ in range(_SAMPLE_SIZE)
+    ]
+
+
+def _push_each_character(cpfs: list[str]) -> None:
+    validator = CpfIncrementalValidator()
+
+    for cpf in cpfs:
+        validator.reset()
+
+        for char in cpf:
+            validator.push(char)
+            validator.is_valid  # noqa: B018
+
+
+def _revalidate_each_character(cpfs: list[str]) -> None:
+    validator = CpfValidator()
+
+    for cpf in cpfs:
+        for end in range(1, len(cpf) + 1):
+            validator.is_valid(cpf[:end])
+
+
+def main() -> None:
+    cpfs = _sample_cpfs()
+    chars = sum(len(cpf) for cpf in cpfs)
+
+    for label, run in (
+        ("incremental", _push_each_character),
+        ("revalidate", _revalidate_each_character),
+    ):
+        best = min(timeit.repeat(lambda run=run: run(cpfs), number=1, repeat=_REPEAT))
+        print(f"{label:>11}: {best / chars * 1e9:8.1f} ns/char")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark ``CpfValidator.inspect`` against ``is_valid``.
+
+Run from the package root with ``python benchmarks/inspect.py``. Prints the
+per-item cost of validating the same mix of valid and invalid CPFs with
+``is_valid``, with ``inspect`` and with the batch ``inspect_many``.
+"""
+
+import random
+import timeit
+
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfValidator
+
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+    cpfs = CpfCheckDigits.complete_many(
+        rng.randrange(10**9) for _ in range(_SAMPLE_SIZE)
+    )
+
+    return [
+        f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9]}{rng.choice('0123456789')}" for c in cpfs if c
+    ]
+
+
+def main() -> None:
+    validator = CpfValidator()
+    cpfs = _sample_cpfs()
+
+    for label, path in (
+        ("is_valid", lambda: [validator.is_valid(cpf) for cpf in cpfs]),
+        ("inspect", lambda: [validator.inspect(cpf) for cpf in cpfs]),
+        ("inspect_many", lambda: validator.inspect_many(cpfs)),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+        print(f"{label:>12}: {best / len(cpfs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark ``CpfValidator.is_valid_array`` against per-item ``is_valid``.
+
+Run from the package root with ``python benchmarks/is_valid_array.py``
+(requires the ``numpy`` extra). Prints the per-row cost of validating the
+same formatted CPFs one ``is_valid`` call at a time and as a single NumPy
+``U14`` array.
+"""
+
+import random
+import timeit
+
+import numpy as np
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfValidator
+
+_SAMPLE_SIZE = 200_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+    cpfs = CpfCheckDigits.complete_many(
+        rng.randrange(10**9) for _ in range(_SAMPLE_SIZE)
+    )
+
+    return [f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}" for c in cpfs if c]
+
+
+def main() -> None:
+    validator = CpfValidator()
+    cpfs = _sample_cpfs()
+    array = np.array(cpfs, dtype="U14")
+
+    for label, path in (
+        ("is_valid", lambda: [validator.is_valid(cpf) for cpf in cpfs]),
+        ("is_valid_array", lambda: validator.is_valid_array(array)),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+        print(f"{label:>14}: {best / len(cpfs) * 1e9:8.1f} ns/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark ``CpfValidator.is_valid`` on integer CPFs.
+
+Run from the package root with ``python benchmarks/is_valid_int.py``. Prints
+the per-item cost of validating CPFs stored as integers by zero-padding them
+into strings first and by passing the integers directly.
+"""
+
+import random
+import timeit
+
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfValidator
+
+_SAMPLE_SIZE = 10_000
+_REPEAT = 5
+
+
+def _sample_cpfs() -> list[int]:
+    rng = random.Random(0)
+    bases = [rng.randrange(1, 10**9) * 100 for _ in range(_SAMPLE_SIZE)]
+
+    return [int(cpf) for cpf in CpfCheckDigits.complete_many(bases) if cpf is not None]
+
+
+def main() -> None:
+    cpfs = _sample_cpfs()
+    validator = CpfValidator()
+
+    for label, path in (
+        (
+            "zfill string",
+            lambda: [validator.is_valid(str(cpf).zfill(11)) for cpf in cpfs],
+        ),
+        ("integer", lambda: [validator.is_valid(cpf) for cpf in cpfs]),
+        ("is_valid_many", lambda: validator.is_valid_many(cpfs)),
+    ):
+        best = min(timeit.repeat(path, number=1, repeat=_REPEAT))
+        print(f"{label:>14}: {best / len(cpfs) * 1e9:8.1f} ns/item")
+
+
+if __name__ == "__main__":
+    main()
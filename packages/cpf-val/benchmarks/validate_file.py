@@ -0,0 +1,75 @@
+"""Benchmark ``CpfValidator.validate_file`` throughput.
+
+Run from the package root with ``python benchmarks/validate_file.py``.
+Writes a temporary file of formatted CPFs, one per line, and a CSV with the
+CPF in its second column, and prints how many MB/s ``validate_file`` scans
+in each layout.
+"""
+
+import os
+import random
+import tempfile
+import timeit
+
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfValidator
+
+_SAMPLE_SIZE = 500_000
+_REPEAT = 3
+
+
+def _sample_cpfs() -> list[str]:
+    rng = random.Random(0)
+    cpfs = CpfCheckDigits.complete_many(
+        rng.randrange(10**9) * 100 for _ in range(_SAMPLE_SIZE)
+    )
+
+    return [f"{c[:3]}.{c[3:6]}.{c[6:9]}-{c[9:]}" for c in cpfs if c]
+
+
+def _write_file(directory: str, name: str, lines: list[str]) -> str:
+    path = os.path.join(directory, name)
+
+    with open(path, "w", encoding="ascii") as file:
+        file.write("\n".join(lines))
+        file.write("\n")
+
+    return path
+
+
+def main() -> None:
+    validator = CpfValidator()
+    cpfs = _sample_cpfs()
+
+    with tempfile.TemporaryDirectory() as directory:
+        layouts = (
+            ("one per line", _write_file(directory, "cpfs.txt", cpfs), {}),
+            (
+                "csv column",
+                _write_file(
+                    directory,
+                    "cpfs.csv",
+                    [f"{i},{cpf},Person {i}" for i, cpf in enumerate(cpfs)],
+                ),
+                {"column": 1},
+            ),
+        )
+
+        for label, path, kwargs in layouts:
+            size_mb = os.path.getsize(path) / 1e6
+            best = min(
+                timeit.repeat(
+                    lambda path=path, kwargs=kwargs: validator.validate_file(
+                        path, **kwargs
+                    ).finish(),
+                    number=1,
+                    repeat=_REPEAT,
+                )
+            )
+            print(
+                f"{label:>12}: {size_mb / best:7.1f} MB/s ({len(cpfs) / best:,.0f} lines/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
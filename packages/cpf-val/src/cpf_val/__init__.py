@@ -1,5 +1,8 @@
+from .cpf_file_report import CpfFileReport
+from .cpf_incremental_validator import CpfIncrementalValidator
+from .cpf_inspection import CpfInspection
 from .cpf_val import cpf_val
-from .cpf_validator import CPF_LENGTH, CpfValidator
+from .cpf_validator import CPF_LENGTH, CpfValidator, CpfValidatorReason
 from .exceptions import (
     CpfValidatorException,
     CpfValidatorInputTypeError,
@@ -9,10 +12,14 @@ from .types import CpfInput
 
 __all__ = [
     "CPF_LENGTH",
+    "CpfFileReport",
+    "CpfIncrementalValidator",
     "CpfInput",
+    "CpfInspection",
     "CpfValidator",
     "CpfValidatorException",
     "CpfValidatorInputTypeError",
+    "CpfValidatorReason",
     "CpfValidatorTypeError",
     "cpf_val",
 ]
@@ -0,0 +1,29 @@
+"""Line-by-line outcome of validating a file of CPF values."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lacus.utils import FileReport
+
+if TYPE_CHECKING:
+    from .cpf_validator import CpfValidatorReason  # noqa: F401
+
+
+class CpfFileReport(FileReport["CpfValidatorReason"]):
+    """Outcome of :meth:`CpfValidator.validate_file
+    <cpf_val.CpfValidator.validate_file>`, filled in while it is iterated.
+
+    Iterating yields ``(line_number, reason)`` for each invalid line, with
+    1-based line numbers and a :class:`~cpf_val.CpfValidatorReason`. The
+    counts cover the lines scanned so far and are final once the iteration
+    is exhausted (see :meth:`finish`). The scan is the one of
+    :class:`lacus.utils.FileReport`: the file is opened on the first
+    iteration, memory use does not grow with its size, and it is closed when
+    the scan ends or when :meth:`close` is called.
+    """
+
+    __slots__ = ()
+
+
+__all__ = ["CpfFileReport"]
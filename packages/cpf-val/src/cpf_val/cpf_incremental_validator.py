@@ -0,0 +1,124 @@
+"""Incremental validator for CPF (Cadastro de Pessoa Física) identifiers fed
+one character at a time."""
+
+from __future__ import annotations
+
+from cpf_dv import (
+    CPF_CHECK_DIGIT_BY_REMAINDER,
+    CPF_FIRST_WEIGHTS,
+    CPF_SECOND_DIGIT_WEIGHT,
+    CPF_SECOND_WEIGHTS,
+)
+
+from .cpf_validator import CPF_LENGTH
+from .exceptions import CpfValidatorInputTypeError
+
+_DIGIT_CHARS = frozenset("0123456789")
+_DELTA_FACTOR = ord("0")
+_CPF_BASE_LAST_INDEX = 8
+_CPF_CHECK_DIGITS_INDEX = 9
+
+
+class CpfIncrementalValidator:
+    """Validator for a CPF fed one character at a time, as by a streaming
+    parser or keystroke events.
+
+    Digits are taken and every other character is skipped, as
+    :meth:`CpfValidator.is_valid <cpf_val.CpfValidator.is_valid>` sanitizes
+    them, and both weighted sums of the check digits grow as they arrive, so
+    nothing is re-scanned. The CPF is rejected the moment a digit makes it
+    ineligible: 9 repeated digits, a wrong check digit or a 12th digit. Call
+    :meth:`reset` to reuse the validator for the next field.
+    """
+
+    __slots__ = (
+        "_count",
+        "_first_digit",
+        "_first_sum",
+        "_rejected",
+        "_repeated",
+        "_second_sum",
+    )
+
+    def __init__(self) -> None:
+        """Create a new, empty incremental validator."""
+        self.reset()
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether the digits taken so far are a valid CPF."""
+        return self._count == CPF_LENGTH and not self._rejected
+
+    @property
+    def is_rejected(self) -> bool:
+        """Return whether no further digits can make the CPF valid."""
+        return self._rejected
+
+    def push(self, chars: str) -> bool:
+        """Feed ``chars`` to the validator and return whether the CPF can
+        still be valid.
+
+        Usually gets one character at a time, but any chunk of the input
+        works. Characters fed after the CPF is rejected are ignored.
+
+        Raises:
+            ``CpfValidatorInputTypeError``: If ``chars`` is not a string.
+        """
+        if not isinstance(chars, str):
+            raise CpfValidatorInputTypeError(chars, "string")
+
+        if self._rejected:
+            return False
+
+        for char in chars:
+            if char not in _DIGIT_CHARS:
+                continue
+
+            if not self._take(char):
+                self._rejected = True
+
+                return False
+
+        return True
+
+    def reset(self) -> None:
+        """Forget the digits taken so far, to validate the next CPF."""
+        self._count = 0
+        self._first_sum = 0
+        self._second_sum = 0
+        self._first_digit = ""
+        self._repeated = False
+        self._rejected = False
+
+    def _take(self, digit: str) -> bool:
+        """Take one digit, returning whether the CPF can still be valid."""
+        index = self._count
+
+        if index >= CPF_LENGTH:
+            return False
+
+        self._count = index + 1
+        value = ord(digit) - _DELTA_FACTOR
+
+        if index < _CPF_CHECK_DIGITS_INDEX:
+            self._first_sum += value * CPF_FIRST_WEIGHTS[index]
+            self._second_sum += value * CPF_SECOND_WEIGHTS[index]
+
+            if index == 0:
+                self._first_digit = digit
+                self._repeated = True
+            else:
+                self._repeated = self._repeated and digit == self._first_digit
+
+            return not (index == _CPF_BASE_LAST_INDEX and self._repeated)
+
+        if index == _CPF_CHECK_DIGITS_INDEX:
+            first_digit = CPF_CHECK_DIGIT_BY_REMAINDER[self._first_sum % 11]
+            self._second_sum += first_digit * CPF_SECOND_DIGIT_WEIGHT
+
+            return value == first_digit
+
+        return value == CPF_CHECK_DIGIT_BY_REMAINDER[self._second_sum % 11]
+
+
+__all__ = ["CpfIncrementalValidator"]
@@ -0,0 +1,74 @@
+"""Detailed outcome of validating a single CPF."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cpf_validator import CpfValidatorReason
+
+
+class CpfInspection:
+    """Outcome of :meth:`CpfValidator.inspect
+    <cpf_val.CpfValidator.inspect>`: why the CPF is valid or not, the
+    value that was checked and the check digits it should have.
+    """
+
+    __slots__ = ("_expected_check_digits", "_reason", "_sanitized")
+
+    def __init__(
+        self,
+        reason: CpfValidatorReason,
+        sanitized: str,
+        expected_check_digits: str | None,
+    ) -> None:
+        self._reason = reason
+        self._sanitized = sanitized
+        self._expected_check_digits = expected_check_digits
+
+    @property
+    def reason(self) -> CpfValidatorReason:
+        """Return why the CPF is rejected, or ``VALID``."""
+        return self._reason
+
+    @property
+    def sanitized(self) -> str:
+        """Return the input stripped of its non-digit characters (an integer
+        input is zero-padded to 11 digits when in range).
+        """
+        return self._sanitized
+
+    @property
+    def expected_check_digits(self) -> str | None:
+        """Return the check digits calculated from the first 9 digits, or
+        ``None`` when the sanitized value is not an eligible CPF base (wrong
+        length or repeated digits).
+        """
+        return self._expected_check_digits
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether the CPF is valid."""
+        return not self._reason
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CpfInspection):
+            return NotImplemented
+
+        return (self._reason, self._sanitized, self._expected_check_digits) == (
+            other._reason,
+            other._sanitized,
+            other._expected_check_digits,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._reason, self._sanitized, self._expected_check_digits))
+
+    def __repr__(self) -> str:
+        return (
+            f"CpfInspection(reason={self._reason.name}, sanitized={self._sanitized!r}, "
+            f"expected_check_digits={self._expected_check_digits!r})"
+        )
+
+
+__all__ = ["CpfInspection"]
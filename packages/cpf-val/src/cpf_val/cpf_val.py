@@ -17,8 +17,8 @@ def cpf_val(cpf_input: CpfInput) -> bool:
     valid Brazilian CPF.
 
     Raises:
-        ``CpfValidatorInputTypeError``: If the input is not a string or
-            sequence of strings.
+        ``CpfValidatorInputTypeError``: If the input is not a string,
+            integer or sequence of strings.
 
     See Also:
         :class:`CpfValidator` for the detailed validation contract.
@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 from collections.abc import Sequence
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any
 
-from cpf_dv import CpfCheckDigits
+from cpf_dv import CpfCheckDigits, CpfCheckDigitsStatus
+from lacus.utils import LruCache
 
+from .cpf_file_report import CpfFileReport
+from .cpf_inspection import CpfInspection
 from .exceptions import CpfValidatorInputTypeError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+    from types import ModuleType
+
+    import numpy as np
+
     from .types import CpfInput
 
 CPF_LENGTH = 11
@@ -19,7 +30,108 @@ digits).
 """
 
 
+class CpfValidatorReason(IntEnum):
+    """Why a CPF is rejected by :class:`CpfValidator`, or ``VALID`` when it
+    is not. ``VALID`` is the only falsy member.
+    """
+
+    VALID = 0
+    """The CPF is valid."""
+
+    INVALID_LENGTH = 1
+    """The sanitized CPF does not have 11 digits."""
+
+    REPEATED_DIGITS = 2
+    """The first 9 digits are all the same."""
+
+    CHECK_DIGITS_MISMATCH = 3
+    """The check digits differ from the calculated ones."""
+
+
 _NON_DIGIT_PATTERN = re.compile(r"[^0-9]")
+_NON_DIGIT_BYTES = bytes(code for code in range(256) if not 0x30 <= code <= 0x39)
+_BYTES_INPUT_TYPES = (bytes, bytearray, memoryview)
+_CACHEABLE_INPUT_TYPES = (str, int, bytes)
+_EXPECTED_INPUT_TYPE = "string, integer, bytes or string[]"
+_EXPECTED_ARRAY_TYPE = "string or bytes array"
+_INT_CPF_LIMIT = 10**CPF_LENGTH
+_CHECK_DIGITS_MODULUS = 100
+_CHECK_DIGITS_BY_NUMBER = tuple(
+    f"{number:02d}" for number in range(_CHECK_DIGITS_MODULUS)
+)
+_CHECK_DIGITS_BY_BYTES = {digits.encode(): digits for digits in _CHECK_DIGITS_BY_NUMBER}
+_CPF_BASE_LENGTH = 9
+_ARRAY_CHUNK_SIZE = 1 << 16
+_REASON_BY_STATUS = {
+    CpfCheckDigitsStatus.INVALID_LENGTH: CpfValidatorReason.INVALID_LENGTH,
+    CpfCheckDigitsStatus.REPEATED_DIGITS: CpfValidatorReason.REPEATED_DIGITS,
+}
+
+
+def _inspect_sanitized(
+    sanitized_cpf: str | bytes,
+) -> tuple[CpfValidatorReason, str | None]:
+    """Return why a CPF stripped of its non-digit characters is rejected (or
+    ``VALID``), with its expected check digits when its first 9 digits are an
+    eligible base.
+    """
+    if len(sanitized_cpf) != CPF_LENGTH:
+        return CpfValidatorReason.INVALID_LENGTH, None
+
+    status, check_digits = CpfCheckDigits.classify(sanitized_cpf)
+
+    if status is not CpfCheckDigitsStatus.OK:
+        return _REASON_BY_STATUS[status], None
+
+    actual_check_digits = sanitized_cpf[_CPF_BASE_LENGTH:]
+
+    if isinstance(actual_check_digits, bytes):
+        actual_check_digits = _CHECK_DIGITS_BY_BYTES[actual_check_digits]
+
+    if actual_check_digits != check_digits:
+        return CpfValidatorReason.CHECK_DIGITS_MISMATCH, check_digits
+
+    return CpfValidatorReason.VALID, check_digits
+
+
+def _import_numpy() -> ModuleType:
+    """Import NumPy for the array API, pointing to the optional extra when it
+    is not installed.
+    """
+    try:
+        import numpy
+    except ModuleNotFoundError as error:
+        raise ModuleNotFoundError(
+            'NumPy is required for array input. Install it with "pip install cpf-val[numpy]".'
+        ) from error
+
+    return numpy
+
+
+def _is_valid_char_codes(np: ModuleType, char_codes: np.ndarray) -> np.ndarray:
+    """Validate a matrix of character codes, one CPF per row.
+
+    Mirrors :meth:`CpfValidator.is_valid`: digits are compacted to the left of
+    each row through their running count, rows that do not keep exactly 11
+    digits are rejected, and the check digits come from
+    :meth:`CpfCheckDigits.calculate_array`.
+    """
+    keep = (char_codes >= ord("0")) & (char_codes <= ord("9"))
+    positions = np.cumsum(keep, axis=1) - 1
+    rows, columns = np.nonzero(keep & (positions < CPF_LENGTH))
+    sanitized = np.zeros((len(char_codes), CPF_LENGTH), np.uint8)
+    sanitized[rows, positions[rows, columns]] = char_codes[rows, columns]
+
+    check_digits, eligible = CpfCheckDigits.calculate_array(
+        sanitized[:, :_CPF_BASE_LENGTH]
+    )
+    actual_digits = sanitized[:, _CPF_BASE_LENGTH:].astype(np.int16) - ord("0")
+
+    return (
+        (keep.sum(axis=1) == CPF_LENGTH)
+        & eligible
+        & (actual_digits == check_digits).all(axis=1)
+    )
 
 
 class CpfValidator:
@@ -29,6 +141,27 @@ class CpfValidator:
     algorithm.
     """
 
+    def __init__(self, *, cache_size: int | None = None) -> None:
+        """Create a new :class:`CpfValidator`.
+
+        A positive ``cache_size`` enables an LRU cache of up to that many
+        :meth:`is_valid` results, keyed by the raw ``str``, ``int`` or
+        ``bytes`` input (see :attr:`cache`).
+        """
+        self._cache: LruCache[str | int | bytes, bool] | None = (
+            LruCache(cache_size) if cache_size else None
+        )
+
+    @property
+    def cache(self) -> LruCache[str | int | bytes, bool] | None:
+        """Return the :meth:`is_valid` cache enabled by ``cache_size``, or
+        ``None``.
+
+        Its ``hits``, ``misses`` and ``evictions`` counters show how well it
+        serves the traffic.
+        """
+        return self._cache
+
     def is_valid(self, cpf_input: CpfInput) -> bool:
         """Validate a CPF input.
 
@@ -38,29 +171,235 @@ class CpfValidator:
         computed via the standard modulo-11 algorithm. Invalid values return
         ``False`` instead of raising.
 
+        An ``int`` is read as the full 11-digit CPF with leading zeros implied
+        (e.g. ``5449651910`` for ``054.496.519-10``), as stored in ``BIGINT``
+        columns, and is checked arithmetically without building a string.
+        ``bytes``, ``bytearray`` and ``memoryview`` inputs are sanitized with
+        ``bytes.translate`` and checked on their byte values, without decoding.
+
+        Raises:
+            ``CpfValidatorInputTypeError``: If the input is not a string,
+                integer, bytes-like object or sequence of strings.
+        """
+        cache = self._cache
+
+        if cache is None or cpf_input.__class__ not in _CACHEABLE_INPUT_TYPES:
+            return self._is_valid(cpf_input)
+
+        result = cache.get(cpf_input)  # type: ignore[arg-type]
+
+        if result is None:
+            result = self._is_valid(cpf_input)
+            cache.put(cpf_input, result)  # type: ignore[arg-type]
+
+        return result
+
+    def is_valid_many(self, cpf_inputs: Iterable[CpfInput]) -> list[bool]:
+        """Validate many CPF inputs in a single call.
+
+        Returns one boolean per input, in input order, with the same result
+        :meth:`is_valid` gives for each item. Integer CPFs, such as the items
+        of an ``array("q")`` or a ``range``, take the arithmetic path.
+
+        Raises:
+            ``CpfValidatorInputTypeError``: If any input is not a string,
+                integer, bytes-like object or sequence of strings.
+        """
+        is_valid = self.is_valid
+
+        return [is_valid(cpf_input) for cpf_input in cpf_inputs]
+
+    def is_valid_array(self, cpf_array: np.ndarray) -> np.ndarray:
+        """Validate a NumPy array of CPF strings without per-row Python calls.
+
+        Accepts fixed-width unicode (e.g. ``U11``, ``U14``) or bytes (e.g.
+        ``S14``) arrays of any shape and returns a boolean array of the same
+        shape, with the result :meth:`is_valid` gives for each element. The
+        array is viewed as a matrix of character codes and sanitized,
+        length-checked and validated with vectorized operations, in chunks to
+        bound memory use.
+
+        Requires the ``numpy`` extra (``pip install cpf-val[numpy]``).
+
+        Raises:
+            ``CpfValidatorInputTypeError``: If the input is not a NumPy unicode
+                or bytes array.
+        """
+        np = _import_numpy()
+
+        if not (isinstance(cpf_array, np.ndarray) and cpf_array.dtype.kind in "US"):
+            raise CpfValidatorInputTypeError(cpf_array, _EXPECTED_ARRAY_TYPE)
+
+        flat_array = np.ascontiguousarray(cpf_array).reshape(-1)
+        results = np.zeros(len(flat_array), bool)
+
+        code_dtype = np.dtype(np.uint32 if flat_array.dtype.kind == "U" else np.uint8)
+        code_dtype = code_dtype.newbyteorder(flat_array.dtype.byteorder)
+        char_codes = flat_array.view(code_dtype).reshape(
+            len(flat_array), flat_array.dtype.itemsize // code_dtype.itemsize
+        )
+
+        for start in range(0, len(flat_array), _ARRAY_CHUNK_SIZE):
+            stop = start + _ARRAY_CHUNK_SIZE
+            results[start:stop] = _is_valid_char_codes(np, char_codes[start:stop])
+
+        return results.reshape(cpf_array.shape)
+
+    def inspect(self, cpf_input: CpfInput) -> CpfInspection:
+        """Validate a CPF input and report why it is rejected.
+
+        Returns a :class:`CpfInspection` with the :class:`CpfValidatorReason`
+        (``VALID`` exactly when :meth:`is_valid` returns ``True``), the
+        sanitized value and the expected check digits, all gathered in the
+        same pass that validates the input. An integer is zero-padded to 11
+        digits, or reports ``INVALID_LENGTH`` with its decimal representation
+        as the sanitized value when outside the 11-digit range.
+
+        Raises:
+            ``CpfValidatorInputTypeError``: If the input is not a string,
+                integer, bytes-like object or sequence of strings.
+        """
+        reason, sanitized_cpf, check_digits = self._inspect(cpf_input)
+
+        if isinstance(sanitized_cpf, bytes):
+            sanitized_cpf = sanitized_cpf.decode("ascii")
+
+        return CpfInspection(reason, sanitized_cpf, check_digits)
+
+    def inspect_many(
+        self, cpf_inputs: Iterable[CpfInput]
+    ) -> Counter[CpfValidatorReason]:
+        """Count the :class:`CpfValidatorReason` of many CPF inputs.
+
+        Each input gets the reason :meth:`inspect` reports for it; reasons
+        that never occur are absent from the returned
+        :class:`~collections.Counter` (and read as ``0``).
+
         Raises:
-            ``CpfValidatorInputTypeError``: If the input is not a string or
-                sequence of strings.
+            ``CpfValidatorInputTypeError``: If any input is not a string,
+                integer, bytes-like object or sequence of strings.
+        """
+        inspect = self._inspect
+
+        return Counter(inspect(cpf_input)[0] for cpf_input in cpf_inputs)
+
+    def validate_file(
+        self,
+        path: str | PathLike[str],
+        *,
+        column: int | None = None,
+        delimiter: str | bytes = ",",
+        header: bool = False,
+    ) -> CpfFileReport:
+        """Validate a file holding one CPF per line, or one column of a
+        delimited (e.g. CSV) file.
+
+        The file is memory-mapped and scanned in chunks of lines as bytes, so
+        memory use is bounded regardless of its size, even when its lines
+        are long. Each line (or its
+        ``column``-th field, zero-based, split on ``delimiter``) gets the
+        result :meth:`is_valid` gives for it; a line without that field
+        counts as an empty value. Blank lines, and the first line when
+        ``header`` is set, are skipped but keep their line numbers. Fields
+        are split on every ``delimiter``, so quoted fields must not contain
+        it.
+
+        The returned :class:`CpfFileReport` is scanned lazily: iterate it for
+        the ``(line_number, reason)`` of each invalid line, and read its
+        counts once it is exhausted (or after :meth:`CpfFileReport.finish`).
+        The file is only opened on the first iteration, so an ``OSError`` for
+        a file that cannot be opened is raised from there.
         """
+
+        def sanitize(field: bytes) -> bytes:
+            return field.translate(None, _NON_DIGIT_BYTES)
+
+        def reason_of(sanitized_field: bytes) -> CpfValidatorReason:
+            return _inspect_sanitized(sanitized_field)[0]
+
+        if isinstance(delimiter, str):
+            delimiter = delimiter.encode()
+
+        return CpfFileReport(path, column, delimiter, header, sanitize, reason_of)
+
+    def _is_valid(self, cpf_input: CpfInput) -> bool:
+        """Validate a CPF input, bypassing the cache."""
+        if isinstance(cpf_input, int) and not isinstance(cpf_input, bool):
+            return self._is_valid_int(cpf_input)
+
+        if isinstance(cpf_input, _BYTES_INPUT_TYPES):
+            return self._is_valid_bytes(cpf_input)
+
         actual_input = self._to_string_input(cpf_input)
         sanitized_cpf = _NON_DIGIT_PATTERN.sub("", actual_input)
 
         if len(sanitized_cpf) != CPF_LENGTH:
             return False
 
-        try:
-            cpf_check_digits = CpfCheckDigits(sanitized_cpf)
-        except Exception:
+        status, check_digits = CpfCheckDigits.classify(sanitized_cpf)
+
+        return status is CpfCheckDigitsStatus.OK and sanitized_cpf[9:] == check_digits
+
+    def _is_valid_int(self, cpf_number: int) -> bool:
+        """Validate a full CPF held as an integer, which ``CpfCheckDigits``
+        reads the same way, comparing its last 2 digits arithmetically.
+        """
+        status, check_digits = CpfCheckDigits.classify(cpf_number)
+
+        return (
+            status is CpfCheckDigitsStatus.OK
+            and check_digits
+            == _CHECK_DIGITS_BY_NUMBER[cpf_number % _CHECK_DIGITS_MODULUS]
+        )
+
+    def _is_valid_bytes(self, cpf_bytes: bytes | bytearray | memoryview) -> bool:
+        """Validate a full CPF held in a bytes-like object, stripping
+        non-digit bytes with ``bytes.translate``.
+        """
+        sanitized_cpf = bytes(cpf_bytes).translate(None, _NON_DIGIT_BYTES)
+
+        if len(sanitized_cpf) != CPF_LENGTH:
             return False
 
-        return sanitized_cpf == cpf_check_digits.cpf
+        status, check_digits = CpfCheckDigits.classify(sanitized_cpf)
+
+        return (
+            status is CpfCheckDigitsStatus.OK
+            and check_digits == _CHECK_DIGITS_BY_BYTES[sanitized_cpf[9:]]
+        )
+
+    def _inspect(
+        self, cpf_input: CpfInput
+    ) -> tuple[CpfValidatorReason, str | bytes, str | None]:
+        """Return the reason, sanitized value and expected check digits of a
+        CPF input, without decoding bytes-like input. An integer is
+        zero-padded to 11 digits, or reports ``INVALID_LENGTH`` with its
+        decimal representation when out of range.
+
+        Raises:
+            ``CpfValidatorInputTypeError``: If the input is not a string,
+                integer, bytes-like object or sequence of strings.
+        """
+        if isinstance(cpf_input, int) and not isinstance(cpf_input, bool):
+            if not 0 <= cpf_input < _INT_CPF_LIMIT:
+                return CpfValidatorReason.INVALID_LENGTH, str(cpf_input), None
+
+            sanitized_cpf: str | bytes = f"{cpf_input:011d}"
+        elif isinstance(cpf_input, _BYTES_INPUT_TYPES):
+            sanitized_cpf = bytes(cpf_input).translate(None, _NON_DIGIT_BYTES)
+        else:
+            sanitized_cpf = _NON_DIGIT_PATTERN.sub("", self._to_string_input(cpf_input))
+
+        reason, check_digits = _inspect_sanitized(sanitized_cpf)
+
+        return reason, sanitized_cpf, check_digits
 
     def _to_string_input(self, cpf_input: Any) -> str:
         """Normalize the input to a string.
 
         Raises:
-            ``CpfValidatorInputTypeError``: If the input is not a string or
-                sequence of strings.
+            ``CpfValidatorInputTypeError``: If the input is not a string,
+                integer, bytes-like object or sequence of strings.
         """
         if isinstance(cpf_input, str):
             return cpf_input
@@ -68,14 +407,11 @@ class CpfValidator:
         if isinstance(cpf_input, Sequence) and not isinstance(cpf_input, str):
             for item in cpf_input:
                 if not isinstance(item, str):
-                    raise CpfValidatorInputTypeError(
-                        cpf_input,
-                        "string or string[]",
-                    )
+                    raise CpfValidatorInputTypeError(cpf_input, _EXPECTED_INPUT_TYPE)
 
             return "".join(cpf_input)
 
-        raise CpfValidatorInputTypeError(cpf_input, "string or string[]")
+        raise CpfValidatorInputTypeError(cpf_input, _EXPECTED_INPUT_TYPE)
 
 
-__all__ = ["CPF_LENGTH", "CpfValidator"]
+__all__ = ["CPF_LENGTH", "CpfValidator", "CpfValidatorReason"]
@@ -5,12 +5,15 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import TypeAlias
 
-CpfInput: TypeAlias = str | Sequence[str]
+CpfInput: TypeAlias = str | int | bytes | bytearray | memoryview | Sequence[str]
 """Valid input types for CPF validation.
 
 A CPF may be given as:
 
 - A string of numeric characters (with or without formatting).
+- An integer holding the full 11-digit CPF, with leading zeros implied.
+- A ``bytes``, ``bytearray`` or ``memoryview`` with the same ASCII content as a
+  string.
 - A sequence of strings, each representing one or more numeric characters and/or
   punctuation.
 """
@@ -0,0 +1,116 @@
+"""Spec for :class:`cpf_val.CpfIncrementalValidator`.
+
+:meth:`CpfValidator.is_valid` is the reference: feeding an input one
+character at a time must end in the same verdict.
+"""
+
+import random
+
+import pytest
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfIncrementalValidator, CpfValidator, CpfValidatorInputTypeError
+
+_ALPHABET = "0123456789abc.- "
+
+
+def _sample_inputs() -> list[str]:
+    rng = random.Random(0)
+    inputs = ["", "05449651910", "054.496.519-10", "11111111111", "00000000000"]
+
+    for _ in range(300):
+        cpf = CpfCheckDigits(f"{rng.randrange(10**9):09d}").cpf
+        inputs.extend(
+            [
+                cpf,
+                f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}",
+                f"{cpf}0",
+                "".join(rng.choices(_ALPHABET, k=rng.choice([10, 11, 12, 14]))),
+            ]
+        )
+
+    return inputs
+
+
+SAMPLE_INPUTS = _sample_inputs()
+
+
+def describe_cpf_incremental_validator():
+    def describe_push_method():
+        def it_is_valid_once_the_last_check_digit_matches():
+            validator = CpfIncrementalValidator()
+
+            validator.push("0544965191")
+
+            assert not validator.is_valid
+            assert validator.push("0")
+            assert validator.is_valid
+
+        def it_skips_non_digit_characters():
+            validator = CpfIncrementalValidator()
+
+            assert validator.push("054.496.519-10 ab")
+            assert validator.is_valid
+
+        @pytest.mark.parametrize(
+            ("chars", "rejected_at"),
+            [
+                ("111111111", 9),
+                ("05449651920", 10),
+                ("05449651911", 11),
+                ("05449651910", None),
+                ("000000001", None),
+            ],
+        )
+        def it_rejects_the_cpf_as_soon_as_it_becomes_ineligible(chars, rejected_at):
+            validator = CpfIncrementalValidator()
+            verdicts = [validator.push(char) for char in chars]
+
+            expected_index = None if rejected_at is None else rejected_at - 1
+
+            assert (
+                next((i for i, ok in enumerate(verdicts) if not ok), None)
+                == expected_index
+            )
+
+        def it_rejects_a_12th_digit():
+            validator = CpfIncrementalValidator()
+            validator.push("05449651910")
+
+            assert not validator.push("1")
+            assert validator.is_rejected
+            assert not validator.is_valid
+
+        def it_ignores_characters_fed_after_the_rejection():
+            validator = CpfIncrementalValidator()
+            validator.push("111111111")
+
+            assert not validator.push("11")
+            assert not validator.is_valid
+
+        @pytest.mark.parametrize("value", [None, 1, b"1", ["1"]])
+        def it_raises_cpf_validator_input_type_error_for_non_strings(value):
+            with pytest.raises(CpfValidatorInputTypeError):
+                CpfIncrementalValidator().push(value)
+
+    def describe_reset_method():
+        def it_reuses_the_validator_for_the_next_field():
+            validator = CpfIncrementalValidator()
+            validator.push("111111111")
+
+            validator.reset()
+
+            assert not validator.is_rejected
+            assert validator.push("05449651910")
+            assert validator.is_valid
+
+    def it_matches_cpf_validator():
+        reference = CpfValidator()
+        validator = CpfIncrementalValidator()
+
+        for value in SAMPLE_INPUTS:
+            validator.reset()
+
+            for char in value:
+                validator.push(char)
+
+            assert validator.is_valid is reference.is_valid(value), value
@@ -29,9 +29,17 @@ Dropped cases:
 """
 
 import re
+from array import array
+from collections import Counter
 
 import pytest
-from cpf_val import CpfValidator, CpfValidatorInputTypeError
+from cpf_dv import CpfCheckDigits
+from cpf_val import (
+    CpfInspection,
+    CpfValidator,
+    CpfValidatorInputTypeError,
+    CpfValidatorReason,
+)
 
 REPEATED_DIGIT_PREFIXES = [
     "000000000",
@@ -146,7 +154,6 @@ SHORT_OR_LONG_NUMERIC_STRINGS = [
 
 INVALID_INPUT_CASES = [
     (None, "NoneType"),
-    (42, "integer number"),
     (3.14, "float number"),
     (True, "boolean"),
     ({}, "dict"),
@@ -154,7 +161,9 @@ INVALID_INPUT_CASES = [
 ]
 
 
-def _create_inputs_set(cpf: str) -> list[tuple[str, str | list[str]]]:
+def _create_inputs_set(
+    cpf: str,
+) -> list[tuple[str, str | bytes | memoryview | list[str]]]:
     unformatted_string = cpf
     formatted_string = re.sub(
         r"(\d{3})(\d{3})(\d{3})(\d+)",
@@ -171,6 +180,9 @@ def _create_inputs_set(cpf: str) -> list[tuple[str, str | list[str]]]:
         ("array", unformatted_array),
         ("formatted array", formatted_array),
         ("grouped array", grouped_array),
+        ("bytes", unformatted_string.encode()),
+        ("formatted bytes", formatted_string.encode()),
+        ("memoryview", memoryview(formatted_string.encode())),
     ]
 
 
@@ -272,6 +284,48 @@ def describe_cpf_validator():
 
                     assert validator.is_valid(input_value) is False
 
+        def describe_when_given_an_integer():
+            @pytest.mark.parametrize("cpf", VALID_CPF_SAMPLES)
+            def it_returns_true_for_valid_cpf_samples(cpf):
+                validator = CpfValidator()
+
+                assert validator.is_valid(int(re.sub(r"\D", "", cpf))) is True
+
+            def it_reads_leading_zeros_as_implied():
+                validator = CpfValidator()
+
+                assert validator.is_valid(5449651910) is True
+                assert validator.is_valid(5449651911) is False
+
+            def it_returns_false_for_every_wrong_check_digit_of_a_known_base():
+                validator = CpfValidator()
+
+                for index in range(100):
+                    assert validator.is_valid(177170876_00 + index) is (index == 0)
+
+            @pytest.mark.parametrize("prefix", REPEATED_DIGIT_PREFIXES)
+            def it_returns_false_for_a_cpf_with_all_digits_the_same(prefix):
+                validator = CpfValidator()
+
+                for index in range(100):
+                    assert validator.is_valid(int(prefix) * 100 + index) is False
+
+            @pytest.mark.parametrize("cpf", [-82911017366, 0, 42, 100_000_000_000])
+            def it_returns_false_for_out_of_range_or_repeated_integers(cpf):
+                validator = CpfValidator()
+
+                assert validator.is_valid(cpf) is False
+
+            @pytest.mark.parametrize("cpf", VALID_CPF_SAMPLES)
+            def it_reads_integers_like_cpf_check_digits(cpf):
+                validator = CpfValidator()
+                cpf_number = int(re.sub(r"\D", "", cpf))
+
+                assert CpfCheckDigits(cpf_number).cpf == f"{cpf_number:011d}"
+                assert validator.is_valid(cpf_number + 1) is (
+                    CpfCheckDigits(cpf_number + 1).cpf == f"{cpf_number + 1:011d}"
+                )
+
         def describe_when_given_a_non_digit_string():
             @pytest.mark.parametrize("cpf", NON_DIGIT_STRINGS)
             def it_returns_false_for_a_non_digit_string(cpf):
@@ -301,10 +355,176 @@ def describe_cpf_validator():
 
                 error = exc_info.value
 
-                assert error.expected_type == "string or string[]"
+                assert error.expected_type == "string, integer, bytes or string[]"
                 assert error.actual_input is input_value
                 assert error.actual_type == actual_type
                 assert (
                     str(error)
-                    == f"CPF input must be of type string or string[]. Got {actual_type}."
+                    == "CPF input must be of type string, integer, bytes or string[]. "
+                    f"Got {actual_type}."
                 )
+
+    def describe_is_valid_many_method():
+        def it_returns_the_is_valid_result_for_each_input_in_order():
+            validator = CpfValidator()
+            cpf_inputs = [
+                "829.110.173-66",
+                "82911017367",
+                82911017366,
+                ["829110173", "66"],
+                "1",
+            ]
+
+            assert validator.is_valid_many(cpf_inputs) == [
+                True,
+                False,
+                True,
+                True,
+                False,
+            ]
+
+        def it_accepts_integer_arrays_and_ranges():
+            validator = CpfValidator()
+
+            assert validator.is_valid_many(
+                array("q", [82911017366, 5449651910, 42])
+            ) == [
+                True,
+                True,
+                False,
+            ]
+            assert validator.is_valid_many(range(177170876_00, 177170876_03)) == [
+                True,
+                False,
+                False,
+            ]
+
+        def it_returns_an_empty_list_for_an_empty_iterable():
+            assert CpfValidator().is_valid_many([]) == []
+
+        @pytest.mark.parametrize(("input_value", "actual_type"), INVALID_INPUT_CASES)
+        def it_raises_cpf_validator_input_type_error(input_value, actual_type):
+            with pytest.raises(CpfValidatorInputTypeError) as exc_info:
+                CpfValidator().is_valid_many(["82911017366", input_value])
+
+            assert exc_info.value.actual_type == actual_type
+
+    def describe_inspect_method():
+        @pytest.mark.parametrize(
+            ("cpf_input", "reason", "sanitized", "expected_check_digits"),
+            [
+                ("054.496.519-10", CpfValidatorReason.VALID, "05449651910", "10"),
+                (5449651910, CpfValidatorReason.VALID, "05449651910", "10"),
+                (b"054.496.519-10", CpfValidatorReason.VALID, "05449651910", "10"),
+                (
+                    ["054", "496", "519", "11"],
+                    CpfValidatorReason.CHECK_DIGITS_MISMATCH,
+                    "05449651911",
+                    "10",
+                ),
+                (
+                    "054.496.519-1",
+                    CpfValidatorReason.INVALID_LENGTH,
+                    "0544965191",
+                    None,
+                ),
+                (-1234567890, CpfValidatorReason.INVALID_LENGTH, "-1234567890", None),
+                (
+                    "111.111.111-11",
+                    CpfValidatorReason.REPEATED_DIGITS,
+                    "11111111111",
+                    None,
+                ),
+            ],
+        )
+        def it_reports_the_reason_sanitized_value_and_expected_check_digits(
+            cpf_input, reason, sanitized, expected_check_digits
+        ):
+            inspection = CpfValidator().inspect(cpf_input)
+
+            assert isinstance(inspection, CpfInspection)
+            assert inspection.reason is reason
+            assert inspection.sanitized == sanitized
+            assert inspection.expected_check_digits == expected_check_digits
+            assert inspection.is_valid is (reason is CpfValidatorReason.VALID)
+
+        @pytest.mark.parametrize(
+            "cpf_input",
+            [
+                *VALID_CPF_SAMPLES,
+                *INVALID_CPF_SAMPLES,
+                *SHORT_OR_LONG_NUMERIC_STRINGS,
+                42,
+                -1,
+            ],
+        )
+        def it_agrees_with_is_valid(cpf_input):
+            validator = CpfValidator()
+
+            assert validator.inspect(cpf_input).is_valid is validator.is_valid(
+                cpf_input
+            )
+
+        @pytest.mark.parametrize(("input_value", "actual_type"), INVALID_INPUT_CASES)
+        def it_raises_cpf_validator_input_type_error(input_value, actual_type):
+            with pytest.raises(CpfValidatorInputTypeError) as exc_info:
+                CpfValidator().inspect(input_value)
+
+            assert exc_info.value.actual_type == actual_type
+
+    def describe_inspect_many_method():
+        def it_counts_the_reason_of_each_input():
+            validator = CpfValidator()
+
+            assert validator.inspect_many(
+                ["054.496.519-10", 5449651910, b"05449651911", "11111111111", "1"]
+            ) == Counter(
+                {
+                    CpfValidatorReason.VALID: 2,
+                    CpfValidatorReason.CHECK_DIGITS_MISMATCH: 1,
+                    CpfValidatorReason.REPEATED_DIGITS: 1,
+                    CpfValidatorReason.INVALID_LENGTH: 1,
+                }
+            )
+
+        def it_returns_an_empty_counter_for_an_empty_iterable():
+            assert CpfValidator().inspect_many([]) == Counter()
+
+    def describe_cache():
+        def it_is_disabled_by_default():
+            assert CpfValidator().cache is None
+
+        def it_caches_results_by_raw_input():
+            validator = CpfValidator(cache_size=8)
+
+            assert validator.is_valid("054.496.519-10") is True
+            assert validator.is_valid("054.496.519-10") is True
+            assert validator.is_valid(5449651910) is True
+            assert validator.is_valid(b"05449651911") is False
+            assert validator.is_valid(b"05449651911") is False
+
+            cache = validator.cache
+            assert (cache.hits, cache.misses, len(cache)) == (2, 3, 3)
+
+        def it_evicts_the_least_recently_used_input():
+            validator = CpfValidator(cache_size=2)
+
+            validator.is_valid("05449651910")
+            validator.is_valid("82911017366")
+            validator.is_valid("05449651910")
+            validator.is_valid("11111111111")
+
+            assert "82911017366" not in validator.cache
+            assert "05449651910" in validator.cache
+            assert validator.cache.evictions == 1
+
+        def it_skips_inputs_that_are_not_hashable():
+            validator = CpfValidator(cache_size=8)
+
+            assert validator.is_valid(["054.496.519", "-10"]) is True
+            assert validator.is_valid(bytearray(b"05449651910")) is True
+            assert len(validator.cache) == 0
+
+        def it_still_raises_for_an_invalid_input_type():
+            with pytest.raises(CpfValidatorInputTypeError):
+                CpfValidator(cache_size=8).is_valid(1.5)
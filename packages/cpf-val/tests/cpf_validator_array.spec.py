@@ -0,0 +1,84 @@
+"""Spec for :meth:`cpf_val.CpfValidator.is_valid_array`.
+
+:meth:`CpfValidator.is_valid` is the reference: every element of the array
+must get the same result it gets on its own. Skipped when the optional
+``numpy`` extra is not installed.
+"""
+
+import random
+
+import pytest
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfValidator, CpfValidatorInputTypeError
+
+np = pytest.importorskip("numpy")
+
+
+def _sample_inputs() -> list[str]:
+    rng = random.Random(0)
+    cpfs = CpfCheckDigits.complete_many(rng.randrange(10**9) for _ in range(500))
+    inputs = [
+        "",
+        "00000000000",
+        "11111111111",
+        "1234567890",
+        "123456789012",
+        "054.496.519-10 ",
+        "054 496 519 10 x",
+        "0544965191\u0660",
+        "054496519\uff110",
+    ]
+
+    for cpf in cpfs:
+        if cpf is None:
+            continue
+
+        formatted = f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}"
+        inputs.extend([cpf, formatted, f"{cpf[:-1]}{(int(cpf[-1]) + 1) % 10}"])
+
+    return inputs
+
+
+SAMPLE_INPUTS = _sample_inputs()
+
+
+def describe_is_valid_array_method():
+    @pytest.mark.parametrize("dtype", ["U", "S"])
+    def it_matches_is_valid_for_every_element(dtype):
+        validator = CpfValidator()
+        inputs = [value for value in SAMPLE_INPUTS if dtype == "U" or value.isascii()]
+        array = np.array(inputs).astype(dtype)
+
+        assert validator.is_valid_array(array).tolist() == [
+            validator.is_valid(value) for value in inputs
+        ]
+
+    def it_keeps_the_shape_of_the_input_array():
+        array = np.array([["054.496.519-10", "05449651911"]] * 3)
+
+        result = CpfValidator().is_valid_array(array)
+
+        assert result.dtype == np.bool_
+        assert result.shape == (3, 2)
+        assert result.tolist() == [[True, False]] * 3
+
+    def it_accepts_non_contiguous_and_big_endian_arrays():
+        array = np.array(["05449651910", "x", "829.110.173-66"], dtype=">U14")
+
+        assert CpfValidator().is_valid_array(array[::2]).tolist() == [True, True]
+
+    def it_returns_an_empty_mask_for_an_empty_array():
+        assert CpfValidator().is_valid_array(np.array([], dtype="U11")).tolist() == []
+
+    @pytest.mark.parametrize(
+        "cpf_array",
+        [
+            "05449651910",
+            ["05449651910"],
+            np.array([5449651910]),
+            np.array(["05449651910"], dtype=object),
+        ],
+    )
+    def it_raises_cpf_validator_input_type_error(cpf_array):
+        with pytest.raises(CpfValidatorInputTypeError):
+            CpfValidator().is_valid_array(cpf_array)
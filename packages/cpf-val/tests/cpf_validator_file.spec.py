@@ -0,0 +1,153 @@
+"""Spec for :meth:`cpf_val.CpfValidator.validate_file` and
+:class:`cpf_val.CpfFileReport`.
+
+:meth:`CpfValidator.is_valid` is the reference: a line is reported invalid
+exactly when ``is_valid`` rejects its value.
+"""
+
+import random
+
+import pytest
+from cpf_dv import CpfCheckDigits
+from cpf_val import CpfFileReport, CpfValidator, CpfValidatorReason
+from lacus.utils import file_report as file_report_module
+
+VALID_LINES = ["054.496.519-10", "05449651910"]
+
+INVALID_LINES = [
+    ("05449651911", CpfValidatorReason.CHECK_DIGITS_MISMATCH),
+    ("0544965191", CpfValidatorReason.INVALID_LENGTH),
+    ("054.496.519-100", CpfValidatorReason.INVALID_LENGTH),
+    ("111.111.111-11", CpfValidatorReason.REPEATED_DIGITS),
+]
+
+
+def _write(tmp_path, content: bytes):
+    path = tmp_path / "cpfs.txt"
+    path.write_bytes(content)
+
+    return path
+
+
+def describe_validate_file_method():
+    def describe_when_given_one_cpf_per_line():
+        def it_reports_the_line_number_and_reason_of_each_invalid_line(tmp_path):
+            lines = [
+                VALID_LINES[0],
+                *(line for line, _ in INVALID_LINES),
+                VALID_LINES[1],
+            ]
+            path = _write(tmp_path, "\n".join(lines).encode())
+
+            report = CpfValidator().validate_file(path)
+
+            assert isinstance(report, CpfFileReport)
+            assert list(report) == [
+                (index, reason)
+                for index, (_, reason) in enumerate(INVALID_LINES, start=2)
+            ]
+            assert (report.total, report.valid, report.invalid) == (6, 2, 4)
+
+        def it_matches_is_valid_for_every_line(tmp_path):
+            rng = random.Random(0)
+            cpfs = CpfCheckDigits.complete_many(
+                rng.randrange(10**9) for _ in range(300)
+            )
+            lines = []
+
+            for cpf in filter(None, cpfs):
+                lines.extend([cpf, f"{cpf[:-1]}{(int(cpf[-1]) + 1) % 10}"])
+
+            path = _write(tmp_path, "\n".join(lines).encode() + b"\n")
+            validator = CpfValidator()
+
+            invalid_line_numbers = [
+                line_number for line_number, _ in validator.validate_file(path)
+            ]
+
+            assert invalid_line_numbers == [
+                index
+                for index, line in enumerate(lines, start=1)
+                if not validator.is_valid(line)
+            ]
+
+        def it_skips_blank_lines_and_keeps_their_line_numbers(tmp_path):
+            path = _write(tmp_path, b"\n05449651911\r\n  \n\n05449651910\n\n")
+
+            report = CpfValidator().validate_file(path)
+
+            assert list(report) == [(2, CpfValidatorReason.CHECK_DIGITS_MISMATCH)]
+            assert report.total == 2
+
+        def it_validates_lines_across_chunk_boundaries(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 5)
+            path = _write(tmp_path, b"05449651910\n05449651911\n82911017366")
+
+            report = CpfValidator().validate_file(path)
+
+            assert list(report) == [(2, CpfValidatorReason.CHECK_DIGITS_MISMATCH)]
+            assert (report.total, report.valid) == (3, 2)
+
+        def it_validates_lines_longer_than_a_chunk_like_is_valid(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 8)
+            lines = [
+                "054.496.519" + " " * 30 + "-10",
+                "x" * 40 + "05449651910",
+                "1" * 40,
+            ]
+            path = _write(tmp_path, "\n".join(lines).encode())
+            validator = CpfValidator()
+
+            assert [
+                line_number for line_number, _ in validator.validate_file(path)
+            ] == [
+                index
+                for index, line in enumerate(lines, start=1)
+                if not validator.is_valid(line)
+            ]
+
+        def it_reports_no_lines_for_an_empty_file(tmp_path):
+            report = CpfValidator().validate_file(_write(tmp_path, b"")).finish()
+
+            assert (report.total, report.valid, report.invalid) == (0, 0, 0)
+
+    def describe_when_given_a_column():
+        def it_validates_that_field_of_each_line(tmp_path):
+            path = _write(
+                tmp_path, b"name;cpf\na;054.496.519-10\nb;05449651\nc;82911017366"
+            )
+
+            report = CpfValidator().validate_file(
+                path, column=1, delimiter=";", header=True
+            )
+
+            assert list(report) == [(3, CpfValidatorReason.INVALID_LENGTH)]
+            assert (report.total, report.valid, report.invalid) == (3, 2, 1)
+
+        def it_treats_a_missing_field_as_an_empty_value(tmp_path):
+            path = _write(tmp_path, b"a,05449651910\nb\n")
+
+            report = CpfValidator().validate_file(path, column=1)
+
+            assert list(report) == [(2, CpfValidatorReason.INVALID_LENGTH)]
+
+    def describe_the_report():
+        def it_closes_the_file_once_exhausted(tmp_path):
+            report = CpfValidator().validate_file(_write(tmp_path, b"05449651910\n"))
+
+            assert report.closed is False
+            assert report.finish() is report
+            assert report.closed is True
+
+        def it_closes_the_file_when_leaving_a_with_block(tmp_path):
+            with CpfValidator().validate_file(_write(tmp_path, b"x\ny\n")) as report:
+                assert next(report) == (1, CpfValidatorReason.INVALID_LENGTH)
+
+            assert report.closed is True
+            assert list(report) == []
+
+        def it_raises_on_iteration_when_the_file_does_not_exist(tmp_path):
+            report = CpfValidator().validate_file(tmp_path / "missing.txt")
+
+            with pytest.raises(FileNotFoundError):
+                next(report)
@@ -33,6 +33,10 @@ def describe_the_cpf_val_package_api():
             expected_names = {
                 "cpf_val",
                 "CpfValidator",
+                "CpfValidatorReason",
+                "CpfFileReport",
+                "CpfInspection",
+                "CpfIncrementalValidator",
                 "CpfValidatorTypeError",
                 "CpfValidatorInputTypeError",
                 "CpfValidatorException",
@@ -0,0 +1,59 @@
+"""Benchmark ``generate_random_sequence`` and ``generate_random_sequences``
+against drawing each character with ``secrets.choice``.
+
+Run from the package root with ``python benchmarks/generate_random_sequence.py``.
+Prints the cost of generating 12-character alphanumeric sequences (the size
+of a CNPJ base) one ``secrets.choice`` call per character, one
+``generate_random_sequence`` call per sequence, and in a single
+``generate_random_sequences`` batch, with the default CSPRNG and with a seeded
+``random.Random``.
+"""
+
+import random
+import secrets
+import timeit
+
+from lacus.utils import generate_random_sequence, generate_random_sequences
+
+_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_COUNT = 10_000
+_SIZE = 12
+_REPEAT = 5
+
+
+def main() -> None:
+    rng = random.Random(0)
+
+    for label, run in (
+        (
+            "secrets.choice",
+            lambda: [
+                "".join(secrets.choice(_CHARS) for _ in range(_SIZE))
+                for _ in range(_COUNT)
+            ],
+        ),
+        (
+            "per sequence",
+            lambda: [
+                generate_random_sequence(_SIZE, "alphanumeric") for _ in range(_COUNT)
+            ],
+        ),
+        ("batch", lambda: generate_random_sequences(_COUNT, _SIZE, "alphanumeric")),
+        (
+            "seeded sequence",
+            lambda: [
+                generate_random_sequence(_SIZE, "alphanumeric", rng)
+                for _ in range(_COUNT)
+            ],
+        ),
+        (
+            "seeded batch",
+            lambda: generate_random_sequences(_COUNT, _SIZE, "alphanumeric", rng),
+        ),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=_REPEAT))
+        print(f"{label:>15}: {best / _COUNT * 1e9:8.1f} ns/sequence")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,22 @@
 from .describe_type import describe_type
-from .generate_random_sequence import generate_random_sequence
-from .types import SequenceType
+from .file_report import FileReport
+from .generate_random_sequence import (
+    generate_random_sequence,
+    generate_random_sequences,
+)
+from .keyed_permutation import KeyedPermutation
+from .lru_cache import LruCache
+from .types import RandomSource, SequenceType
 
 __all__ = [
+    "FileReport",
+    "KeyedPermutation",
+    "LruCache",
+    "RandomSource",
     "SequenceType",
     "describe_type",
     "generate_random_sequence",
+    "generate_random_sequences",
 ]
 
 __version__ = "0.0.0"
@@ -0,0 +1,268 @@
+"""Lazy, line-by-line validation report over a memory-mapped file."""
+
+from __future__ import annotations
+
+import mmap
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from os import PathLike
+    from types import TracebackType
+
+_R = TypeVar("_R")
+_ReportT = TypeVar("_ReportT", bound="FileReport")
+
+_CHUNK_SIZE = 1 << 20
+_MAX_SANITIZED_SIZE = 1 << 20
+
+
+def _sanitize_long_field(
+    data: mmap.mmap,
+    start: int,
+    stop: int,
+    column: int | None,
+    delimiter: bytes,
+    sanitize: Callable[[bytes], bytes],
+) -> bytes | None:
+    """Sanitize the field of a line longer than a chunk piece by piece, or
+    return ``None`` when the line is blank.
+
+    The line is searched in place, and at most :data:`_MAX_SANITIZED_SIZE`
+    sanitized bytes are kept, so memory use stays bounded however long the
+    line is.
+    """
+    pieces = range(start, stop, _CHUNK_SIZE)
+
+    if all(data[piece : min(piece + _CHUNK_SIZE, stop)].isspace() for piece in pieces):
+        return None
+
+    if column is not None:
+        for _ in range(column):
+            field_start = data.find(delimiter, start, stop)
+
+            if field_start < 0:
+                return sanitize(b"")
+
+            start = field_start + len(delimiter)
+
+        field_stop = data.find(delimiter, start, stop)
+        stop = stop if field_stop < 0 else field_stop
+
+    sanitized = b""
+
+    for piece in range(start, stop, _CHUNK_SIZE):
+        sanitized += sanitize(data[piece : min(piece + _CHUNK_SIZE, stop)])
+
+        if len(sanitized) > _MAX_SANITIZED_SIZE:
+            return sanitized[:_MAX_SANITIZED_SIZE]
+
+    return sanitized
+
+
+def _iter_fields(
+    data: bytes | mmap.mmap,
+    column: int | None,
+    delimiter: bytes,
+    header: bool,
+    sanitize: Callable[[bytes], bytes],
+) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(line_number, sanitized_field)`` for every non-blank line of
+    ``data``.
+
+    Lines are split in chunks of at most :data:`_CHUNK_SIZE` bytes cut at a
+    line break, so only one chunk is held in memory at a time. A line longer
+    than a chunk is handled by :func:`_sanitize_long_field`. A line that
+    lacks ``column`` yields an empty field.
+    """
+    size = len(data)
+    start = 0
+    line_number = 0
+
+    while start < size:
+        stop = min(start + _CHUNK_SIZE, size)
+
+        if stop < size:
+            line_break = data.rfind(b"\n", start, stop)
+
+            if line_break < 0:
+                line_number += 1
+                line_break = data.find(b"\n", start)
+                stop = size if line_break < 0 else line_break
+
+                if not (header and line_number == 1):
+                    field = _sanitize_long_field(
+                        data, start, stop, column, delimiter, sanitize
+                    )
+
+                    if field is not None:
+                        yield line_number, field
+
+                start = stop + 1
+                continue
+
+            stop = line_break + 1
+
+        lines = data[start:stop].split(b"\n")
+
+        if lines[-1] == b"":
+            lines.pop()
+
+        for line in lines:
+            line_number += 1
+
+            if header and line_number == 1:
+                continue
+
+            if not line or line.isspace():
+                continue
+
+            if column is None:
+                yield line_number, sanitize(line)
+            else:
+                fields = line.split(delimiter)
+
+                try:
+                    yield line_number, sanitize(fields[column])
+                except IndexError:
+                    yield line_number, sanitize(b"")
+
+        start = stop
+
+
+class FileReport(Generic[_R]):
+    """Outcome of validating a file with one value per line, or one column
+    of a delimited (e.g. CSV) file, filled in while it is iterated.
+
+    The file is only opened once the report is iterated, then memory-mapped
+    and scanned as bytes in chunks of lines, so memory use does not grow with
+    its size, not even for a file without line breaks. Each non-blank line
+    (or its ``column``-th field, zero-based, split on ``delimiter``) is
+    passed through ``sanitize`` and then ``reason_of``, and a truthy reason
+    marks the line invalid. ``sanitize`` must work byte by byte, as fields
+    longer than a chunk are sanitized piece by piece, and only their first
+    MiB of sanitized bytes is checked.
+
+    Iterating yields ``(line_number, reason)`` for each invalid line, with
+    1-based line numbers. The counts cover the lines scanned so far and are
+    final once the iteration is exhausted (see :meth:`finish`). The file is
+    closed when the scan ends, when :meth:`close` is called or when leaving
+    a ``with`` block.
+
+    Args:
+        path: Path of the file to scan.
+        column: Zero-based field to validate, or ``None`` for whole lines.
+        delimiter: Bytes the fields of a line are split on.
+        header: Whether to skip the first line.
+        sanitize: Reduces a raw field to the bytes ``reason_of`` checks.
+        reason_of: Returns why a sanitized field is invalid, or a falsy
+            reason when it is valid.
+    """
+
+    __slots__ = ("_closed", "_invalid", "_reasons", "_total", "_valid")
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        column: int | None,
+        delimiter: bytes,
+        header: bool,
+        sanitize: Callable[[bytes], bytes],
+        reason_of: Callable[[bytes], _R],
+    ) -> None:
+        self._total = 0
+        self._valid = 0
+        self._invalid = 0
+        self._closed = False
+        self._reasons = self._scan(path, column, delimiter, header, sanitize, reason_of)
+
+    @property
+    def total(self) -> int:
+        """Return the number of non-blank lines validated so far."""
+        return self._total
+
+    @property
+    def valid(self) -> int:
+        """Return the number of valid lines found so far."""
+        return self._valid
+
+    @property
+    def invalid(self) -> int:
+        """Return the number of invalid lines found so far."""
+        return self._invalid
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the scan has ended and the file is released."""
+        return self._closed
+
+    def finish(self: _ReportT) -> _ReportT:
+        """Scan the remaining lines, discarding their reasons, so the counts
+        are final, and return the report itself.
+        """
+        for _ in self:
+            pass
+
+        return self
+
+    def close(self) -> None:
+        """Stop the scan and release the file, if it was opened."""
+        self._reasons.close()
+        self._closed = True
+
+    def __iter__(self: _ReportT) -> _ReportT:
+        return self
+
+    def __next__(self) -> tuple[int, _R]:
+        try:
+            return next(self._reasons)
+        except StopIteration:
+            self.close()
+            raise
+
+    def __enter__(self: _ReportT) -> _ReportT:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _scan(
+        self,
+        path: str | PathLike[str],
+        column: int | None,
+        delimiter: bytes,
+        header: bool,
+        sanitize: Callable[[bytes], bytes],
+        reason_of: Callable[[bytes], _R],
+    ) -> Iterator[tuple[int, _R]]:
+        with open(path, "rb") as file:
+            try:
+                data: bytes | mmap.mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                data = b""
+
+            try:
+                for line_number, field in _iter_fields(
+                    data, column, delimiter, header, sanitize
+                ):
+                    self._total += 1
+                    reason = reason_of(field)
+
+                    if reason:
+                        self._invalid += 1
+                        yield line_number, reason
+                    else:
+                        self._valid += 1
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+
+
+__all__ = ["FileReport"]
@@ -1,19 +1,111 @@
+from __future__ import annotations
+
 import secrets
+from random import Random
+from typing import TYPE_CHECKING
+
+from .describe_type import describe_type
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-from .types import SequenceType
+    from .types import RandomSource, SequenceType
 
 _NUMERIC = "0123456789"
 _ALPHABETIC = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 _ALPHANUMERIC = _NUMERIC + _ALPHABETIC
+_BYTE_VALUES = 256
+_EXTRA_BYTES = 8
+
+
+def _build_sampling_table(chars: str) -> tuple[bytes, bytes, int]:
+    """Build the ``bytes.translate`` arguments that turn random bytes into
+    characters of ``chars`` without modulo bias.
+
+    Bytes below the largest multiple of ``len(chars)`` that fits in a byte
+    map to ``chars[byte % len(chars)]``, so every character gets the same
+    number of byte values; the remaining bytes are deleted (rejected).
+    Returns the translation table, the rejected bytes and how many byte
+    values are accepted.
+    """
+    accepted = _BYTE_VALUES - _BYTE_VALUES % len(chars)
+    table = bytes(ord(chars[value % len(chars)]) for value in range(accepted))
+    table += bytes(_BYTE_VALUES - accepted)
+
+    return table, bytes(range(accepted, _BYTE_VALUES)), accepted
+
+
+_SAMPLING_TABLES = {
+    "numeric": _build_sampling_table(_NUMERIC),
+    "alphabetic": _build_sampling_table(_ALPHABETIC),
+    "alphanumeric": _build_sampling_table(_ALPHANUMERIC),
+}
+
+
+def _token_bytes_function(rng: RandomSource) -> Callable[[int], bytes]:
+    """Return the function drawing ``n`` random bytes from ``rng``.
+
+    Raises:
+        TypeError: If ``rng`` is not a supported randomness source.
+    """
+    if rng is None:
+        return secrets.token_bytes
+
+    if isinstance(rng, Random):
+        return rng.randbytes
+
+    numpy_bytes = getattr(rng, "bytes", None)
+
+    if callable(numpy_bytes):
+        return numpy_bytes
+
+    raise TypeError(
+        f"rng must be a random.Random, a NumPy Generator or None, got {describe_type(rng)}"
+    )
+
+
+def _random_chars(
+    length: int, sequence_type: SequenceType, token_bytes: Callable[[int], bytes]
+) -> str:
+    """Return ``length`` random characters of ``sequence_type``, drawn from
+    as few ``token_bytes`` calls as possible.
+
+    Each draw asks for the expected number of bytes needed after rejection
+    plus a small margin, so a second draw is rarely required.
+    """
+    table, rejected, accepted = _SAMPLING_TABLES.get(
+        sequence_type, _SAMPLING_TABLES["alphanumeric"]
+    )
+    chunks: list[bytes] = []
+    missing = length
 
+    while missing > 0:
+        draw_size = -(-missing * _BYTE_VALUES // accepted) + _EXTRA_BYTES
+        chunk = token_bytes(draw_size).translate(table, rejected)
+        chunks.append(chunk)
+        missing -= len(chunk)
 
-def generate_random_sequence(size: int, sequence_type: SequenceType) -> str:
+    return b"".join(chunks)[:length].decode("ascii")
+
+
+def generate_random_sequence(
+    size: int, sequence_type: SequenceType, rng: RandomSource = None
+) -> str:
     """Generate a random character sequence of the given length and type.
 
+    Characters come from a single draw of random bytes (rarely two), mapped
+    to the character set with rejection sampling so that every character is
+    equally likely.
+
     Args:
         size: Length of the sequence.
         sequence_type: Character set to draw from. One of ``"numeric"`` (``0-9``),
             ``"alphabetic"`` (``A-Z``), or ``"alphanumeric"`` (``0-9A-Z``).
+        rng: Source of the random bytes. ``None`` (default) uses
+            ``secrets.token_bytes``, which is cryptographically secure. A
+            ``random.Random`` (through ``randbytes``) or a NumPy
+            ``Generator`` (through ``bytes``) seeded by the caller makes the
+            output reproducible and is faster, but not secure.
 
     Returns:
         A random string of the requested length using uppercase letters and/or
@@ -26,15 +118,58 @@ def generate_random_sequence(size: int, sequence_type: SequenceType) -> str:
         'AXQMZB'
         >>> generate_random_sequence(8, "alphanumeric")  # doctest: +SKIP
         '8ZFB2K09'
+        >>> generate_random_sequence(10, "numeric", random.Random(42))  # doctest: +SKIP
+        '7173798896'
+
+    Raises:
+        ValueError: If ``size`` is negative.
+        TypeError: If ``rng`` is not a supported randomness source.
     """
     if size < 0:
         raise ValueError(f"size must be non-negative, got {size}")
 
-    if sequence_type == "numeric":
-        chars = _NUMERIC
-    elif sequence_type == "alphabetic":
-        chars = _ALPHABETIC
-    else:
-        chars = _ALPHANUMERIC
+    return _random_chars(size, sequence_type, _token_bytes_function(rng))
+
+
+def generate_random_sequences(
+    count: int, size: int, sequence_type: SequenceType, rng: RandomSource = None
+) -> list[str]:
+    """Generate many random character sequences of the same length and type.
+
+    All ``count * size`` characters come from one entropy draw, as in
+    :func:`generate_random_sequence`, which makes generating many short
+    sequences (e.g. bases of identifiers) much cheaper than one call each.
+
+    Args:
+        count: Number of sequences.
+        size: Length of each sequence.
+        sequence_type: Character set to draw from, as in
+            :func:`generate_random_sequence`.
+        rng: Source of the random bytes, as in
+            :func:`generate_random_sequence`.
+
+    Returns:
+        A list of ``count`` random strings of length ``size``.
+
+    Examples:
+        >>> generate_random_sequences(3, 4, "numeric")  # doctest: +SKIP
+        ['0931', '7254', '4408']
+
+    Raises:
+        ValueError: If ``count`` or ``size`` is negative.
+        TypeError: If ``rng`` is not a supported randomness source.
+    """
+    if count < 0:
+        raise ValueError(f"count must be non-negative, got {count}")
+
+    if size < 0:
+        raise ValueError(f"size must be non-negative, got {size}")
+
+    token_bytes = _token_bytes_function(rng)
+
+    if size == 0:
+        return [""] * count
+
+    chars = _random_chars(count * size, sequence_type, token_bytes)
 
-    return "".join(secrets.choice(chars) for _ in range(size))
+    return [chars[start : start + size] for start in range(0, len(chars), size)]
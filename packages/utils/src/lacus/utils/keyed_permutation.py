@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .generate_random_sequence import _token_bytes_function
+
+if TYPE_CHECKING:
+    from .types import RandomSource
+
+_KEY_BYTES = 8
+_MAX_BITS = 64
+_MASK_64 = (1 << _MAX_BITS) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_MIX_MULTIPLIER_1 = 0xBF58476D1CE4E5B9
+_MIX_MULTIPLIER_2 = 0x94D049BB133111EB
+_STAGE_MULTIPLIERS = (_MIX_MULTIPLIER_1, _MIX_MULTIPLIER_2, 0xD6E8FEB86659FD93)
+
+
+def _mix64(value: int) -> int:
+    """Scramble a 64-bit integer with the SplitMix64 finalizer."""
+    value = ((value ^ (value >> 30)) * _MIX_MULTIPLIER_1) & _MASK_64
+    value = ((value ^ (value >> 27)) * _MIX_MULTIPLIER_2) & _MASK_64
+
+    return value ^ (value >> 31)
+
+
+class KeyedPermutation:
+    """Pseudorandom permutation of ``range(size)`` selected by an integer key.
+
+    Maps every index to a distinct value of the same range, so walking the
+    indices ``0, 1, 2, ...`` visits the whole range in a shuffled order
+    without repeats and without storing anything besides the key.
+
+    Built as a keyed invertible hash over the smallest power of two that
+    covers ``size``: three stages, each mixing in a round key derived from
+    ``key``, multiplying by an odd constant and xor-shifting the high half
+    into the low half, so every output bit depends on every input bit.
+    Values past ``size`` are hashed again (cycle-walking) until they fall
+    back into the range, which takes fewer than 2 iterations per index on
+    average. The output is well shuffled, but this is not a cryptographic
+    cipher: use it to spread values, not to hide them.
+
+    Args:
+        size: Number of elements of the permuted range, from 1 to ``2**64``.
+        key: Integer selecting the permutation. When ``None``, 64 random bits
+            are drawn from ``rng``.
+        rng: Source of randomness for the key, as in
+            :func:`generate_random_sequence`.
+
+    Examples:
+        >>> permutation = KeyedPermutation(10, key=42)
+        >>> sorted(permutation.permute(index) for index in range(10))
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    """
+
+    __slots__ = ("_key", "_mask", "_multipliers", "_round_keys", "_shift", "_size")
+
+    def __init__(
+        self, size: int, key: int | None = None, rng: RandomSource = None
+    ) -> None:
+        if isinstance(size, bool) or not isinstance(size, int):
+            raise TypeError(f"size must be an integer, got {type(size).__name__}")
+
+        if not 1 <= size <= 1 << _MAX_BITS:
+            raise ValueError(f"size must be between 1 and 2**{_MAX_BITS}, got {size}")
+
+        if key is None:
+            key = int.from_bytes(_token_bytes_function(rng)(_KEY_BYTES), "big")
+        elif isinstance(key, bool) or not isinstance(key, int):
+            raise TypeError(f"key must be an integer, got {type(key).__name__}")
+
+        bits = max(1, (size - 1).bit_length())
+        self._size = size
+        self._key = key
+        self._mask = (1 << bits) - 1
+        self._shift = max(1, bits // 2)
+        self._multipliers = tuple(
+            multiplier & self._mask | 1 for multiplier in _STAGE_MULTIPLIERS
+        )
+        self._round_keys = tuple(
+            _mix64((key + _GOLDEN_GAMMA * (stage + 1)) & _MASK_64) & self._mask
+            for stage in range(len(_STAGE_MULTIPLIERS))
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the permuted range."""
+        return self._size
+
+    @property
+    def key(self) -> int:
+        """Key selecting the permutation; the same key and size always give
+        the same permutation.
+        """
+        return self._key
+
+    def permute(self, index: int) -> int:
+        """Return the value that ``index`` is mapped to.
+
+        Raises:
+            IndexError: If ``index`` is not in ``range(size)``.
+        """
+        if not 0 <= index < self._size:
+            raise IndexError(
+                f"index must be between 0 and {self._size - 1}, got {index}"
+            )
+
+        return self._permute(index)
+
+    def permute_range(self, start: int, stop: int) -> list[int]:
+        """Return the values that the indices ``start`` to ``stop - 1`` are
+        mapped to, in index order.
+
+        Equivalent to calling :meth:`permute` for each index, without the
+        per-call overhead.
+
+        Raises:
+            IndexError: If ``start`` to ``stop`` is not a range within
+                ``range(size + 1)``.
+        """
+        if not 0 <= start <= stop <= self._size:
+            raise IndexError(
+                f"start and stop must satisfy 0 <= start <= stop <= {self._size}, "
+                f"got {start} and {stop}"
+            )
+
+        permute = self._permute
+
+        return [permute(index) for index in range(start, stop)]
+
+    def _permute(self, value: int) -> int:
+        """Hash ``value`` until it falls back into the range.
+
+        Each step (xor with a round key, multiplication by an odd number
+        modulo the power of two, xor with its own high bits shifted down)
+        is invertible, so the hash is a permutation of the power-of-two
+        range, and cycle-walking restricts it to ``range(size)``.
+        """
+        size = self._size
+        mask = self._mask
+        shift = self._shift
+        key_0, key_1, key_2 = self._round_keys
+        multiplier_0, multiplier_1, multiplier_2 = self._multipliers
+
+        while True:
+            value = ((value ^ key_0) * multiplier_0) & mask
+            value ^= value >> shift
+            value = ((value ^ key_1) * multiplier_1) & mask
+            value ^= value >> shift
+            value = ((value ^ key_2) * multiplier_2) & mask
+            value ^= value >> shift
+
+            if value < size:
+                return value
+
+    def __len__(self) -> int:
+        return self._size
+
+
+__all__ = ["KeyedPermutation"]
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class LruCache(Generic[_K, _V]):
+    """Bounded mapping that evicts its least recently used entry when full.
+
+    Counts hits, misses and evictions, so callers can tell whether caching
+    pays off for their traffic. Not thread-safe: share an instance across
+    threads only behind a lock.
+
+    Args:
+        max_size: Maximum number of entries kept. Must be positive.
+
+    Examples:
+        >>> cache = LruCache(2)
+        >>> cache.put("a", 1)
+        >>> cache.put("b", 2)
+        >>> cache.get("a")
+        1
+        >>> cache.put("c", 3)  # evicts "b", the least recently used
+        >>> cache.get("b") is None
+        True
+        >>> (cache.hits, cache.misses, cache.evictions)
+        (1, 1, 1)
+    """
+
+    __slots__ = ("_entries", "_evictions", "_hits", "_max_size", "_misses")
+
+    def __init__(self, max_size: int) -> None:
+        if isinstance(max_size, bool) or not isinstance(max_size, int):
+            raise TypeError(
+                f"max_size must be an integer, got {type(max_size).__name__}"
+            )
+
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self._entries: OrderedDict[_K, _V] = OrderedDict()
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of entries kept."""
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """Number of :meth:`get` calls that found their key."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of :meth:`get` calls that did not find their key."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries dropped to make room for new ones."""
+        return self._evictions
+
+    def get(self, key: _K, default: _V | None = None) -> _V | None:
+        """Return the value cached for ``key``, marking it as the most
+        recently used, or ``default`` when it is not cached.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+
+            return default
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Cache ``value`` for ``key`` as the most recently used entry,
+        evicting the least recently used one when the cache is full.
+        """
+        entries = self._entries
+
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self._max_size:
+            entries.popitem(last=False)
+            self._evictions += 1
+
+        entries[key] = value
+
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return (
+            f"LruCache(max_size={self._max_size}, size={len(self._entries)}, "
+            f"hits={self._hits}, misses={self._misses}, evictions={self._evictions})"
+        )
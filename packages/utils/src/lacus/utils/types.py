@@ -1,4 +1,8 @@
-from typing import Literal
+from random import Random
+from typing import TYPE_CHECKING, Literal, Union
+
+if TYPE_CHECKING:
+    from numpy.random import Generator
 
 SequenceType = Literal["alphabetic", "alphanumeric", "numeric"]
 """Character type for random sequence generation.
@@ -7,3 +11,13 @@ SequenceType = Literal["alphabetic", "alphanumeric", "numeric"]
 - ``"numeric"``: digits only (``0-9``).
 - ``"alphabetic"``: uppercase letters only (``A-Z``).
 """
+
+RandomSource = Union[Random, "Generator", None]
+"""Source of randomness for random sequence generation.
+
+- ``None``: the operating system CSPRNG, through ``secrets`` (default).
+- ``random.Random``: e.g. ``random.Random(seed)``, for reproducible output;
+  ``random.SystemRandom()`` also works and stays cryptographically secure.
+- ``numpy.random.Generator``: e.g. ``numpy.random.default_rng(seed)``, for
+  reproducible output.
+"""
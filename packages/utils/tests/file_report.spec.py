@@ -0,0 +1,137 @@
+import gc
+
+import pytest
+from lacus.utils import FileReport
+from lacus.utils import file_report as file_report_module
+
+
+def _digits(field: bytes) -> bytes:
+    return bytes(byte for byte in field if 0x30 <= byte <= 0x39)
+
+
+def _reason_of(field: bytes) -> str:
+    return "" if len(field) == 3 else "length"
+
+
+def _report(path, column=None, delimiter=b",", header=False):
+    return FileReport(path, column, delimiter, header, _digits, _reason_of)
+
+
+def _write(tmp_path, content: bytes):
+    path = tmp_path / "values.txt"
+    path.write_bytes(content)
+
+    return path
+
+
+def describe_file_report():
+    def describe_when_iterated():
+        def it_yields_the_line_number_and_reason_of_each_invalid_line(tmp_path):
+            report = _report(_write(tmp_path, b"123\n1-2-3\n12\n\n  \n4567\n"))
+
+            assert list(report) == [(3, "length"), (6, "length")]
+            assert (report.total, report.valid, report.invalid) == (4, 2, 2)
+
+        def it_validates_one_column_and_skips_the_header(tmp_path):
+            path = _write(tmp_path, b"id;value\na;123\nb;12\nc\n")
+
+            report = _report(path, column=1, delimiter=b";", header=True)
+
+            assert list(report) == [(3, "length"), (4, "length")]
+
+        def it_reports_no_lines_for_an_empty_file(tmp_path):
+            report = _report(_write(tmp_path, b"")).finish()
+
+            assert (report.total, report.valid, report.invalid) == (0, 0, 0)
+
+        def it_validates_lines_across_chunk_boundaries(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 5)
+
+            report = _report(_write(tmp_path, b"123\n1234\n456\n7-8-9"))
+
+            assert list(report) == [(2, "length")]
+            assert report.total == 4
+
+    def describe_when_a_line_is_longer_than_a_chunk():
+        def it_sanitizes_the_line_piece_by_piece(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 4)
+            path = _write(tmp_path, b"1----2----3\n12345678901\n" + b" " * 9 + b"\n123")
+
+            report = _report(path)
+
+            assert list(report) == [(2, "length")]
+            assert report.total == 3
+
+        def it_finds_the_column_of_a_long_line(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 4)
+            path = _write(tmp_path, b"xxxxxxx,1-2-3,9999999\nyyyyyyyyy\n")
+
+            report = _report(path, column=1)
+
+            assert list(report) == [(2, "length")]
+            assert report.valid == 1
+
+        def it_keeps_a_bounded_number_of_sanitized_bytes(tmp_path, monkeypatch):
+            monkeypatch.setattr(file_report_module, "_CHUNK_SIZE", 4)
+            monkeypatch.setattr(file_report_module, "_MAX_SANITIZED_SIZE", 6)
+            fields = []
+
+            def reason_of(field):
+                fields.append(field)
+
+                return ""
+
+            path = _write(tmp_path, b"1" * 20)
+
+            assert list(FileReport(path, None, b",", False, _digits, reason_of)) == []
+            assert fields == [b"111111"]
+
+    def describe_when_closing():
+        def it_does_not_open_the_file_until_iterated(tmp_path):
+            path = tmp_path / "later.txt"
+            report = _report(path)
+
+            path.write_bytes(b"12\n")
+
+            assert list(report) == [(1, "length")]
+
+        def it_raises_on_iteration_when_the_file_does_not_exist(tmp_path):
+            report = _report(tmp_path / "missing.txt")
+
+            with pytest.raises(FileNotFoundError):
+                next(report)
+
+        def it_closes_the_file_once_exhausted(tmp_path):
+            report = _report(_write(tmp_path, b"123\n"))
+
+            assert report.closed is False
+            assert report.finish() is report
+            assert report.closed is True
+
+        def it_closes_the_file_when_leaving_a_with_block(tmp_path):
+            with _report(_write(tmp_path, b"1\n2\n")) as report:
+                assert next(report) == (1, "length")
+
+            assert report.closed is True
+            assert list(report) == []
+
+        def it_releases_the_file_when_dropped_or_never_iterated(tmp_path, monkeypatch):
+            path = _write(tmp_path, b"1\n2\n")
+            files = []
+
+            def tracking_open(*args):
+                files.append(open(*args))  # noqa: SIM115
+
+                return files[-1]
+
+            monkeypatch.setattr(
+                file_report_module, "open", tracking_open, raising=False
+            )
+            _report(path)
+            partly_read = _report(path)
+            next(partly_read)
+            del partly_read
+            gc.collect()
+
+            assert len(files) == 1
+            assert files[0].closed is True
@@ -1,7 +1,10 @@
+import random
 import re
+import secrets
+from collections import Counter
 
 import pytest
-from lacus.utils import generate_random_sequence
+from lacus.utils import generate_random_sequence, generate_random_sequences
 
 
 def describe_generate_random_sequence():
@@ -58,3 +61,135 @@ def describe_generate_random_sequence():
         def it_raises_value_error_for_negative_size():
             with pytest.raises(ValueError, match="size must be non-negative"):
                 generate_random_sequence(-1, "numeric")
+
+    def describe_sampling():
+        def it_draws_all_characters_at_once(monkeypatch):
+            draws = []
+            token_bytes = secrets.token_bytes
+
+            def counting_token_bytes(size):
+                draws.append(size)
+
+                return token_bytes(size)
+
+            monkeypatch.setattr(secrets, "token_bytes", counting_token_bytes)
+
+            generate_random_sequence(12, "numeric")
+
+            assert len(draws) == 1
+
+        def it_rejects_bytes_that_would_bias_the_result(monkeypatch):
+            draws = iter([bytes([250, 251, 255, 0, 9, 10]), bytes(range(20))])
+            monkeypatch.setattr(secrets, "token_bytes", lambda _size: next(draws))
+
+            assert generate_random_sequence(5, "numeric") == "09001"
+
+        @pytest.mark.parametrize(
+            ("sequence_type", "chars"),
+            [
+                ("numeric", "0123456789"),
+                ("alphabetic", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"),
+                ("alphanumeric", "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"),
+            ],
+        )
+        def it_draws_every_character_about_equally_often(sequence_type, chars):
+            samples = 2_000 * len(chars)
+            counts = Counter(generate_random_sequence(samples, sequence_type))
+
+            assert set(counts) == set(chars)
+            assert all(1_700 < count < 2_300 for count in counts.values())
+
+
+def describe_generate_random_sequences():
+    @pytest.mark.parametrize("sequence_type", ["numeric", "alphabetic", "alphanumeric"])
+    def it_generates_count_sequences_of_the_given_size(sequence_type):
+        result = generate_random_sequences(50, 12, sequence_type)
+
+        assert len(result) == 50
+        assert all(len(sequence) == 12 for sequence in result)
+
+    def it_uses_the_character_set_of_the_type():
+        numeric = generate_random_sequences(20, 8, "numeric")
+        alphabetic = generate_random_sequences(20, 8, "alphabetic")
+
+        assert all(re.fullmatch(r"\d{8}", sequence) for sequence in numeric)
+        assert all(re.fullmatch(r"[A-Z]{8}", sequence) for sequence in alphabetic)
+
+    def it_draws_every_sequence_at_once(monkeypatch):
+        draws = []
+        token_bytes = secrets.token_bytes
+
+        def counting_token_bytes(size):
+            draws.append(size)
+
+            return token_bytes(size)
+
+        monkeypatch.setattr(secrets, "token_bytes", counting_token_bytes)
+
+        generate_random_sequences(1_000, 12, "alphanumeric")
+
+        assert len(draws) <= 2
+
+    def it_handles_empty_results():
+        assert generate_random_sequences(0, 12, "numeric") == []
+        assert generate_random_sequences(3, 0, "numeric") == ["", "", ""]
+
+    @pytest.mark.parametrize(
+        ("count", "size", "name"), [(-1, 4, "count"), (4, -1, "size")]
+    )
+    def it_raises_value_error_for_negative_arguments(count, size, name):
+        with pytest.raises(ValueError, match=f"{name} must be non-negative"):
+            generate_random_sequences(count, size, "numeric")
+
+
+def describe_rng():
+    @pytest.mark.parametrize("sequence_type", ["numeric", "alphabetic", "alphanumeric"])
+    def it_reproduces_the_output_of_a_seeded_random(sequence_type):
+        first = generate_random_sequence(64, sequence_type, random.Random(7))
+        second = generate_random_sequence(64, sequence_type, random.Random(7))
+
+        assert first == second
+        assert first != generate_random_sequence(64, sequence_type, random.Random(8))
+
+    def it_reproduces_batches_of_a_seeded_random():
+        first = generate_random_sequences(100, 12, "alphanumeric", random.Random(7))
+        second = generate_random_sequences(100, 12, "alphanumeric", random.Random(7))
+
+        assert first == second
+        assert all(re.fullmatch(r"[0-9A-Z]{12}", sequence) for sequence in first)
+
+    def it_reproduces_the_output_of_a_seeded_numpy_generator():
+        np = pytest.importorskip("numpy")
+
+        first = generate_random_sequences(100, 11, "numeric", np.random.default_rng(7))
+        second = generate_random_sequences(100, 11, "numeric", np.random.default_rng(7))
+
+        assert first == second
+        assert all(re.fullmatch(r"\d{11}", sequence) for sequence in first)
+
+    def it_keeps_sampling_unbiased_with_a_seeded_random():
+        counts = Counter(generate_random_sequence(20_000, "numeric", random.Random(7)))
+
+        assert set(counts) == set("0123456789")
+        assert all(1_700 < count < 2_300 for count in counts.values())
+
+    def it_accepts_system_random():
+        result = generate_random_sequence(16, "alphabetic", random.SystemRandom())
+
+        assert re.fullmatch(r"[A-Z]{16}", result)
+
+    def it_does_not_use_secrets_with_a_given_rng(monkeypatch):
+        def failing_token_bytes(_size):
+            raise AssertionError("secrets.token_bytes must not be called")
+
+        monkeypatch.setattr(secrets, "token_bytes", failing_token_bytes)
+
+        assert len(generate_random_sequence(12, "numeric", random.Random(7))) == 12
+
+    @pytest.mark.parametrize("rng", [42, "seed", object()])
+    def it_raises_type_error_for_unsupported_sources(rng):
+        with pytest.raises(TypeError, match=r"rng must be a random\.Random"):
+            generate_random_sequence(4, "numeric", rng)
+
+        with pytest.raises(TypeError, match=r"rng must be a random\.Random"):
+            generate_random_sequences(3, 0, "numeric", rng)
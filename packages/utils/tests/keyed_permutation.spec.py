@@ -0,0 +1,105 @@
+import random
+
+import pytest
+from lacus.utils import KeyedPermutation
+
+
+def describe_keyed_permutation():
+    def describe_when_created():
+        def it_exposes_the_size_and_key():
+            permutation = KeyedPermutation(10, key=42)
+
+            assert permutation.size == 10
+            assert len(permutation) == 10
+            assert permutation.key == 42
+
+        def it_draws_the_key_from_the_given_rng():
+            first = KeyedPermutation(1_000, rng=random.Random(7))
+            second = KeyedPermutation(1_000, rng=random.Random(7))
+
+            assert first.key == second.key
+
+        def it_draws_a_random_key_by_default():
+            keys = {KeyedPermutation(1_000).key for _ in range(10)}
+
+            assert len(keys) > 1
+
+        @pytest.mark.parametrize("size", [0, -1, 2**64 + 1])
+        def it_rejects_a_size_out_of_range(size):
+            with pytest.raises(
+                ValueError, match="size must be between 1 and 2\\*\\*64"
+            ):
+                KeyedPermutation(size, key=1)
+
+        @pytest.mark.parametrize("size", [1.5, "3", True, None])
+        def it_rejects_a_non_integer_size(size):
+            with pytest.raises(TypeError, match="size must be an integer"):
+                KeyedPermutation(size, key=1)
+
+        @pytest.mark.parametrize("key", [1.5, "3", True])
+        def it_rejects_a_non_integer_key(key):
+            with pytest.raises(TypeError, match="key must be an integer"):
+                KeyedPermutation(10, key=key)
+
+        def it_rejects_an_unsupported_rng():
+            with pytest.raises(TypeError, match="rng must be"):
+                KeyedPermutation(10, rng=42)
+
+    def describe_permute():
+        @pytest.mark.parametrize("size", [1, 2, 3, 10, 64, 100, 1_000, 4_097])
+        def it_maps_the_range_onto_itself_without_repeats(size):
+            permutation = KeyedPermutation(size, key=123)
+
+            assert sorted(permutation.permute(index) for index in range(size)) == list(
+                range(size)
+            )
+
+        def it_is_deterministic_for_the_same_key_and_size():
+            first = KeyedPermutation(10_000, key=99)
+            second = KeyedPermutation(10_000, key=99)
+
+            assert [first.permute(index) for index in range(100)] == [
+                second.permute(index) for index in range(100)
+            ]
+
+        def it_gives_different_orders_for_different_keys():
+            first = KeyedPermutation(10_000, key=1)
+            second = KeyedPermutation(10_000, key=2)
+
+            assert [first.permute(index) for index in range(100)] != [
+                second.permute(index) for index in range(100)
+            ]
+
+        def it_shuffles_the_range():
+            permutation = KeyedPermutation(10_000, key=5)
+            fixed_points = sum(
+                permutation.permute(index) == index for index in range(10_000)
+            )
+
+            assert fixed_points < 10
+
+        def it_handles_the_largest_size():
+            permutation = KeyedPermutation(2**64, key=5)
+
+            assert 0 <= permutation.permute(2**64 - 1) < 2**64
+
+        @pytest.mark.parametrize("index", [-1, 10])
+        def it_raises_index_error_out_of_range(index):
+            with pytest.raises(IndexError, match="index must be between 0 and 9"):
+                KeyedPermutation(10, key=1).permute(index)
+
+    def describe_permute_range():
+        def it_matches_permute_for_each_index():
+            permutation = KeyedPermutation(1_000, key=8)
+
+            assert permutation.permute_range(100, 200) == [
+                permutation.permute(index) for index in range(100, 200)
+            ]
+
+        def it_returns_an_empty_list_for_an_empty_range():
+            assert KeyedPermutation(10, key=1).permute_range(10, 10) == []
+
+        @pytest.mark.parametrize(("start", "stop"), [(-1, 5), (5, 4), (0, 11)])
+        def it_raises_index_error_for_an_invalid_range(start, stop):
+            with pytest.raises(IndexError, match="start and stop must satisfy"):
+                KeyedPermutation(10, key=1).permute_range(start, stop)
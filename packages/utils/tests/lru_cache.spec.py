@@ -0,0 +1,76 @@
+import pytest
+from lacus.utils import LruCache
+
+
+def describe_lru_cache():
+    def describe_when_created():
+        def it_starts_empty_with_zeroed_counters():
+            cache = LruCache(3)
+
+            assert len(cache) == 0
+            assert cache.max_size == 3
+            assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+        @pytest.mark.parametrize("max_size", [0, -1])
+        def it_rejects_a_non_positive_max_size(max_size):
+            with pytest.raises(ValueError, match="max_size must be positive"):
+                LruCache(max_size)
+
+        @pytest.mark.parametrize("max_size", [1.5, "3", True, None])
+        def it_rejects_a_non_integer_max_size(max_size):
+            with pytest.raises(TypeError, match="max_size must be an integer"):
+                LruCache(max_size)
+
+    def describe_when_getting_and_putting():
+        def it_returns_cached_values_and_counts_hits_and_misses():
+            cache = LruCache(3)
+            cache.put("a", 1)
+
+            assert cache.get("a") == 1
+            assert cache.get("b") is None
+            assert cache.get("b", 0) == 0
+            assert (cache.hits, cache.misses) == (1, 2)
+
+        def it_replaces_the_value_of_an_existing_key_without_evicting():
+            cache = LruCache(2)
+            cache.put("a", 1)
+            cache.put("b", 2)
+            cache.put("a", 3)
+
+            assert cache.get("a") == 3
+            assert len(cache) == 2
+            assert cache.evictions == 0
+
+    def describe_when_full():
+        def it_evicts_the_least_recently_used_entry():
+            cache = LruCache(2)
+            cache.put("a", 1)
+            cache.put("b", 2)
+            cache.get("a")
+            cache.put("c", 3)
+
+            assert "a" in cache
+            assert "b" not in cache
+            assert "c" in cache
+            assert cache.evictions == 1
+
+        def it_treats_a_put_of_an_existing_key_as_a_use():
+            cache = LruCache(2)
+            cache.put("a", 1)
+            cache.put("b", 2)
+            cache.put("a", 1)
+            cache.put("c", 3)
+
+            assert "a" in cache
+            assert "b" not in cache
+
+    def describe_when_cleared():
+        def it_drops_every_entry_and_keeps_the_counters():
+            cache = LruCache(2)
+            cache.put("a", 1)
+            cache.get("a")
+            cache.clear()
+
+            assert len(cache) == 0
+            assert "a" not in cache
+            assert cache.hits == 1